@@ -0,0 +1,63 @@
+"""
+Benchmark do dHash usado na deduplicação de frames.
+
+Extrai até `--frames` frames de um vídeo local (idealmente 1080p) via `FFmpegWrapper.iter_frames`
+em cada formato e mede quantos hashes por segundo o `FrameDeduplicator` calcula, um a um e em lote.
+
+Uso:
+    python -m benchmarks.dedup_benchmark caminho/do/video_1080p.mp4 [--frames 60]
+"""
+import argparse
+import itertools
+import time
+from typing import List
+
+from src.core.constants.frame_format import FrameFormat
+from src.core.domain.entities.frame_extraction_config import FrameExtractionConfig
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+from src.infrastructure.video.frame_deduplicator import FrameDeduplicator
+
+
+def run(video_path: str, frames: int) -> List[dict]:
+    wrapper = FFmpegWrapper()
+    deduplicator = FrameDeduplicator(max_distance=0)
+    results = []
+    for frame_format in FrameFormat:
+        config = FrameExtractionConfig(frame_format=frame_format)
+        frames_data = [frame.data for frame in itertools.islice(wrapper.iter_frames(video_path, config), frames)]
+        count = len(frames_data) or 1
+
+        started = time.perf_counter()
+        for data in frames_data:
+            deduplicator.frame_hash(data)
+        single_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        deduplicator.frame_hashes(frames_data)
+        batch_elapsed = time.perf_counter() - started
+
+        results.append({
+            "format": frame_format.format,
+            "frames": len(frames_data),
+            "hashes_per_second": count / (single_elapsed or 1e-9),
+            "batch_hashes_per_second": count / (batch_elapsed or 1e-9),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede hashes por segundo do dHash por formato de frame.")
+    parser.add_argument("video_path")
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args()
+
+    print(f"{'format':<8}{'frames':>8}{'hashes/s':>12}{'batch/s':>12}")
+    for result in run(args.video_path, args.frames):
+        print(
+            f"{result['format']:<8}{result['frames']:>8}"
+            f"{result['hashes_per_second']:>12,.0f}{result['batch_hashes_per_second']:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
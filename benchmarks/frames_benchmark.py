@@ -0,0 +1,74 @@
+"""
+Benchmark de extração de frames por formato de saída.
+
+Extrai os frames de um vídeo local via `FFmpegWrapper.iter_frames` para cada formato
+configurado e reporta bytes por frame e tempo de codificação por frame.
+
+Uso:
+    python -m benchmarks.frames_benchmark caminho/do/video.mp4 [--max-width 1280] [--quality 80] [--mode scene]
+"""
+import argparse
+import time
+from typing import List, Optional
+
+from src.core.constants.extraction_mode import ExtractionMode
+from src.core.constants.frame_format import FrameFormat
+from src.core.domain.entities.frame_extraction_config import FrameExtractionConfig
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+
+
+def run(
+    video_path: str,
+    quality: Optional[int],
+    max_width: Optional[int],
+    max_height: Optional[int],
+    mode: ExtractionMode = ExtractionMode.INTERVAL,
+) -> List[dict]:
+    wrapper = FFmpegWrapper()
+    results = []
+    for frame_format in FrameFormat:
+        config = FrameExtractionConfig(
+            frame_format=frame_format,
+            quality=quality if frame_format != FrameFormat.PNG else None,
+            max_width=max_width,
+            max_height=max_height,
+            mode=mode,
+        )
+        started = time.perf_counter()
+        sizes = [len(frame.data) for frame in wrapper.iter_frames(video_path, config)]
+        elapsed = time.perf_counter() - started
+
+        count = len(sizes) or 1
+        results.append({
+            "format": frame_format.format,
+            "frames": len(sizes),
+            "bytes_per_frame": sum(sizes) / count,
+            "ms_per_frame": elapsed * 1000 / count,
+            "total_bytes": sum(sizes),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara formatos de frame (png/jpeg/webp).")
+    parser.add_argument("video_path")
+    parser.add_argument("--quality", type=int, default=80)
+    parser.add_argument("--max-width", type=int, default=None)
+    parser.add_argument("--max-height", type=int, default=None)
+    parser.add_argument("--mode", choices=ExtractionMode.mode_list(), default=ExtractionMode.INTERVAL.mode)
+    args = parser.parse_args()
+
+    results = run(args.video_path, args.quality, args.max_width, args.max_height, ExtractionMode.from_mode(args.mode))
+    baseline = next(result for result in results if result["format"] == FrameFormat.PNG.format)
+
+    print(f"{'format':<8}{'frames':>8}{'bytes/frame':>14}{'ms/frame':>10}{'vs png':>9}")
+    for result in results:
+        ratio = result["bytes_per_frame"] / (baseline["bytes_per_frame"] or 1)
+        print(
+            f"{result['format']:<8}{result['frames']:>8}{result['bytes_per_frame']:>14,.0f}"
+            f"{result['ms_per_frame']:>10.1f}{ratio:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
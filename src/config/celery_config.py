@@ -18,16 +18,21 @@ _suffix = '_dev' if _env == 'development' else ''
 
 default_q = f'default{_suffix}'
 extract_frames_q = f'extract_frames_queue{_suffix}'
+extract_frames_long_q = f'extract_frames_long_queue{_suffix}'
 notification_q = f'notification_queue{_suffix}'
 
 task_default_queue = default_q
 task_queues = (
     Queue(default_q),
     Queue(extract_frames_q),
+    Queue(extract_frames_long_q),
     Queue(notification_q),
 )
 task_routes = {
     'src.infrastructure.tasks.video_tasks.extract_frames_task': {'queue': extract_frames_q},
+    'src.infrastructure.tasks.video_tasks.extract_frames_chunk_task': {'queue': extract_frames_q},
+    'src.infrastructure.tasks.video_tasks.finalize_chunked_video_task': {'queue': extract_frames_q},
+    'src.infrastructure.tasks.video_tasks.fail_chunked_video_task': {'queue': extract_frames_q},
     'src.infrastructure.tasks.notification_task.send_notification_task': {'queue': notification_q},
 }
 
@@ -37,6 +37,24 @@ ZIPPER_SERVICE_X_API_KEY = os.getenv("ZIPPER_SERVICE_X_API_KEY")
 STORAGE_BUCKET = os.getenv("STORAGE_BUCKET", "default-bucket")
 STORAGE_VIDEO_PATH = os.getenv("STORAGE_VIDEO_PATH", "default-path-video")
 STORAGE_FRAMES_PATH = os.getenv("STORAGE_FRAMES_PATH", "default-path-frames")
+STORAGE_UPLOAD_CONCURRENCY = int(os.getenv("STORAGE_UPLOAD_CONCURRENCY", 16))
+STORAGE_UPLOAD_RETRY_DEADLINE_SECONDS = float(os.getenv("STORAGE_UPLOAD_RETRY_DEADLINE_SECONDS", 300))
+# upload direto ao storage: POST pré-assinado até o tamanho da parte, multipart com URLs por parte acima dele
+DIRECT_UPLOAD_MAX_SIZE_MB = int(os.getenv("DIRECT_UPLOAD_MAX_SIZE_MB", 5 * 1024))
+DIRECT_UPLOAD_PART_SIZE_MB = int(os.getenv("DIRECT_UPLOAD_PART_SIZE_MB", 64))
+DIRECT_UPLOAD_URL_EXPIRATION_SECONDS = int(os.getenv("DIRECT_UPLOAD_URL_EXPIRATION_SECONDS", 3600))
+# s3 (padrão), filesystem (STORAGE_ENDPOINT_URL é o diretório raiz) ou memory (objetos só no processo que
+# os gravou: benchmarks e execução em um único processo)
+STORAGE_PROVIDER = os.getenv("STORAGE_PROVIDER", "s3").lower()
+STORAGE_ENDPOINT_URL = os.getenv("STORAGE_ENDPOINT_URL")
+# latência, banda e falhas simuladas pelos backends filesystem/memory (benchmarks e testes de carga)
+STORAGE_FAULT_INJECTION = {
+    "latency_ms": float(os.getenv("STORAGE_INJECTED_LATENCY_MS", 0)),
+    "jitter_ms": float(os.getenv("STORAGE_INJECTED_JITTER_MS", 0)),
+    "bandwidth_mbps": float(os.getenv("STORAGE_INJECTED_BANDWIDTH_MBPS", 0)) or None,
+    "error_rate": float(os.getenv("STORAGE_INJECTED_ERROR_RATE", 0)),
+    "throttle_rate": float(os.getenv("STORAGE_INJECTED_THROTTLE_RATE", 0)),
+}
 
 AWS_ACCESS_KEY_ID = os.getenv('AWS_ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
@@ -51,3 +69,19 @@ elif ENVIRONMENT == 'production':
     SQS_QUEUE_NAME = f"{SQS_QUEUE_NAME}-prod"
 
 FRAMES_PER_SECOND = os.getenv('FRAMES_PER_SECOND', '1')
+FRAME_KEY_SHARD_PREFIX_LENGTH = int(os.getenv('FRAME_KEY_SHARD_PREFIX_LENGTH', 0))
+FRAME_STREAMING_ENABLED = os.getenv('FRAME_STREAMING_ENABLED', 'true').lower() in ('true', '1')
+FRAME_PIPELINE_BUFFER_SIZE = int(os.getenv('FRAME_PIPELINE_BUFFER_SIZE', 32))
+# ffmpeg por job na extração paralela: por padrão, um por CPU. Com vários processos do worker
+# rodando jobs ao mesmo tempo, use as CPUs divididas pela concorrência do worker
+FRAME_EXTRACTION_PARALLELISM = int(os.getenv('FRAME_EXTRACTION_PARALLELISM', os.cpu_count() or 1))
+FRAME_SEGMENT_MIN_SECONDS = float(os.getenv('FRAME_SEGMENT_MIN_SECONDS', 30))
+DISTRIBUTED_CHUNKING_ENABLED = os.getenv('DISTRIBUTED_CHUNKING_ENABLED', 'false').lower() in ('true', '1')
+DISTRIBUTED_CHUNK_SECONDS = float(os.getenv('DISTRIBUTED_CHUNK_SECONDS', 600))
+VIDEO_TASK_TIME_LIMIT_MIN = int(os.getenv('VIDEO_TASK_TIME_LIMIT_MIN', 5 * 60))
+VIDEO_TASK_TIME_LIMIT_MAX = int(os.getenv('VIDEO_TASK_TIME_LIMIT_MAX', 2 * 60 * 60))
+VIDEO_TASK_SECONDS_PER_VIDEO_SECOND = float(os.getenv('VIDEO_TASK_SECONDS_PER_VIDEO_SECOND', 0.5))
+LONG_VIDEO_SECONDS = float(os.getenv('LONG_VIDEO_SECONDS', 20 * 60))
+PROGRESS_UPDATE_INTERVAL_SECONDS = float(os.getenv('PROGRESS_UPDATE_INTERVAL_SECONDS', 2))
+CHECKPOINT_INTERVAL_SECONDS = float(os.getenv('CHECKPOINT_INTERVAL_SECONDS', 5))
+CANCELLATION_POLL_INTERVAL_SECONDS = float(os.getenv('CANCELLATION_POLL_INTERVAL_SECONDS', 1))
@@ -0,0 +1,43 @@
+from src.core.constants.video_job_status import VideoJobStatus
+from src.core.domain.dtos.video_frame_extractor.video_job_dto import VideoJobDTO
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+
+
+class CancelVideoJobUseCase:
+    """
+    Cancela um job ainda não finalizado: grava o status CANCELLED e revoga as tarefas enfileiradas.
+    Um worker que já esteja processando o job percebe o novo status, termina o ffmpeg, para os
+    uploads e remove os frames parciais do prefixo do job; se ele terminar antes de perceber, a
+    conclusão não é gravada por cima do cancelamento.
+    """
+
+    def __init__(self, video_job_repository: IVideoJobRepository, task_gateway: ITaskQueueGateway):
+        self._video_job_repository = video_job_repository
+        self._task_gateway = task_gateway
+
+    @classmethod
+    def build(cls, video_job_repository: IVideoJobRepository, task_gateway: ITaskQueueGateway) -> "CancelVideoJobUseCase":
+        return cls(video_job_repository, task_gateway)
+
+    async def execute(self, job_ref: str) -> VideoJobDTO:
+        # update condicional: um job que o worker concluiu (ou falhou) nesse meio-tempo não volta a CANCELLED
+        saved_job = self._video_job_repository.cancel(job_ref)
+        if not saved_job:
+            status = self._video_job_repository.find_status(job_ref)
+            if status is None:
+                raise EntityNotFoundException(message=f"VideoJob com job_ref {job_ref} não encontrado.")
+            raise BadRequestException(message=f"VideoJob {job_ref} is already {status} and cannot be cancelled")
+
+        self._task_gateway.revoke_tasks(saved_job.task_ids)
+        self._task_gateway.notification_status_callback(
+            {
+                "job_ref": saved_job.job_ref,
+                "detail": VideoJobStatus.to_dict()[saved_job.status],
+            },
+        )
+        return VideoJobDTO.from_entity(saved_job)
+
+__all__ = ["CancelVideoJobUseCase"]
@@ -0,0 +1,70 @@
+from typing import List, Tuple
+
+from src.config.settings import STORAGE_BUCKET
+from src.core.application.use_cases.register_video_use_case import RegisterVideoUseCase
+from src.core.constants.video_job_status import VideoJobStatus
+from src.core.domain.dtos.video_frame_extractor.confirm_video_upload_dto import ConfirmVideoUploadDTO
+from src.core.domain.entities.storage_object import StorageObject
+from src.core.domain.entities.video_job import VideoJob
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+
+
+class ConfirmVideoUploadUseCase(RegisterVideoUseCase):
+    """
+    Segunda etapa do upload direto: conclui o multipart (se houver), confere o objeto com um HEAD
+    (existência e tamanho declarado) e segue o mesmo caminho do registro: probe, agendamento e fila.
+
+    Enquanto o objeto não existe o job continua PENDING e o confirm pode ser repetido; um objeto que
+    não confere (tamanho, vídeo ilegível) falha o job e é removido. Um confirm repetido depois de o
+    multipart já ter sido concluído encontra o objeto e não o conclui de novo.
+    """
+
+    async def execute(self, job_ref: str, dto: ConfirmVideoUploadDTO) -> VideoJob:
+        video_job = self._video_job_repository.find_by_job_ref(job_ref)
+        if not video_job:
+            raise EntityNotFoundException(message=f"VideoJob com job_ref {job_ref} não encontrado.")
+        if video_job.status != VideoJobStatus.PENDING.status or not video_job.upload:
+            raise BadRequestException(message=f"VideoJob {job_ref} is not waiting for a direct upload")
+
+        upload = video_job.upload
+        stored = self._storage_gateway.head_object(STORAGE_BUCKET, upload["key"])
+        if stored is None and upload.get("upload_id"):
+            parts = self._uploaded_parts(dto, upload)
+            try:
+                self._storage_gateway.complete_multipart_upload(STORAGE_BUCKET, upload["key"], upload["upload_id"], parts)
+                stored = self._storage_gateway.head_object(STORAGE_BUCKET, upload["key"])
+            except Exception as e:
+                self._storage_gateway.abort_multipart_upload(STORAGE_BUCKET, upload["key"], upload["upload_id"])
+                self._fail_upload(video_job, str(e))
+                raise
+        if stored is None:
+            raise BadRequestException(message=f"The video of VideoJob {job_ref} has not been uploaded yet")
+
+        try:
+            self._check_uploaded_object(stored, upload)
+            # sem os bytes na API, o ETag (MD5 do conteúdo, ou dos MD5 das partes de tamanho fixo) identifica o vídeo no cache
+            etag = (stored.metadata.get("ETag") or "").strip('"')
+            video_job.content_hash = f"etag:{etag}" if etag else None
+            return await self._enqueue_uploaded_video(video_job, STORAGE_BUCKET, upload["key"])
+        except Exception as e:
+            self._fail_upload(video_job, str(e))
+            raise
+
+    @staticmethod
+    def _uploaded_parts(dto: ConfirmVideoUploadDTO, upload: dict) -> List[Tuple[int, str]]:
+        numbers = sorted(part.part_number for part in dto.parts)
+        if numbers != list(range(1, upload["part_count"] + 1)):
+            raise BadRequestException(
+                message=f"Multipart upload needs the etag of every part from 1 to {upload['part_count']}"
+            )
+        return [(part.part_number, part.etag) for part in dto.parts]
+
+    @staticmethod
+    def _check_uploaded_object(stored: StorageObject, upload: dict):
+        size = stored.metadata.get("ContentLength")
+        if size != upload["size"]:
+            raise BadRequestException(message=f"Uploaded video has {size} bytes but {upload['size']} were declared")
+
+
+__all__ = ["ConfirmVideoUploadUseCase"]
@@ -0,0 +1,89 @@
+import math
+from typing import List, Optional
+
+from src.config.settings import DIRECT_UPLOAD_PART_SIZE_MB, DIRECT_UPLOAD_URL_EXPIRATION_SECONDS, STORAGE_BUCKET
+from src.core.application.use_cases.register_video_use_case import RegisterVideoUseCase
+from src.core.domain.dtos.video_frame_extractor.create_video_upload_dto import CreateVideoUploadDTO
+from src.core.domain.dtos.video_frame_extractor.video_upload_dto import UploadPartUrlDTO, VideoUploadDTO
+
+# limite de partes de um upload multipart no S3
+MAX_UPLOAD_PARTS = 10000
+
+
+class CreateVideoUploadUseCase(RegisterVideoUseCase):
+    """
+    Primeira etapa do upload direto ao storage: cria o job (PENDING) e devolve URLs assinadas para o
+    cliente enviar o vídeo sem que os bytes passem pela API.
+
+    Vídeos de até `DIRECT_UPLOAD_PART_SIZE_MB` recebem um POST pré-assinado cuja política exige o tamanho
+    declarado; acima disso, um upload multipart com uma URL de PUT por parte. O job só é validado e
+    enfileirado em `ConfirmVideoUploadUseCase`.
+    """
+
+    async def execute(self, dto: CreateVideoUploadDTO, job_ref: str = '') -> VideoUploadDTO:
+        saved_job = None
+        upload_id: Optional[str] = None
+        try:
+            saved_job = self._video_job_repository.save(self._find_or_create_job(dto, job_ref))
+            key = self._video_key(saved_job)
+
+            part_size = self._part_size(dto.size)
+            presigned_post = None
+            parts: List[UploadPartUrlDTO] = []
+            if dto.size <= part_size:
+                presigned_post = self._storage_gateway.presign_post(
+                    bucket=STORAGE_BUCKET,
+                    key=key,
+                    content_type=dto.content_type,
+                    max_size=dto.size,
+                    expiration=DIRECT_UPLOAD_URL_EXPIRATION_SECONDS,
+                )
+            else:
+                upload_id = self._storage_gateway.create_multipart_upload(STORAGE_BUCKET, key, dto.content_type)
+                parts = [
+                    UploadPartUrlDTO(
+                        part_number=number,
+                        url=self._storage_gateway.presign_upload_part(
+                            STORAGE_BUCKET, key, upload_id, number, DIRECT_UPLOAD_URL_EXPIRATION_SECONDS
+                        ),
+                    )
+                    for number in range(1, math.ceil(dto.size / part_size) + 1)
+                ]
+
+            # o confirm compara o objeto enviado com o que foi declarado aqui
+            saved_job.upload = {
+                "key": key,
+                "size": dto.size,
+                "content_type": dto.content_type,
+                "upload_id": upload_id,
+                "part_size": part_size if upload_id else None,
+                "part_count": len(parts) or None,
+            }
+            saved_job = self._video_job_repository.save(saved_job)
+            self._send_notification(saved_job)
+        except Exception as e:
+            if upload_id:
+                self._storage_gateway.abort_multipart_upload(STORAGE_BUCKET, self._video_key(saved_job), upload_id)
+            if saved_job:
+                self._fail_upload(saved_job, str(e))
+            raise
+
+        return VideoUploadDTO(
+            job_ref=saved_job.job_ref,
+            status=saved_job.status,
+            method="MULTIPART" if upload_id else "POST",
+            expires_in=DIRECT_UPLOAD_URL_EXPIRATION_SECONDS,
+            url=presigned_post["url"] if presigned_post else None,
+            fields=presigned_post["fields"] if presigned_post else None,
+            upload_id=upload_id,
+            part_size=part_size if upload_id else None,
+            parts=parts or None,
+        )
+
+    @staticmethod
+    def _part_size(size: int) -> int:
+        # partes maiores que o padrão só quando o vídeo não cabe em MAX_UPLOAD_PARTS partes
+        return max(DIRECT_UPLOAD_PART_SIZE_MB * 1024 * 1024, math.ceil(size / MAX_UPLOAD_PARTS))
+
+
+__all__ = ["CreateVideoUploadUseCase"]
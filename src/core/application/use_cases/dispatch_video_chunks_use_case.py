@@ -0,0 +1,118 @@
+from typing import Optional
+
+from src.config.settings import DISTRIBUTED_CHUNK_SECONDS, DISTRIBUTED_CHUNKING_ENABLED
+from src.core.domain.dtos.video_frame_extractor.process_video_task_dto import ProcessVideoTaskDTO
+from src.core.domain.entities.frame_extraction_config import FrameExtractionConfig
+from src.core.domain.entities.media_metadata import MediaMetadata
+from src.core.domain.entities.video_job import VideoJob
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+
+
+class DispatchVideoChunksUseCase:
+    """
+    Modo distribuído: divide um vídeo longo em trechos de até `DISTRIBUTED_CHUNK_SECONDS` e
+    enfileira uma subtarefa por trecho, para que vários workers processem o mesmo job.
+
+    Retorna `None` (e o job segue pelo processamento em uma única tarefa) quando o modo está
+    desligado, quando o job usa extração por keyframe/cena, sprites ou shards, quando já há resultado
+    no cache, quando a duração não pode ser obtida ou quando o vídeo cabe em um só trecho.
+    """
+
+    def __init__(
+        self,
+        video_job_repository: IVideoJobRepository,
+        storage_gateway: ObjectStorageGateway,
+        video_processor: FFmpegWrapper,
+        task_gateway: ITaskQueueGateway,
+        chunking_enabled: bool = DISTRIBUTED_CHUNKING_ENABLED,
+        chunk_seconds: float = DISTRIBUTED_CHUNK_SECONDS,
+        frame_cache_repository: Optional[IFrameCacheRepository] = None,
+    ):
+        self._video_job_repository = video_job_repository
+        self._storage_gateway = storage_gateway
+        self._video_processor = video_processor
+        self._task_gateway = task_gateway
+        self._chunking_enabled = chunking_enabled
+        self._chunk_seconds = chunk_seconds
+        self._frame_cache_repository = frame_cache_repository
+
+    @classmethod
+    def build(
+        cls,
+        video_job_repository: IVideoJobRepository,
+        storage_gateway: ObjectStorageGateway,
+        video_processor: FFmpegWrapper,
+        task_gateway: ITaskQueueGateway,
+        frame_cache_repository: Optional[IFrameCacheRepository] = None,
+    ) -> "DispatchVideoChunksUseCase":
+        return cls(
+            video_job_repository, storage_gateway, video_processor, task_gateway,
+            frame_cache_repository=frame_cache_repository,
+        )
+
+    def execute(self, dto: ProcessVideoTaskDTO) -> Optional[str]:
+        if not self._chunking_enabled:
+            return None
+
+        video_job = self._video_job_repository.find_by_job_ref(dto.job_ref)
+        if not video_job:
+            raise EntityNotFoundException(message=f"VideoJob com job_ref {dto.job_ref} não encontrado.")
+        frame_config = FrameExtractionConfig.from_dict(video_job.config)
+        if (
+            not frame_config.mode.is_uniform or frame_config.sprites or frame_config.shards
+            or frame_config.frame_count or frame_config.renditions
+        ):
+            # keyframe/scene não têm grade de ticks para dividir entre workers; sprites e shards
+            # tar são montados sobre a sequência inteira de frames, em uma única tarefa; N frames
+            # espaçados são uma prévia curta, que não compensa distribuir; e as renditions saem
+            # de uma única decodificação do vídeo
+            return None
+        if self._is_cached(video_job, frame_config):
+            # o processamento em tarefa única copia os frames do cache, sem rodar o ffmpeg
+            return None
+
+        duration = self._video_duration(video_job)
+        if not duration:
+            return None
+
+        chunks = self._video_processor.plan_chunks(duration, self._chunk_seconds, frame_config)
+        if len(chunks) <= 1:
+            return None
+
+        video_job.start_processing()
+        if not self._video_job_repository.save_unless_cancelled(video_job):
+            # cancelado antes do fan-out: nenhum trecho é enfileirado
+            return None
+
+        chord_id = self._task_gateway.enqueue_video_chunks(
+            dto.model_dump(),
+            [chunk._asdict() for chunk in chunks],
+        )
+        self._video_job_repository.add_task_id(video_job.job_ref, chord_id)
+        print(f"Job {video_job.job_ref} dividido em {len(chunks)} trechos ({frame_config.clip_duration(duration):.0f}s de vídeo).")
+        return chord_id
+
+    def _is_cached(self, video_job: VideoJob, frame_config: FrameExtractionConfig) -> bool:
+        if not self._frame_cache_repository or not video_job.content_hash:
+            return False
+        return self._frame_cache_repository.find_by_cache_key(frame_config.cache_key(video_job.content_hash)) is not None
+
+    def _video_duration(self, video_job: VideoJob) -> Optional[float]:
+        media_metadata = MediaMetadata.from_dict(video_job.media_metadata)
+        if media_metadata:
+            return media_metadata.duration
+
+        # jobs registrados sem metadados: o ffprobe lê só o cabeçalho pela URL assinada, sem baixar o vídeo
+        video_url = self._storage_gateway.presign_url(
+            bucket=video_job.bucket,
+            key=f"{video_job.video_path}/{video_job.client_identification}/{video_job.job_ref}",
+        )
+        return self._video_processor.probe_duration(video_url)
+
+
+__all__ = ["DispatchVideoChunksUseCase"]
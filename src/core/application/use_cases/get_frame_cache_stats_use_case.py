@@ -0,0 +1,15 @@
+from src.core.domain.dtos.video_frame_extractor.frame_cache_stats_dto import FrameCacheStatsDTO
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
+
+class GetFrameCacheStatsUseCase:
+    def __init__(self, frame_cache_repository: IFrameCacheRepository):
+        self._frame_cache_repository = frame_cache_repository
+
+    @classmethod
+    def build(cls, frame_cache_repository: IFrameCacheRepository) -> "GetFrameCacheStatsUseCase":
+        return cls(frame_cache_repository)
+
+    async def execute(self) -> FrameCacheStatsDTO:
+        return FrameCacheStatsDTO.from_stats(self._frame_cache_repository.stats())
+
+__all__ = ["GetFrameCacheStatsUseCase"]
@@ -1,15 +1,55 @@
+import io
+import json
 import os
 import tempfile
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 
+from src.config.settings import (
+    CANCELLATION_POLL_INTERVAL_SECONDS,
+    CHECKPOINT_INTERVAL_SECONDS,
+    FRAME_KEY_SHARD_PREFIX_LENGTH,
+    FRAME_PIPELINE_BUFFER_SIZE,
+    FRAME_STREAMING_ENABLED,
+    PROGRESS_UPDATE_INTERVAL_SECONDS,
+)
+from src.core.constants.manifest_format import ManifestFormat
+from src.core.constants.video_job_status import VideoJobStatus
 from src.core.domain.dtos.video_frame_extractor.process_video_task_dto import ProcessVideoTaskDTO
+from src.core.domain.entities.bulk_upload_result import BulkUploadResult
+from src.core.domain.entities.frame_cache_entry import FrameCacheEntry
+from src.core.domain.entities.frame_extraction_config import FrameExtractionConfig
+from src.core.domain.entities.frame_key_layout import FrameKeyLayout
+from src.core.domain.entities.frame_manifest import FrameManifest
+from src.core.domain.entities.frame_rendition import RenditionFrame
+from src.core.domain.entities.frame_segment import FrameSegment
+from src.core.domain.entities.media_metadata import MediaMetadata
+from src.core.domain.entities.sprite_sheet import SpriteSheet
 from src.core.domain.entities.storage_item import StorageItem
+from src.core.domain.entities.video_frame import VideoFrame
 from src.core.domain.entities.video_job import VideoJob
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.exceptions.job_cancelled_exception import JobCancelledException
 from src.core.ports.gateways.callbacks.i_notification_gateway import INotificationGateway
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
 from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
 from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.shared.bounded_pipeline import BoundedPipeline
+from src.core.shared.frame_checkpoint_tracker import FrameCheckpointTracker
+from src.core.shared.job_cancellation_watcher import JobCancellationWatcher
+from src.core.shared.job_progress_tracker import JobProgressTracker
+from src.core.shared.multipart_upload_writer import MultipartUploadWriter
+from src.core.shared.tar_shard_writer import TarShardWriter
 from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+from src.infrastructure.video.frame_deduplicator import FrameDeduplicator
+
+# índice das sprite sheets / shards tar, gravado no prefixo do job
+FRAME_INDEX_NAME = "index.json"
+# sub-prefixo (dentro do prefixo de frames do job) com a parte do manifesto de cada trecho distribuído
+CHUNK_PARTS_DIR = "_chunks"
+# contadores de `BulkUploadResult.metrics` somados entre os lotes do job; os demais valores
+# (concorrência, latência, taxa de erro) são os do último lote
+UPLOAD_METRIC_COUNTERS = ("throttle_events", "errors", "successes", "retries")
+
 
 class ProcessVideoUseCase:
     def __init__(
@@ -18,12 +58,15 @@ class ProcessVideoUseCase:
         storage_gateway: ObjectStorageGateway,
         video_processor: FFmpegWrapper,
         notification_gateway: INotificationGateway,
+        frame_cache_repository: Optional[IFrameCacheRepository] = None,
     ):
         self._video_job_repository = video_job_repository
         self._storage_gateway = storage_gateway
         self._video_processor = video_processor
         self._notification_gateway = notification_gateway
-        
+        self._frame_cache_repository = frame_cache_repository
+        self._upload_metrics: Dict[str, Any] = {}
+
     def _send_notification(self, video_job: VideoJob, detail: str = None):
         notification = video_job.build_notification(detail=detail)
         self._notification_gateway.send_notification(
@@ -38,64 +81,683 @@ class ProcessVideoUseCase:
         storage_gateway: ObjectStorageGateway,
         video_processor: FFmpegWrapper,
         notification_gateway: INotificationGateway,
+        frame_cache_repository: Optional[IFrameCacheRepository] = None,
     ) -> "ProcessVideoUseCase":
-        return cls(video_job_repository, storage_gateway, video_processor, notification_gateway)
+        return cls(video_job_repository, storage_gateway, video_processor, notification_gateway, frame_cache_repository)
 
     def execute(self, dto: ProcessVideoTaskDTO):
-        video_job = self._video_job_repository.find_by_job_ref(dto.job_ref)
-        if not video_job:
-            raise EntityNotFoundException(message=f"VideoJob com job_ref {dto.job_ref} não encontrado.")
+        video_job = self._find_video_job(dto.job_ref)
+        if video_job.is_cancelled:
+            # cancelado antes de a revogação chegar ao worker: nada foi extraído ainda
+            raise JobCancelledException(video_job.job_ref)
         
         try:
-            video_job.start_processing()
-            self._video_job_repository.save(video_job)
-            
-            video_bytes = self._storage_gateway.download_object(
+            with self._cancellation_watcher(video_job) as cancellation:
+                return self._process(video_job, cancellation)
+        except JobCancelledException:
+            self._discard_cancelled(video_job)
+            raise
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            self._fail_job(video_job, f"Failed to process video: {e}")
+            raise
+
+    def _process(self, video_job: VideoJob, cancellation: JobCancellationWatcher) -> Dict[str, Any]:
+        # retry do Celery (ERROR) ou reentrega após a queda do worker (PROCESSING): parte dos frames já está no storage
+        retrying = video_job.status in (VideoJobStatus.PROCESSING.status, VideoJobStatus.ERROR.status)
+        video_job.start_processing()
+        if not self._video_job_repository.save_unless_cancelled(video_job):
+            raise JobCancelledException(video_job.job_ref)
+
+        frame_config = FrameExtractionConfig.from_dict(video_job.config)
+        cache_key = self._cache_key(video_job, frame_config)
+        if cache_key and self._materialize_from_cache(video_job, cache_key):
+            return self._complete_job(video_job)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_video_path = os.path.join(temp_dir, 'input_video')
+            self._storage_gateway.download_to_file(
                 bucket=video_job.bucket,
-                key=f"{video_job.video_path}/{video_job.client_identification}/{video_job.job_ref}"
+                key=f"{video_job.video_path}/{video_job.client_identification}/{video_job.job_ref}",
+                file_path=temp_video_path,
             )
+            cancellation.raise_if_cancelled()
+
+            frame_config = self._resolve_sampling(video_job, frame_config, temp_video_path)
+            progress = self._progress_tracker(video_job, frame_config)
+            if frame_config.sprites:
+                sprites = self._video_processor.iter_sprites(
+                    temp_video_path, frame_config, on_progress=progress.on_extraction
+                )
+                video_job.result = self._upload_sprites(cancellation.guard(sprites), video_job, frame_config, progress)
+            elif frame_config.renditions:
+                rendition_frames = self._video_processor.iter_renditions(
+                    temp_video_path, frame_config, on_progress=progress.on_extraction
+                )
+                with BoundedPipeline(rendition_frames, max_buffered=FRAME_PIPELINE_BUFFER_SIZE) as buffered_frames:
+                    video_job.result = self._upload_renditions(
+                        cancellation.guard(buffered_frames), video_job, frame_config, progress
+                    )
+            else:
+                deduplicator = self._build_deduplicator(frame_config)
+                checkpoint = self._checkpoint_tracker(video_job, frame_config)
+                frames = self._extract_frames(
+                    temp_video_path, temp_dir, frame_config, progress,
+                    start_tick=checkpoint.resume_tick if checkpoint else 0,
+                )
+                if deduplicator:
+                    frames = deduplicator.filter(frames)
+                dropped_frames = deduplicator.dropped if deduplicator else []
+                # upload acontece enquanto o ffmpeg ainda decodifica os próximos frames
+                with BoundedPipeline(frames, max_buffered=FRAME_PIPELINE_BUFFER_SIZE) as buffered_frames:
+                    # o cancelamento é checado antes de cada frame entrar no upload
+                    buffered_frames = cancellation.guard(buffered_frames)
+                    if frame_config.shards:
+                        video_job.result = self._upload_frame_shards(
+                            buffered_frames, video_job, frame_config, dropped_frames, progress
+                        )
+                    else:
+                        existing_keys = self._existing_frame_keys(video_job) if retrying else None
+                        # a mesma listagem traz as partes do manifesto gravadas pelo checkpoint
+                        manifest = FrameManifest(checkpoint.resumed_entries(existing_keys or ()) if checkpoint else ())
+                        resumed = len(manifest)
+                        try:
+                            uploaded = self._upload_frames_in_bulk(
+                                buffered_frames, video_job, frame_config, manifest, progress,
+                                skip_keys=existing_keys, checkpoint=checkpoint,
+                            )
+                        finally:
+                            if checkpoint:
+                                # grava até o último frame enviado, mesmo se o upload falhou no meio
+                                checkpoint.flush()
+                        if checkpoint:
+                            checkpoint.discard()
+                        manifest.add_dropped(dropped_frames)
+                        video_job.result = {
+                            **self._extraction_result(resumed + uploaded, len(dropped_frames)),
+                            "manifest": self._upload_manifest(manifest, video_job, frame_config),
+                            "key_layout": self._key_layout(video_job, frame_config).to_dict(),
+                        }
+            progress.finish()
+
+        cancellation.raise_if_cancelled()
+        return self._complete_job(video_job, cache_key)
+
+    def execute_chunk(self, dto: ProcessVideoTaskDTO, segment: FrameSegment) -> Dict[str, Any]:
+        """
+        Processa um trecho do vídeo no modo distribuído: extrai os frames do segmento direto da
+        URL assinada (sem baixar o vídeo inteiro) e envia-os ao storage. As entradas do manifesto
+        do trecho (e os frames descartados) vão para uma parte jsonl em `<prefixo de frames>/_chunks/`;
+        pelo chord volta só a contagem e a chave da parte. O job só é concluído por
+        `complete_chunks`, quando todos os trechos terminarem.
+        """
+        video_job = self._find_video_job(dto.job_ref)
+        if video_job.is_cancelled:
+            raise JobCancelledException(video_job.job_ref)
+        frame_config = FrameExtractionConfig.from_dict(video_job.config)
+        video_url = self._storage_gateway.presign_url(
+            bucket=video_job.bucket,
+            key=f"{video_job.video_path}/{video_job.client_identification}/{video_job.job_ref}",
+        )
+        frames = self._video_processor.iter_segment_frames(video_url, segment, frame_config)
+        deduplicator = self._build_deduplicator(frame_config)
+        if deduplicator:
+            frames = deduplicator.filter(frames)
+        manifest = FrameManifest()
+        try:
+            with self._cancellation_watcher(video_job) as cancellation:
+                uploaded = self._upload_frames_in_bulk(cancellation.guard(frames), video_job, frame_config, manifest)
+        except JobCancelledException:
+            self._discard_cancelled(video_job)
+            raise
+        print(f"Trecho {segment.start_tick}-{segment.end_tick} do job {video_job.job_ref}: {uploaded} frames enviados.")
+        manifest.add_dropped(deduplicator.dropped if deduplicator else [])
+        manifest_part = f"{self._chunk_parts_prefix(video_job)}{segment.start_tick:010d}.{ManifestFormat.JSONL.format}"
+        # o manifesto único é montado em `complete_chunks` a partir das partes
+        self._storage_gateway.upload_object(StorageItem(
+            bucket=video_job.bucket,
+            key=manifest_part,
+            content=manifest.serialize(ManifestFormat.JSONL),
+            content_type=ManifestFormat.JSONL.content_type,
+        ))
+        return {
+            "start_tick": segment.start_tick,
+            "end_tick": segment.end_tick,
+            "frames": uploaded,
+            "dropped_frames": len(manifest.dropped),
+            "manifest_part": manifest_part,
+            "upload_metrics": self._upload_metrics,
+        }
+
+    def complete_chunks(self, dto: ProcessVideoTaskDTO, chunk_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        video_job = self._find_video_job(dto.job_ref)
+        if video_job.is_cancelled:
+            # trechos que terminaram antes de perceber o cancelamento deixaram frames no prefixo
+            self._discard_cancelled(video_job)
+            raise JobCancelledException(video_job.job_ref)
+        total_frames = sum(result.get("frames", 0) for result in chunk_results)
+        for result in chunk_results:
+            self._record_upload_metrics(result.get("upload_metrics"))
+        print(f"Job {video_job.job_ref}: {len(chunk_results)} trechos concluídos, {total_frames} frames.")
+        manifest = self._merge_chunk_manifests(video_job, chunk_results)
+        frame_config = FrameExtractionConfig.from_dict(video_job.config)
+        video_job.result = {
+            **self._extraction_result(total_frames, len(manifest.dropped)),
+            "manifest": self._upload_manifest(manifest, video_job, frame_config),
+            "key_layout": self._key_layout(video_job, frame_config).to_dict(),
+        }
+        try:
+            payload = self._complete_job(video_job, self._cache_key(video_job, frame_config))
+        except JobCancelledException:
+            self._discard_cancelled(video_job)
+            raise
+        # só depois da conclusão: um retry desta task ainda precisa das partes para refazer o manifesto
+        self._storage_gateway.delete_prefix(video_job.bucket, self._chunk_parts_prefix(video_job))
+        return payload
+
+    def _merge_chunk_manifests(self, video_job: VideoJob, chunk_results: List[Dict[str, Any]]) -> FrameManifest:
+        """Junta as partes do manifesto gravadas pelos trechos; as linhas com `duplicate_of` são frames descartados."""
+        manifest = FrameManifest()
+        for result in chunk_results:
+            # um trecho interrompido pelo cancelamento não grava parte
+            if not result.get("manifest_part"):
+                continue
+            content = self._storage_gateway.download_object(video_job.bucket, result["manifest_part"])
+            lines = [json.loads(line) for line in content.decode("utf8").splitlines()]
+            manifest.extend(line for line in lines if "duplicate_of" not in line)
+            manifest.add_dropped(line for line in lines if "duplicate_of" in line)
+        return manifest
+
+    def fail_chunks(self, dto: ProcessVideoTaskDTO, reason: str):
+        video_job = self._find_video_job(dto.job_ref)
+        if video_job.is_cancelled:
+            # trechos interrompidos pelo cancelamento não tornam o job um erro
+            return
+        self._fail_job(video_job, f"Failed to process video: {reason}")
+
+    def _checkpoint_tracker(self, video_job: VideoJob, frame_config: FrameExtractionConfig) -> Optional[FrameCheckpointTracker]:
+        """
+        Só a extração frame a frame com grade de tempo é retomada do checkpoint: keyframe/scene não
+        têm como fazer seek em um frame pelo índice, a deduplicação depende do último frame mantido
+        e sprites/shards/renditions agregam vários frames por objeto. Nesses casos o retry extrai
+        tudo de novo, pulando só os objetos que já existem.
+        """
+        if (
+            not FRAME_STREAMING_ENABLED or not frame_config.mode.is_uniform or frame_config.deduplicates
+            or frame_config.shards
+        ):
+            return None
+        return FrameCheckpointTracker(
+            self._video_job_repository, self._storage_gateway, video_job, self._frames_prefix(video_job),
+            min_interval=CHECKPOINT_INTERVAL_SECONDS,
+        )
+
+    def _existing_frame_keys(self, video_job: VideoJob) -> Set[str]:
+        # uma única listagem do prefixo, em vez de um HEAD por frame
+        keys = {obj.key for obj in self._storage_gateway.list_objects(video_job.bucket, f"{self._frames_prefix(video_job)}/")}
+        print(f"Retry do job {video_job.job_ref}: {len(keys)} objetos já enviados.")
+        return keys
+
+    def _cancellation_watcher(self, video_job: VideoJob) -> JobCancellationWatcher:
+        return JobCancellationWatcher(
+            self._video_job_repository, video_job.job_ref, poll_interval=CANCELLATION_POLL_INTERVAL_SECONDS
+        )
+
+    def _discard_cancelled(self, video_job: VideoJob):
+        """Remove os frames já enviados por um job cancelado; o status CANCELLED foi gravado pela API."""
+        print(f"Job {video_job.job_ref} cancelado: removendo os frames parciais.")
+        self._storage_gateway.delete_prefix(video_job.bucket, f"{self._frames_prefix(video_job)}/")
+
+    def _progress_tracker(self, video_job: VideoJob, frame_config: FrameExtractionConfig) -> JobProgressTracker:
+        # o percentual usa a duração gravada no registro, limitada ao trecho pedido pelo job
+        media_metadata = MediaMetadata.from_dict(video_job.media_metadata)
+        return JobProgressTracker(
+            self._video_job_repository,
+            video_job,
+            total_seconds=frame_config.clip_duration(media_metadata.duration) if media_metadata else None,
+            min_interval=PROGRESS_UPDATE_INTERVAL_SECONDS,
+        )
+
+    def _resolve_sampling(
+        self, video_job: VideoJob, frame_config: FrameExtractionConfig, video_path: str
+    ) -> FrameExtractionConfig:
+        """Converte `frame_count` em fps/max_frames com a duração gravada no registro (ou lida do arquivo)."""
+        if not frame_config.frame_count:
+            return frame_config
+        media_metadata = MediaMetadata.from_dict(video_job.media_metadata)
+        duration = media_metadata.duration if media_metadata else self._video_processor.probe_duration(video_path)
+        return frame_config.for_duration(duration)
+
+    def _cache_key(self, video_job: VideoJob, frame_config: FrameExtractionConfig) -> Optional[str]:
+        if not self._frame_cache_repository or not video_job.content_hash:
+            return None
+        return frame_config.cache_key(video_job.content_hash)
+
+    def _materialize_from_cache(self, video_job: VideoJob, cache_key: str) -> bool:
+        """
+        Em um hit, copia no storage os frames já extraídos por um job anterior para o prefixo
+        deste job, sem baixar o vídeo nem rodar o ffmpeg. Se os frames referenciados não existem
+        mais (ou estão incompletos), a entrada é removida e o job segue pelo processamento normal.
+        """
+        entry = self._frame_cache_repository.find_by_cache_key(cache_key)
+        if not entry:
+            self._frame_cache_repository.record_lookup(hit=False)
+            return False
+
+        frames_prefix = self._frames_prefix(video_job)
+        if entry.job_ref == video_job.job_ref:
+            # retry de um job que já concluiu a extração: os frames já estão no próprio prefixo
+            video_job.result = entry.result
+            return True
+
+        copied = self._storage_gateway.copy_prefix(entry.bucket, entry.frames_prefix, video_job.bucket, frames_prefix)
+        if not copied or copied != self._stored_objects(entry.result, copied):
+            print(f"Cache do job {video_job.job_ref}: frames de {entry.job_ref} não existem mais, removendo entrada.")
+            if copied:
+                self._storage_gateway.delete_prefix(video_job.bucket, frames_prefix)
+            self._frame_cache_repository.delete(entry)
+            self._frame_cache_repository.record_lookup(hit=False)
+            return False
+
+        print(f"Cache hit do job {video_job.job_ref}: {copied} frames copiados de {entry.job_ref}.")
+        video_job.result = {**entry.result, "cached_from": entry.job_ref}
+        # a cópia nova vive mais que a original: a entrada passa a apontar para ela, a menos que
+        # a cópia também vá ser apagada após o processamento (mesma regra de `_store_in_cache`)
+        if not video_job.config.get("delete_after_processing"):
+            entry.point_to(video_job.bucket, frames_prefix, video_job.job_ref)
+            self._frame_cache_repository.save(entry)
+        self._frame_cache_repository.record_lookup(hit=True)
+        return True
+
+    def _store_in_cache(self, video_job: VideoJob, cache_key: Optional[str]):
+        # frames que serão apagados após o processamento não podem ser referenciados pelo cache
+        if not cache_key or video_job.config.get("delete_after_processing"):
+            return
+        self._frame_cache_repository.save(FrameCacheEntry(
+            cache_key=cache_key,
+            content_hash=video_job.content_hash,
+            bucket=video_job.bucket,
+            frames_prefix=self._frames_prefix(video_job),
+            job_ref=video_job.job_ref,
+            # as métricas de upload são deste job, não dos frames que um cache hit reaproveita
+            result={name: value for name, value in video_job.result.items() if name != "upload_metrics"},
+        ))
+
+    @staticmethod
+    def _stored_objects(result: Dict[str, Any], default: int) -> int:
+        # nos modos sprite e shard o prefixo guarda as sprites/shards e o índice, não um objeto por frame
+        if "sprites" in result:
+            return result["sprites"] + 1
+        if "shards" in result:
+            return len(result["shards"]) + 1
+        if "renditions" in result:
+            return sum(result["renditions"].values()) + (1 if result.get("manifest") else 0)
+        return result.get("frames", default) + (1 if result.get("manifest") else 0)
+
+    @staticmethod
+    def _frames_prefix(video_job: VideoJob) -> str:
+        return f"{video_job.frames_path}/{video_job.client_identification}/{video_job.job_ref}"
+
+    def _chunk_parts_prefix(self, video_job: VideoJob) -> str:
+        return f"{self._frames_prefix(video_job)}/{CHUNK_PARTS_DIR}/"
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_video_path = os.path.join(temp_dir, 'input_video')
-                with open(temp_video_path, 'wb') as f:
-                    f.write(video_bytes)
-
-                frame_paths = self._video_processor.extract_frames(temp_video_path, temp_dir)
-                self._upload_frames_in_bulk(frame_paths, video_job)
-
-            video_job.complete()
-            self._video_job_repository.save(video_job)
-            
-            self._send_notification(video_job)
-
-            return {
-                "job_ref": video_job.job_ref,
-                "client_identification": video_job.client_identification,
-                "bucket": video_job.bucket,
-                "frames_path": f"{video_job.frames_path}/{video_job.client_identification}/{video_job.job_ref}",
-                "notify_url": video_job.notify_url,
+    @staticmethod
+    def _key_layout(video_job: VideoJob, frame_config: FrameExtractionConfig) -> FrameKeyLayout:
+        """
+        Layout das chaves dos frames, dimensionado pela quantidade de frames prevista pelo probe do
+        registro. Depende só do job e da configuração, então retries e trechos distribuídos do mesmo
+        job chegam às mesmas chaves.
+        """
+        media_metadata = MediaMetadata.from_dict(video_job.media_metadata)
+        frame_count = frame_config.estimated_frames(media_metadata) if media_metadata else None
+        return FrameKeyLayout.for_frame_count(frame_count, shard_prefix_length=FRAME_KEY_SHARD_PREFIX_LENGTH)
+
+    def _find_video_job(self, job_ref: str) -> VideoJob:
+        video_job = self._video_job_repository.find_by_job_ref(job_ref)
+        if not video_job:
+            raise EntityNotFoundException(message=f"VideoJob com job_ref {job_ref} não encontrado.")
+        return video_job
+
+    def _complete_job(self, video_job: VideoJob, cache_key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Grava o job como COMPLETED, a menos que ele tenha sido cancelado depois da última checagem
+        do watcher: nesse caso a conclusão é descartada (`JobCancelledException`) e nada vai para o
+        cache nem para o zipper.
+        """
+        self._attach_upload_metrics(video_job)
+        video_job.complete()
+        if not self._video_job_repository.save_unless_cancelled(video_job):
+            raise JobCancelledException(video_job.job_ref)
+        self._store_in_cache(video_job, cache_key)
+
+        self._send_notification(video_job)
+
+        payload = {
+            "job_ref": video_job.job_ref,
+            "client_identification": video_job.client_identification,
+            "bucket": video_job.bucket,
+            "frames_path": f"{video_job.frames_path}/{video_job.client_identification}/{video_job.job_ref}",
+            "notify_url": video_job.notify_url,
+        }
+        if video_job.result and video_job.result.get("manifest"):
+            # uma leitura do manifesto substitui a listagem paginada do prefixo
+            payload["manifest"] = f"{payload['frames_path']}/{video_job.result['manifest']}"
+        if video_job.result and video_job.result.get("key_layout"):
+            # com chaves em diretórios de hash o prefixo só pode ser lido recursivamente (ou pelo manifesto)
+            payload["key_layout"] = video_job.result["key_layout"]
+        if video_job.result and video_job.result.get("renditions"):
+            # cada consumidor lê só o sub-prefixo da rendition que usa
+            payload["renditions"] = {
+                name: f"{payload['frames_path']}/{name}" for name in video_job.result["renditions"]
             }
+        if video_job.result and video_job.result.get("shards"):
+            # o zipper baixa poucos tar em vez de listar e baixar cada frame
+            payload["shards"] = [f"{payload['frames_path']}/{shard}" for shard in video_job.result["shards"]]
+            payload["shard_index"] = f"{payload['frames_path']}/{video_job.result['shard_index']}"
+        return payload
 
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            error_message = f"Failed to process video: {e}"
-            
-            if video_job:
-                video_job.fail(error_message)
-                self._video_job_repository.save(video_job)
+    def _fail_job(self, video_job: VideoJob, error_message: str):
+        if video_job:
+            # o throttling do storage costuma explicar a falha: as métricas ficam no job também
+            self._attach_upload_metrics(video_job)
+            video_job.fail(error_message)
+            # um job cancelado continua CANCELLED mesmo que o processamento tenha falhado em seguida
+            if self._video_job_repository.save_unless_cancelled(video_job):
                 self._send_notification(video_job, detail=error_message)
 
-            raise
+    def _extract_frames(
+        self,
+        video_path: str,
+        output_dir: str,
+        frame_config: FrameExtractionConfig,
+        progress: Optional[JobProgressTracker] = None,
+        start_tick: int = 0,
+    ) -> Iterator[VideoFrame]:
+        if FRAME_STREAMING_ENABLED:
+            # vídeos longos são divididos em segmentos paralelos; curtos seguem pelo pipe único
+            return self._video_processor.iter_frames_parallel(
+                video_path, frame_config, on_progress=progress.on_extraction if progress else None,
+                start_tick=start_tick,
+            )
+
+        # fallback: extração em diretório, relendo os arquivos gerados
+        frame_paths = self._video_processor.extract_frames(video_path, output_dir, frame_config)
+        return self._read_frame_files(frame_paths)
 
-    def _upload_frames_in_bulk(self, frame_paths: List[str], video_job: VideoJob):
-        for frame_path in frame_paths:
+    @staticmethod
+    def _read_frame_files(frame_paths: List[str]) -> Iterator[VideoFrame]:
+        for index, frame_path in enumerate(frame_paths):
             with open(frame_path, 'rb') as frame_file:
-                self._storage_gateway.upload_file_obj(
-                    StorageItem(
-                        bucket=video_job.bucket,
-                        key=f"{video_job.frames_path}/{video_job.client_identification}/{video_job.job_ref}/{os.path.basename(frame_path)}",
-                        file_object=frame_file,
-                        content_type='image/png'
-                    )
+                yield VideoFrame(index=index, pts=None, data=frame_file.read())
+
+    @staticmethod
+    def _build_deduplicator(frame_config: FrameExtractionConfig) -> Optional[FrameDeduplicator]:
+        if not frame_config.deduplicates:
+            return None
+        return FrameDeduplicator(max_distance=frame_config.dedup_max_distance)
+
+    @staticmethod
+    def _extraction_result(uploaded: int, dropped_frames: int = 0) -> Dict[str, Any]:
+        # o job guarda só quantos frames a deduplicação descartou: a lista fica no manifesto/índice,
+        # que não tem o limite de tamanho do documento
+        return {"frames": uploaded, "dropped_frames": dropped_frames}
+
+    @staticmethod
+    def _frame_metadata(frame: VideoFrame) -> Optional[Dict[str, str]]:
+        # timestamp do frame no vídeo de origem (essencial nos modos keyframe/scene, que não têm intervalo fixo)
+        if frame.pts is None:
+            return None
+        return {"pts": f"{frame.pts:.6f}"}
+
+    def _upload_frames_in_bulk(
+        self,
+        frames: Iterable[VideoFrame],
+        video_job: VideoJob,
+        frame_config: FrameExtractionConfig,
+        manifest: Optional[FrameManifest] = None,
+        progress: Optional[JobProgressTracker] = None,
+        skip_keys: Optional[Set[str]] = None,
+        checkpoint: Optional[FrameCheckpointTracker] = None,
+    ) -> int:
+        """
+        Envia os frames e retorna quantos estão no storage ao final, incluindo os que foram pulados
+        por já existirem (`skip_keys`, enviados por uma tentativa anterior).
+        """
+        frames_prefix = self._frames_prefix(video_job)
+        key_layout = self._key_layout(video_job, frame_config)
+        skipped = 0
+
+        def items() -> Iterator[StorageItem]:
+            nonlocal skipped
+            for frame in frames:
+                name = key_layout.frame_key(frame.index, frame_config.extension)
+                key = f"{frames_prefix}/{name}"
+                entry = manifest.add(frame, name) if manifest is not None else None
+                if progress:
+                    progress.on_uploaded()
+                if checkpoint:
+                    checkpoint.submitted(key, entry)
+                if skip_keys and key in skip_keys:
+                    skipped += 1
+                    if checkpoint:
+                        checkpoint.uploaded(key)
+                    continue
+                yield StorageItem(
+                    bucket=video_job.bucket,
+                    key=key,
+                    file_object=io.BytesIO(frame.data),
+                    content_type=frame_config.content_type,
+                    metadata=self._frame_metadata(frame),
                 )
+
+        result = self._storage_gateway.upload_items_bulk(
+            items(), on_uploaded=(lambda item: checkpoint.uploaded(item.key)) if checkpoint else None
+        )
+        return len(self._check_uploaded(result).uploaded) + skipped
+
+    def _upload_renditions(
+        self,
+        rendition_frames: Iterable[RenditionFrame],
+        video_job: VideoJob,
+        frame_config: FrameExtractionConfig,
+        progress: Optional[JobProgressTracker] = None,
+    ) -> Dict[str, Any]:
+        """
+        Envia cada rendition para o sub-prefixo `<prefixo do job>/<nome da rendition>`. O manifesto
+        único lista todas as renditions (a `key` relativa inclui o sub-prefixo) e `frames` conta os
+        frames extraídos, não os objetos: cada frame gera um objeto por rendition.
+        """
+        frames_prefix = self._frames_prefix(video_job)
+        key_layout = self._key_layout(video_job, frame_config)
+        manifest = FrameManifest()
+        counts = {rendition.name: 0 for rendition in frame_config.renditions}
+
+        def items() -> Iterator[StorageItem]:
+            for rendition, frame in rendition_frames:
+                name = key_layout.frame_key(frame.index, rendition.extension, directory=rendition.name)
+                manifest.add(frame, name)
+                counts[rendition.name] += 1
+                if progress and rendition == frame_config.renditions[-1]:
+                    # o frame conta como enviado quando a última rendition dele entra no upload
+                    progress.on_uploaded()
+                yield StorageItem(
+                    bucket=video_job.bucket,
+                    key=f"{frames_prefix}/{name}",
+                    file_object=io.BytesIO(frame.data),
+                    content_type=rendition.content_type,
+                    metadata=self._frame_metadata(frame),
+                )
+
+        self._check_uploaded(self._storage_gateway.upload_items_bulk(items()))
+        return {
+            **self._extraction_result(max(counts.values(), default=0)),
+            "renditions": counts,
+            "manifest": self._upload_manifest(manifest, video_job, frame_config),
+            "key_layout": key_layout.to_dict(),
+        }
+
+    def _upload_manifest(self, manifest: FrameManifest, video_job: VideoJob, frame_config: FrameExtractionConfig) -> str:
+        manifest_format = frame_config.manifest_format
+        self._storage_gateway.upload_object(StorageItem(
+            bucket=video_job.bucket,
+            key=f"{self._frames_prefix(video_job)}/{manifest_format.file_name}",
+            content=manifest.serialize(manifest_format),
+            content_type=manifest_format.content_type,
+        ))
+        return manifest_format.file_name
+
+    def _upload_sprites(
+        self,
+        sprites: Iterable[SpriteSheet],
+        video_job: VideoJob,
+        frame_config: FrameExtractionConfig,
+        progress: Optional[JobProgressTracker] = None,
+    ) -> Dict[str, Any]:
+        """
+        Envia as sprite sheets e um `index.json` que mapeia cada frame (índice e timestamp) para a
+        sprite e o deslocamento em pixels. As sprites são referenciadas pelo nome relativo ao prefixo
+        do job, que continua válido quando o cache copia os frames para outro job.
+        """
+        frames_prefix = self._frames_prefix(video_job)
+        uploaded_sprites: List[SpriteSheet] = []
+
+        def items() -> Iterator[StorageItem]:
+            for sprite in sprites:
+                # o índice só precisa das posições: a imagem é liberada depois do upload
+                uploaded_sprites.append(sprite._replace(data=b""))
+                if progress:
+                    progress.on_uploaded(len(sprite.tiles))
+                yield StorageItem(
+                    bucket=video_job.bucket,
+                    key=f"{frames_prefix}/{self._sprite_name(sprite, frame_config)}",
+                    file_object=io.BytesIO(sprite.data),
+                    content_type=frame_config.content_type,
+                )
+
+        self._check_uploaded(self._storage_gateway.upload_items_bulk(items()))
+
+        index = self._sprite_index(uploaded_sprites, frame_config)
+        self._storage_gateway.upload_object(StorageItem(
+            bucket=video_job.bucket,
+            key=f"{frames_prefix}/{FRAME_INDEX_NAME}",
+            content=json.dumps(index).encode("utf8"),
+            content_type="application/json",
+        ))
+        return {
+            **self._extraction_result(len(index["frames"])),
+            "sprites": len(uploaded_sprites),
+            "sprite_index": FRAME_INDEX_NAME,
+        }
+
+    def _upload_frame_shards(
+        self,
+        frames: Iterable[VideoFrame],
+        video_job: VideoJob,
+        frame_config: FrameExtractionConfig,
+        dropped_frames: List[Dict[str, Any]],
+        progress: Optional[JobProgressTracker] = None,
+    ) -> Dict[str, Any]:
+        """
+        Grava os frames em arquivos tar de até `shard_size_mb`, enviados por upload multipart à
+        medida que são escritos (nenhum tar inteiro fica em memória ou em disco). O `index.json`
+        mapeia cada frame para (shard, offset, length), então um frame isolado continua acessível
+        com um GET por intervalo de bytes, e lista os frames descartados pela deduplicação.
+        """
+        frames_prefix = self._frames_prefix(video_job)
+        key_layout = self._key_layout(video_job, frame_config)
+        shards: List[str] = []
+        index_frames: List[Dict[str, Any]] = []
+        writer: Optional[MultipartUploadWriter] = None
+        tar: Optional[TarShardWriter] = None
+        try:
+            for frame in frames:
+                entry_size = TarShardWriter.entry_size(len(frame.data))
+                if tar is None or (tar.members and tar.size + entry_size > frame_config.shard_size_bytes):
+                    if tar is not None:
+                        tar.close()
+                        writer.close()
+                    shards.append(f"shard_{len(shards):04d}.tar")
+                    writer = MultipartUploadWriter(
+                        self._storage_gateway, video_job.bucket, f"{frames_prefix}/{shards[-1]}",
+                        content_type="application/x-tar",
+                    )
+                    tar = TarShardWriter(writer)
+
+                # dentro do tar não há prefixo a espalhar: só a largura do índice vale
+                name = key_layout.file_name(frame.index, frame_config.extension)
+                offset, length = tar.add(name, frame.data)
+                index_frames.append({
+                    "index": frame.index, "pts": frame.pts, "name": name,
+                    "shard": shards[-1], "offset": offset, "length": length,
+                })
+                if progress:
+                    progress.on_uploaded()
+            if tar is not None:
+                tar.close()
+                writer.close()
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            raise
+
+        self._storage_gateway.upload_object(StorageItem(
+            bucket=video_job.bucket,
+            key=f"{frames_prefix}/{FRAME_INDEX_NAME}",
+            content=json.dumps({
+                "content_type": frame_config.content_type, "shards": shards, "frames": index_frames,
+                "dropped_frames": sorted(dropped_frames, key=lambda dropped: dropped["index"]),
+            }).encode("utf8"),
+            content_type="application/json",
+        ))
+        return {
+            **self._extraction_result(len(index_frames), len(dropped_frames)),
+            "shards": shards,
+            "shard_index": FRAME_INDEX_NAME,
+            "key_layout": key_layout.to_dict(),
+        }
+
+    @staticmethod
+    def _sprite_name(sprite: SpriteSheet, frame_config: FrameExtractionConfig) -> str:
+        return f"sprite_{sprite.index:04d}.{frame_config.extension}"
+
+    def _sprite_index(self, sprites: List[SpriteSheet], frame_config: FrameExtractionConfig) -> Dict[str, Any]:
+        sprites = sorted(sprites, key=lambda sprite: sprite.index)
+        return {
+            "columns": frame_config.sprite_columns,
+            "rows": frame_config.sprite_rows,
+            "tile_width": sprites[0].tile_width if sprites else None,
+            "tile_height": sprites[0].tile_height if sprites else None,
+            "sprites": [self._sprite_name(sprite, frame_config) for sprite in sprites],
+            "frames": [
+                {
+                    "index": tile.index,
+                    "pts": tile.pts,
+                    "sprite": self._sprite_name(sprite, frame_config),
+                    "x": tile.x,
+                    "y": tile.y,
+                }
+                for sprite in sprites
+                for tile in sprite.tiles
+            ],
+        }
+
+    def _check_uploaded(self, result: BulkUploadResult) -> BulkUploadResult:
+        self._record_upload_metrics(result.metrics)
+        if not result.ok:
+            failed_keys = ", ".join(failure.item.key for failure in result.failed[:5])
+            raise RuntimeError(f"{len(result.failed)} frame(s) failed to upload: {failed_keys}")
+        return result
+
+    def _record_upload_metrics(self, metrics: Optional[Dict[str, Any]]):
+        """Acumula as métricas de um lote de upload (ou de um trecho distribuído) nas do job."""
+        if not metrics:
+            return
+        self._upload_metrics = {
+            **metrics,
+            **{counter: self._upload_metrics.get(counter, 0) + metrics.get(counter, 0) for counter in UPLOAD_METRIC_COUNTERS},
+        }
+
+    def _attach_upload_metrics(self, video_job: VideoJob):
+        if self._upload_metrics:
+            video_job.result = {**(video_job.result or {}), "upload_metrics": self._upload_metrics}
@@ -1,12 +1,37 @@
-from src.config.settings import STORAGE_BUCKET, STORAGE_FRAMES_PATH, STORAGE_VIDEO_PATH
+import asyncio
+import hashlib
+from typing import AsyncIterator, Optional
+
+from src.config.settings import (
+    LONG_VIDEO_SECONDS,
+    STORAGE_BUCKET,
+    STORAGE_FRAMES_PATH,
+    STORAGE_VIDEO_PATH,
+    VIDEO_TASK_SECONDS_PER_VIDEO_SECOND,
+    VIDEO_TASK_TIME_LIMIT_MAX,
+    VIDEO_TASK_TIME_LIMIT_MIN,
+)
 from src.core.constants.video_job_status import VideoJobStatus
-from src.core.domain.dtos.video_frame_extractor.register_video_dto import RegisterVideoDTO
+from src.core.domain.dtos.video_frame_extractor.register_video_params_dto import (
+    MAX_VIDEO_FILE_SIZE,
+    MAX_VIDEO_FILE_SIZE_MESSAGE,
+    RegisterVideoParamsDTO,
+)
+from src.core.domain.entities.frame_extraction_config import FrameExtractionConfig
+from src.core.domain.entities.media_metadata import MediaMetadata
+from src.core.domain.entities.task_schedule import TaskSchedule
 from src.core.domain.entities.video_job import VideoJob
-from src.core.domain.entities.storage_item import StorageItem
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.exceptions.validation_exception import ValidationException
+from src.core.shared.multipart_upload_writer import MIN_PART_SIZE, MultipartUploadWriter
 from src.core.ports.gateways.callbacks.i_notification_gateway import INotificationGateway
 from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
 from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
 from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+
+# resolução de referência para a estimativa de custo (720p)
+REFERENCE_PIXELS = 1280 * 720
 
 class RegisterVideoUseCase:
     def __init__(
@@ -15,11 +40,13 @@ class RegisterVideoUseCase:
         storage_gateway: ObjectStorageGateway,
         task_gateway: ITaskQueueGateway,
         notification_gateway: INotificationGateway,
+        video_processor: FFmpegWrapper,
     ):
         self._video_job_repository = video_job_repository
         self._storage_gateway = storage_gateway
         self._task_gateway = task_gateway
         self._notification_gateway = notification_gateway
+        self._video_processor = video_processor
 
     @classmethod
     def build(
@@ -28,8 +55,9 @@ class RegisterVideoUseCase:
         storage_gateway: ObjectStorageGateway,
         task_gateway: ITaskQueueGateway,
         notification_gateway: INotificationGateway,
+        video_processor: FFmpegWrapper,
     ) -> "RegisterVideoUseCase":
-        return cls(video_job_repository, storage_gateway, task_gateway, notification_gateway)
+        return cls(video_job_repository, storage_gateway, task_gateway, notification_gateway, video_processor)
     
     def _send_notification(self, video_job: VideoJob):
         self._task_gateway.notification_status_callback(
@@ -39,61 +67,137 @@ class RegisterVideoUseCase:
             },
         )
 
-    async def execute(self, dto: RegisterVideoDTO, job_ref: str = '') -> VideoJob:
+    async def execute(
+        self,
+        dto: RegisterVideoParamsDTO,
+        video_chunks: AsyncIterator[bytes],
+        content_type: Optional[str] = None,
+        job_ref: str = '',
+    ) -> VideoJob:
+        """
+        Registra o vídeo recebido em streaming: cada pedaço que chega do cliente segue direto para
+        um upload multipart, sem arquivo temporário e sem o vídeo inteiro em memória. O limite de
+        tamanho e o hash do conteúdo são aplicados durante o envio; passou do limite, o upload é abortado.
+        """
+        saved_job = None
+        writer: Optional[MultipartUploadWriter] = None
         try:
-            video_job = self._video_job_repository.find_by_job_ref(job_ref)
-            if video_job:
-                video_job.reactivate()
-                video_job.status = VideoJobStatus.PENDING.status
-                video_job.error_message = None
-            else:
-                video_job = VideoJob(
-                    job_ref=job_ref,
-                    client_identification=dto.client_identification,
-                    status=VideoJobStatus.PENDING.status,
-                    bucket=STORAGE_BUCKET,
-                    video_path=STORAGE_VIDEO_PATH,
-                    frames_path=STORAGE_FRAMES_PATH,
-                    notify_url=dto.notify_url,
-                    config={},
-                )
-                video_job.id=None
-            saved_job = self._video_job_repository.save(video_job)
-
+            saved_job = self._video_job_repository.save(self._find_or_create_job(dto, job_ref))
             self._send_notification(saved_job)
-            storage_item = StorageItem(
-                bucket=STORAGE_BUCKET,
-                key=f"{STORAGE_VIDEO_PATH}/{video_job.client_identification}/{video_job.job_ref}",
-                file_object=dto.video_file.file,
-                content_type=dto.video_file.content_type
+
+            key = self._video_key(saved_job)
+            # partes mínimas: o primeiro byte chega ao storage cedo e a memória por upload fica pequena
+            writer = await asyncio.to_thread(
+                MultipartUploadWriter, self._storage_gateway, STORAGE_BUCKET, key, content_type, MIN_PART_SIZE
             )
-            self._storage_gateway.upload_file_obj(storage_item)
-
-            task_data = {
-                "job_ref": saved_job.job_ref,
-                "client_identification": saved_job.client_identification,
-                "bucket": saved_job.bucket,
-                "video_path": saved_job.video_path,
-                "frames_path": saved_job.frames_path,
-                "notify_url": saved_job.notify_url,
-                "config": saved_job.config,
-            }
-            self._task_gateway.enqueue_video_processing_task(task_data)
-            
-            saved_job.enqueue()
-            saved_job = self._video_job_repository.save(saved_job)
-            self._send_notification(saved_job)
+            content_hash = hashlib.sha256()
+            async for chunk in video_chunks:
+                if writer.tell() + len(chunk) > MAX_VIDEO_FILE_SIZE:
+                    raise ValidationException(field="video_file", expected_format=MAX_VIDEO_FILE_SIZE_MESSAGE)
+                content_hash.update(chunk)
+                # a escrita bloqueia quando há partes demais pendentes, o que segura a leitura do cliente
+                await asyncio.to_thread(writer.write, chunk)
+            if not writer.tell():
+                raise BadRequestException(message="Uploaded video file is empty")
+            await asyncio.to_thread(writer.close)
+            saved_job.content_hash = content_hash.hexdigest()
+
+            return await self._enqueue_uploaded_video(saved_job, STORAGE_BUCKET, key)
+        except BaseException as e:
+            if writer:
+                await asyncio.to_thread(writer.abort)
+            if saved_job:
+                self._fail_upload(saved_job, str(e) or type(e).__name__)
+            raise
+
+    def _find_or_create_job(self, dto: RegisterVideoParamsDTO, job_ref: str) -> VideoJob:
+        video_job = self._video_job_repository.find_by_job_ref(job_ref)
+        if video_job:
+            video_job.reactivate()
+            video_job.status = VideoJobStatus.PENDING.status
+            video_job.error_message = None
+            # o checkpoint de uma extração anterior não vale para o novo vídeo
+            video_job.checkpoint = {}
+            return video_job
+        video_job = VideoJob(
+            job_ref=job_ref,
+            client_identification=dto.client_identification,
+            status=VideoJobStatus.PENDING.status,
+            bucket=STORAGE_BUCKET,
+            video_path=STORAGE_VIDEO_PATH,
+            frames_path=STORAGE_FRAMES_PATH,
+            notify_url=dto.notify_url,
+            config=dto.job_config().model_dump(),
+        )
+        video_job.id=None
+        return video_job
 
-            return saved_job
-        except Exception as e:
-            if video_job:
-                video_job.fail(str(e))
-                video_job = self._video_job_repository.save(video_job)
-                self._storage_gateway.delete_object(
-                    bucket=STORAGE_BUCKET,
-                    key=f"{STORAGE_VIDEO_PATH}/{video_job.client_identification}/{video_job.job_ref}"
-                )
-                self._send_notification(video_job)
+    @staticmethod
+    def _video_key(video_job: VideoJob) -> str:
+        return f"{STORAGE_VIDEO_PATH}/{video_job.client_identification}/{video_job.job_ref}"
+
+    async def _enqueue_uploaded_video(self, saved_job: VideoJob, bucket: str, key: str) -> VideoJob:
+        """Valida o vídeo já armazenado, grava os metadados e enfileira a extração."""
+        media_metadata = await self._probe_upload(bucket, key)
+        saved_job.media_metadata = media_metadata.to_dict()
+        frame_config = FrameExtractionConfig.from_dict(saved_job.config)
+        if frame_config.start_offset >= media_metadata.duration:
+            raise BadRequestException(
+                message=f"start_seconds ({frame_config.start_offset}) is beyond the video duration ({media_metadata.duration}s)"
+            )
+
+        task_data = {
+            "job_ref": saved_job.job_ref,
+            "client_identification": saved_job.client_identification,
+            "bucket": saved_job.bucket,
+            "video_path": saved_job.video_path,
+            "frames_path": saved_job.frames_path,
+            "notify_url": saved_job.notify_url,
+            "config": saved_job.config,
+        }
+        # persiste hash/metadados e o status QUEUED antes de o worker poder ler o job
+        saved_job.enqueue()
+        if not self._video_job_repository.save_unless_cancelled(saved_job):
+            raise BadRequestException(message=f"VideoJob {saved_job.job_ref} was cancelled during registration")
+        task_id = self._task_gateway.enqueue_video_processing_task(task_data, self._build_task_schedule(media_metadata, frame_config))
+        # o id permite revogar a tarefa se o job for cancelado antes de um worker pegá-la
+        self._video_job_repository.add_task_id(saved_job.job_ref, task_id)
+        self._send_notification(saved_job)
+
+        return saved_job
+
+    def _fail_upload(self, video_job: VideoJob, reason: str):
+        video_job.fail(reason)
+        # um job cancelado durante o registro continua CANCELLED; o vídeo enviado é removido do mesmo jeito
+        saved = self._video_job_repository.save_unless_cancelled(video_job)
+        self._storage_gateway.delete_object(bucket=STORAGE_BUCKET, key=self._video_key(video_job))
+        if saved:
+            self._send_notification(video_job)
+
+    async def _probe_upload(self, bucket: str, key: str) -> MediaMetadata:
+        """Lê os metadados do vídeo já enviado (via URL assinada) e rejeita arquivos que não são vídeo."""
+        video_url = self._storage_gateway.presign_url(bucket=bucket, key=key)
+        try:
+            # o ffprobe lê o cabeçalho pela rede: roda fora do event loop para não travar as outras requisições
+            return await asyncio.to_thread(self._video_processor.probe_media, video_url)
+        except ValueError as e:
+            raise BadRequestException(message=f"Uploaded file is not a decodable video: {e}")
+
+    @staticmethod
+    def _build_task_schedule(
+        media_metadata: MediaMetadata, frame_config: Optional[FrameExtractionConfig] = None
+    ) -> TaskSchedule:
+        # o custo da extração é dominado pela decodificação: cresce com a duração do trecho e a resolução
+        frame_config = frame_config or FrameExtractionConfig()
+        decoded_seconds = frame_config.clip_duration(media_metadata.duration)
+        pixel_factor = max(1.0, media_metadata.pixels / REFERENCE_PIXELS)
+        estimated_seconds = decoded_seconds * VIDEO_TASK_SECONDS_PER_VIDEO_SECOND * pixel_factor
+        time_limit = int(min(VIDEO_TASK_TIME_LIMIT_MAX, max(VIDEO_TASK_TIME_LIMIT_MIN, 2 * estimated_seconds)))
+        return TaskSchedule(
+            time_limit=time_limit,
+            soft_time_limit=time_limit * 5 // 6,
+            long_running=decoded_seconds >= LONG_VIDEO_SECONDS,
+        )
 
 
 __all__ = ["RegisterVideoUseCase"]
@@ -0,0 +1,40 @@
+from enum import Enum
+
+class ExtractionMode(Enum):
+    INTERVAL = "interval"
+    KEYFRAME = "keyframe"
+    SCENE = "scene"
+
+    @property
+    def mode(self) -> str:
+        return self.value
+
+    @property
+    def is_uniform(self) -> bool:
+        """Indica se os frames seguem uma grade de tempo fixa (`FRAMES_PER_SECOND`)."""
+        return self == ExtractionMode.INTERVAL
+
+    @classmethod
+    def from_mode(cls, value: str) -> "ExtractionMode":
+        """
+        Retorna o modo correspondente ao nome informado (ex: "scene").
+        :raises ValueError: se o modo não for suportado.
+        """
+        for member in cls:
+            if member.mode == str(value).lower():
+                return member
+        raise ValueError(f"Unsupported extraction mode: {value}")
+
+    @classmethod
+    def mode_list(cls):
+        """
+        Retorna todos os modos de extração suportados.
+        :return: Lista com o nome dos modos.
+        """
+        return [member.mode for member in cls]
+
+    def __str__(self) -> str:
+        return self.mode
+
+
+__all__ = ["ExtractionMode"]
@@ -0,0 +1,43 @@
+from enum import Enum
+
+class FrameFormat(Enum):
+    PNG = ("png", "png", "image/png")
+    JPEG = ("jpeg", "jpg", "image/jpeg")
+    WEBP = ("webp", "webp", "image/webp")
+
+    @property
+    def format(self) -> str:
+        return self.value[0]
+
+    @property
+    def extension(self) -> str:
+        return self.value[1]
+
+    @property
+    def content_type(self) -> str:
+        return self.value[2]
+
+    @classmethod
+    def from_format(cls, value: str) -> "FrameFormat":
+        """
+        Retorna o formato correspondente ao nome informado (ex: "jpeg").
+        :raises ValueError: se o formato não for suportado.
+        """
+        for member in cls:
+            if member.format == str(value).lower():
+                return member
+        raise ValueError(f"Unsupported frame format: {value}")
+
+    @classmethod
+    def format_list(cls):
+        """
+        Retorna todos os formatos de frame suportados.
+        :return: Lista com o nome dos formatos.
+        """
+        return [member.format for member in cls]
+
+    def __str__(self) -> str:
+        return self.format
+
+
+__all__ = ["FrameFormat"]
@@ -0,0 +1,42 @@
+from enum import Enum
+
+class ManifestFormat(Enum):
+    JSONL = ("jsonl", "manifest.jsonl", "application/x-ndjson")
+    COLUMNAR = ("columnar", "manifest.json", "application/json")
+
+    @property
+    def format(self) -> str:
+        return self.value[0]
+
+    @property
+    def file_name(self) -> str:
+        return self.value[1]
+
+    @property
+    def content_type(self) -> str:
+        return self.value[2]
+
+    @classmethod
+    def from_format(cls, value: str) -> "ManifestFormat":
+        """
+        Retorna o formato de manifesto correspondente ao nome informado (ex: "columnar").
+        :raises ValueError: se o formato não for suportado.
+        """
+        for member in cls:
+            if member.format == str(value).lower():
+                return member
+        raise ValueError(f"Unsupported manifest format: {value}")
+
+    @classmethod
+    def format_list(cls):
+        """
+        Retorna todos os formatos de manifesto suportados.
+        :return: Lista com o nome dos formatos.
+        """
+        return [member.format for member in cls]
+
+    def __str__(self) -> str:
+        return self.format
+
+
+__all__ = ["ManifestFormat"]
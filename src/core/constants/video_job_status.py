@@ -6,6 +6,7 @@ class VideoJobStatus(Enum):
     PROCESSING = ("PROCESSING", "Processing in progress")
     COMPLETED = ("COMPLETED", "Processing completed")
     ERROR = ("ERROR", "An error occurred during processing")
+    CANCELLED = ("CANCELLED", "Processing cancelled by the client")
     
     @property
     def status(self) -> str:
@@ -2,12 +2,24 @@ from dependency_injector import containers, providers
 from src.config.celery_app import celery_app
 
 from src.config.database import get_db
+from src.config.settings import (
+    STORAGE_ENDPOINT_URL,
+    STORAGE_FAULT_INJECTION,
+    STORAGE_PROVIDER,
+    STORAGE_UPLOAD_CONCURRENCY,
+    STORAGE_UPLOAD_RETRY_DEADLINE_SECONDS,
+)
+from src.core.domain.entities.storage_config import StorageConfig
 from src.core.ports.gateways.zipper.i_zipper_gateway import IZipperGateway
 from src.core.shared.identity_map import IdentityMap
+from src.infrastructure.gateways.filesystem_storage_gateway import FileSystemStorageGateway
+from src.infrastructure.gateways.in_memory_storage_gateway import InMemoryStorageGateway
 from src.infrastructure.gateways.s3_storage_gateway import S3StorageGateway
 from src.infrastructure.gateways.zipper_gateway import ZipperServiceGateway
 from src.infrastructure.repositories.mongoengine.video_job_repository import MongoVideoJobRepository
+from src.infrastructure.repositories.mongoengine.frame_cache_repository import MongoFrameCacheRepository
 from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
 from src.infrastructure.gateways.celery_task_queue_gateway import CeleryTaskQueueGateway
 from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
 from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
@@ -22,6 +34,7 @@ class Container(containers.DeclarativeContainer):
         "src.infrastructure.tasks.video_tasks",
         "src.presentation.api.v1.controllers.video_controller",
         "src.core.application.use_cases.process_video_use_case",
+        "src.core.application.use_cases.dispatch_video_chunks_use_case",
         "src.core.application.use_cases.register_video_use_case",
         "src.core.application.use_cases.send_video_to_zipper_use_case",
         "src.infrastructure.gateways.s3_storage_gateway",
@@ -29,6 +42,7 @@ class Container(containers.DeclarativeContainer):
         "src.infrastructure.gateways.zipper_gateway",
         "src.infrastructure.gateways.notification_gateway",
         "src.infrastructure.repositories.mongoengine.video_job_repository",
+        "src.infrastructure.repositories.mongoengine.frame_cache_repository",
         "src.infrastructure.tasks.notification_task"
     ])
 
@@ -37,8 +51,20 @@ class Container(containers.DeclarativeContainer):
 
     celery_app_provider = providers.Object(celery_app)
 
-    object_storage_gateway: providers.Singleton[ObjectStorageGateway] = providers.Singleton(
-        S3StorageGateway
+    storage_config = providers.Singleton(
+        StorageConfig,
+        provider=STORAGE_PROVIDER,
+        endpoint_url=STORAGE_ENDPOINT_URL,
+        max_concurrency=STORAGE_UPLOAD_CONCURRENCY,
+        upload_retry_deadline=STORAGE_UPLOAD_RETRY_DEADLINE_SECONDS,
+        extra={"fault_injection": STORAGE_FAULT_INJECTION},
+    )
+
+    object_storage_gateway: providers.Selector[ObjectStorageGateway] = providers.Selector(
+        providers.Object(STORAGE_PROVIDER),
+        s3=providers.Singleton(S3StorageGateway, storage_config=storage_config),
+        filesystem=providers.Singleton(FileSystemStorageGateway, storage_config=storage_config),
+        memory=providers.Singleton(InMemoryStorageGateway, storage_config=storage_config),
     )
 
     notification_gateway = providers.Factory(NotificationGateway)
@@ -52,6 +78,10 @@ class Container(containers.DeclarativeContainer):
     video_job_repository: providers.Factory[IVideoJobRepository] = providers.Factory(
         MongoVideoJobRepository
     )
+
+    frame_cache_repository: providers.Factory[IFrameCacheRepository] = providers.Factory(
+        MongoFrameCacheRepository
+    )
     
     zipper_gateway = providers.Factory[IZipperGateway](ZipperServiceGateway)
 
@@ -61,4 +91,6 @@ class Container(containers.DeclarativeContainer):
         storage_gateway=object_storage_gateway,
         task_gateway=task_queue_gateway,
         notification_gateway=notification_gateway,
+        video_processor=ffmpeg_wrapper,
+        frame_cache_repository=frame_cache_repository,
     )
@@ -0,0 +1,24 @@
+from typing import List
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class UploadedPartDTO(BaseModel):
+    part_number: int = Field(..., ge=1, le=10000)
+    etag: str = Field(..., min_length=1, description="Header ETag devolvido pelo PUT da parte")
+
+
+class ConfirmVideoUploadDTO(BaseModel):
+    parts: List[UploadedPartDTO] = Field(
+        default_factory=list, description="Partes enviadas, obrigatórias quando o upload é multipart"
+    )
+
+    @field_validator('parts')
+    @classmethod
+    def validate_parts(cls, value: List[UploadedPartDTO]):
+        numbers = [part.part_number for part in value]
+        if len(set(numbers)) != len(numbers):
+            raise ValueError('part numbers must be unique')
+        return value
+
+__all__ = ["ConfirmVideoUploadDTO", "UploadedPartDTO"]
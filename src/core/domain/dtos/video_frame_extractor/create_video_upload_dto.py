@@ -0,0 +1,39 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from src.config.settings import DIRECT_UPLOAD_MAX_SIZE_MB
+from src.core.domain.dtos.video_frame_extractor.register_video_config_dto import RegisterVideoConfigDTO
+
+
+class CreateVideoUploadDTO(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    client_identification: str = Field(..., description="Identificação do cliente/usuário")
+    notify_url: Optional[str] = Field(None, description="URL de callback para notificação")
+    size: int = Field(..., gt=0, description="Tamanho do vídeo em bytes; o upload precisa ter exatamente esse tamanho")
+    content_type: Optional[str] = Field(
+        None, pattern=r"^[\w.+-]+/[\w.+-]+$", description="Content-Type do vídeo, exigido no upload (ex: video/mp4)"
+    )
+    config: Optional[RegisterVideoConfigDTO] = Field(
+        None, description='Configuração do job, ex: {"frame_format": "jpeg", "quality": 85, "fps": 2}'
+    )
+
+    @field_validator('notify_url')
+    @classmethod
+    def validate_notify_url(cls, value):
+        if value is not None and not value.startswith(('http://', 'https://')):
+            raise ValueError('notify_url must be a valid URL starting with http:// or https://')
+        return value
+
+    @field_validator('size')
+    @classmethod
+    def validate_size(cls, value: int):
+        if value > DIRECT_UPLOAD_MAX_SIZE_MB * 1024 * 1024:
+            raise ValueError(f'Video file size exceeds the maximum limit of {DIRECT_UPLOAD_MAX_SIZE_MB}MB')
+        return value
+
+    def job_config(self) -> RegisterVideoConfigDTO:
+        return self.config or RegisterVideoConfigDTO()
+
+__all__ = ["CreateVideoUploadDTO"]
@@ -0,0 +1,21 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+class FrameCacheStatsDTO(BaseModel):
+    hits: int
+    misses: int
+    entries: int
+    hit_ratio: float
+
+    @classmethod
+    def from_stats(cls, stats: Dict[str, int]) -> "FrameCacheStatsDTO":
+        lookups = stats["hits"] + stats["misses"]
+        return cls(
+            hits=stats["hits"],
+            misses=stats["misses"],
+            entries=stats["entries"],
+            hit_ratio=round(stats["hits"] / lookups, 4) if lookups else 0.0,
+        )
+
+__all__ = ["FrameCacheStatsDTO"]
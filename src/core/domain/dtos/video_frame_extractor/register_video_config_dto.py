@@ -1,6 +1,68 @@
-from pydantic import BaseModel, ConfigDict
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.core.domain.dtos.video_frame_extractor.rendition_config_dto import RenditionConfigDTO
 
 class RegisterVideoConfigDTO(BaseModel):
     model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
     
-    delete_after_processing: bool
+    delete_after_processing: bool = False
+    frame_format: Literal["png", "jpeg", "webp"] = Field("png", description="Formato de saída dos frames")
+    quality: Optional[int] = Field(None, ge=1, le=100, description="Qualidade de 1 a 100 (jpeg/webp)")
+    max_width: Optional[int] = Field(None, gt=0, description="Largura máxima dos frames, em pixels")
+    max_height: Optional[int] = Field(None, gt=0, description="Altura máxima dos frames, em pixels")
+    mode: Literal["interval", "keyframe", "scene"] = Field(
+        "interval", description="Frames extraídos: a intervalo fixo, só keyframes ou só trocas de cena"
+    )
+    scene_threshold: Optional[float] = Field(
+        None, gt=0, lt=1, description="Sensibilidade do modo scene (0-1); padrão 0.3"
+    )
+    dedup_max_distance: Optional[int] = Field(
+        None, ge=0, le=64, description="Descarta frames a até N bits (dHash) do último frame mantido"
+    )
+    sprite_columns: Optional[int] = Field(
+        None, ge=1, le=16, description="Colunas de cada sprite sheet; com sprite_rows, agrupa os frames em sprites"
+    )
+    sprite_rows: Optional[int] = Field(None, ge=1, le=16, description="Linhas de cada sprite sheet")
+    shard_size_mb: Optional[int] = Field(
+        None, ge=1, le=5120, description="Grava os frames em arquivos tar de até N MiB, com índice por intervalo de bytes"
+    )
+    manifest_format: Literal["jsonl", "columnar"] = Field(
+        "jsonl", description="Formato do manifesto de frames: uma linha JSON por frame ou uma lista por campo"
+    )
+    start_seconds: Optional[float] = Field(None, ge=0, description="Início do trecho extraído, em segundos")
+    end_seconds: Optional[float] = Field(None, gt=0, description="Fim do trecho extraído, em segundos")
+    fps: Optional[float] = Field(None, gt=0, le=60, description="Frames por segundo do job (modo interval)")
+    max_frames: Optional[int] = Field(None, ge=1, description="Quantidade máxima de frames extraídos")
+    frame_count: Optional[int] = Field(
+        None, ge=1, le=1000, description="Extrai N frames igualmente espaçados no trecho (modo interval)"
+    )
+    renditions: Optional[List[RenditionConfigDTO]] = Field(
+        None, min_length=1, max_length=8,
+        description="Gera cada frame em vários tamanhos/formatos com uma única decodificação, um sub-prefixo por rendition",
+    )
+
+    @model_validator(mode="after")
+    def validate_sprite_layout(self):
+        if (self.sprite_columns is None) != (self.sprite_rows is None):
+            raise ValueError("sprite_columns and sprite_rows must be set together")
+        if self.sprite_columns is not None and self.dedup_max_distance is not None:
+            raise ValueError("dedup_max_distance is not supported with sprite sheets")
+        if self.sprite_columns is not None and self.shard_size_mb is not None:
+            raise ValueError("shard_size_mb is not supported with sprite sheets")
+        if self.start_seconds is not None and self.end_seconds is not None and self.end_seconds <= self.start_seconds:
+            raise ValueError("end_seconds must be greater than start_seconds")
+        if self.frame_count is not None and self.fps is not None:
+            raise ValueError("frame_count and fps cannot be set together")
+        if self.frame_count is not None and self.mode != "interval":
+            raise ValueError("frame_count is only supported in interval mode")
+        if self.renditions is not None:
+            names = [rendition.name for rendition in self.renditions]
+            if len(set(names)) != len(names):
+                raise ValueError("rendition names must be unique")
+            if self.sprite_columns is not None or self.shard_size_mb is not None or self.dedup_max_distance is not None:
+                raise ValueError("renditions are not supported with sprite sheets, tar shards or dedup")
+        return self
+
+__all__ = ["RegisterVideoConfigDTO"]
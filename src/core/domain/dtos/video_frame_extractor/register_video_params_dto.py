@@ -0,0 +1,42 @@
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Optional
+
+from src.core.domain.dtos.video_frame_extractor.register_video_config_dto import RegisterVideoConfigDTO
+
+# limite do arquivo de vídeo do registro (a mensagem anuncia 200MB, com folga)
+MAX_VIDEO_FILE_SIZE = 210 * 1024 * 1024
+MAX_VIDEO_FILE_SIZE_MESSAGE = 'Video file size exceeds the maximum limit of 200MB'
+
+
+class RegisterVideoParamsDTO(BaseModel):
+    """Parâmetros do registro de vídeo (query string); o arquivo chega no corpo da requisição."""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    client_identification: str = Field(..., description="Identificação do cliente/usuário")
+    notify_url: Optional[str] = Field(None, description="URL de callback para notificação")
+    config: Optional[str] = Field(
+        None,
+        description='Configuração do job em JSON, ex: {"frame_format": "jpeg", "quality": 85, "max_width": 1280, "start_seconds": 30, "end_seconds": 90, "fps": 2}',
+    )
+
+    @field_validator('notify_url')
+    @classmethod
+    def validate_notify_url(cls, value):
+        if value is not None and not value.startswith(('http://', 'https://')):
+            raise ValueError('notify_url must be a valid URL starting with http:// or https://')
+        return value
+
+    @field_validator('config')
+    @classmethod
+    def validate_config(cls, value):
+        if value:
+            RegisterVideoConfigDTO.model_validate_json(value)
+        return value
+
+    def job_config(self) -> RegisterVideoConfigDTO:
+        if not self.config:
+            return RegisterVideoConfigDTO()
+        return RegisterVideoConfigDTO.model_validate_json(self.config)
+
+__all__ = ["RegisterVideoParamsDTO", "MAX_VIDEO_FILE_SIZE", "MAX_VIDEO_FILE_SIZE_MESSAGE"]
@@ -0,0 +1,24 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.core.domain.entities.frame_rendition import FrameRendition
+
+class RenditionConfigDTO(BaseModel):
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+    name: Optional[str] = Field(
+        None, pattern=r"^[A-Za-z0-9_-]{1,32}$", description="Sub-prefixo da rendition; padrão derivado do tamanho e formato"
+    )
+    format: Literal["png", "jpeg", "webp"] = Field("png", description="Formato dos frames da rendition")
+    width: Optional[int] = Field(None, gt=0, description="Largura máxima dos frames da rendition, em pixels")
+    height: Optional[int] = Field(None, gt=0, description="Altura máxima dos frames da rendition, em pixels")
+    quality: Optional[int] = Field(None, ge=1, le=100, description="Qualidade de 1 a 100 (jpeg/webp)")
+
+    @model_validator(mode="after")
+    def fill_default_name(self):
+        if self.name is None:
+            self.name = FrameRendition.default_name(self.width, self.height, self.format)
+        return self
+
+__all__ = ["RenditionConfigDTO"]
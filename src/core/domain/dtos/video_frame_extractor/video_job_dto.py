@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Any, Dict, Optional
 
 from src.core.domain.entities.video_job import VideoJob
 
@@ -10,6 +11,11 @@ class VideoJobDTO(BaseModel):
     status: str
     created_at: datetime
     updated_at: datetime
+    media_metadata: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
+    content_hash: Optional[str] = None
+    manifest_key: Optional[str] = None
+    progress: Optional[Dict[str, Any]] = None
 
     @classmethod
     def from_entity(cls, entity: VideoJob) -> "VideoJobDTO":
@@ -20,6 +26,18 @@ class VideoJobDTO(BaseModel):
             status=entity.status,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
+            media_metadata=entity.media_metadata or None,
+            result=entity.result or None,
+            content_hash=entity.content_hash,
+            manifest_key=cls._manifest_key(entity),
+            progress=entity.progress or None,
         )
 
+    @staticmethod
+    def _manifest_key(entity: VideoJob) -> Optional[str]:
+        manifest = (entity.result or {}).get("manifest")
+        if not manifest:
+            return None
+        return f"{entity.frames_path}/{entity.client_identification}/{entity.job_ref}/{manifest}"
+
 __all__ = ["VideoJobDTO"]
@@ -0,0 +1,31 @@
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class UploadPartUrlDTO(BaseModel):
+    part_number: int
+    url: str
+
+
+class VideoUploadDTO(BaseModel):
+    """
+    Instruções para o cliente enviar o vídeo direto ao storage.
+
+    `method` POST: enviar um form multipart para `url` com todos os `fields` e o arquivo no campo `file`.
+    `method` MULTIPART: enviar cada trecho de `part_size` bytes com PUT na URL da sua parte e guardar o
+    header `ETag` da resposta. Em ambos os casos, concluir com `POST /video/{job_ref}/upload/confirm`
+    (no multipart, informando os pares part_number/etag).
+    """
+
+    job_ref: str
+    status: str
+    method: Literal["POST", "MULTIPART"]
+    expires_in: int = Field(..., description="Validade das URLs, em segundos")
+    url: Optional[str] = None
+    fields: Optional[Dict[str, Any]] = None
+    upload_id: Optional[str] = None
+    part_size: Optional[int] = None
+    parts: Optional[List[UploadPartUrlDTO]] = None
+
+__all__ = ["VideoUploadDTO", "UploadPartUrlDTO"]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from src.core.domain.entities.storage_item import StorageItem
+from src.core.domain.entities.storage_object import StorageObject
+
+
+@dataclass
+class BulkUploadFailure:
+    item: StorageItem
+    error: Exception
+
+
+@dataclass
+class BulkUploadResult:
+    """
+    Resultado de um upload em lote: objetos enviados e itens que falharam, um a um.
+    `metrics` traz a concorrência do gateway ao final do lote e os eventos de throttling/retries do lote.
+    """
+    uploaded: List[StorageObject] = field(default_factory=list)
+    failed: List[BulkUploadFailure] = field(default_factory=list)
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+
+__all__ = ["BulkUploadResult", "BulkUploadFailure"]
@@ -0,0 +1,18 @@
+from typing import NamedTuple
+
+
+class ExtractionProgress(NamedTuple):
+    """
+    Progresso informado pelo ffmpeg (`-progress`) durante a extração.
+
+    Parâmetros:
+    - frames (int): Frames gerados até o momento.
+    - out_time (float): Posição já processada do trecho extraído, em segundos.
+    - done (bool): Indica o último bloco de progresso, emitido quando o ffmpeg termina.
+    """
+    frames: int
+    out_time: float
+    done: bool = False
+
+
+__all__ = ["ExtractionProgress"]
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from src.core.domain.entities.base_entity import BaseEntity
+
+
+class FrameCacheEntry(BaseEntity):
+    """
+    Índice do cache de resultados: aponta, para um vídeo (hash do conteúdo) + configuração de
+    extração, o prefixo onde um job anterior já deixou os frames prontos.
+
+    A entrada vive enquanto os frames referenciados existirem: a cada hit ela passa a apontar
+    para a cópia mais recente, e é removida quando o prefixo referenciado não existe mais.
+    """
+
+    def __init__(
+        self,
+        cache_key: str,
+        content_hash: str,
+        bucket: str,
+        frames_prefix: str,
+        job_ref: str,
+        result: Optional[Dict[str, Any]] = None,
+        hits: int = 0,
+        id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        inactivated_at: Optional[datetime] = None,
+    ):
+        super().__init__(
+            id=id,
+            created_at=created_at or datetime.now(),
+            updated_at=updated_at or datetime.now(),
+            inactivated_at=inactivated_at,
+        )
+        self.cache_key = cache_key
+        self.content_hash = content_hash
+        self.bucket = bucket
+        self.frames_prefix = frames_prefix
+        self.job_ref = job_ref
+        self.result = result or {}
+        self.hits = hits
+
+    def point_to(self, bucket: str, frames_prefix: str, job_ref: str):
+        """Passa a referenciar a cópia de um job mais novo, que vai durar mais que a original."""
+        self.bucket = bucket
+        self.frames_prefix = frames_prefix
+        self.job_ref = job_ref
+        self.hits += 1
+        self.updated_at = datetime.now()
+
+
+__all__ = ["FrameCacheEntry"]
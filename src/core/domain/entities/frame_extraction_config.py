@@ -0,0 +1,205 @@
+from __future__ import annotations
+import hashlib
+import json
+import math
+from dataclasses import dataclass, replace
+from fractions import Fraction
+from typing import Any, Dict, Optional, Tuple
+
+from src.config.settings import FRAMES_PER_SECOND
+from src.core.constants.extraction_mode import ExtractionMode
+from src.core.constants.frame_format import FrameFormat
+from src.core.constants.manifest_format import ManifestFormat
+from src.core.domain.entities.frame_rendition import FrameRendition
+from src.core.domain.entities.media_metadata import MediaMetadata
+
+DEFAULT_SCENE_THRESHOLD = 0.3
+
+
+@dataclass(frozen=True)
+class FrameExtractionConfig:
+    """
+    Parâmetros de codificação dos frames de um job, lidos de `VideoJob.config`.
+
+    `quality` vai de 1 (menor arquivo) a 100 (melhor qualidade) e é ignorado para PNG.
+    `max_width`/`max_height` reduzem o frame mantendo a proporção; nunca ampliam.
+    `mode` define quais frames são extraídos: um a cada intervalo fixo, só os keyframes (I-frames)
+    ou só as trocas de cena cujo score (0-1) passa de `scene_threshold`.
+    `dedup_max_distance`, quando definido, descarta frames quase idênticos ao último mantido.
+    `sprite_columns`/`sprite_rows`, quando definidos, agrupam os frames em sprite sheets dessa grade.
+    `shard_size_mb`, quando definido, grava os frames em arquivos tar de até esse tamanho.
+    `manifest_format` define o formato do manifesto gravado junto aos frames (jsonl ou columnar).
+    `start_seconds`/`end_seconds` limitam a extração a um trecho do vídeo (o resto nem é decodificado);
+    `fps` substitui `FRAMES_PER_SECOND` para o job e `max_frames` limita a quantidade de frames.
+    `frame_count` pede N frames igualmente espaçados no trecho: vira `fps`/`max_frames` em `for_duration`.
+    `renditions`, quando definido, gera cada frame em vários tamanhos/formatos a partir de uma única
+    decodificação; nesse caso formato, qualidade e tamanho vêm de cada rendition.
+    """
+
+    frame_format: FrameFormat = FrameFormat.PNG
+    quality: Optional[int] = None
+    max_width: Optional[int] = None
+    max_height: Optional[int] = None
+    mode: ExtractionMode = ExtractionMode.INTERVAL
+    scene_threshold: float = DEFAULT_SCENE_THRESHOLD
+    dedup_max_distance: Optional[int] = None
+    sprite_columns: Optional[int] = None
+    sprite_rows: Optional[int] = None
+    shard_size_mb: Optional[int] = None
+    manifest_format: ManifestFormat = ManifestFormat.JSONL
+    start_seconds: Optional[float] = None
+    end_seconds: Optional[float] = None
+    fps: Optional[float] = None
+    max_frames: Optional[int] = None
+    frame_count: Optional[int] = None
+    renditions: Tuple[FrameRendition, ...] = ()
+
+    @classmethod
+    def from_dict(cls, config: Optional[Dict[str, Any]]) -> "FrameExtractionConfig":
+        config = config or {}
+        return cls(
+            frame_format=FrameFormat.from_format(config.get("frame_format") or FrameFormat.PNG.format),
+            quality=config.get("quality"),
+            max_width=config.get("max_width"),
+            max_height=config.get("max_height"),
+            mode=ExtractionMode.from_mode(config.get("mode") or ExtractionMode.INTERVAL.mode),
+            scene_threshold=config.get("scene_threshold") or DEFAULT_SCENE_THRESHOLD,
+            dedup_max_distance=config.get("dedup_max_distance"),
+            sprite_columns=config.get("sprite_columns"),
+            sprite_rows=config.get("sprite_rows"),
+            shard_size_mb=config.get("shard_size_mb"),
+            manifest_format=ManifestFormat.from_format(config.get("manifest_format") or ManifestFormat.JSONL.format),
+            start_seconds=config.get("start_seconds"),
+            end_seconds=config.get("end_seconds"),
+            fps=config.get("fps"),
+            max_frames=config.get("max_frames"),
+            frame_count=config.get("frame_count"),
+            renditions=tuple(FrameRendition.from_dict(rendition) for rendition in config.get("renditions") or ()),
+        )
+
+    @property
+    def extension(self) -> str:
+        return self.frame_format.extension
+
+    @property
+    def content_type(self) -> str:
+        return self.frame_format.content_type
+
+    @property
+    def resizes(self) -> bool:
+        return bool(self.max_width or self.max_height)
+
+    @property
+    def deduplicates(self) -> bool:
+        return self.dedup_max_distance is not None
+
+    @property
+    def sprites(self) -> bool:
+        return bool(self.sprite_columns and self.sprite_rows)
+
+    @property
+    def shards(self) -> bool:
+        return bool(self.shard_size_mb)
+
+    @property
+    def shard_size_bytes(self) -> int:
+        return self.shard_size_mb * 1024 * 1024 if self.shards else 0
+
+    @property
+    def tiles_per_sprite(self) -> int:
+        return self.sprite_columns * self.sprite_rows if self.sprites else 1
+
+    def for_rendition(self, rendition: FrameRendition) -> "FrameExtractionConfig":
+        """Configuração de codificação de uma rendition: mesma amostragem, com o formato e o tamanho dela."""
+        return replace(
+            self,
+            frame_format=rendition.frame_format,
+            quality=rendition.quality,
+            max_width=rendition.width,
+            max_height=rendition.height,
+            renditions=(),
+        )
+
+    @property
+    def frame_rate(self) -> Fraction:
+        """Taxa de amostragem do modo interval: `fps` do job ou `FRAMES_PER_SECOND`."""
+        if self.fps:
+            return Fraction(self.fps).limit_denominator(1_000_000)
+        return Fraction(FRAMES_PER_SECOND)
+
+    @property
+    def start_offset(self) -> float:
+        return self.start_seconds or 0.0
+
+    @property
+    def trims(self) -> bool:
+        return bool(self.start_seconds or self.end_seconds)
+
+    def clip_duration(self, duration: float) -> float:
+        """Duração do trecho extraído de um vídeo com `duration` segundos."""
+        end = min(self.end_seconds, duration) if self.end_seconds else duration
+        return max(0.0, end - self.start_offset)
+
+    def total_ticks(self, duration: float) -> int:
+        """Quantidade de frames da grade do modo interval no trecho, respeitando `max_frames`."""
+        ticks = math.ceil(self.clip_duration(duration) * self.frame_rate)
+        return min(ticks, self.max_frames) if self.max_frames else ticks
+
+    def estimated_frames(self, media_metadata: MediaMetadata) -> int:
+        """
+        Limite superior de frames que a extração gera para o vídeo: a grade do trecho no modo interval;
+        nos modos keyframe/scene, todos os frames do vídeo (ambos respeitando `max_frames`).
+        """
+        config = self.for_duration(media_metadata.duration)
+        if config.mode.is_uniform:
+            return config.total_ticks(media_metadata.duration)
+        frames = media_metadata.frame_count or media_metadata.estimated_frames(media_metadata.fps)
+        return min(frames, config.max_frames) if config.max_frames else frames
+
+    def for_duration(self, duration: Optional[float]) -> "FrameExtractionConfig":
+        """
+        Resolve `frame_count` para a duração do vídeo: N frames igualmente espaçados no trecho viram
+        `fps = N / duração do trecho`, com `max_frames = N` para o arredondamento da grade não gerar um a mais.
+        """
+        if not self.frame_count:
+            return self
+        clip_duration = self.clip_duration(duration) if duration else 0
+        if clip_duration <= 0:
+            # sem a duração não há como espaçar: ficam os N primeiros frames da grade padrão
+            return replace(self, max_frames=min(self.max_frames or self.frame_count, self.frame_count), frame_count=None)
+        return replace(
+            self,
+            fps=self.frame_count / clip_duration,
+            max_frames=min(self.max_frames or self.frame_count, self.frame_count),
+            frame_count=None,
+        )
+
+    def cache_key(self, content_hash: str) -> str:
+        """
+        Chave do cache de resultados: mesmo vídeo + mesmos parâmetros de extração = mesmos frames.
+        Inclui a taxa efetiva (`fps` do job ou `FRAMES_PER_SECOND`) no modo interval, já que ela define
+        a grade de amostragem.
+        """
+        fingerprint = {
+            "frame_format": self.frame_format.format,
+            "quality": self.quality,
+            "max_width": self.max_width,
+            "max_height": self.max_height,
+            "mode": self.mode.mode,
+            "scene_threshold": self.scene_threshold if self.mode == ExtractionMode.SCENE else None,
+            "fps": str(self.frame_rate) if self.mode.is_uniform and not self.frame_count else None,
+            "dedup_max_distance": self.dedup_max_distance,
+            "sprite_layout": f"{self.sprite_columns}x{self.sprite_rows}" if self.sprites else None,
+            "shard_size_mb": self.shard_size_mb,
+            "manifest_format": self.manifest_format.format,
+            "start_seconds": self.start_seconds,
+            "end_seconds": self.end_seconds,
+            "max_frames": self.max_frames,
+            "frame_count": self.frame_count,
+            "renditions": [rendition.to_dict() for rendition in self.renditions] or None,
+        }
+        digest = hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+        return f"{content_hash}:{digest[:16]}"
+
+
+__all__ = ["FrameExtractionConfig"]
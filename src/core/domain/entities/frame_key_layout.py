@@ -0,0 +1,59 @@
+import hashlib
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+# versão gravada pelos jobs novos; jobs sem `key_layout` no resultado usam a versão 1
+FRAME_KEY_LAYOUT_VERSION = 2
+MIN_INDEX_WIDTH = 4
+
+
+@dataclass(frozen=True)
+class FrameKeyLayout:
+    """
+    Como os frames de um job são nomeados no storage, relativo ao prefixo do job. Vai no resultado
+    do job e no payload do zipper como `key_layout`, para quem lê os frames saber qual layout o job usou.
+
+    - versão 1 (jobs anteriores a `key_layout`): `frame_%04d.<ext>` direto no prefixo do job; acima de
+      9.999 frames o nome ganha um dígito e a ordem lexical das chaves deixa de ser a ordem dos frames;
+    - versão 2: o índice tem zeros à esquerda na largura do maior índice previsto pelo probe (mínimo 4),
+      então a ordem lexical volta a ser a ordem dos frames. Com `shard_prefix_length`, cada frame fica
+      em um diretório com os primeiros caracteres hex do sha256 do nome do arquivo, que espalha as
+      chaves de um job por vários prefixos do S3; nesse caso a ordem vem do manifesto, não da listagem.
+    """
+
+    version: int = 1
+    index_width: int = MIN_INDEX_WIDTH
+    shard_prefix_length: int = 0
+
+    @classmethod
+    def for_frame_count(cls, frame_count: Optional[int], shard_prefix_length: int = 0) -> "FrameKeyLayout":
+        """Layout atual para um job que vai gerar até `frame_count` frames (`None` se o probe não informou)."""
+        width = max(MIN_INDEX_WIDTH, len(str(frame_count - 1))) if frame_count else MIN_INDEX_WIDTH
+        return cls(version=FRAME_KEY_LAYOUT_VERSION, index_width=width, shard_prefix_length=shard_prefix_length)
+
+    @classmethod
+    def from_dict(cls, layout: Optional[Dict[str, Any]]) -> "FrameKeyLayout":
+        if not layout:
+            return cls()
+        return cls(
+            version=layout.get("version", 1),
+            index_width=layout.get("index_width", MIN_INDEX_WIDTH),
+            shard_prefix_length=layout.get("shard_prefix_length", 0),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def file_name(self, index: int, extension: str) -> str:
+        """Nome do arquivo do frame, sem diretório (ex: `frame_00042.png`); também usado dentro dos tar."""
+        return f"frame_{index:0{self.index_width}d}.{extension}"
+
+    def frame_key(self, index: int, extension: str, directory: Optional[str] = None) -> str:
+        """Chave do frame relativa ao prefixo do job, dentro de `directory` (ex: o nome da rendition)."""
+        name = self.file_name(index, extension)
+        if self.shard_prefix_length:
+            name = f"{hashlib.sha256(name.encode('utf8')).hexdigest()[:self.shard_prefix_length]}/{name}"
+        return f"{directory}/{name}" if directory else name
+
+
+__all__ = ["FrameKeyLayout", "FRAME_KEY_LAYOUT_VERSION"]
@@ -0,0 +1,74 @@
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List
+
+from src.core.constants.manifest_format import ManifestFormat
+from src.core.domain.entities.video_frame import VideoFrame
+
+MANIFEST_FIELDS = ("index", "pts", "key", "size", "sha256")
+DROPPED_FIELDS = ("index", "pts", "duplicate_of", "distance")
+
+
+class FrameManifest:
+    """
+    Manifesto dos frames de um job: índice, timestamp de apresentação, chave do objeto, tamanho
+    em bytes e sha256 de cada frame, para que quem consome os frames leia um único objeto em vez
+    de listar o prefixo e deduzir o timestamp pelo nome do arquivo.
+
+    `key` é relativa ao prefixo de frames do job (onde o manifesto é gravado), então continua
+    válida quando o cache copia os frames para outro job.
+
+    Frames descartados pela deduplicação também ficam no manifesto (índice, timestamp, frame
+    mantido de que são duplicata e distância), não no documento do job.
+
+    Formatos:
+    - jsonl: uma linha JSON por frame, em ordem de índice; as linhas de frames descartados têm
+      `duplicate_of` no lugar de `key`;
+    - columnar: um único JSON com uma lista por campo (`{"index": [...], "pts": [...], ...}`) e,
+      se houver descartes, `dropped_frames` com uma lista por campo dos descartados.
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]] = (), dropped: Iterable[Dict[str, Any]] = ()):
+        self._entries: List[Dict[str, Any]] = list(entries)
+        self._dropped: List[Dict[str, Any]] = list(dropped)
+
+    def add(self, frame: VideoFrame, key: str) -> Dict[str, Any]:
+        entry = {
+            "index": frame.index,
+            "pts": frame.pts,
+            "key": key,
+            "size": len(frame.data),
+            "sha256": hashlib.sha256(frame.data).hexdigest(),
+        }
+        self._entries.append(entry)
+        return entry
+
+    def extend(self, entries: Iterable[Dict[str, Any]]):
+        self._entries.extend(entries)
+
+    def add_dropped(self, dropped: Iterable[Dict[str, Any]]):
+        self._dropped.extend(dropped)
+
+    @property
+    def entries(self) -> List[Dict[str, Any]]:
+        return sorted(self._entries, key=lambda entry: entry["index"])
+
+    @property
+    def dropped(self) -> List[Dict[str, Any]]:
+        return sorted(self._dropped, key=lambda dropped: dropped["index"])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def serialize(self, manifest_format: ManifestFormat = ManifestFormat.JSONL) -> bytes:
+        entries, dropped = self.entries, self.dropped
+        if manifest_format == ManifestFormat.COLUMNAR:
+            columns: Dict[str, Any] = {field: [entry[field] for entry in entries] for field in MANIFEST_FIELDS}
+            if dropped:
+                columns["dropped_frames"] = {field: [entry[field] for entry in dropped] for field in DROPPED_FIELDS}
+            return json.dumps(columns, separators=(",", ":")).encode("utf8")
+        lines = sorted(entries + dropped, key=lambda entry: entry["index"])
+        return "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in lines).encode("utf8")
+
+
+__all__ = ["FrameManifest", "MANIFEST_FIELDS", "DROPPED_FIELDS"]
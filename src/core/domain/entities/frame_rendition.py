@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Any, Dict, NamedTuple, Optional
+
+from src.core.constants.frame_format import FrameFormat
+from src.core.domain.entities.video_frame import VideoFrame
+
+
+@dataclass(frozen=True)
+class FrameRendition:
+    """
+    Uma das saídas de um job com várias renditions: os mesmos frames, decodificados uma única vez,
+    codificados em outro tamanho/formato e enviados para o sub-prefixo `name` do job.
+
+    `width`/`height` reduzem o frame mantendo a proporção (nunca ampliam); `quality` segue a mesma
+    escala de 1 a 100 de `FrameExtractionConfig`.
+    """
+
+    name: str
+    frame_format: FrameFormat = FrameFormat.PNG
+    width: Optional[int] = None
+    height: Optional[int] = None
+    quality: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, rendition: Dict[str, Any]) -> "FrameRendition":
+        frame_format = FrameFormat.from_format(rendition.get("format") or FrameFormat.PNG.format)
+        width, height = rendition.get("width"), rendition.get("height")
+        return cls(
+            name=rendition.get("name") or cls.default_name(width, height, frame_format.format),
+            frame_format=frame_format,
+            width=width,
+            height=height,
+            quality=rendition.get("quality"),
+        )
+
+    @staticmethod
+    def default_name(width: Optional[int], height: Optional[int], frame_format: str) -> str:
+        """Nome do sub-prefixo quando o job não informa um (ex: `320w_webp`, `1280x720_jpeg`, `original_png`)."""
+        if width and height:
+            size = f"{width}x{height}"
+        elif width or height:
+            size = f"{width}w" if width else f"{height}h"
+        else:
+            size = "original"
+        return f"{size}_{frame_format}"
+
+    @property
+    def extension(self) -> str:
+        return self.frame_format.extension
+
+    @property
+    def content_type(self) -> str:
+        return self.frame_format.content_type
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "format": self.frame_format.format,
+            "width": self.width,
+            "height": self.height,
+            "quality": self.quality,
+        }
+
+
+class RenditionFrame(NamedTuple):
+    """
+    Um frame de uma rendition específica.
+
+    Parâmetros:
+    - rendition (FrameRendition): Rendition à qual o frame pertence.
+    - frame (VideoFrame): Frame codificado no tamanho/formato da rendition; `index`/`pts` são os
+      mesmos em todas as renditions.
+    """
+    rendition: FrameRendition
+    frame: VideoFrame
+
+
+__all__ = ["FrameRendition", "RenditionFrame"]
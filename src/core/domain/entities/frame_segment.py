@@ -0,0 +1,13 @@
+from typing import NamedTuple, Optional
+
+
+class FrameSegment(NamedTuple):
+    """
+    Intervalo `[start_tick, end_tick)` da grade de saída do filtro `fps` (tick = índice global do frame).
+    `end_tick=None` indica que o segmento vai até o fim do vídeo.
+    """
+    start_tick: int
+    end_tick: Optional[int]
+
+
+__all__ = ["FrameSegment"]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+import math
+from dataclasses import asdict, dataclass, fields
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class MediaMetadata:
+    """
+    Metadados do vídeo obtidos via ffprobe no registro do job.
+    `frame_count` vem do container quando disponível; caso contrário é estimado por `duration * fps`.
+    """
+
+    duration: float
+    width: int
+    height: int
+    fps: float
+    codec: str
+    frame_count: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["MediaMetadata"]:
+        if not data:
+            return None
+        names = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @property
+    def pixels(self) -> int:
+        return self.width * self.height
+
+    def estimated_frames(self, frames_per_second: float) -> int:
+        """Quantidade de frames que a extração vai gerar a `frames_per_second`."""
+        return math.ceil(self.duration * frames_per_second)
+
+
+__all__ = ["MediaMetadata"]
@@ -0,0 +1,38 @@
+from typing import List, NamedTuple, Optional
+
+
+class SpriteTile(NamedTuple):
+    """
+    Posição de um frame dentro de uma sprite sheet.
+
+    Parâmetros:
+    - index (int): Posição do frame na sequência extraída (começa em 0).
+    - pts (Optional[float]): Timestamp de apresentação do frame no vídeo de origem, em segundos.
+    - x (int): Deslocamento horizontal do frame na sprite, em pixels.
+    - y (int): Deslocamento vertical do frame na sprite, em pixels.
+    """
+    index: int
+    pts: Optional[float]
+    x: int
+    y: int
+
+
+class SpriteSheet(NamedTuple):
+    """
+    Imagem com vários frames do vídeo organizados em grade (filtro `tile` do ffmpeg), já codificada.
+
+    Parâmetros:
+    - index (int): Posição da sprite na sequência gerada (começa em 0).
+    - data (bytes): Conteúdo codificado da sprite.
+    - tile_width (int): Largura de cada frame dentro da sprite, em pixels.
+    - tile_height (int): Altura de cada frame dentro da sprite, em pixels.
+    - tiles (List[SpriteTile]): Frames presentes na sprite, na ordem da grade (a última pode estar incompleta).
+    """
+    index: int
+    data: bytes
+    tile_width: int
+    tile_height: int
+    tiles: List[SpriteTile]
+
+
+__all__ = ["SpriteSheet", "SpriteTile"]
@@ -21,6 +21,12 @@ class StorageConfig:
     retry_min: int = 1
     retry_max: int = 60
 
+    max_concurrency: int = 10
+    upload_retry_deadline: float = 300.0
+    presign_cache_size: int = 10000
+    multipart_threshold: int = 16 * 1024 * 1024
+    multipart_chunksize: int = 8 * 1024 * 1024
+
     extra: Optional[Dict[str, Any]] = None
 
 
@@ -1,4 +1,4 @@
-from typing import IO, Any, Optional
+from typing import IO, Any, Dict, Optional
 
 class StorageItem:
     """
@@ -10,6 +10,7 @@ class StorageItem:
     - content (Optional[bytes]): O conteúdo do objeto em bytes. (Deprecated: use file_object instead)
     - content_type (Optional[str]): O tipo de conteúdo (MIME type) do objeto.
     - file_object (Optional[IO[Any]]): Um objeto de arquivo (ex: BytesIO, SpooledTemporaryFile) para streaming.
+    - metadata (Optional[Dict[str, str]]): Metadados customizados gravados junto ao objeto.
     """
     def __init__(
         self,
@@ -18,6 +19,7 @@ class StorageItem:
         content: Optional[bytes] = None,
         content_type: Optional[str] = None,
         file_object: Optional[IO[Any]] = None,
+        metadata: Optional[Dict[str, str]] = None,
     ):
         self.bucket = bucket
         self.key = key
@@ -26,5 +28,6 @@ class StorageItem:
 
         self.file_object = file_object
         self.content_type = content_type
+        self.metadata = metadata
 
 __all__ = ["StorageItem"]
@@ -1,11 +1,34 @@
-from typing import Optional
+from typing import Callable, Optional
 
 class StorageObject:
-    """Representa um objeto já armazenado no Object Storage."""
-    def __init__(self, bucket: str, key: str, url: str, metadata: Optional[dict] = None):
+    """
+    Representa um objeto já armazenado no Object Storage.
+
+    A URL pode ser informada diretamente ou calculada sob demanda por `url_resolver`
+    no primeiro acesso, evitando assinar URLs que ninguém vai usar.
+    """
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        url: Optional[str] = None,
+        metadata: Optional[dict] = None,
+        url_resolver: Optional[Callable[[str, str], str]] = None,
+    ):
         self.bucket = bucket
         self.key = key
-        self.url = url
+        self._url = url
+        self._url_resolver = url_resolver
         self.metadata = metadata or {}
 
+    @property
+    def url(self) -> Optional[str]:
+        if self._url is None and self._url_resolver is not None:
+            self._url = self._url_resolver(self.bucket, self.key)
+        return self._url
+
+    @url.setter
+    def url(self, value: str):
+        self._url = value
+
 __all__ = ["StorageObject"]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TaskSchedule:
+    """
+    Como a tarefa de extração de um job deve ser agendada: limites de tempo próprios
+    (em segundos) e se deve ir para a fila de vídeos longos.
+    """
+
+    time_limit: int
+    soft_time_limit: int
+    long_running: bool = False
+
+
+__all__ = ["TaskSchedule"]
@@ -0,0 +1,18 @@
+from typing import NamedTuple, Optional
+
+
+class VideoFrame(NamedTuple):
+    """
+    Representa um frame extraído do vídeo, já codificado (ex: PNG).
+
+    Parâmetros:
+    - index (int): Posição do frame na sequência extraída (começa em 0).
+    - pts (Optional[float]): Timestamp de apresentação do frame no vídeo de origem, em segundos.
+    - data (bytes): Conteúdo codificado do frame.
+    """
+    index: int
+    pts: Optional[float]
+    data: bytes
+
+
+__all__ = ["VideoFrame"]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 
 from src.core.domain.dtos.callbacks.notification_dto import NotificationDTO
 from src.core.domain.entities.base_entity import BaseEntity
@@ -18,6 +18,13 @@ class VideoJob(BaseEntity):
         frames_path: str,
         notify_url: Optional[str] = None,
         config: Optional[Dict[str, Any]] = None,
+        media_metadata: Optional[Dict[str, Any]] = None,
+        result: Optional[Dict[str, Any]] = None,
+        content_hash: Optional[str] = None,
+        progress: Optional[Dict[str, Any]] = None,
+        task_ids: Optional[List[str]] = None,
+        checkpoint: Optional[Dict[str, Any]] = None,
+        upload: Optional[Dict[str, Any]] = None,
         error_message: Optional[str] = None,
         id: Optional[str] = None,
         created_at: Optional[datetime] = None,
@@ -38,6 +45,13 @@ class VideoJob(BaseEntity):
         self.frames_path = frames_path
         self.notify_url = notify_url
         self.config = config or {}
+        self.media_metadata = media_metadata or {}
+        self.result = result or {}
+        self.content_hash = content_hash
+        self.progress = progress or {}
+        self.task_ids = task_ids or []
+        self.checkpoint = checkpoint or {}
+        self.upload = upload or {}
         self.error_message = error_message
 
     def enqueue(self):
@@ -57,6 +71,7 @@ class VideoJob(BaseEntity):
     def complete(self):
         self.status = VideoJobStatus.COMPLETED.status
         self.error_message = None
+        self.checkpoint = {}
         self.updated_at = datetime.now()
 
     def fail(self, reason: str):
@@ -65,6 +80,16 @@ class VideoJob(BaseEntity):
         self.updated_at = datetime.now()
         self.inactivated_at = datetime.now()
         
+    @property
+    def is_cancelled(self) -> bool:
+        return self.status == VideoJobStatus.CANCELLED.status
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (
+            VideoJobStatus.COMPLETED.status, VideoJobStatus.ERROR.status, VideoJobStatus.CANCELLED.status,
+        )
+        
     def build_notification(self, detail: str = None):
         return NotificationDTO(
             job_ref=self.job_ref,
@@ -0,0 +1,11 @@
+from typing import Optional
+
+
+class JobCancelledException(Exception):
+    """Interrompe o processamento de um job cancelado pelo cliente (não é tratado como falha)."""
+
+    def __init__(self, job_ref: str, message: Optional[str] = None):
+        self.job_ref = job_ref
+        super().__init__(message or f"VideoJob {job_ref} was cancelled")
+
+__all__ = ["JobCancelledException"]
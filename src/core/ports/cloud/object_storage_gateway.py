@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from src.core.domain.entities.bulk_upload_result import BulkUploadResult
 from src.core.domain.entities.storage_object import StorageObject
 from src.core.domain.entities.storage_item import StorageItem
 
@@ -19,7 +20,12 @@ class ObjectStorageGateway(ABC):
 
     @abstractmethod
     def download_object(self, bucket: str, key: str) -> bytes:
-        """Download genérico"""
+        """Download genérico (conteúdo inteiro em memória; use apenas para objetos pequenos)"""
+        pass
+
+    @abstractmethod
+    def download_to_file(self, bucket: str, key: str, file_path: str) -> int:
+        """Download em streaming direto para um arquivo local. Retorna o tamanho em bytes."""
         pass
 
     @abstractmethod
@@ -33,14 +39,82 @@ class ObjectStorageGateway(ABC):
         """Upload em lote: lista de (bytes, key_suffix) -> retorna StorageObject por item"""
         pass
 
+    @abstractmethod
+    def upload_items_bulk(
+        self,
+        items: Iterable[StorageItem],
+        max_concurrency: Optional[int] = None,
+        on_uploaded: Optional[Callable[[StorageItem], None]] = None,
+    ) -> BulkUploadResult:
+        """
+        Upload concorrente de vários `StorageItem`; falhas são coletadas por item sem abortar os demais.
+        `on_uploaded` é chamado com cada item assim que o upload dele termina (fora de ordem).
+        """
+        pass
+
+    @abstractmethod
+    def create_multipart_upload(self, bucket: str, key: str, content_type: Optional[str] = None) -> str:
+        """Inicia um upload multipart -> retorna o `upload_id`"""
+        pass
+
+    @abstractmethod
+    def upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        """Envia uma parte do upload multipart (numeradas a partir de 1) -> retorna o ETag da parte"""
+        pass
+
+    @abstractmethod
+    def complete_multipart_upload(
+        self, bucket: str, key: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> StorageObject:
+        """Conclui o upload multipart a partir de (part_number, etag) -> retorna o `StorageObject` final"""
+        pass
+
+    @abstractmethod
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        """Cancela o upload multipart e descarta as partes já enviadas"""
+        pass
+
     @abstractmethod
     def presign_url(self, bucket: str, key: str, expiration: int = 3600) -> str:
         """Gera URL pré-assinada para GET"""
         pass
 
+    @abstractmethod
+    def presign_urls(self, bucket: str, keys: Iterable[str], expiration: int = 3600) -> Dict[str, str]:
+        """Gera URLs pré-assinadas para GET em lote -> retorna {key: url}"""
+        pass
+
+    @abstractmethod
+    def presign_post(
+        self, bucket: str, key: str, content_type: Optional[str], max_size: int, expiration: int = 3600
+    ) -> Dict[str, Any]:
+        """
+        Gera um POST pré-assinado para o cliente enviar o objeto direto ao storage -> retorna {"url", "fields"}.
+        A política limita o tamanho a `max_size` bytes e fixa o `content_type`, quando informado.
+        """
+        pass
+
+    @abstractmethod
+    def presign_upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, expiration: int = 3600) -> str:
+        """Gera URL pré-assinada para PUT de uma parte de um upload multipart (o ETag volta no header da resposta)"""
+        pass
+
+    @abstractmethod
+    def head_object(self, bucket: str, key: str) -> Optional[StorageObject]:
+        """
+        Metadados de um objeto sem baixá-lo -> `StorageObject` com `ContentLength`, `ContentType` e `ETag`
+        em `metadata`, ou None se o objeto não existe.
+        """
+        pass
+
     @abstractmethod
     def list_objects(self, bucket: str, prefix: str, max_keys: int = 1000) -> List[StorageObject]:
-        """Lista objetos sob um prefix -> retorna lista de `StorageObject`"""
+        """Lista objetos sob um prefix -> retorna lista de `StorageObject` (URL resolvida sob demanda)"""
+        pass
+
+    @abstractmethod
+    def copy_prefix(self, source_bucket: str, source_prefix: str, target_bucket: str, target_prefix: str) -> int:
+        """Copia (no servidor, sem baixar) todos os objetos de um prefix para outro. Retorna quantidade copiada."""
         pass
 
     @abstractmethod
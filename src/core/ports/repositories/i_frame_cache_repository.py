@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from src.core.domain.entities.frame_cache_entry import FrameCacheEntry
+
+class IFrameCacheRepository(ABC):
+    @abstractmethod
+    def save(self, entry: FrameCacheEntry) -> FrameCacheEntry:
+        pass
+
+    @abstractmethod
+    def find_by_cache_key(self, cache_key: str) -> Optional[FrameCacheEntry]:
+        pass
+
+    @abstractmethod
+    def delete(self, entry: FrameCacheEntry) -> None:
+        pass
+
+    @abstractmethod
+    def record_lookup(self, hit: bool) -> None:
+        """Incrementa os contadores de hit/miss do cache"""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """Retorna `hits`, `misses` e `entries`"""
+        pass
+
+__all__ = ["IFrameCacheRepository"]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Optional
 from src.core.domain.entities.video_job import VideoJob
 
 class IVideoJobRepository(ABC):
@@ -7,10 +7,46 @@ class IVideoJobRepository(ABC):
     def save(self, video_job: VideoJob) -> VideoJob:
         pass
 
+    @abstractmethod
+    def save_unless_cancelled(self, video_job: VideoJob) -> bool:
+        """
+        Grava o job só se o status no banco não for CANCELLED, em um único update condicional.
+        Retorna False quando o job foi cancelado (nada é gravado).
+        """
+        pass
+
+    @abstractmethod
+    def cancel(self, job_ref: str) -> Optional[VideoJob]:
+        """
+        Marca o job como CANCELLED só se ele ainda não terminou, em um único update condicional.
+        Retorna o job cancelado, ou None se ele não existe ou já estava finalizado.
+        """
+        pass
+
     @abstractmethod
     def find_by_job_ref(self, job_ref: str) -> Optional[VideoJob]:
         pass
 
+    @abstractmethod
+    def update_progress(self, job_ref: str, progress: Dict[str, Any]) -> None:
+        """Grava só o progresso do job (sem reescrever o documento inteiro)"""
+        pass
+
+    @abstractmethod
+    def save_checkpoint(self, job_ref: str, checkpoint: Dict[str, Any]) -> None:
+        """Grava só o checkpoint do job (último frame enviado), sem reescrever o documento inteiro"""
+        pass
+
+    @abstractmethod
+    def add_task_id(self, job_ref: str, task_id: str) -> None:
+        """Registra o id de uma tarefa enfileirada para o job (revogada se o job for cancelado)"""
+        pass
+
+    @abstractmethod
+    def find_status(self, job_ref: str) -> Optional[str]:
+        """Lê só o status do job, consultado periodicamente pelo worker para detectar cancelamento"""
+        pass
+
     @abstractmethod
     def get_by_id(self, id: str) -> Optional[VideoJob]:
         pass
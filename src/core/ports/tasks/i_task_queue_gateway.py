@@ -1,12 +1,30 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+from src.core.domain.entities.task_schedule import TaskSchedule
 
 class ITaskQueueGateway(ABC):
     @abstractmethod
-    def enqueue_video_processing_task(self, task_data: Dict[str, Any]) -> str:
-        """Enfileira uma tarefa de processamento de vídeo."""
+    def enqueue_video_processing_task(self, task_data: Dict[str, Any], schedule: Optional[TaskSchedule] = None) -> str:
+        """Enfileira uma tarefa de processamento de vídeo (com limites de tempo e fila de `schedule`, se informado)."""
         pass
     
+    @abstractmethod
+    def enqueue_video_chunks(self, task_data: Dict[str, Any], chunks: List[Dict[str, Any]]) -> str:
+        """
+        Enfileira uma subtarefa por trecho do vídeo e uma tarefa final que conclui o job
+        quando todos os trechos terminarem. Retorna o id da tarefa final.
+        """
+        pass
+
+    @abstractmethod
+    def revoke_tasks(self, task_ids: List[str]) -> None:
+        """
+        Revoga tarefas ainda enfileiradas para que nenhum worker as inicie. Tarefas já em
+        execução não são terminadas: o worker percebe o cancelamento pelo status do job.
+        """
+        pass
+
     @abstractmethod
     def notification_status_callback(self, task_data: Dict[str, Any]) -> str:
         """Enfileira uma tarefa de notificação de status."""
@@ -0,0 +1,115 @@
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# peso da amostra mais recente nas médias móveis de latência e de erro
+EWMA_WEIGHT = 0.2
+
+
+class AdaptiveConcurrencyController:
+    """
+    Limite de concorrência AIMD (aumento aditivo, redução multiplicativa) para requisições a um
+    serviço que limita a taxa, como o S3 com `SlowDown`/503.
+
+    - a cada `limit` requisições concluídas com latência e taxa de erro saudáveis (uma "rodada"
+      com o limite atual cheio), o limite sobe 1, até `max_limit`;
+    - um throttling multiplica o limite por `decrease_factor` (nunca abaixo de `min_limit`). As
+      respostas de requisições que já estavam em voo quando a redução aconteceu não reduzem de
+      novo: só há uma redução por janela de uma latência média;
+    - a latência é saudável enquanto a média móvel não passa de `latency_tolerance` vezes a
+      melhor média observada; erros que não são throttling seguram o aumento quando a média
+      móvel de erros passa de `max_error_rate`.
+
+    Seguro entre threads; `snapshot` expõe o limite atual e os contadores como métricas.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial_limit: Optional[int] = None,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_error_rate: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_limit = max(1, max_limit)
+        self._min_limit = max(1, min(min_limit, self._max_limit))
+        self._limit = max(self._min_limit, min(initial_limit or self._max_limit, self._max_limit))
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._max_error_rate = max_error_rate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._healthy_in_round = 0
+        self._latency: Optional[float] = None
+        self._best_latency: Optional[float] = None
+        self._error_rate = 0.0
+        self._last_decrease: Optional[float] = None
+        self._throttle_events = 0
+        self._errors = 0
+        self._successes = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def on_success(self, latency: float):
+        with self._lock:
+            self._successes += 1
+            self._record(latency, error=False)
+            if not self._is_healthy():
+                self._healthy_in_round = 0
+                return
+            self._healthy_in_round += 1
+            if self._healthy_in_round >= self._limit and self._limit < self._max_limit:
+                self._limit += 1
+                self._healthy_in_round = 0
+
+    def on_throttle(self) -> bool:
+        """Registra um throttling; retorna True se o limite foi reduzido."""
+        with self._lock:
+            self._throttle_events += 1
+            self._healthy_in_round = 0
+            now = self._clock()
+            cooldown = self._latency or 0.0
+            if self._last_decrease is not None and now - self._last_decrease < cooldown:
+                return False
+            self._last_decrease = now
+            self._limit = max(self._min_limit, math.floor(self._limit * self._decrease_factor))
+            return True
+
+    def on_error(self, latency: Optional[float] = None):
+        with self._lock:
+            self._errors += 1
+            self._healthy_in_round = 0
+            self._record(latency, error=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "concurrency": self._limit,
+                "max_concurrency": self._max_limit,
+                "throttle_events": self._throttle_events,
+                "errors": self._errors,
+                "successes": self._successes,
+                "latency_ms": round(self._latency * 1000, 1) if self._latency is not None else None,
+                "error_rate": round(self._error_rate, 4),
+            }
+
+    def _record(self, latency: Optional[float], error: bool):
+        self._error_rate += EWMA_WEIGHT * ((1.0 if error else 0.0) - self._error_rate)
+        if latency is None:
+            return
+        self._latency = latency if self._latency is None else self._latency + EWMA_WEIGHT * (latency - self._latency)
+        if self._best_latency is None or self._latency < self._best_latency:
+            self._best_latency = self._latency
+
+    def _is_healthy(self) -> bool:
+        if self._error_rate > self._max_error_rate:
+            return False
+        return self._latency <= self._best_latency * self._latency_tolerance
+
+
+__all__ = ["AdaptiveConcurrencyController"]
@@ -0,0 +1,95 @@
+import queue
+import threading
+from typing import Generic, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_END = object()
+
+
+class BoundedPipeline(Generic[T]):
+    """
+    Produtor/consumidor com buffer limitado entre duas etapas de um job.
+
+    Uma thread consome `source` (ex: frames do ffmpeg) e enfileira os itens em uma
+    fila de tamanho `max_buffered`, enquanto o chamador itera sobre a pipeline em
+    paralelo. Falhas se propagam nos dois sentidos:
+    - erro no produtor é relançado para o consumidor;
+    - erro ou saída antecipada do consumidor cancela o produtor, que fecha `source`.
+
+    Uso:
+        with BoundedPipeline(frames, max_buffered=32) as buffered:
+            for frame in buffered:
+                ...
+    """
+
+    def __init__(self, source: Iterable[T], max_buffered: int):
+        if max_buffered < 1:
+            raise ValueError("max_buffered must be at least 1")
+        self._source = source
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_buffered)
+        self._cancelled = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._produce, name="bounded-pipeline-producer", daemon=True)
+
+    def __enter__(self) -> "BoundedPipeline[T]":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cancel()
+        self._thread.join()
+        return False
+
+    def __iter__(self) -> Iterator[T]:
+        while True:
+            item = self._queue.get()
+            if item is _END:
+                if self._error is not None:
+                    raise self._error
+                return
+            yield item
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        # libera o produtor caso esteja bloqueado com a fila cheia
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _produce(self):
+        iterator = iter(self._source)
+        try:
+            for item in iterator:
+                if not self._put(item):
+                    break
+        except BaseException as e:
+            self._error = e
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+            self._put(_END, force=True)
+
+    def _put(self, item, force: bool = False) -> bool:
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        if force:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                pass
+        return False
+
+
+__all__ = ["BoundedPipeline"]
@@ -0,0 +1,130 @@
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from src.core.constants.manifest_format import ManifestFormat
+from src.core.domain.entities.frame_manifest import FrameManifest
+from src.core.domain.entities.storage_item import StorageItem
+from src.core.domain.entities.video_job import VideoJob
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+
+DEFAULT_MIN_INTERVAL = 5.0
+# sub-prefixo (dentro do prefixo de frames do job) com as partes do manifesto já cobertas pelo checkpoint
+CHECKPOINT_PARTS_DIR = "_checkpoint"
+
+
+class FrameCheckpointTracker:
+    """
+    Checkpoint da extração de um job para que um retry retome de onde a tentativa anterior parou.
+
+    Os uploads concorrentes terminam fora de ordem, então o checkpoint é o último frame cujo
+    upload terminou junto com o de todos os frames enviados antes dele (`frame_index` e `pts`).
+
+    `VideoJob.checkpoint` guarda só esse frame, no máximo uma vez a cada `min_interval` segundos;
+    as entradas do manifesto cobertas por cada gravação vão para uma parte jsonl em
+    `<prefixo de frames>/_checkpoint/`, de onde o retry as lê para que os frames que ele não
+    decodifica de novo continuem no manifesto final. `flush` grava o que faltar (ex: quando o
+    upload falha). Uma gravação que falha é refeita na próxima, sem interromper o job.
+    """
+
+    def __init__(
+        self,
+        video_job_repository: IVideoJobRepository,
+        storage_gateway: ObjectStorageGateway,
+        video_job: VideoJob,
+        frames_prefix: str,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._video_job_repository = video_job_repository
+        self._storage_gateway = storage_gateway
+        self._video_job = video_job
+        self._parts_prefix = f"{frames_prefix}/{CHECKPOINT_PARTS_DIR}/"
+        self._min_interval = min_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pending: Deque[str] = deque()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._done: Set[str] = set()
+        self._unsaved: List[Dict[str, Any]] = []
+        self._last_write: Optional[float] = None
+
+    @property
+    def resume_tick(self) -> int:
+        """Primeiro frame que ainda precisa ser extraído (0 sem checkpoint)."""
+        frame_index = self._video_job.checkpoint.get("frame_index")
+        return frame_index + 1 if frame_index is not None else 0
+
+    def resumed_entries(self, existing_keys: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Entradas do manifesto dos frames já cobertos pelo checkpoint gravado, lidas das partes
+        que aparecem na listagem do prefixo (`existing_keys`). Uma parte gravada sem que o
+        checkpoint tenha avançado é ignorada além do último frame, e as entradas repetidas entre
+        partes (parte refeita depois de uma gravação que falhou) aparecem uma única vez.
+        """
+        last_index = self.resume_tick - 1
+        entries: Dict[int, Dict[str, Any]] = {}
+        for key in sorted(key for key in existing_keys if key.startswith(self._parts_prefix)):
+            content = self._storage_gateway.download_object(self._video_job.bucket, key)
+            for line in content.decode("utf8").splitlines():
+                entry = json.loads(line)
+                if entry["index"] <= last_index:
+                    entries[entry["index"]] = entry
+        return [entries[index] for index in sorted(entries)]
+
+    def discard(self):
+        """Remove as partes do manifesto depois que o manifesto final foi montado."""
+        self._storage_gateway.delete_prefix(self._video_job.bucket, self._parts_prefix)
+
+    def submitted(self, key: str, entry: Dict[str, Any]):
+        """Registra um frame na ordem em que entra no upload."""
+        with self._lock:
+            self._pending.append(key)
+            self._entries[key] = entry
+
+    def uploaded(self, key: str):
+        with self._lock:
+            self._done.add(key)
+            while self._pending and self._pending[0] in self._done:
+                done_key = self._pending.popleft()
+                self._done.discard(done_key)
+                self._unsaved.append(self._entries.pop(done_key))
+        self._flush()
+
+    def flush(self):
+        self._flush(force=True)
+
+    def _flush(self, force: bool = False):
+        with self._lock:
+            if not self._unsaved:
+                return
+            now = self._clock()
+            if not force and self._last_write is not None and now - self._last_write < self._min_interval:
+                return
+            self._last_write = now
+            entries, self._unsaved = self._unsaved, []
+        last = entries[-1]
+        checkpoint = {"frame_index": last["index"], "pts": last["pts"]}
+        try:
+            # a parte vai antes do checkpoint: um checkpoint gravado sempre tem as suas entradas no storage
+            self._storage_gateway.upload_object(StorageItem(
+                bucket=self._video_job.bucket,
+                key=f"{self._parts_prefix}{last['index']:010d}.{ManifestFormat.JSONL.format}",
+                content=FrameManifest(entries).serialize(ManifestFormat.JSONL),
+                content_type=ManifestFormat.JSONL.content_type,
+            ))
+            self._video_job_repository.save_checkpoint(self._video_job.job_ref, checkpoint)
+        except Exception as e:
+            print(f"Não foi possível gravar o checkpoint do job {self._video_job.job_ref}: {e}")
+            with self._lock:
+                self._unsaved = entries + self._unsaved
+            return
+        with self._lock:
+            # mantém a entidade igual ao documento: um `save` posterior não desfaz o checkpoint
+            self._video_job.checkpoint = checkpoint
+
+
+__all__ = ["FrameCheckpointTracker"]
@@ -0,0 +1,85 @@
+import threading
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from src.core.constants.video_job_status import VideoJobStatus
+from src.core.exceptions.job_cancelled_exception import JobCancelledException
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+
+T = TypeVar("T")
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class JobCancellationWatcher:
+    """
+    Sinal cooperativo de cancelamento para o worker: uma thread lê só o status do job a cada
+    `poll_interval` segundos e, quando ele passa a CANCELLED, `cancelled` fica verdadeiro.
+
+    `guard` envolve uma fonte de itens (frames, sprites, renditions) e lança
+    `JobCancelledException` no próximo item depois do cancelamento, fechando a fonte: o gerador
+    do ffmpeg termina o subprocesso no `finally` e o upload em lote para de receber itens.
+
+    Uso:
+        with JobCancellationWatcher(repository, job_ref) as cancellation:
+            frames = cancellation.guard(frames)
+            ...
+    """
+
+    def __init__(
+        self,
+        video_job_repository: IVideoJobRepository,
+        job_ref: str,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self._video_job_repository = video_job_repository
+        self._job_ref = job_ref
+        self._poll_interval = poll_interval
+        self._cancelled = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "JobCancellationWatcher":
+        self._thread = threading.Thread(target=self._watch, name="job-cancellation-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        return False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise JobCancelledException(self._job_ref)
+
+    def guard(self, source: Iterable[T]) -> Iterator[T]:
+        iterator = iter(source)
+        try:
+            for item in iterator:
+                self.raise_if_cancelled()
+                yield item
+            self.raise_if_cancelled()
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+
+    def _watch(self):
+        while not self._stopped.wait(self._poll_interval):
+            try:
+                status = self._video_job_repository.find_status(self._job_ref)
+            except Exception as e:
+                print(f"Não foi possível consultar o status do job {self._job_ref}: {e}")
+                continue
+            if status == VideoJobStatus.CANCELLED.status:
+                print(f"Job {self._job_ref} cancelado: interrompendo o processamento.")
+                self._cancelled.set()
+                return
+
+
+__all__ = ["JobCancellationWatcher"]
@@ -0,0 +1,86 @@
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from src.core.domain.entities.extraction_progress import ExtractionProgress
+from src.core.domain.entities.video_job import VideoJob
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+
+DEFAULT_MIN_INTERVAL = 2.0
+
+
+class JobProgressTracker:
+    """
+    Acumula o progresso de um job (frames gerados pelo ffmpeg, posição já processada do trecho e
+    frames enviados ao storage) e grava em `VideoJob.progress` com um `$set` do campo, no máximo
+    uma vez a cada `min_interval` segundos, para que o acompanhamento não pese no Mongo.
+
+    `on_extraction` é chamado pela thread que lê o stderr do ffmpeg e `on_uploaded` pelo envio dos
+    frames, por isso o estado fica sob lock. `percent` só é calculado quando a duração do trecho
+    (`total_seconds`) é conhecida. Falhas ao gravar o progresso não interrompem o job.
+    """
+
+    def __init__(
+        self,
+        video_job_repository: IVideoJobRepository,
+        video_job: VideoJob,
+        total_seconds: Optional[float],
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._video_job_repository = video_job_repository
+        self._video_job = video_job
+        self._total_seconds = total_seconds
+        self._min_interval = min_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._frames_decoded = 0
+        self._out_time = 0.0
+        self._frames_uploaded = 0
+        self._last_write: Optional[float] = None
+
+    def on_extraction(self, progress: ExtractionProgress):
+        with self._lock:
+            self._frames_decoded = progress.frames
+            self._out_time = progress.out_time
+        self._flush()
+
+    def on_uploaded(self, count: int = 1):
+        with self._lock:
+            self._frames_uploaded += count
+        self._flush()
+
+    def finish(self, completed: bool = True):
+        """Grava o estado final, ignorando o intervalo mínimo; um job concluído fica com 100%."""
+        self._flush(force=True, completed=completed)
+
+    def _flush(self, force: bool = False, completed: bool = False):
+        with self._lock:
+            now = self._clock()
+            if not force and self._last_write is not None and now - self._last_write < self._min_interval:
+                return
+            self._last_write = now
+            progress = self._snapshot(completed)
+            self._video_job.progress = progress
+        try:
+            self._video_job_repository.update_progress(self._video_job.job_ref, progress)
+        except Exception as e:
+            print(f"Não foi possível gravar o progresso do job {self._video_job.job_ref}: {e}")
+
+    def _snapshot(self, completed: bool) -> Dict[str, Any]:
+        percent = None
+        if completed:
+            percent = 100.0
+        elif self._total_seconds:
+            percent = round(min(100.0, 100 * self._out_time / self._total_seconds), 1)
+        return {
+            "frames_decoded": self._frames_decoded,
+            "out_time": round(self._out_time, 3),
+            "frames_uploaded": self._frames_uploaded,
+            "percent": percent,
+            "updated_at": datetime.now().isoformat(),
+        }
+
+
+__all__ = ["JobProgressTracker"]
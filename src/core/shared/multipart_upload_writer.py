@@ -0,0 +1,120 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import List, Optional, Set, Tuple
+
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.domain.entities.storage_object import StorageObject
+
+# o S3 exige partes de pelo menos 5 MiB (exceto a última)
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+
+
+class MultipartUploadWriter:
+    """
+    Destino só-escrita (`write`/`tell`) que envia o conteúdo ao storage por upload multipart,
+    sem nunca montar o objeto inteiro em memória ou em disco.
+
+    O conteúdo é acumulado até `part_size` e cada parte é enviada em background; no máximo
+    `max_in_flight` partes ficam pendentes, o que limita a memória a cerca de
+    `(max_in_flight + 1) * part_size`. `close()` conclui o upload; em caso de erro o upload é
+    abortado e as partes enviadas são descartadas.
+
+    Uso:
+        with MultipartUploadWriter(storage_gateway, bucket, key) as writer:
+            writer.write(data)
+    """
+
+    def __init__(
+        self,
+        storage_gateway: ObjectStorageGateway,
+        bucket: str,
+        key: str,
+        content_type: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_in_flight: int = 4,
+    ):
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+        self._storage_gateway = storage_gateway
+        self.bucket = bucket
+        self.key = key
+        self._part_size = part_size
+        self._max_in_flight = max(1, max_in_flight)
+        self._buffer = bytearray()
+        self._position = 0
+        self._parts: List[Tuple[int, str]] = []
+        self._in_flight: Set[Future] = set()
+        self._executor = ThreadPoolExecutor(max_workers=self._max_in_flight, thread_name_prefix="multipart-upload")
+        self._upload_id = storage_gateway.create_multipart_upload(bucket, key, content_type)
+        self._closed = False
+
+    def __enter__(self) -> "MultipartUploadWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, data: bytes) -> int:
+        if self._closed:
+            raise ValueError("write to a closed MultipartUploadWriter")
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[:self._part_size])
+            del self._buffer[:self._part_size]
+            self._submit(part)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> StorageObject:
+        if self._closed:
+            raise ValueError("MultipartUploadWriter is already closed")
+        try:
+            # sempre há ao menos uma parte, mesmo que vazia
+            if self._buffer or not self._parts and not self._in_flight:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+            self._drain(wait_all=True)
+            storage_object = self._storage_gateway.complete_multipart_upload(
+                self.bucket, self.key, self._upload_id, self._parts
+            )
+        except BaseException:
+            self.abort()
+            raise
+        self._closed = True
+        self._executor.shutdown()
+        return storage_object
+
+    def abort(self):
+        if self._closed:
+            return
+        self._closed = True
+        for future in self._in_flight:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._buffer.clear()
+        self._storage_gateway.abort_multipart_upload(self.bucket, self.key, self._upload_id)
+
+    def _submit(self, part: bytes):
+        self._drain(wait_all=False)
+        part_number = len(self._parts) + len(self._in_flight) + 1
+        future = self._executor.submit(
+            self._storage_gateway.upload_part, self.bucket, self.key, self._upload_id, part_number, part
+        )
+        future.part_number = part_number
+        self._in_flight.add(future)
+
+    def _drain(self, wait_all: bool):
+        # com o limite de partes pendentes atingido, espera alguma terminar antes de enfileirar outra
+        while self._in_flight and (wait_all or len(self._in_flight) >= self._max_in_flight):
+            done, self._in_flight = wait(self._in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._parts.append((future.part_number, future.result()))
+
+
+__all__ = ["MultipartUploadWriter", "DEFAULT_PART_SIZE", "MIN_PART_SIZE"]
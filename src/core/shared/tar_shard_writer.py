@@ -0,0 +1,59 @@
+import tarfile
+import time
+from typing import BinaryIO, Tuple
+
+TAR_BLOCK_SIZE = tarfile.BLOCKSIZE
+
+
+class TarShardWriter:
+    """
+    Escreve um arquivo tar (ustar) em streaming em um destino só-escrita, como um upload
+    multipart, sem precisar de `seek`.
+
+    `add` retorna o offset e o tamanho do conteúdo do membro dentro do tar, o que permite ler
+    um único arquivo depois com um GET por intervalo de bytes (`Range: bytes=offset-(offset+length-1)`).
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._size = 0
+        self._members = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def members(self) -> int:
+        return self._members
+
+    @staticmethod
+    def entry_size(length: int) -> int:
+        """Bytes ocupados no tar por um membro de `length` bytes (cabeçalho + conteúdo com padding)."""
+        return TAR_BLOCK_SIZE + -(-length // TAR_BLOCK_SIZE) * TAR_BLOCK_SIZE
+
+    def add(self, name: str, data: bytes, mtime: float = None) -> Tuple[int, int]:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mode = 0o644
+        info.mtime = int(time.time() if mtime is None else mtime)
+        self._write(info.tobuf(tarfile.USTAR_FORMAT))
+
+        offset = self._size
+        self._write(data)
+        padding = -len(data) % TAR_BLOCK_SIZE
+        if padding:
+            self._write(b"\0" * padding)
+        self._members += 1
+        return offset, len(data)
+
+    def close(self):
+        # dois blocos zerados marcam o fim do arquivo
+        self._write(b"\0" * (2 * TAR_BLOCK_SIZE))
+
+    def _write(self, data: bytes):
+        self._stream.write(data)
+        self._size += len(data)
+
+
+__all__ = ["TarShardWriter", "TAR_BLOCK_SIZE"]
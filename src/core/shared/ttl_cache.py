@@ -0,0 +1,50 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Cache em memória do processo com expiração por item e tamanho máximo.
+
+    Seguro para uso entre threads (ex: uploads concorrentes). Quando cheio,
+    remove primeiro os itens expirados e depois os mais antigos.
+    """
+
+    def __init__(self, max_size: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self._max_size = max_size
+        self._clock = clock
+        self._items: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._items[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        with self._lock:
+            self._items[key] = (value, self._clock() + ttl)
+            self._items.move_to_end(key)
+            if len(self._items) > self._max_size:
+                self._evict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _evict(self):
+        now = self._clock()
+        for key in [k for k, (_, expires_at) in self._items.items() if expires_at <= now]:
+            del self._items[key]
+        while len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+
+
+__all__ = ["TTLCache"]
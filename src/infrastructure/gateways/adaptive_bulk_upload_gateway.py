@@ -0,0 +1,257 @@
+from __future__ import annotations
+from abc import abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import heapq
+import logging
+import random
+import time
+
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError, HTTPClientError
+
+from src.config.settings import LOG_LEVEL
+from src.core.domain.entities.bulk_upload_result import BulkUploadFailure, BulkUploadResult
+from src.core.domain.entities.storage_config import StorageConfig
+from src.core.domain.entities.storage_item import StorageItem
+from src.core.domain.entities.storage_object import StorageObject
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.shared.adaptive_concurrency_controller import AdaptiveConcurrencyController
+from src.core.shared.logging_monitor_handler import LoggingMonitoringHandler
+
+THROTTLE_ERROR_CODES = frozenset({
+    "SlowDown", "Throttling", "ThrottlingException", "RequestLimitExceeded",
+    "TooManyRequestsException", "ServiceUnavailable", "RequestThrottled",
+})
+TRANSIENT_ERROR_CODES = frozenset({"InternalError", "RequestTimeout", "RequestTimeoutException"})
+
+
+@dataclass
+class _PendingUpload:
+    item: StorageItem
+    attempt: int = 0
+
+
+class AdaptiveBulkUploadGateway(ObjectStorageGateway):
+    """Bulk upload machinery shared by every ObjectStorageGateway backend.
+
+    Subclasses implement `_put_object`, a single upload attempt. Bulk uploads run
+    on a thread pool bounded by `StorageConfig.max_concurrency`; inside that
+    ceiling an AIMD controller, shared by every bulk upload of the gateway, sets
+    how many uploads are actually in flight: it grows while latency and error
+    rate stay healthy and halves on throttling (`SlowDown`/503). Throttled and
+    transient failures are retried with backoff until the bulk has spent
+    `StorageConfig.upload_retry_deadline` seconds retrying, instead of a fixed
+    number of attempts per object.
+
+    Failures are classified by botocore error codes, so backends that simulate
+    storage errors raise `ClientError` just like S3 does.
+    """
+
+    def __init__(self, storage_config: StorageConfig, logger_name: str) -> None:
+        self.logger = logging.getLogger(logger_name)
+        self._max_concurrency = max(1, int(storage_config.max_concurrency))
+        self._retry_attempts = int(storage_config.retry_attempts)
+        self._retry_multiplier = float(storage_config.retry_multiplier)
+        self._retry_min = int(storage_config.retry_min)
+        self._retry_max = int(storage_config.retry_max)
+        self._upload_retry_deadline = float(storage_config.upload_retry_deadline)
+        self._upload_concurrency = AdaptiveConcurrencyController(
+            max_limit=self._max_concurrency,
+            initial_limit=max(1, self._max_concurrency // 2),
+        )
+        self._upload_retries = 0
+
+        self.logger.setLevel(LOG_LEVEL)
+
+        # console handler if no handlers are configured
+        self._configure_logger(storage_config)
+
+    def _configure_logger(self, storage_config: StorageConfig):
+        if not self.logger.handlers:
+            ch = logging.StreamHandler()
+            ch.setLevel(LOG_LEVEL)
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
+            ch.setFormatter(formatter)
+            self.logger.addHandler(ch)
+
+        if storage_config.monitoring_url:
+            self.logger.addHandler(LoggingMonitoringHandler(url=storage_config.monitoring_url))
+
+
+    def upload_objects_bulk(
+        self,
+        items: List[Tuple[bytes, str]],
+        bucket: str,
+        prefix: str,
+        content_type: Optional[str] = None,
+    ) -> List[StorageObject]:
+        """Upload multiple objects in bulk and return a list of StorageObjects."""
+        result = self.upload_items_bulk(
+            StorageItem(bucket=bucket, key=f"{prefix.rstrip('/')}/{key_suffix}", content=content, content_type=content_type)
+            for content, key_suffix in items
+        )
+        if not result.ok:
+            raise result.failed[0].error
+        return result.uploaded
+
+    def upload_items_bulk(
+        self,
+        items: Iterable[StorageItem],
+        max_concurrency: Optional[int] = None,
+        on_uploaded: Optional[Callable[[StorageItem], None]] = None,
+    ) -> BulkUploadResult:
+        """Upload StorageItems concurrently, consuming `items` lazily.
+
+        At most `max_concurrency` uploads are in flight (defaults to the configured
+        pool size), and within that ceiling the adaptive controller's current limit,
+        so a generator of frames is never materialized in memory. Throttled and
+        transient failures go back to a backoff queue and are resubmitted ahead of
+        new items; a failure is recorded in the result, without aborting the
+        remaining items, when it is not retryable or the retry deadline, counted
+        from the first retryable failure of the bulk, is over.
+        `on_uploaded` is called on the calling thread for every successful item, in
+        completion order.
+        """
+        ceiling = min(max_concurrency or self._max_concurrency, self._max_concurrency)
+        result = BulkUploadResult()
+        in_flight: Dict[Future, _PendingUpload] = {}
+        backoff: List[Tuple[float, int, _PendingUpload]] = []
+        # started at the first retryable failure and never reset: the deadline covers the whole bulk
+        retry_window: Dict[str, Optional[float]] = {"started": None}
+        metrics_before = self.upload_metrics()
+        source = iter(items)
+        exhausted = False
+        sequence = 0
+
+        with ThreadPoolExecutor(max_workers=ceiling, thread_name_prefix="s3-bulk-upload") as executor:
+            while True:
+                now = time.monotonic()
+                while len(in_flight) < min(ceiling, self._upload_concurrency.limit):
+                    if backoff and backoff[0][0] <= now:
+                        pending = heapq.heappop(backoff)[2]
+                    elif not exhausted:
+                        item = next(source, None)
+                        if item is None:
+                            exhausted = True
+                            continue
+                        pending = _PendingUpload(item)
+                    else:
+                        break
+                    in_flight[executor.submit(self._timed_put, pending.item)] = pending
+
+                if exhausted and not in_flight and not backoff:
+                    break
+
+                timeout = max(0.0, backoff[0][0] - time.monotonic()) if backoff else None
+                if in_flight:
+                    done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    time.sleep(timeout)
+                    done = ()
+
+                for future in done:
+                    pending = in_flight.pop(future)
+                    retry_after = self._settle_upload(future, pending, result, on_uploaded, retry_window)
+                    if retry_after is not None:
+                        sequence += 1
+                        heapq.heappush(backoff, (time.monotonic() + retry_after, sequence, pending))
+
+        result.metrics = self._bulk_metrics(metrics_before)
+        self.logger.info("Bulk upload finished: %d uploaded, %d failed; metrics=%s",
+                         len(result.uploaded), len(result.failed), result.metrics)
+        return result
+
+    def upload_metrics(self) -> Dict[str, Any]:
+        """Current bulk upload concurrency and the throttling/retry counters since the gateway was created."""
+        return {**self._upload_concurrency.snapshot(), "retries": self._upload_retries}
+
+    def _bulk_metrics(self, before: Dict[str, Any]) -> Dict[str, Any]:
+        """Concurrency at the end of a bulk upload, with the counters limited to that bulk
+        (bulks running at the same time on the gateway share the controller, so they count each other's events)."""
+        metrics = self.upload_metrics()
+        for counter in ("throttle_events", "errors", "successes", "retries"):
+            metrics[counter] -= before[counter]
+        return metrics
+
+    def _timed_put(self, item: StorageItem) -> Tuple[StorageObject, float]:
+        started = time.monotonic()
+        uploaded = self._put_object(item)
+        return uploaded, time.monotonic() - started
+
+    def _settle_upload(
+        self,
+        future: Future,
+        pending: _PendingUpload,
+        result: BulkUploadResult,
+        on_uploaded: Optional[Callable[[StorageItem], None]],
+        retry_window: Dict[str, Optional[float]],
+    ) -> Optional[float]:
+        """Feed one finished upload to the controller; return the backoff delay when it must be retried."""
+        controller = self._upload_concurrency
+        limit = controller.limit
+        try:
+            uploaded, latency = future.result()
+        except Exception as exc:
+            kind = self._classify_upload_error(exc)
+            if kind == "throttle":
+                controller.on_throttle()
+            else:
+                controller.on_error()
+            self._log_concurrency_change(limit)
+
+            now = time.monotonic()
+            if kind and retry_window["started"] is None:
+                retry_window["started"] = now
+            if kind and now - retry_window["started"] < self._upload_retry_deadline:
+                pending.attempt += 1
+                self._upload_retries += 1
+                return self._backoff_delay(pending.attempt)
+            result.failed.append(BulkUploadFailure(item=pending.item, error=exc))
+            return None
+
+        controller.on_success(latency)
+        self._log_concurrency_change(limit)
+        result.uploaded.append(uploaded)
+        if on_uploaded:
+            on_uploaded(pending.item)
+        return None
+
+    def _backoff_delay(self, attempt: int) -> float:
+        delay = self._retry_multiplier * (2 ** (attempt - 1))
+        delay = max(self._retry_min, min(delay, self._retry_max))
+        # jitter keeps the retries of a throttled burst from hitting S3 in lockstep
+        return random.uniform(delay / 2, delay)
+
+    @staticmethod
+    def _classify_upload_error(exc: Exception) -> Optional[str]:
+        """Return "throttle", "transient" or None (not retryable) for a failed upload."""
+        if isinstance(exc, ClientError):
+            error = exc.response.get("Error", {})
+            status = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if error.get("Code") in THROTTLE_ERROR_CODES or status in (429, 503):
+                return "throttle"
+            if error.get("Code") in TRANSIENT_ERROR_CODES or (status or 0) >= 500:
+                return "transient"
+            return None
+        if isinstance(exc, (BotoConnectionError, HTTPClientError)):
+            return "transient"
+        return None
+
+    def _log_concurrency_change(self, previous: int):
+        current = self._upload_concurrency.limit
+        if current < previous:
+            self.logger.warning("Upload concurrency reduced %d -> %d after throttling; metrics=%s",
+                                previous, current, self.upload_metrics())
+        elif current > previous:
+            self.logger.debug("Upload concurrency raised %d -> %d", previous, current)
+
+    @abstractmethod
+    def _put_object(self, item: StorageItem) -> StorageObject:
+        """Single upload attempt; retries are up to the caller."""
+        pass
+
+
+__all__ = ["AdaptiveBulkUploadGateway", "THROTTLE_ERROR_CODES", "TRANSIENT_ERROR_CODES"]
@@ -1,6 +1,8 @@
-from typing import Dict, Any
-from celery import Celery
+from typing import Dict, Any, List, Optional
+from celery import Celery, chord, group
 
+from src.config import celery_config
+from src.core.domain.entities.task_schedule import TaskSchedule
 from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
 
 class CeleryTaskQueueGateway(ITaskQueueGateway):
@@ -8,13 +10,48 @@ class CeleryTaskQueueGateway(ITaskQueueGateway):
     def __init__(self, celery_app: Celery):
         self._celery_app = celery_app
 
-    def enqueue_video_processing_task(self, task_data: Dict[str, Any]) -> str:
+    def enqueue_video_processing_task(self, task_data: Dict[str, Any], schedule: Optional[TaskSchedule] = None) -> str:
+        options: Dict[str, Any] = {}
+        if schedule:
+            options['time_limit'] = schedule.time_limit
+            options['soft_time_limit'] = schedule.soft_time_limit
+            if schedule.long_running:
+                options['queue'] = celery_config.extract_frames_long_q
+
         task = self._celery_app.send_task(
             'src.infrastructure.tasks.video_tasks.extract_frames_task',
-            args=[task_data]
+            args=[task_data],
+            **options
         )
         return task.id
-    
+
+    def enqueue_video_chunks(self, task_data: Dict[str, Any], chunks: List[Dict[str, Any]]) -> str:
+        header = group(
+            self._celery_app.signature(
+                'src.infrastructure.tasks.video_tasks.extract_frames_chunk_task',
+                args=[task_data, chunk],
+            )
+            for chunk in chunks
+        )
+        callback = self._celery_app.signature(
+            'src.infrastructure.tasks.video_tasks.finalize_chunked_video_task',
+            args=[task_data],
+        )
+        callback.link_error(
+            self._celery_app.signature(
+                'src.infrastructure.tasks.video_tasks.fail_chunked_video_task',
+                kwargs={'task_data': task_data},
+            )
+        )
+        result = chord(header, app=self._celery_app)(callback)
+        return result.id
+
+    def revoke_tasks(self, task_ids: List[str]) -> None:
+        if not task_ids:
+            return
+        # sem terminate: matar o processo do worker deixaria o ffmpeg órfão e os frames parciais no bucket
+        self._celery_app.control.revoke(list(task_ids))
+
     def notification_status_callback(self, task_data: Dict[str, Any]) -> str:
         task = self._celery_app.send_task(
             'src.infrastructure.tasks.notification_task.send_notification_task',
@@ -0,0 +1,203 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import os
+import shutil
+import tempfile
+import uuid
+
+from src.core.domain.entities.storage_config import StorageConfig
+from src.core.domain.entities.storage_item import StorageItem
+from src.infrastructure.gateways.local_storage_gateway import LocalStorageGateway, _MultipartUpload
+
+# reserved directories under the root; bucket names never start with a dot
+TEMP_DIR = ".tmp"
+METADATA_DIR = ".metadata"
+MULTIPART_DIR = ".multipart"
+
+
+class FileSystemStorageGateway(LocalStorageGateway):
+    """ObjectStorageGateway backed by a local directory.
+
+    The root comes from `StorageConfig.endpoint_url` (a path or a `file://`
+    url; defaults to `<tmp>/object-storage`) and objects live at
+    `<root>/<bucket>/<key>`. Content type and user metadata are kept in JSON
+    sidecars under `<root>/.metadata`, outside the bucket, so listings only
+    see objects.
+
+    Writes never copy when they can avoid it: a StorageItem whose file_object
+    is a file on disk is hardlinked, and copy_prefix/download_to_file hardlink
+    the stored file (falling back to a copy across devices). Every object is
+    first written or linked under `<root>/.tmp` and then renamed into place, so
+    readers never see a partial object. Hardlinked files share their content:
+    whoever produced them must replace them, never modify them in place.
+    Several processes (API and Celery workers) on the same machine can share
+    the root.
+    """
+
+    def __init__(self, storage_config: StorageConfig = None) -> None:
+        storage_config = storage_config or StorageConfig()
+        super().__init__(storage_config, "FileSystemStorageGateway")
+        self._root = self._root_dir(storage_config.endpoint_url)
+        os.makedirs(os.path.join(self._root, TEMP_DIR), exist_ok=True)
+
+    @staticmethod
+    def _root_dir(endpoint_url: Optional[str]) -> str:
+        if not endpoint_url:
+            return os.path.join(tempfile.gettempdir(), "object-storage")
+        if endpoint_url.startswith("file://"):
+            endpoint_url = endpoint_url[len("file://"):]
+        return os.path.abspath(endpoint_url)
+
+    def _path(self, bucket: str, key: str, base: Optional[str] = None) -> str:
+        parts = key.split("/")
+        if not bucket or bucket.startswith(".") or "/" in bucket or any(part in ("", ".", "..") for part in parts):
+            raise ValueError(f"Invalid object key for the filesystem storage: {bucket}/{key}")
+        return os.path.join(*filter(None, (self._root, base, bucket, *parts)))
+
+    def _metadata_path(self, bucket: str, key: str) -> str:
+        return self._path(bucket, key, base=METADATA_DIR) + ".json"
+
+    def _temp_path(self) -> str:
+        return os.path.join(self._root, TEMP_DIR, uuid.uuid4().hex)
+
+    def _store(self, item: StorageItem) -> None:
+        temp_path = self._temp_path()
+        source_path = self._source_path(item)
+        try:
+            if source_path:
+                self._link_or_copy(source_path, temp_path)
+            else:
+                with open(temp_path, "wb") as target:
+                    if item.content is not None:
+                        target.write(item.content)
+                    else:
+                        if hasattr(item.file_object, "seek"):
+                            item.file_object.seek(0)  # a retry must resend the whole stream
+                        shutil.copyfileobj(item.file_object, target)
+            self._publish(temp_path, self._path(item.bucket, item.key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._write_metadata(item.bucket, item.key, item.content_type, item.metadata)
+
+    @staticmethod
+    def _source_path(item: StorageItem) -> Optional[str]:
+        """Path of the file behind the item's file_object, when there is one to hardlink."""
+        if item.content is not None or item.file_object is None:
+            return None
+        name = getattr(item.file_object, "name", None)
+        if not isinstance(name, str) or not os.path.isfile(name):
+            return None
+        if hasattr(item.file_object, "flush"):
+            item.file_object.flush()
+        return name
+
+    @staticmethod
+    def _link_or_copy(source_path: str, target_path: str) -> None:
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            shutil.copyfile(source_path, target_path)
+
+    @staticmethod
+    def _publish(temp_path: str, target_path: str) -> None:
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        os.replace(temp_path, target_path)
+
+    def _write_metadata(self, bucket: str, key: str, content_type: Optional[str], metadata: Optional[Dict[str, str]]):
+        metadata_path = self._metadata_path(bucket, key)
+        if not content_type and not metadata:
+            if os.path.exists(metadata_path):
+                os.remove(metadata_path)
+            return
+        temp_path = self._temp_path()
+        with open(temp_path, "w", encoding="utf8") as target:
+            json.dump({"content_type": content_type, "metadata": metadata or {}}, target)
+        self._publish(temp_path, metadata_path)
+
+    def object_metadata(self, bucket: str, key: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """Content type and user metadata of a stored object (what S3 returns on HEAD)."""
+        self._size(bucket, key)
+        try:
+            with open(self._metadata_path(bucket, key), encoding="utf8") as source:
+                sidecar = json.load(source)
+        except FileNotFoundError:
+            return None, {}
+        return sidecar.get("content_type"), sidecar.get("metadata") or {}
+
+    def _size(self, bucket: str, key: str) -> int:
+        try:
+            return os.path.getsize(self._path(bucket, key))
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            raise self._no_such_key(bucket, key)
+
+    def _read(self, bucket: str, key: str) -> bytes:
+        try:
+            with open(self._path(bucket, key), "rb") as source:
+                return source.read()
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            raise self._no_such_key(bucket, key)
+
+    def _export(self, bucket: str, key: str, file_path: str) -> None:
+        if os.path.lexists(file_path):
+            os.remove(file_path)
+        self._link_or_copy(self._path(bucket, key), file_path)
+
+    def _keys(self, bucket: str, prefix: str) -> Iterable[str]:
+        bucket_path = os.path.join(self._root, bucket)
+        # only the directory that can hold the prefix is walked, not the whole bucket
+        start = os.path.join(bucket_path, *prefix.split("/")[:-1])
+        for directory, _, file_names in os.walk(start):
+            relative = os.path.relpath(directory, bucket_path).replace(os.sep, "/")
+            for file_name in file_names:
+                key = file_name if relative == "." else f"{relative}/{file_name}"
+                if key.startswith(prefix):
+                    yield key
+
+    def _copy(self, source_bucket: str, source_key: str, target_bucket: str, target_key: str) -> None:
+        temp_path = self._temp_path()
+        self._link_or_copy(self._path(source_bucket, source_key), temp_path)
+        self._publish(temp_path, self._path(target_bucket, target_key))
+        content_type, metadata = self.object_metadata(source_bucket, source_key)
+        self._write_metadata(target_bucket, target_key, content_type, metadata)
+
+    def _remove(self, bucket: str, key: str) -> None:
+        for path in (self._path(bucket, key), self._metadata_path(bucket, key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _url(self, bucket: str, key: str) -> str:
+        return Path(self._path(bucket, key)).as_uri()
+
+    def _parts_dir(self, upload_id: str) -> str:
+        return os.path.join(self._root, MULTIPART_DIR, upload_id)
+
+    def _store_part(self, upload_id: str, part_number: int, data: bytes) -> None:
+        parts_dir = self._parts_dir(upload_id)
+        os.makedirs(parts_dir, exist_ok=True)
+        temp_path = self._temp_path()
+        with open(temp_path, "wb") as target:
+            target.write(data)
+        os.replace(temp_path, os.path.join(parts_dir, f"{part_number:05d}"))
+
+    def _assemble(self, upload_id: str, upload: _MultipartUpload, part_numbers: List[int]) -> None:
+        parts_dir = self._parts_dir(upload_id)
+        temp_path = self._temp_path()
+        with open(temp_path, "wb") as target:
+            for number in part_numbers:
+                with open(os.path.join(parts_dir, f"{number:05d}"), "rb") as part:
+                    shutil.copyfileobj(part, target)
+        self._publish(temp_path, self._path(upload.bucket, upload.key))
+        self._write_metadata(upload.bucket, upload.key, upload.content_type, None)
+        self._discard_parts(upload_id)
+
+    def _discard_parts(self, upload_id: str) -> None:
+        shutil.rmtree(self._parts_dir(upload_id), ignore_errors=True)
+
+
+__all__ = ["FileSystemStorageGateway"]
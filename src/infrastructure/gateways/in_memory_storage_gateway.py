@@ -0,0 +1,123 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import os
+import tempfile
+import threading
+import uuid
+
+from src.core.domain.entities.storage_config import StorageConfig
+from src.core.domain.entities.storage_item import StorageItem
+from src.infrastructure.gateways.local_storage_gateway import LocalStorageGateway, _MultipartUpload
+
+
+@dataclass(frozen=True)
+class _StoredObject:
+    data: bytes
+    content_type: Optional[str] = None
+    metadata: Optional[Dict[str, str]] = None
+
+
+class InMemoryStorageGateway(LocalStorageGateway):
+    """ObjectStorageGateway that keeps every object in a dict of the process.
+
+    Objects are only visible to the process that stored them (the API and each
+    Celery worker have their own), so this backend is meant for benchmarks,
+    load tests and single-process runs, not for a deployed pipeline. Stored
+    bytes are shared, never copied, between uploads, copies and downloads.
+
+    Urls are `file://` uris of a copy of the object spilled to a temporary
+    directory on first use, so ffprobe/ffmpeg can open presigned videos; the
+    copy is rewritten when the object changes and removed with it.
+    """
+
+    def __init__(self, storage_config: StorageConfig = None) -> None:
+        super().__init__(storage_config or StorageConfig(), "InMemoryStorageGateway")
+        self._objects: Dict[Tuple[str, str], _StoredObject] = {}
+        self._parts: Dict[str, Dict[int, bytes]] = {}
+        self._lock = threading.Lock()
+        self._spill_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._spilled: Dict[Tuple[str, str], Tuple[_StoredObject, str]] = {}
+
+    def _store(self, item: StorageItem) -> None:
+        stored = _StoredObject(self._item_bytes(item), item.content_type, item.metadata)
+        with self._lock:
+            self._objects[(item.bucket, item.key)] = stored
+
+    def _get(self, bucket: str, key: str) -> _StoredObject:
+        with self._lock:
+            stored = self._objects.get((bucket, key))
+        if stored is None:
+            raise self._no_such_key(bucket, key)
+        return stored
+
+    def _size(self, bucket: str, key: str) -> int:
+        return len(self._get(bucket, key).data)
+
+    def _read(self, bucket: str, key: str) -> bytes:
+        return self._get(bucket, key).data
+
+    def _export(self, bucket: str, key: str, file_path: str) -> None:
+        with open(file_path, "wb") as target:
+            target.write(self._get(bucket, key).data)
+
+    def _keys(self, bucket: str, prefix: str) -> Iterable[str]:
+        with self._lock:
+            return [key for stored_bucket, key in self._objects if stored_bucket == bucket and key.startswith(prefix)]
+
+    def _copy(self, source_bucket: str, source_key: str, target_bucket: str, target_key: str) -> None:
+        stored = self._get(source_bucket, source_key)
+        with self._lock:
+            self._objects[(target_bucket, target_key)] = stored
+
+    def _remove(self, bucket: str, key: str) -> None:
+        with self._lock:
+            self._objects.pop((bucket, key), None)
+            spilled = self._spilled.pop((bucket, key), None)
+        if spilled:
+            os.remove(spilled[1])
+
+    def _url(self, bucket: str, key: str) -> str:
+        return Path(self._spill(bucket, key)).as_uri()
+
+    def _spill(self, bucket: str, key: str) -> str:
+        """Path of an on-disk copy of the object, written again only if the object changed since the last spill."""
+        stored = self._get(bucket, key)
+        with self._lock:
+            spilled = self._spilled.get((bucket, key))
+            if spilled and spilled[0] is stored:
+                return spilled[1]
+            if self._spill_dir is None:
+                # removed with the gateway (or at interpreter exit)
+                self._spill_dir = tempfile.TemporaryDirectory(prefix="memory-storage-")
+            path = os.path.join(self._spill_dir.name, uuid.uuid4().hex)
+            with open(path, "wb") as target:
+                target.write(stored.data)
+            self._spilled[(bucket, key)] = (stored, path)
+        if spilled:
+            os.remove(spilled[1])
+        return path
+
+    def _store_part(self, upload_id: str, part_number: int, data: bytes) -> None:
+        with self._lock:
+            self._parts.setdefault(upload_id, {})[part_number] = bytes(data)
+
+    def _assemble(self, upload_id: str, upload: _MultipartUpload, part_numbers: List[int]) -> None:
+        with self._lock:
+            parts = self._parts.pop(upload_id, {})
+            self._objects[(upload.bucket, upload.key)] = _StoredObject(
+                b"".join(parts[number] for number in part_numbers), upload.content_type,
+            )
+
+    def _discard_parts(self, upload_id: str) -> None:
+        with self._lock:
+            self._parts.pop(upload_id, None)
+
+    def object_metadata(self, bucket: str, key: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """Content type and user metadata of a stored object (what S3 returns on HEAD)."""
+        stored = self._get(bucket, key)
+        return stored.content_type, dict(stored.metadata or {})
+
+
+__all__ = ["InMemoryStorageGateway"]
@@ -0,0 +1,276 @@
+from __future__ import annotations
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import hashlib
+import io
+import threading
+import uuid
+
+from botocore.exceptions import ClientError
+from tenacity import Retrying, retry_if_exception, stop_after_attempt, wait_exponential
+
+from src.core.domain.entities.storage_config import StorageConfig
+from src.core.domain.entities.storage_item import StorageItem
+from src.core.domain.entities.storage_object import StorageObject
+from src.infrastructure.gateways.adaptive_bulk_upload_gateway import AdaptiveBulkUploadGateway
+from src.infrastructure.gateways.storage_fault_injector import StorageFaultInjector, client_error
+
+
+@dataclass
+class _MultipartUpload:
+    bucket: str
+    key: str
+    content_type: Optional[str] = None
+    etags: Dict[int, str] = field(default_factory=dict)
+
+
+class LocalStorageGateway(AdaptiveBulkUploadGateway):
+    """Base for ObjectStorageGateway backends that keep objects on this machine.
+
+    Implements the whole port on top of a few storage primitives, with the
+    semantics the pipeline relies on from S3: prefix listings in key order,
+    atomic object replacement, multipart uploads validated by part ETag and
+    `NoSuchKey` errors for missing objects.
+
+    Every request goes through a StorageFaultInjector (latency, bandwidth and
+    throttling/error injection), so benchmarks and load tests see realistic
+    storage behavior without S3. Bulk uploads use the same adaptive
+    concurrency as S3StorageGateway; every other request retries throttled and
+    transient errors, as S3 calls do through tenacity/botocore, with the
+    StorageConfig retry policy.
+    """
+
+    def __init__(self, storage_config: StorageConfig, logger_name: str) -> None:
+        super().__init__(storage_config, logger_name)
+        self._faults = StorageFaultInjector.from_config(storage_config)
+        self._retrying = Retrying(
+            stop=stop_after_attempt(self._retry_attempts),
+            wait=wait_exponential(multiplier=self._retry_multiplier, min=self._retry_min, max=self._retry_max),
+            retry=retry_if_exception(lambda exc: self._classify_upload_error(exc) is not None),
+            reraise=True,
+        )
+        self._uploads: Dict[str, _MultipartUpload] = {}
+        self._uploads_lock = threading.Lock()
+
+    def upload_object(self, item: StorageItem) -> StorageObject:
+        return self._retrying(self._put_object, item)
+
+    def upload_file_obj(self, item: StorageItem) -> StorageObject:
+        if not item.file_object:
+            raise ValueError("StorageItem must contain a file_object for upload_file_obj method.")
+        return self._retrying(self._put_object, item)
+
+    def _put_object(self, item: StorageItem) -> StorageObject:
+        self._faults.before_request("PutObject", self._item_size(item))
+        self._store(item)
+        self.logger.debug("Stored object %s/%s", item.bucket, item.key)
+        return StorageObject(bucket=item.bucket, key=item.key, url_resolver=self.presign_url)
+
+    def download_object(self, bucket: str, key: str) -> bytes:
+        def download() -> bytes:
+            self._faults.before_request("GetObject", self._size(bucket, key))
+            return self._read(bucket, key)
+
+        return self._retrying(download)
+
+    def download_to_file(self, bucket: str, key: str, file_path: str) -> int:
+        def download() -> int:
+            size = self._size(bucket, key)
+            self._faults.before_request("GetObject", size)
+            self._export(bucket, key, file_path)
+            return size
+
+        size = self._retrying(download)
+        self.logger.info("Downloaded object %s/%s to %s (%d bytes)", bucket, key, file_path, size)
+        return size
+
+    def create_multipart_upload(self, bucket: str, key: str, content_type: Optional[str] = None) -> str:
+        self._retrying(self._faults.before_request, "CreateMultipartUpload")
+        upload_id = uuid.uuid4().hex
+        with self._uploads_lock:
+            self._uploads[upload_id] = _MultipartUpload(bucket=bucket, key=key, content_type=content_type)
+        return upload_id
+
+    def upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        def upload() -> str:
+            self._faults.before_request("UploadPart", len(data))
+            upload = self._multipart_upload(upload_id)
+            self._store_part(upload_id, part_number, data)
+            etag = f'"{hashlib.md5(data).hexdigest()}"'
+            upload.etags[part_number] = etag
+            return etag
+
+        return self._retrying(upload)
+
+    def complete_multipart_upload(
+        self, bucket: str, key: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> StorageObject:
+        self._retrying(self._faults.before_request, "CompleteMultipartUpload")
+        upload = self._multipart_upload(upload_id)
+        part_numbers = [number for number, _ in sorted(parts)]
+        for number, etag in parts:
+            if upload.etags.get(number) != etag:
+                raise client_error("CompleteMultipartUpload", "InvalidPart", f"Part {number} was not uploaded", 400)
+        self._assemble(upload_id, upload, part_numbers)
+        with self._uploads_lock:
+            self._uploads.pop(upload_id, None)
+        self.logger.info("Completed multipart upload %s/%s (%d parts)", bucket, key, len(parts))
+        return StorageObject(bucket=bucket, key=key, url_resolver=self.presign_url)
+
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        with self._uploads_lock:
+            self._uploads.pop(upload_id, None)
+        self._discard_parts(upload_id)
+        self.logger.info("Aborted multipart upload %s/%s", bucket, key)
+
+    def presign_url(self, bucket: str, key: str, expiration: int = 3600) -> str:
+        return self._url(bucket, key)
+
+    def presign_urls(self, bucket: str, keys: Iterable[str], expiration: int = 3600) -> Dict[str, str]:
+        return {key: self._url(bucket, key) for key in keys}
+
+    def presign_post(
+        self, bucket: str, key: str, content_type: Optional[str], max_size: int, expiration: int = 3600
+    ) -> Dict[str, Any]:
+        """The object location plus the form fields S3 would require; there is no HTTP endpoint to POST to."""
+        fields: Dict[str, Any] = {"key": key}
+        if content_type:
+            fields["Content-Type"] = content_type
+        return {"url": self._url(bucket, key), "fields": fields}
+
+    def presign_upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, expiration: int = 3600) -> str:
+        return f"{self._url(bucket, key)}?uploadId={upload_id}&partNumber={part_number}"
+
+    def head_object(self, bucket: str, key: str) -> Optional[StorageObject]:
+        """Size and content type of a stored object; no ETag is computed, since that would read the whole object."""
+        self._retrying(self._faults.before_request, "HeadObject")
+        try:
+            size = self._size(bucket, key)
+            content_type, _ = self.object_metadata(bucket, key)
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] == "NoSuchKey":
+                return None
+            raise
+        metadata = {"ContentLength": size, "ContentType": content_type, "ETag": None}
+        return StorageObject(bucket=bucket, key=key, metadata=metadata, url_resolver=self.presign_url)
+
+    def list_objects(self, bucket: str, prefix: str, max_keys: int = 1000) -> List[StorageObject]:
+        self._retrying(self._faults.before_request, "ListObjectsV2")
+        return [
+            StorageObject(bucket=bucket, key=key, url_resolver=self.presign_url)
+            for key in sorted(self._keys(bucket, prefix))
+        ]
+
+    def copy_prefix(self, source_bucket: str, source_prefix: str, target_bucket: str, target_prefix: str) -> int:
+        source_prefix = f"{source_prefix.rstrip('/')}/"
+        target_prefix = f"{target_prefix.rstrip('/')}/"
+        keys = [obj.key for obj in self.list_objects(source_bucket, source_prefix)]
+        for key in keys:
+            self._retrying(self._faults.before_request, "CopyObject")
+            self._copy(source_bucket, key, target_bucket, target_prefix + key[len(source_prefix):])
+        self.logger.info("Copied %d objects from %s/%s to %s/%s", len(keys), source_bucket, source_prefix, target_bucket, target_prefix)
+        return len(keys)
+
+    def delete_object(self, bucket: str, key: str) -> bool:
+        self._retrying(self._faults.before_request, "DeleteObject")
+        self._remove(bucket, key)
+        return True
+
+    def delete_prefix(self, bucket: str, prefix: str) -> int:
+        keys = [obj.key for obj in self.list_objects(bucket, prefix)]
+        self._retrying(self._faults.before_request, "DeleteObjects")
+        for key in keys:
+            self._remove(bucket, key)
+        self.logger.info("Deleted %d objects from bucket %s with prefix %s", len(keys), bucket, prefix)
+        return len(keys)
+
+    def _multipart_upload(self, upload_id: str) -> _MultipartUpload:
+        with self._uploads_lock:
+            upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise client_error("UploadPart", "NoSuchUpload", f"Upload {upload_id} does not exist", 404)
+        return upload
+
+    @staticmethod
+    def _no_such_key(bucket: str, key: str) -> ClientError:
+        return client_error("GetObject", "NoSuchKey", f"{bucket}/{key} does not exist", 404)
+
+    @staticmethod
+    def _item_size(item: StorageItem) -> int:
+        if item.content is not None:
+            return len(item.content)
+        file_object = item.file_object
+        try:
+            position = file_object.tell()
+            file_object.seek(0, io.SEEK_END)
+            size = file_object.tell()
+            file_object.seek(position)
+            return size
+        except (AttributeError, OSError, ValueError):
+            return 0
+
+    @staticmethod
+    def _item_bytes(item: StorageItem) -> bytes:
+        if item.content is not None:
+            return item.content
+        if hasattr(item.file_object, "seek"):
+            item.file_object.seek(0)  # a retry must resend the whole stream
+        return item.file_object.read()
+
+    @abstractmethod
+    def object_metadata(self, bucket: str, key: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """Content type and user metadata of a stored object (what S3 returns on HEAD)."""
+        pass
+
+    @abstractmethod
+    def _store(self, item: StorageItem) -> None:
+        """Store the item, atomically replacing any object under the same key."""
+        pass
+
+    @abstractmethod
+    def _size(self, bucket: str, key: str) -> int:
+        """Object size in bytes; raises `NoSuchKey` when it does not exist."""
+        pass
+
+    @abstractmethod
+    def _read(self, bucket: str, key: str) -> bytes:
+        pass
+
+    @abstractmethod
+    def _export(self, bucket: str, key: str, file_path: str) -> None:
+        """Write the object content to a local file."""
+        pass
+
+    @abstractmethod
+    def _keys(self, bucket: str, prefix: str) -> Iterable[str]:
+        """Every key of the bucket starting with `prefix`, in any order."""
+        pass
+
+    @abstractmethod
+    def _copy(self, source_bucket: str, source_key: str, target_bucket: str, target_key: str) -> None:
+        pass
+
+    @abstractmethod
+    def _remove(self, bucket: str, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def _url(self, bucket: str, key: str) -> str:
+        pass
+
+    @abstractmethod
+    def _store_part(self, upload_id: str, part_number: int, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    def _assemble(self, upload_id: str, upload: _MultipartUpload, part_numbers: List[int]) -> None:
+        """Concatenate the parts into the final object and discard them."""
+        pass
+
+    @abstractmethod
+    def _discard_parts(self, upload_id: str) -> None:
+        pass
+
+
+__all__ = ["LocalStorageGateway"]
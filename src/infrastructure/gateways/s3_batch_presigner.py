@@ -0,0 +1,118 @@
+from __future__ import annotations
+import hashlib
+import hmac
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import quote, urlsplit, parse_qsl
+
+SIGNATURE_PARAM = "X-Amz-Signature"
+
+
+class S3BatchPresigner:
+    """Presign many S3 GET urls while deriving the SigV4 signing key only once.
+
+    botocore re-resolves the endpoint, re-serializes the request and re-derives
+    the signing key (four chained HMACs) for every `generate_presigned_url` call.
+    For a batch we let botocore sign a single template url, then reuse its host,
+    path prefix, query string and timestamp for every other key: each extra url
+    costs one SHA-256 of the canonical request plus one HMAC.
+
+    Keys that cannot be derived from the template (e.g. a template that signs
+    headers other than `host`) fall back to the regular botocore call.
+    """
+
+    def __init__(self, client, credentials_provider):
+        self._client = client
+        self._credentials_provider = credentials_provider
+        self._signing_keys: Dict[Tuple[str, str, str, str], bytes] = {}
+
+    def presign_get_urls(self, bucket: str, keys: Iterable[str], expiration: int) -> Dict[str, str]:
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        template_key = keys[0]
+        template_url = self._presign_with_botocore(bucket, template_key, expiration)
+        urls = {template_key: template_url}
+
+        template = self._parse_template(template_url, template_key)
+        for key in keys[1:]:
+            if key in urls:
+                continue
+            urls[key] = self._sign(template, key) if template else self._presign_with_botocore(bucket, key, expiration)
+        return urls
+
+    def _presign_with_botocore(self, bucket: str, key: str, expiration: int) -> str:
+        return self._client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=expiration,
+        )
+
+    def _parse_template(self, url: str, key: str):
+        parts = urlsplit(url)
+        encoded_key = quote(key, safe="/~")
+        if not parts.path.endswith(encoded_key):
+            return None
+
+        query_pairs: List[Tuple[str, str]] = [
+            (name, value)
+            for name, value in (pair.partition("=")[::2] for pair in parts.query.split("&"))
+            if name != SIGNATURE_PARAM
+        ]
+        params = dict(parse_qsl(parts.query))
+        if params.get("X-Amz-SignedHeaders") != "host":
+            return None
+
+        credentials = self._credentials_provider()
+        if credentials is None:
+            return None
+        access_key, date, region, service, _ = params["X-Amz-Credential"].split("/")
+        if access_key != credentials.access_key:
+            return None
+
+        timestamp = params["X-Amz-Date"]
+        return {
+            "base": f"{parts.scheme}://{parts.netloc}",
+            "host": parts.netloc,
+            "path_prefix": parts.path[: len(parts.path) - len(encoded_key)],
+            "query": "&".join(f"{name}={value}" for name, value in query_pairs),
+            "canonical_query": "&".join(f"{name}={value}" for name, value in sorted(query_pairs)),
+            "timestamp": timestamp,
+            "scope": f"{date}/{region}/{service}/aws4_request",
+            "signing_key": self._signing_key(credentials.secret_key, date, region, service),
+        }
+
+    def _signing_key(self, secret_key: str, date: str, region: str, service: str) -> bytes:
+        cache_key = (secret_key, date, region, service)
+        signing_key = self._signing_keys.get(cache_key)
+        if signing_key is None:
+            k_date = hmac.new(f"AWS4{secret_key}".encode(), date.encode(), hashlib.sha256).digest()
+            k_region = hmac.new(k_date, region.encode(), hashlib.sha256).digest()
+            k_service = hmac.new(k_region, service.encode(), hashlib.sha256).digest()
+            signing_key = hmac.new(k_service, b"aws4_request", hashlib.sha256).digest()
+            # one entry per day/region is enough; drop stale days
+            self._signing_keys = {cache_key: signing_key}
+        return signing_key
+
+    @staticmethod
+    def _sign(template: dict, key: str) -> str:
+        path = template["path_prefix"] + quote(key, safe="/~")
+        canonical_request = "\n".join([
+            "GET",
+            path,
+            template["canonical_query"],
+            f"host:{template['host']}\n",
+            "host",
+            "UNSIGNED-PAYLOAD",
+        ])
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256",
+            template["timestamp"],
+            template["scope"],
+            hashlib.sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ])
+        signature = hmac.new(template["signing_key"], string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+        return f"{template['base']}{path}?{template['query']}&{SIGNATURE_PARAM}={signature}"
+
+
+__all__ = ["S3BatchPresigner"]
@@ -1,76 +1,84 @@
 from __future__ import annotations
-from typing import List, Tuple, Optional
-import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple, Optional
+import os
+import time
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, retry_if_exception_type, stop_after_attempt, wait_exponential
 
-from src.config.settings import LOG_LEVEL, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN, AWS_DEFAULT_REGION
-from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.config.settings import AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, AWS_SESSION_TOKEN, AWS_DEFAULT_REGION
 from src.core.domain.entities.storage_object import StorageObject
 from src.core.domain.entities.storage_item import StorageItem
 from src.core.domain.entities.storage_config import StorageConfig
-from src.core.shared.logging_monitor_handler import LoggingMonitoringHandler
+from src.core.shared.ttl_cache import TTLCache
+from src.infrastructure.gateways.adaptive_bulk_upload_gateway import AdaptiveBulkUploadGateway
+from src.infrastructure.gateways.s3_batch_presigner import S3BatchPresigner
 
 
-class S3StorageGateway(ObjectStorageGateway):
+class S3StorageGateway(AdaptiveBulkUploadGateway):
     """Concrete implementation of ObjectStorageGateway using AWS S3 (boto3).
 
-    This implementation is synchronous and keeps responsibilities small:
+    Single-object calls are synchronous and keep responsibilities small:
     - translate boto3 responses into StorageObject
     - basic error handling
     - presigned url generation
+
+    Bulk uploads (see AdaptiveBulkUploadGateway) run on a thread pool bounded by
+    `StorageConfig.max_concurrency`; the botocore connection pool is sized to the
+    same limit so workers never wait for a free connection.
+
+    `StorageConfig.endpoint_url`/`region_name`, when set, point the client at an
+    S3-compatible service (e.g. MinIO or LocalStack).
+
+    Presigned urls are never generated eagerly: returned StorageObjects resolve
+    their url on first access, and signed urls are cached per expiry window.
     """
 
     def __init__(self, storage_config: StorageConfig = None) -> None:
         if not storage_config:
             storage_config = StorageConfig()
-        
-        config = Config(retries={"max_attempts": storage_config.max_attempts})
+        super().__init__(storage_config, "S3StorageGateway")
+
+        config = Config(
+            retries={"max_attempts": storage_config.max_attempts},
+            max_pool_connections=self._max_concurrency,
+            signature_version="s3v4",
+        )
 
-        client_kwargs = {"region_name": AWS_DEFAULT_REGION, "config": config}
+        client_kwargs = {"region_name": storage_config.region_name or AWS_DEFAULT_REGION, "config": config}
+        if storage_config.endpoint_url:
+            client_kwargs["endpoint_url"] = storage_config.endpoint_url
+        session_kwargs = {}
         if AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY:
-            client_kwargs.update({
+            session_kwargs.update({
                 "aws_access_key_id": AWS_ACCESS_KEY_ID,
                 "aws_secret_access_key": AWS_SECRET_ACCESS_KEY,
             })
             if AWS_SESSION_TOKEN:
-                client_kwargs["aws_session_token"] = AWS_SESSION_TOKEN
+                session_kwargs["aws_session_token"] = AWS_SESSION_TOKEN
 
-        self.logger = logging.getLogger("S3StorageGateway")
-        self._client = boto3.client("s3", **client_kwargs)
+        self._session = boto3.session.Session(**session_kwargs)
+        self._client = self._session.client("s3", **client_kwargs)
 
-        self.logger.debug("S3 client created; region=%s, creds_provided=%s, session_token=%s",
+        self._transfer_config = TransferConfig(
+            multipart_threshold=storage_config.multipart_threshold,
+            multipart_chunksize=storage_config.multipart_chunksize,
+            max_concurrency=self._max_concurrency,
+        )
+
+        self._presign_cache = TTLCache(max_size=storage_config.presign_cache_size)
+        self._batch_presigner = S3BatchPresigner(self._client, self._frozen_credentials)
+
+        self.logger.debug("S3 client created; region=%s, endpoint=%s, creds_provided=%s, session_token=%s",
                           client_kwargs.get("region_name"),
+                          client_kwargs.get("endpoint_url"),
                           bool(AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY),
                           bool(AWS_SESSION_TOKEN))
 
-        self._retry_attempts = int(storage_config.retry_attempts)
-        self._retry_multiplier = float(storage_config.retry_multiplier)
-        self._retry_min = int(storage_config.retry_min)
-        self._retry_max = int(storage_config.retry_max)
-
-        self.logger.setLevel(LOG_LEVEL)
-
-        # console handler if no handlers are configured
-        self._configure_logger(storage_config)
-
-    def _configure_logger(self, storage_config: StorageConfig):        
-        if not self.logger.handlers:
-            ch = logging.StreamHandler()
-            ch.setLevel(LOG_LEVEL)
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            ch.setFormatter(formatter)
-            self.logger.addHandler(ch)
-            
-        if storage_config.monitoring_url:
-            self.logger.addHandler(LoggingMonitoringHandler(url=storage_config.monitoring_url))
-
-
     @retry(
         stop=stop_after_attempt(10),
         wait=wait_exponential(multiplier=1, min=2, max=10),
@@ -78,14 +86,26 @@ class S3StorageGateway(ObjectStorageGateway):
     )
     def upload_object(self, item: StorageItem) -> StorageObject:
         """Upload a single StorageItem to S3 and return a StorageObject pointing to it."""
+        return self._put_object(item)
+
+    def _put_object(self, item: StorageItem) -> StorageObject:
+        """Single PutObject attempt; retries are up to the caller."""
         try:
+            body = item.content
+            if body is None and item.file_object is not None:
+                body = item.file_object
+                if hasattr(body, "seek"):
+                    body.seek(0)  # a retry must resend the whole stream
+
             params = {
                 "Bucket": item.bucket,
                 "Key": item.key,
-                "Body": item.content,
+                "Body": body,
             }
             if item.content_type:
                 params["ContentType"] = item.content_type
+            if item.metadata:
+                params["Metadata"] = item.metadata
 
             response = self._client.put_object(**params)
 
@@ -95,9 +115,8 @@ class S3StorageGateway(ObjectStorageGateway):
                 if etag:
                     metadata["ETag"] = etag
 
-            url = self.presign_url(item.bucket, item.key)
             self.logger.info("Uploaded object %s/%s", item.bucket, item.key)
-            return StorageObject(bucket=item.bucket, key=item.key, url=url, metadata=metadata)
+            return StorageObject(bucket=item.bucket, key=item.key, metadata=metadata, url_resolver=self.presign_url)
 
         except ClientError as exc:
             aws_err = getattr(exc, "response", {}).get("Error", {})
@@ -121,9 +140,8 @@ class S3StorageGateway(ObjectStorageGateway):
                 extra_args['ContentType'] = item.content_type
         
             self._client.upload_fileobj(Fileobj=item.file_object, Bucket=item.bucket, Key=item.key, ExtraArgs=extra_args)
-            url = self.presign_url(item.bucket, item.key)
             self.logger.info("Uploaded file-like object %s/%s", item.bucket, item.key)
-            return StorageObject(bucket=item.bucket, key=item.key, url=url)
+            return StorageObject(bucket=item.bucket, key=item.key, url_resolver=self.presign_url)
         except ClientError as exc:
             aws_err = getattr(exc, "response", {}).get("Error", {})
             err_message = aws_err.get("Message") or str(exc)
@@ -146,34 +164,177 @@ class S3StorageGateway(ObjectStorageGateway):
             self.logger.error("Failed to download object %s/%s: %s", bucket, key, exc)
             raise
 
-    def upload_objects_bulk(
-        self,
-        items: List[Tuple[bytes, str]],
-        bucket: str,
-        prefix: str,
-        content_type: Optional[str] = None,
-    ) -> List[StorageObject]:
-        """Upload multiple objects to S3 in bulk and return a list of StorageObjects."""
-        storage_objects = []
-        for content, key_suffix in items:
-            key = f"{prefix.rstrip('/')}/{key_suffix}"
-            item = StorageItem(bucket=bucket, key=key, content=content, content_type=content_type)
-            storage_objects.append(self.upload_object(item))
-        return storage_objects
+    @retry(
+        stop=stop_after_attempt(10),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(ClientError)
+    )
+    def download_to_file(self, bucket: str, key: str, file_path: str) -> int:
+        """Stream an object from S3 straight into a local file and return its size.
+
+        Objects above `StorageConfig.multipart_threshold` are fetched with parallel
+        ranged GETs; only the in-flight chunks are ever held in memory.
+        """
+        try:
+            self._client.download_file(Bucket=bucket, Key=key, Filename=file_path, Config=self._transfer_config)
+            size = os.path.getsize(file_path)
+            self.logger.info("Downloaded object %s/%s to %s (%d bytes)", bucket, key, file_path, size)
+            return size
+        except ClientError as exc:
+            self.logger.error("Failed to download object %s/%s: %s", bucket, key, exc)
+            raise
+
+    def create_multipart_upload(self, bucket: str, key: str, content_type: Optional[str] = None) -> str:
+        params = {"Bucket": bucket, "Key": key}
+        if content_type:
+            params["ContentType"] = content_type
+        upload_id = self._client.create_multipart_upload(**params)["UploadId"]
+        self.logger.debug("Started multipart upload %s/%s (%s)", bucket, key, upload_id)
+        return upload_id
+
+    @retry(
+        stop=stop_after_attempt(10),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(ClientError)
+    )
+    def upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        response = self._client.upload_part(
+            Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=data,
+        )
+        return response["ETag"]
+
+    def complete_multipart_upload(
+        self, bucket: str, key: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> StorageObject:
+        response = self._client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": [{"PartNumber": number, "ETag": etag} for number, etag in sorted(parts)]},
+        )
+        self.logger.info("Completed multipart upload %s/%s (%d parts)", bucket, key, len(parts))
+        metadata = {"ETag": response["ETag"]} if response.get("ETag") else {}
+        return StorageObject(bucket=bucket, key=key, metadata=metadata, url_resolver=self.presign_url)
+
+    def abort_multipart_upload(self, bucket: str, key: str, upload_id: str) -> None:
+        try:
+            self._client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            self.logger.info("Aborted multipart upload %s/%s", bucket, key)
+        except ClientError as exc:
+            # best effort: the caller is already handling the original failure
+            self.logger.error("Failed to abort multipart upload %s/%s: %s", bucket, key, exc)
 
     def presign_url(self, bucket: str, key: str, expiration: int = 3600) -> str:
         """Generate a presigned URL to access an object in S3."""
+        cache_key, ttl = self._presign_cache_key(bucket, key, expiration)
+        url = self._presign_cache.get(cache_key)
+        if url:
+            return url
         try:
             url = self._client.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": bucket, "Key": key},
                 ExpiresIn=expiration,
             )
+            self._presign_cache.set(cache_key, url, ttl)
             return url
         except ClientError as exc:
             self.logger.error("Failed to generate presigned URL for %s/%s: %s", bucket, key, exc)
             raise
 
+    def presign_urls(self, bucket: str, keys: Iterable[str], expiration: int = 3600) -> Dict[str, str]:
+        """Generate presigned GET URLs for many keys, signing only the ones not cached."""
+        urls: Dict[str, str] = {}
+        missing: Dict[str, tuple] = {}
+        for key in keys:
+            cache_key, ttl = self._presign_cache_key(bucket, key, expiration)
+            url = self._presign_cache.get(cache_key)
+            if url:
+                urls[key] = url
+            else:
+                missing[key] = (cache_key, ttl)
+
+        if missing:
+            try:
+                signed = self._batch_presigner.presign_get_urls(bucket, missing.keys(), expiration)
+            except ClientError as exc:
+                self.logger.error("Failed to generate presigned URLs for %s: %s", bucket, exc)
+                raise
+            for key, url in signed.items():
+                cache_key, ttl = missing[key]
+                self._presign_cache.set(cache_key, url, ttl)
+                urls[key] = url
+        return urls
+
+    def presign_post(
+        self, bucket: str, key: str, content_type: Optional[str], max_size: int, expiration: int = 3600
+    ) -> Dict[str, Any]:
+        """Generate a presigned POST (url + form fields) for a browser/client upload straight to S3.
+
+        The signed policy caps the object at `max_size` bytes and pins the content type,
+        so S3 itself rejects anything else; nothing is cached since every upload is unique.
+        """
+        fields: Dict[str, Any] = {}
+        conditions: List[Any] = [["content-length-range", 1, max_size]]
+        if content_type:
+            fields["Content-Type"] = content_type
+            conditions.append({"Content-Type": content_type})
+        try:
+            return self._client.generate_presigned_post(
+                Bucket=bucket, Key=key, Fields=fields, Conditions=conditions, ExpiresIn=expiration,
+            )
+        except ClientError as exc:
+            self.logger.error("Failed to generate presigned POST for %s/%s: %s", bucket, key, exc)
+            raise
+
+    def presign_upload_part(self, bucket: str, key: str, upload_id: str, part_number: int, expiration: int = 3600) -> str:
+        """Generate a presigned PUT url for one part of a multipart upload."""
+        try:
+            return self._client.generate_presigned_url(
+                "upload_part",
+                Params={"Bucket": bucket, "Key": key, "UploadId": upload_id, "PartNumber": part_number},
+                ExpiresIn=expiration,
+            )
+        except ClientError as exc:
+            self.logger.error("Failed to generate presigned part url for %s/%s: %s", bucket, key, exc)
+            raise
+
+    @retry(
+        stop=stop_after_attempt(10),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception(lambda exc: isinstance(exc, ClientError) and not S3StorageGateway._is_not_found(exc))
+    )
+    def head_object(self, bucket: str, key: str) -> Optional[StorageObject]:
+        """HEAD an object: size, content type and ETag without downloading it; None when it does not exist."""
+        try:
+            response = self._client.head_object(Bucket=bucket, Key=key)
+        except ClientError as exc:
+            if self._is_not_found(exc):
+                return None
+            self.logger.error("Failed to head object %s/%s: %s", bucket, key, exc)
+            raise
+        metadata = {
+            "ContentLength": response["ContentLength"],
+            "ContentType": response.get("ContentType"),
+            "ETag": response.get("ETag"),
+        }
+        return StorageObject(bucket=bucket, key=key, metadata=metadata, url_resolver=self.presign_url)
+
+    @staticmethod
+    def _is_not_found(exc: ClientError) -> bool:
+        return exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    @staticmethod
+    def _presign_cache_key(bucket: str, key: str, expiration: int) -> Tuple[tuple, int]:
+        # An url signed in a window is only reused inside that same window,
+        # so every url handed out is still valid for at least half its expiration.
+        window = max(1, expiration // 2)
+        return (bucket, key, expiration, int(time.time() // window)), window
+
+    def _frozen_credentials(self):
+        credentials = self._session.get_credentials()
+        return credentials.get_frozen_credentials() if credentials else None
+
     def list_objects(self, bucket: str, prefix: str, max_keys: int = 1000) -> List[StorageObject]:
         try:
             paginator = self._client.get_paginator("list_objects_v2")
@@ -183,14 +344,43 @@ class S3StorageGateway(ObjectStorageGateway):
             for page in pages:
                 if "Contents" in page:
                     for obj in page["Contents"]:
-                        key = obj["Key"]
-                        url = self.presign_url(bucket, key)
-                        objects.append(StorageObject(bucket=bucket, key=key, url=url))
+                        objects.append(StorageObject(bucket=bucket, key=obj["Key"], url_resolver=self.presign_url))
             return objects
         except ClientError as exc:
             self.logger.error("Failed to list objects in bucket %s with prefix %s: %s", bucket, prefix, exc)
             raise
             
+    def copy_prefix(self, source_bucket: str, source_prefix: str, target_bucket: str, target_prefix: str) -> int:
+        """Server-side copy of every object under `source_prefix` to `target_prefix`.
+
+        Objects never leave S3 (CopyObject keeps content type and user metadata);
+        copies run on the same bounded pool used by bulk uploads.
+        """
+        source_prefix = f"{source_prefix.rstrip('/')}/"
+        target_prefix = f"{target_prefix.rstrip('/')}/"
+        keys = [obj.key for obj in self.list_objects(source_bucket, source_prefix)]
+
+        def copy(key: str):
+            self._copy_object(source_bucket, key, target_bucket, target_prefix + key[len(source_prefix):])
+
+        with ThreadPoolExecutor(max_workers=self._max_concurrency) as executor:
+            list(executor.map(copy, keys))
+
+        self.logger.info("Copied %d objects from %s/%s to %s/%s", len(keys), source_bucket, source_prefix, target_bucket, target_prefix)
+        return len(keys)
+
+    @retry(
+        stop=stop_after_attempt(10),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_exception_type(ClientError)
+    )
+    def _copy_object(self, source_bucket: str, source_key: str, target_bucket: str, target_key: str):
+        self._client.copy_object(
+            Bucket=target_bucket,
+            Key=target_key,
+            CopySource={"Bucket": source_bucket, "Key": source_key},
+        )
+
     @retry(
         stop=stop_after_attempt(10),
         wait=wait_exponential(multiplier=1, min=2, max=10),
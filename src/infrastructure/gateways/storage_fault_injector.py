@@ -0,0 +1,89 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional
+import random
+import threading
+import time
+
+from botocore.exceptions import ClientError
+
+from src.core.domain.entities.storage_config import StorageConfig
+
+
+class StorageFaultInjector:
+    """Simulated object storage behavior for the local storage backends.
+
+    Every request waits `latency` seconds (plus up to `jitter` more) and, when
+    `bandwidth` (bytes per second) is set, the time its payload would take on
+    the wire. It then fails with probability `throttle_rate` (S3 `SlowDown`,
+    HTTP 503) or `error_rate` (S3 `InternalError`, HTTP 500). Failures are
+    botocore `ClientError`s, so retries and the adaptive bulk upload react to
+    them exactly as they do against S3.
+
+    Configured through `StorageConfig.extra["fault_injection"]`, e.g.
+    `{"latency_ms": 20, "jitter_ms": 10, "bandwidth_mbps": 100, "throttle_rate": 0.01}`.
+    `seed` makes the injected failures reproducible.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: Optional[float] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        seed: Optional[int] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._latency = latency
+        self._jitter = jitter
+        self._bandwidth = bandwidth
+        self._error_rate = error_rate
+        self._throttle_rate = throttle_rate
+        self._sleep = sleep
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, storage_config: StorageConfig) -> "StorageFaultInjector":
+        options: Dict[str, Any] = (storage_config.extra or {}).get("fault_injection") or {}
+        bandwidth_mbps = options.get("bandwidth_mbps")
+        return cls(
+            latency=float(options.get("latency_ms", 0)) / 1000,
+            jitter=float(options.get("jitter_ms", 0)) / 1000,
+            bandwidth=float(bandwidth_mbps) * 1_000_000 / 8 if bandwidth_mbps else None,
+            error_rate=float(options.get("error_rate", 0)),
+            throttle_rate=float(options.get("throttle_rate", 0)),
+            seed=options.get("seed"),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._latency or self._jitter or self._bandwidth or self._error_rate or self._throttle_rate)
+
+    def before_request(self, operation: str, size: int = 0) -> None:
+        """Apply the simulated latency/transfer time of `operation` and maybe fail it."""
+        with self._lock:
+            jitter = self._random.uniform(0, self._jitter) if self._jitter else 0.0
+            roll = self._random.random()
+
+        delay = self._latency + jitter
+        if self._bandwidth and size:
+            delay += size / self._bandwidth
+        if delay:
+            self._sleep(delay)
+
+        if roll < self._throttle_rate:
+            raise client_error(operation, "SlowDown", "Please reduce your request rate.", 503)
+        if roll < self._throttle_rate + self._error_rate:
+            raise client_error(operation, "InternalError", "We encountered an internal error.", 500)
+
+
+def client_error(operation: str, code: str, message: str, status: int) -> ClientError:
+    """A botocore ClientError shaped like the ones S3 returns."""
+    return ClientError(
+        {"Error": {"Code": code, "Message": message}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        operation,
+    )
+
+
+__all__ = ["StorageFaultInjector", "client_error"]
@@ -0,0 +1,42 @@
+from typing import Dict, Optional
+from src.core.domain.entities.frame_cache_entry import FrameCacheEntry
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
+from src.infrastructure.repositories.mongoengine.models.frame_cache_model import FrameCacheCounterModel, FrameCacheEntryModel
+
+class MongoFrameCacheRepository(IFrameCacheRepository):
+
+    def save(self, entry: FrameCacheEntry) -> FrameCacheEntry:
+        """Salva ou atualiza uma entrada do cache (uma por `cache_key`)."""
+        model = FrameCacheEntryModel.objects(cache_key=entry.cache_key).first()
+        if not model:
+            model = FrameCacheEntryModel.from_entity(entry)
+        else:
+            model.bucket = entry.bucket
+            model.frames_prefix = entry.frames_prefix
+            model.job_ref = entry.job_ref
+            model.result = entry.result
+            model.hits = entry.hits
+
+        model.save()
+
+        return model.to_entity()
+
+    def find_by_cache_key(self, cache_key: str) -> Optional[FrameCacheEntry]:
+        model: FrameCacheEntryModel = FrameCacheEntryModel.objects(cache_key=cache_key).first()
+        return model.to_entity() if model else None
+
+    def delete(self, entry: FrameCacheEntry) -> None:
+        FrameCacheEntryModel.objects(cache_key=entry.cache_key).delete()
+
+    def record_lookup(self, hit: bool) -> None:
+        FrameCacheCounterModel.objects(name="hits" if hit else "misses").update_one(upsert=True, inc__value=1)
+
+    def stats(self) -> Dict[str, int]:
+        counters = {counter.name: counter.value for counter in FrameCacheCounterModel.objects}
+        return {
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "entries": FrameCacheEntryModel.objects.count(),
+        }
+
+__all__ = ["MongoFrameCacheRepository"]
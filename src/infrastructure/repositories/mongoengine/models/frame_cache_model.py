@@ -0,0 +1,54 @@
+from mongoengine import DictField, Document, IntField, StringField
+from src.infrastructure.repositories.mongoengine.models.base_model import BaseModel
+from src.core.domain.entities.frame_cache_entry import FrameCacheEntry
+
+
+class FrameCacheEntryModel(BaseModel):
+    """Modelo MongoEngine para FrameCacheEntry."""
+    meta = {'collection': 'frame_cache', 'indexes': ['cache_key', 'job_ref']}
+
+    cache_key = StringField(required=True, unique=True)
+    content_hash = StringField(required=True)
+    bucket = StringField(required=True)
+    frames_prefix = StringField(required=True)
+    job_ref = StringField(required=True)
+    result = DictField()
+    hits = IntField(default=0)
+
+    @classmethod
+    def from_entity(cls, entry: FrameCacheEntry) -> "FrameCacheEntryModel":
+        return cls(
+            id=entry.id,
+            cache_key=entry.cache_key,
+            content_hash=entry.content_hash,
+            bucket=entry.bucket,
+            frames_prefix=entry.frames_prefix,
+            job_ref=entry.job_ref,
+            result=entry.result,
+            hits=entry.hits,
+        )
+
+    def to_entity(self) -> FrameCacheEntry:
+        return FrameCacheEntry(
+            id=self.id,
+            cache_key=self.cache_key,
+            content_hash=self.content_hash,
+            bucket=self.bucket,
+            frames_prefix=self.frames_prefix,
+            job_ref=self.job_ref,
+            result=self.result,
+            hits=self.hits,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+
+class FrameCacheCounterModel(Document):
+    """Contadores globais do cache (hits/misses), compartilhados entre API e workers."""
+    meta = {'collection': 'frame_cache_counters'}
+
+    name = StringField(primary_key=True)
+    value = IntField(default=0)
+
+
+__all__ = ["FrameCacheEntryModel", "FrameCacheCounterModel"]
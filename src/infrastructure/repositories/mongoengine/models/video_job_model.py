@@ -1,4 +1,4 @@
-from mongoengine import StringField, DictField
+from mongoengine import StringField, DictField, ListField
 from src.core.shared.identity_map import IdentityMap
 from src.infrastructure.repositories.mongoengine.models.base_model import BaseModel
 from src.core.constants.video_job_status import VideoJobStatus
@@ -18,6 +18,13 @@ class VideoJobModel(BaseModel):
     frames_path = StringField(required=True)
     notify_url = StringField()
     config = DictField()
+    media_metadata = DictField()
+    result = DictField()
+    content_hash = StringField()
+    progress = DictField()
+    task_ids = ListField(StringField())
+    checkpoint = DictField()
+    upload = DictField()
     error_message = StringField()
     
     @classmethod
@@ -32,6 +39,13 @@ class VideoJobModel(BaseModel):
             frames_path=video_job.frames_path,
             notify_url=video_job.notify_url,
             config=video_job.config,
+            media_metadata=video_job.media_metadata,
+            result=video_job.result,
+            content_hash=video_job.content_hash,
+            progress=video_job.progress,
+            task_ids=video_job.task_ids,
+            checkpoint=video_job.checkpoint,
+            upload=video_job.upload,
             error_message=video_job.error_message
         )
     
@@ -51,6 +65,13 @@ class VideoJobModel(BaseModel):
             frames_path=self.frames_path,
             notify_url=self.notify_url,
             config=self.config,
+            media_metadata=self.media_metadata,
+            result=self.result,
+            content_hash=self.content_hash,
+            progress=self.progress,
+            task_ids=list(self.task_ids or []),
+            checkpoint=self.checkpoint,
+            upload=self.upload,
             error_message=self.error_message
         )
         
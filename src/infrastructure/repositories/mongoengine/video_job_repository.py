@@ -1,5 +1,7 @@
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, Optional
 from uuid import uuid4
+from src.core.constants.video_job_status import VideoJobStatus
 from src.core.domain.entities.video_job import VideoJob
 from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
 from src.infrastructure.repositories.mongoengine.models.video_job_model import VideoJobModel
@@ -16,18 +18,67 @@ class MongoVideoJobRepository(IVideoJobRepository):
             if not model:
                 raise ValueError(f"VideoJob com ID {video_job.id} não encontrado para atualização.")
 
-            model.status = video_job.status
-            model.error_message = video_job.error_message
-            model.updated_at = video_job.updated_at
+            for field, value in self._updatable_fields(video_job).items():
+                setattr(model, field, value)
 
         model.save()
 
         return model.to_entity()
 
+    def save_unless_cancelled(self, video_job: VideoJob) -> bool:
+        """Grava os mesmos campos do `save` com um `$set` filtrado por `status != CANCELLED`."""
+        updates = {f"set__{field}": value for field, value in self._updatable_fields(video_job).items()}
+        updated = VideoJobModel.objects(
+            id=video_job.id, status__ne=VideoJobStatus.CANCELLED.status,
+        ).update_one(**updates)
+        return updated == 1
+
+    def cancel(self, job_ref: str) -> Optional[VideoJob]:
+        """`findAndModify` filtrado pelos status não finalizados: não sobrescreve um job que acabou de terminar."""
+        now = datetime.now()
+        model = VideoJobModel.objects(
+            job_ref=job_ref,
+            status__in=[VideoJobStatus.PENDING.status, VideoJobStatus.QUEUED.status, VideoJobStatus.PROCESSING.status],
+        ).modify(
+            new=True, set__status=VideoJobStatus.CANCELLED.status, set__updated_at=now, set__inactivated_at=now,
+        )
+        return model.to_entity() if model else None
+
+    @staticmethod
+    def _updatable_fields(video_job: VideoJob) -> Dict[str, Any]:
+        # campos reescritos em uma atualização; task_ids só recebe `$push`
+        return {
+            "status": video_job.status,
+            "error_message": video_job.error_message,
+            "media_metadata": video_job.media_metadata,
+            "result": video_job.result,
+            "content_hash": video_job.content_hash,
+            "progress": video_job.progress,
+            "checkpoint": video_job.checkpoint,
+            "upload": video_job.upload,
+            "updated_at": video_job.updated_at,
+        }
+
     def find_by_job_ref(self, job_ref: str) -> Optional[VideoJob]:
         model: VideoJobModel = VideoJobModel.objects(job_ref=job_ref).first()
         return model.to_entity() if model else None
     
+    def update_progress(self, job_ref: str, progress: Dict[str, Any]) -> None:
+        """Atualiza só o campo `progress` (`$set`), chamado com frequência durante a extração."""
+        VideoJobModel.objects(job_ref=job_ref).update_one(set__progress=progress)
+
+    def save_checkpoint(self, job_ref: str, checkpoint: Dict[str, Any]) -> None:
+        """Atualiza só o campo `checkpoint` (`$set`); as entradas do manifesto ficam no storage."""
+        VideoJobModel.objects(job_ref=job_ref).update_one(set__checkpoint=checkpoint)
+
+    def add_task_id(self, job_ref: str, task_id: str) -> None:
+        """Acrescenta o id da tarefa (`$push`); os ids não são reescritos pelo `save`."""
+        VideoJobModel.objects(job_ref=job_ref).update_one(push__task_ids=task_id)
+
+    def find_status(self, job_ref: str) -> Optional[str]:
+        """Projeta só o campo `status`, sem montar a entidade."""
+        return VideoJobModel.objects(job_ref=job_ref).scalar('status').first()
+
     def get_by_id(self, id: str) -> Optional[VideoJob]:
         """Busca um VideoJob pelo id."""
         model: VideoJobModel = VideoJobModel.objects(id=id).first()
@@ -1,11 +1,16 @@
-from typing import Dict, Any
+from typing import Dict, Any, List
 from dependency_injector.wiring import inject, Provide
 from src.config.celery_app import celery_app
+from src.core.application.use_cases.dispatch_video_chunks_use_case import DispatchVideoChunksUseCase
 from src.core.application.use_cases.send_video_to_zipper_use_case import SendVideoToZipperUseCase
 from src.core.containers import Container
+from src.core.domain.entities.frame_segment import FrameSegment
+from src.core.exceptions.job_cancelled_exception import JobCancelledException
 from src.core.ports.gateways.zipper.i_zipper_gateway import IZipperGateway
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
 from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
 from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
 from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
 from src.core.domain.dtos.video_frame_extractor.process_video_task_dto import ProcessVideoTaskDTO
 from src.core.application.use_cases.process_video_use_case import ProcessVideoUseCase
@@ -25,16 +30,31 @@ def extract_frames_task(
     ffmpeg_wrapper: FFmpegWrapper = Provide[Container.ffmpeg_wrapper],
     zipper_gateway: IZipperGateway = Provide[Container.zipper_gateway],
     notification_gateway = Provide[Container.notification_gateway],
+    task_gateway: ITaskQueueGateway = Provide[Container.task_queue_gateway],
+    frame_cache_repository: IFrameCacheRepository = Provide[Container.frame_cache_repository],
 ):
     try:
         print(f"Iniciando task {self.request.id} com dados: {task_data}")
         dto = ProcessVideoTaskDTO(**task_data)
+
+        dispatch_video_chunks_use_case = DispatchVideoChunksUseCase.build(
+            video_job_repository=video_job_repository,
+            storage_gateway=storage_gateway,
+            video_processor=ffmpeg_wrapper,
+            task_gateway=task_gateway,
+            frame_cache_repository=frame_cache_repository,
+        )
+        chord_id = dispatch_video_chunks_use_case.execute(dto)
+        if chord_id:
+            print(f"Task {self.request.id} distribuída em trechos (finalização: {chord_id}).")
+            return {'status': 'dispatched', 'job_ref': dto.job_ref, 'chord_id': chord_id}
         
         process_video_use_case = ProcessVideoUseCase.build(
             video_job_repository=video_job_repository,
             storage_gateway=storage_gateway,
             video_processor=ffmpeg_wrapper,
-            notification_gateway=notification_gateway
+            notification_gateway=notification_gateway,
+            frame_cache_repository=frame_cache_repository,
         )
         video_process_result = process_video_use_case.execute(dto)
         
@@ -45,6 +65,10 @@ def extract_frames_task(
 
         print(f"Task {self.request.id} concluída com sucesso.")
         return {'status': 'success', 'job_ref': dto.job_ref}
+    except JobCancelledException as e:
+        # cancelamento não é retentado: o worker fica livre para o próximo job
+        print(f"Task {self.request.id} interrompida: {e}")
+        return {'status': 'cancelled', 'job_ref': e.job_ref}
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -53,3 +77,120 @@ def extract_frames_task(
 
         raise self.retry(exc=e, countdown=60)
 
+
+@celery_app.task(
+    name='src.infrastructure.tasks.video_tasks.extract_frames_chunk_task',
+    bind=True,
+    acks_late=True,
+)
+@inject
+def extract_frames_chunk_task(
+    self,
+    task_data: Dict[str, Any],
+    chunk: Dict[str, Any],
+    video_job_repository: IVideoJobRepository = Provide[Container.video_job_repository],
+    storage_gateway: ObjectStorageGateway = Provide[Container.object_storage_gateway],
+    ffmpeg_wrapper: FFmpegWrapper = Provide[Container.ffmpeg_wrapper],
+    notification_gateway = Provide[Container.notification_gateway],
+):
+    try:
+        print(f"Iniciando trecho {chunk} da task {self.request.id} (job {task_data.get('job_ref')})")
+        dto = ProcessVideoTaskDTO(**task_data)
+
+        process_video_use_case = ProcessVideoUseCase.build(
+            video_job_repository=video_job_repository,
+            storage_gateway=storage_gateway,
+            video_processor=ffmpeg_wrapper,
+            notification_gateway=notification_gateway
+        )
+        return process_video_use_case.execute_chunk(dto, FrameSegment(**chunk))
+    except JobCancelledException as e:
+        print(f"Trecho {chunk} da task {self.request.id} interrompido: {e}")
+        return {**chunk, 'status': 'cancelled', 'frames': 0}
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+
+        print(f"Erro no trecho {chunk} da task {self.request.id}: {e}")
+
+        raise self.retry(exc=e, countdown=60)
+
+
+@celery_app.task(
+    name='src.infrastructure.tasks.video_tasks.finalize_chunked_video_task',
+    bind=True,
+    acks_late=True,
+)
+@inject
+def finalize_chunked_video_task(
+    self,
+    chunk_results: List[Dict[str, Any]],
+    task_data: Dict[str, Any],
+    video_job_repository: IVideoJobRepository = Provide[Container.video_job_repository],
+    storage_gateway: ObjectStorageGateway = Provide[Container.object_storage_gateway],
+    ffmpeg_wrapper: FFmpegWrapper = Provide[Container.ffmpeg_wrapper],
+    zipper_gateway: IZipperGateway = Provide[Container.zipper_gateway],
+    notification_gateway = Provide[Container.notification_gateway],
+    frame_cache_repository: IFrameCacheRepository = Provide[Container.frame_cache_repository],
+):
+    try:
+        dto = ProcessVideoTaskDTO(**task_data)
+
+        process_video_use_case = ProcessVideoUseCase.build(
+            video_job_repository=video_job_repository,
+            storage_gateway=storage_gateway,
+            video_processor=ffmpeg_wrapper,
+            notification_gateway=notification_gateway,
+            frame_cache_repository=frame_cache_repository,
+        )
+        video_process_result = process_video_use_case.complete_chunks(dto, chunk_results)
+
+        send_video_to_zipper_use_case = SendVideoToZipperUseCase.build(
+            zipper_gateway=zipper_gateway
+        )
+        send_video_to_zipper_use_case.execute(video_process_result)
+
+        print(f"Task {self.request.id} concluída com sucesso.")
+        return {'status': 'success', 'job_ref': dto.job_ref}
+    except JobCancelledException as e:
+        # cancelamento não é retentado: o worker fica livre para o próximo job
+        print(f"Task {self.request.id} interrompida: {e}")
+        return {'status': 'cancelled', 'job_ref': e.job_ref}
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+
+        print(f"Erro na task {self.request.id}: {e}")
+
+        raise self.retry(exc=e, countdown=60)
+
+
+@celery_app.task(
+    name='src.infrastructure.tasks.video_tasks.fail_chunked_video_task',
+    bind=True,
+    acks_late=True,
+)
+@inject
+def fail_chunked_video_task(
+    self,
+    *errback_args,
+    task_data: Dict[str, Any],
+    video_job_repository: IVideoJobRepository = Provide[Container.video_job_repository],
+    storage_gateway: ObjectStorageGateway = Provide[Container.object_storage_gateway],
+    ffmpeg_wrapper: FFmpegWrapper = Provide[Container.ffmpeg_wrapper],
+    notification_gateway = Provide[Container.notification_gateway],
+):
+    # errback do chord: recebe o id da task que falhou (ou request/exc/traceback)
+    error = next((arg for arg in errback_args if isinstance(arg, BaseException)), None)
+    reason = str(error) if error else f"chunk task {errback_args[0] if errback_args else ''} failed"
+    print(f"Falha no processamento distribuído do job {task_data.get('job_ref')}: {reason}")
+
+    process_video_use_case = ProcessVideoUseCase.build(
+        video_job_repository=video_job_repository,
+        storage_gateway=storage_gateway,
+        video_processor=ffmpeg_wrapper,
+        notification_gateway=notification_gateway
+    )
+    process_video_use_case.fail_chunks(ProcessVideoTaskDTO(**task_data), reason)
+    return {'status': 'error', 'job_ref': task_data.get('job_ref')}
+
@@ -1,23 +1,67 @@
 import ffmpeg
+import io
+import math
 import os
-from typing import List
+import subprocess
+import tempfile
+import threading
+from contextlib import ExitStack
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from src.config.settings import FRAMES_PER_SECOND
+from PIL import Image
+
+from src.config.settings import FRAME_EXTRACTION_PARALLELISM, FRAME_SEGMENT_MIN_SECONDS
+from src.core.constants.extraction_mode import ExtractionMode
+from src.core.constants.frame_format import FrameFormat
+from src.core.domain.entities.extraction_progress import ExtractionProgress
+from src.core.domain.entities.frame_extraction_config import FrameExtractionConfig
+from src.core.domain.entities.frame_rendition import RenditionFrame
+from src.core.domain.entities.frame_segment import FrameSegment
+from src.core.domain.entities.media_metadata import MediaMetadata
+from src.core.domain.entities.sprite_sheet import SpriteSheet, SpriteTile
+from src.core.domain.entities.video_frame import VideoFrame
+from src.core.shared.bounded_pipeline import BoundedPipeline
+from src.infrastructure.video.frame_pipe_reader import FFmpegStderrReader, ImagePipeReader
+from src.infrastructure.video.segment_spool import SegmentSpool
+
+ProgressCallback = Callable[[ExtractionProgress], None]
+
+# codec do ffmpeg usado para cada formato de frame
+FRAME_ENCODERS = {
+    FrameFormat.PNG: 'png',
+    FrameFormat.JPEG: 'mjpeg',
+    FrameFormat.WEBP: 'libwebp',
+}
 
 class FFmpegWrapper:
-    def extract_frames(self, video_path: str, output_dir: str) -> List[str]:
+    def __init__(
+        self,
+        parallelism: int = FRAME_EXTRACTION_PARALLELISM,
+        min_segment_seconds: float = FRAME_SEGMENT_MIN_SECONDS,
+    ):
+        self._parallelism = max(1, parallelism)
+        self._min_segment_seconds = min_segment_seconds
+
+    def extract_frames(
+        self, video_path: str, output_dir: str, config: Optional[FrameExtractionConfig] = None
+    ) -> List[str]:
         """
-        Extrai frames de um vídeo a 1 frame por segundo.
+        Extrai frames de um vídeo conforme o modo do job (por padrão, 1 frame por segundo).
         Retorna uma lista de caminhos para os frames extraídos.
         """
+        config = config or FrameExtractionConfig()
         print(f"Extraindo frames de {video_path} para {output_dir}")
-        
+
         try:
             (
-                ffmpeg
-                .input(video_path)
-                .filter('fps', fps=FRAMES_PER_SECOND)
-                .output(os.path.join(output_dir, 'frame_%04d.png'), start_number=0)
+                self._filter_frames(self._input(video_path, config), config)
+                .output(
+                    os.path.join(output_dir, f'frame_%04d.{config.extension}'),
+                    start_number=0,
+                    **self._sampling_options(config),
+                    **self._encoder_options(config),
+                )
                 .run(capture_stdout=True, capture_stderr=True, quiet=True)
             )
         except ffmpeg.Error as e:
@@ -28,10 +72,569 @@ class FFmpegWrapper:
             print('stderr:', e.stderr.decode('utf8'))
             raise e
 
+        # acima de 9999 o ffmpeg alarga o `%04d` (frame_10000): a ordem é pelo número, não lexical
         extracted_files = sorted(
-            [os.path.join(output_dir, f) for f in os.listdir(output_dir) if f.endswith('.png')]
+            [os.path.join(output_dir, f) for f in os.listdir(output_dir) if f.endswith(f'.{config.extension}')],
+            key=self._frame_file_number,
         )
         print(f"Extração concluída. {len(extracted_files)} frames gerados.")
         return extracted_files
 
+    def iter_frames(
+        self,
+        video_path: str,
+        config: Optional[FrameExtractionConfig] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[VideoFrame]:
+        """
+        Extrai frames lendo-os diretamente do stdout do ffmpeg (`image2pipe`), sem gravar em disco.
+        Gera um `VideoFrame(index, pts, data)` assim que cada frame é produzido.
+        Se o consumidor parar de iterar, o processo do ffmpeg é encerrado.
+        `on_progress` recebe o progresso do `-progress` do ffmpeg (chamado na thread de leitura do stderr).
+        """
+        config = config or FrameExtractionConfig()
+        print(f"Extraindo frames de {video_path} via pipe")
+
+        process = (
+            self._filter_frames(self._input(video_path, config), config)
+            .filter('showinfo')
+            .output(
+                'pipe:',
+                format='image2pipe',
+                vcodec=FRAME_ENCODERS[config.frame_format],
+                **self._sampling_options(config),
+                **self._encoder_options(config),
+            )
+            .global_args(*self._global_args(on_progress))
+            .run_async(pipe_stdout=True, pipe_stderr=True)
+        )
+        stderr_reader = FFmpegStderrReader(process.stderr, on_progress=on_progress)
+        stderr_reader.start()
+
+        index = 0
+        try:
+            for data in ImagePipeReader(process.stdout, config.frame_format.format):
+                yield VideoFrame(index=index, pts=self._source_pts(stderr_reader.next_timestamp(), config), data=data)
+                index += 1
+
+            process.wait()
+            stderr_reader.join()
+            if process.returncode != 0:
+                print('stderr:', stderr_reader.output.decode('utf8'))
+                raise ffmpeg.Error('ffmpeg', b'', stderr_reader.output)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+        print(f"Extração concluída. {index} frames gerados.")
+
+    def iter_sprites(
+        self, video_path: str, config: FrameExtractionConfig, on_progress: Optional[ProgressCallback] = None
+    ) -> Iterator[SpriteSheet]:
+        """
+        Agrupa os frames em sprite sheets de `sprite_columns` x `sprite_rows` com o filtro `tile`,
+        lidas do stdout do ffmpeg como em `iter_frames`. O `showinfo` fica antes do `tile`, então
+        registra o timestamp de cada frame, e a posição de cada um na grade sai da ordem de chegada.
+
+        Cada sprite só é entregue quando a próxima chega (ou o ffmpeg termina): assim a última,
+        que pode vir incompleta, recebe exatamente os timestamps que sobraram.
+        """
+        columns, rows = config.sprite_columns, config.sprite_rows
+        print(f"Extraindo sprites {columns}x{rows} de {video_path} via pipe")
+
+        stream = self._filter_frames(self._input(video_path, config), config)
+        if config.max_frames:
+            # o limite vale para frames, não para sprites: corta antes do tile
+            stream = stream.filter('trim', end_frame=config.max_frames)
+        process = (
+            stream
+            .filter('showinfo')
+            .filter('tile', layout=f'{columns}x{rows}')
+            .output(
+                'pipe:',
+                format='image2pipe',
+                vcodec=FRAME_ENCODERS[config.frame_format],
+                # uma imagem por grade completa, sem duplicar sprites para manter taxa constante
+                fps_mode='passthrough',
+                **self._encoder_options(config),
+            )
+            .global_args(*self._global_args(on_progress))
+            .run_async(pipe_stdout=True, pipe_stderr=True)
+        )
+        stderr_reader = FFmpegStderrReader(process.stderr, on_progress=on_progress)
+        stderr_reader.start()
+
+        sprite_index = 0
+        pending: Optional[bytes] = None
+        try:
+            for data in ImagePipeReader(process.stdout, config.frame_format.format):
+                if pending is not None:
+                    timestamps = [stderr_reader.next_timestamp() for _ in range(config.tiles_per_sprite)]
+                    yield self._sprite_sheet(sprite_index, pending, timestamps, config)
+                    sprite_index += 1
+                pending = data
+
+            process.wait()
+            stderr_reader.join()
+            if process.returncode != 0:
+                print('stderr:', stderr_reader.output.decode('utf8'))
+                raise ffmpeg.Error('ffmpeg', b'', stderr_reader.output)
+
+            if pending is not None:
+                timestamps = list(iter(lambda: stderr_reader.next_timestamp(timeout=0), None))
+                yield self._sprite_sheet(sprite_index, pending, timestamps[:config.tiles_per_sprite], config)
+                sprite_index += 1
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+        print(f"Extração concluída. {sprite_index} sprites geradas.")
+
+    @staticmethod
+    def _sprite_sheet(
+        sprite_index: int, data: bytes, timestamps: List[Optional[float]], config: FrameExtractionConfig
+    ) -> SpriteSheet:
+        # o tamanho do frame só é conhecido depois do scale: sai das dimensões da própria sprite
+        with Image.open(io.BytesIO(data)) as image:
+            width, height = image.size
+        tile_width, tile_height = width // config.sprite_columns, height // config.sprite_rows
+        first_index = sprite_index * config.tiles_per_sprite
+        tiles = [
+            SpriteTile(
+                index=first_index + position,
+                pts=FFmpegWrapper._source_pts(pts, config),
+                x=(position % config.sprite_columns) * tile_width,
+                y=(position // config.sprite_columns) * tile_height,
+            )
+            for position, pts in enumerate(timestamps)
+        ]
+        return SpriteSheet(index=sprite_index, data=data, tile_width=tile_width, tile_height=tile_height, tiles=tiles)
+
+    def iter_renditions(
+        self, video_path: str, config: FrameExtractionConfig, on_progress: Optional[ProgressCallback] = None
+    ) -> Iterator[RenditionFrame]:
+        """
+        Gera cada frame em todas as `config.renditions` com uma única decodificação: depois da
+        amostragem (e do `showinfo`), o filtro `split` copia o frame para uma cadeia de escala e
+        encoder por rendition. Cada saída vai para um pipe próprio, herdado pelo ffmpeg como
+        `pipe:<fd>`, lido por uma thread com buffer limitado para que nenhuma saída trave as outras.
+
+        Entrega, para cada frame, um `RenditionFrame` por rendition, na ordem de `config.renditions`.
+        """
+        renditions = config.renditions
+        print(f"Extraindo frames de {video_path} em {len(renditions)} renditions via pipe")
+
+        pipes = [os.pipe() for _ in renditions]
+        split = self._sample_frames(self._input(video_path, config), config).filter('showinfo').split()
+        outputs = []
+        for number, (rendition, (_, write_fd)) in enumerate(zip(renditions, pipes)):
+            rendition_config = config.for_rendition(rendition)
+            outputs.append(
+                self._scale_frames(split[number], rendition_config)
+                .output(
+                    f'pipe:{write_fd}',
+                    format='image2pipe',
+                    vcodec=FRAME_ENCODERS[rendition.frame_format],
+                    **self._sampling_options(config),
+                    **self._encoder_options(rendition_config),
+                )
+            )
+        args = ffmpeg.merge_outputs(*outputs).global_args(*self._global_args(on_progress)).compile()
+        try:
+            process = subprocess.Popen(
+                args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, pass_fds=[write_fd for _, write_fd in pipes]
+            )
+        finally:
+            # só o ffmpeg escreve: sem fechar aqui, os leitores nunca receberiam EOF
+            for _, write_fd in pipes:
+                os.close(write_fd)
+        stderr_reader = FFmpegStderrReader(process.stderr, on_progress=on_progress)
+        stderr_reader.start()
+
+        index = 0
+        with ExitStack() as stack:
+            streams = [stack.enter_context(os.fdopen(read_fd, 'rb')) for read_fd, _ in pipes]
+            readers = [
+                stack.enter_context(
+                    BoundedPipeline(ImagePipeReader(stream, rendition.frame_format.format), max_buffered=2)
+                )
+                for rendition, stream in zip(renditions, streams)
+            ]
+            try:
+                for encoded in zip(*readers):
+                    pts = self._source_pts(stderr_reader.next_timestamp(), config)
+                    for rendition, data in zip(renditions, encoded):
+                        yield RenditionFrame(rendition=rendition, frame=VideoFrame(index=index, pts=pts, data=data))
+                    index += 1
+
+                process.wait()
+                stderr_reader.join()
+                if process.returncode != 0:
+                    print('stderr:', stderr_reader.output.decode('utf8'))
+                    raise ffmpeg.Error('ffmpeg', b'', stderr_reader.output)
+            finally:
+                # encerrar o ffmpeg fecha os pipes e libera as threads de leitura antes do ExitStack
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+
+        print(f"Extração concluída. {index} frames gerados em {len(renditions)} renditions.")
+
+    def iter_frames_parallel(
+        self,
+        video_path: str,
+        config: Optional[FrameExtractionConfig] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        start_tick: int = 0,
+    ) -> Iterator[VideoFrame]:
+        """
+        Extrai frames dividindo a linha do tempo em segmentos processados por vários ffmpeg em paralelo.
+
+        Cada segmento usa seek na entrada (`-ss`) com `-copyts -start_at_zero`, então o filtro `fps`
+        enxerga a mesma grade de tempo de uma execução única e o tick global de cada frame sai do
+        `pts_time` que o `showinfo` reporta enquanto o frame chega pelo pipe. Os segmentos se
+        sobrepõem por um intervalo de frame e cada um só mantém os ticks do seu próprio intervalo,
+        sem duplicar nem perder frames nas fronteiras.
+
+        Todos os segmentos decodificam ao mesmo tempo e até o fim: cada um grava os seus frames em um
+        arquivo temporário (`SegmentSpool`), lido em ordem global enquanto ainda está sendo escrito.
+
+        Vídeos curtos (ou `parallelism=1`) caem na extração via pipe de `iter_frames`, assim como os
+        modos keyframe e scene, que não têm grade de tempo para dividir.
+
+        Com `on_progress`, o progresso informado é a soma do progresso de todos os segmentos.
+
+        `start_tick` retoma a extração de uma tentativa anterior: os ticks já concluídos não são
+        decodificados (o primeiro segmento começa com seek no tick) e os frames mantêm o índice
+        global. Só vale para os modos com grade de tempo.
+        """
+        config = config or FrameExtractionConfig()
+        if not config.mode.is_uniform:
+            yield from self.iter_frames(video_path, config, on_progress)
+            return
+
+        duration = self.probe_duration(video_path)
+        segments = self._plan_segments(duration, config) if duration else []
+        if start_tick:
+            segments = self._resume_segments(segments or [FrameSegment(0, None)], start_tick)
+            if not segments:
+                return
+        elif len(segments) <= 1:
+            yield from self.iter_frames(video_path, config, on_progress)
+            return
+
+        print(f"Extraindo frames de {video_path} em {len(segments)} segmentos paralelos")
+        fps = config.frame_rate
+        processes: List[Any] = []
+        lock = threading.Lock()
+        progress = _SegmentsProgress(on_progress) if on_progress else None
+
+        index = 0
+        with tempfile.TemporaryDirectory() as spool_dir, ExitStack() as stack:
+            # os segmentos ainda não consumidos seguem decodificando para o disco, não para a memória
+            streams = [
+                stack.enter_context(SegmentSpool(
+                    self._stream_segment(
+                        video_path, segment, config, processes, lock, progress.segment(number) if progress else None,
+                    ),
+                    spool_dir,
+                ))
+                for number, segment in enumerate(segments)
+            ]
+            first_tick = None
+            try:
+                # os segmentos rodam juntos, mas são entregues em ordem global
+                for stream in streams:
+                    for tick, data in stream:
+                        first_tick = tick - start_tick if first_tick is None else first_tick
+                        yield VideoFrame(index=tick - first_tick, pts=self._source_pts(float(tick / fps), config), data=data)
+                        index += 1
+            finally:
+                # encerrar os ffmpeg libera as threads de leitura antes do ExitStack
+                with lock:
+                    for process in processes:
+                        if process.poll() is None:
+                            process.kill()
+
+        print(f"Extração concluída. {index} frames gerados.")
+
+    def iter_segment_frames(
+        self, video_path: str, segment: FrameSegment, config: Optional[FrameExtractionConfig] = None
+    ) -> Iterator[VideoFrame]:
+        """
+        Extrai apenas os frames de um segmento da linha do tempo, com `index` igual ao tick global.
+        `video_path` pode ser uma URL (ex: presigned): o ffmpeg faz seek por range request.
+        """
+        config = config or FrameExtractionConfig()
+        fps = config.frame_rate
+        for tick, data in self._stream_segment(video_path, segment, config, [], threading.Lock()):
+            yield VideoFrame(index=tick, pts=self._source_pts(float(tick / fps), config), data=data)
+
+    def plan_chunks(
+        self, duration: float, chunk_seconds: float, config: Optional[FrameExtractionConfig] = None
+    ) -> List[FrameSegment]:
+        """Divide o trecho extraído em segmentos de no máximo `chunk_seconds` (para processamento distribuído)."""
+        config = config or FrameExtractionConfig()
+        count = math.ceil(config.clip_duration(duration) / chunk_seconds)
+        return self._split_ticks(config.total_ticks(duration), count, open_ended=not self._is_bounded(config))
+
+    def _plan_segments(self, duration: float, config: Optional[FrameExtractionConfig] = None) -> List[FrameSegment]:
+        config = config or FrameExtractionConfig()
+        count = min(self._parallelism, int(config.clip_duration(duration) // self._min_segment_seconds))
+        return self._split_ticks(config.total_ticks(duration), count, open_ended=not self._is_bounded(config))
+
+    @staticmethod
+    def _resume_segments(segments: List[FrameSegment], start_tick: int) -> List[FrameSegment]:
+        # descarta os segmentos já concluídos e recorta o segmento em que a tentativa anterior parou
+        return [
+            FrameSegment(max(segment.start_tick, start_tick), segment.end_tick)
+            for segment in segments
+            if segment.end_tick is None or segment.end_tick > start_tick
+        ]
+
+    @staticmethod
+    def _is_bounded(config: FrameExtractionConfig) -> bool:
+        # com fim de trecho ou limite de frames o último segmento termina em um tick conhecido, não no fim do vídeo
+        return bool(config.end_seconds or config.max_frames)
+
+    @staticmethod
+    def _split_ticks(total_ticks: int, count: int, open_ended: bool = True) -> List[FrameSegment]:
+        count = min(count, total_ticks)
+        last_end = None if open_ended else total_ticks
+        if count <= 1:
+            return [FrameSegment(0, last_end)]
+
+        ticks_per_segment = math.ceil(total_ticks / count)
+        return [
+            FrameSegment(start, start + ticks_per_segment if start + ticks_per_segment < total_ticks else last_end)
+            for start in range(0, total_ticks, ticks_per_segment)
+        ]
+
+    def _stream_segment(
+        self,
+        video_path: str,
+        segment: FrameSegment,
+        config: FrameExtractionConfig,
+        processes: List[Any],
+        lock: threading.Lock,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[Tuple[int, bytes]]:
+        """
+        Lê os frames de um segmento do stdout do ffmpeg (`image2pipe`) como `(tick global, dados)`.
+        Com `-copyts -start_at_zero` a saída do filtro `fps` fica na grade de tempo do vídeo inteiro,
+        então o tick de cada frame sai do `pts_time` do `showinfo`; os ticks da margem, que pertencem
+        aos segmentos vizinhos, são descartados. O processo é registrado em `processes` para que
+        quem consome os segmentos possa encerrá-lo.
+        """
+        fps = config.frame_rate
+        # margem de um intervalo de frame: o filtro fps escolhe o frame mais próximo de cada tick
+        seek = max(Fraction(0), segment.start_tick / fps - 1 / fps)
+        input_options: Dict[str, Any] = {'ss': float(seek) + config.start_offset}
+        if segment.end_tick is not None:
+            duration = segment.end_tick / fps + 1 / fps - seek
+            if config.end_seconds:
+                duration = min(duration, Fraction(config.end_seconds) - Fraction(config.start_offset) - seek)
+            input_options['t'] = float(duration)
+
+        stream = ffmpeg.input(video_path, **input_options)
+        if config.start_seconds:
+            # com -copyts os timestamps são os do vídeo: desloca para o início do trecho, como na extração única
+            stream = stream.filter('setpts', f'PTS-{config.start_seconds}/TB')
+        stream = (
+            self._filter_frames(stream, config)
+            .filter('showinfo')
+            .output(
+                'pipe:',
+                format='image2pipe',
+                vcodec=FRAME_ENCODERS[config.frame_format],
+                # cada frame sai com o timestamp do filtro fps, sem completar a taxa desde o zero
+                fps_mode='passthrough',
+                **self._encoder_options(config),
+            )
+            .global_args(*self._global_args(on_progress), '-copyts', '-start_at_zero')
+        )
+        with lock:
+            process = stream.run_async(pipe_stdout=True, pipe_stderr=True)
+            processes.append(process)
+
+        def segment_progress(progress: ExtractionProgress):
+            # com -copyts o out_time do muxer não acompanha o trecho: deriva da grade de ticks
+            on_progress(progress._replace(out_time=float(progress.frames / fps)))
+
+        stderr_reader = FFmpegStderrReader(process.stderr, on_progress=segment_progress if on_progress else None)
+        stderr_reader.start()
+        try:
+            for data in ImagePipeReader(process.stdout, config.frame_format.format):
+                pts = stderr_reader.next_timestamp()
+                if pts is None:
+                    raise RuntimeError(f"ffmpeg did not report the timestamp of a frame of segment {segment}")
+                tick = round(pts * fps)
+                if tick >= segment.start_tick and (segment.end_tick is None or tick < segment.end_tick):
+                    yield tick, data
+
+            process.wait()
+            stderr_reader.join()
+            if process.returncode != 0:
+                print('stderr:', stderr_reader.output.decode('utf8'))
+                raise ffmpeg.Error('ffmpeg', b'', stderr_reader.output)
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            process.stdout.close()
+
+    @staticmethod
+    def _frame_file_number(frame_path: str) -> int:
+        return int(os.path.splitext(os.path.basename(frame_path))[0].rsplit('_', 1)[-1])
+
+    @staticmethod
+    def probe_media(video_path: str) -> MediaMetadata:
+        """
+        Lê duração, resolução, fps, codec e quantidade de frames via ffprobe (só o cabeçalho do arquivo).
+        `video_path` pode ser uma URL. Lança `ValueError` se o arquivo não puder ser lido ou não
+        tiver stream de vídeo decodificável.
+        """
+        try:
+            probe = ffmpeg.probe(video_path)
+        except ffmpeg.Error as e:
+            stderr = (e.stderr or b'').decode('utf8', errors='replace').strip().splitlines()
+            raise ValueError(f"ffprobe could not read {video_path}: {stderr[-1] if stderr else e}") from e
+
+        video_stream = next((stream for stream in probe.get('streams', []) if stream.get('codec_type') == 'video'), None)
+        if video_stream is None:
+            raise ValueError(f"No video stream found in {video_path}")
+
+        duration = float(probe.get('format', {}).get('duration') or video_stream.get('duration') or 0)
+        frame_rate = video_stream.get('avg_frame_rate') or video_stream.get('r_frame_rate') or '0/1'
+        numerator, _, denominator = frame_rate.partition('/')
+        fps = float(numerator) / float(denominator) if denominator and float(denominator) else float(numerator)
+        if duration <= 0 or fps <= 0 or not video_stream.get('width'):
+            raise ValueError(f"Video stream in {video_path} has no decodable frames")
+
+        nb_frames = video_stream.get('nb_frames')
+        return MediaMetadata(
+            duration=duration,
+            width=int(video_stream['width']),
+            height=int(video_stream['height']),
+            fps=round(fps, 3),
+            codec=video_stream.get('codec_name', 'unknown'),
+            frame_count=int(nb_frames) if nb_frames and str(nb_frames).isdigit() else round(duration * fps),
+        )
+
+    @classmethod
+    def probe_duration(cls, video_path: str) -> Optional[float]:
+        """Duração do vídeo em segundos via ffprobe, ou `None` se não for possível obtê-la."""
+        try:
+            return cls.probe_media(video_path).duration
+        except (KeyError, ValueError, OSError) as e:
+            print(f"Não foi possível obter a duração de {video_path}: {e}")
+            return None
+
+    @staticmethod
+    def _global_args(on_progress: Optional[ProgressCallback] = None) -> Tuple[str, ...]:
+        # o bloco do -progress sai no stderr, junto do showinfo, e é lido pelo FFmpegStderrReader
+        if on_progress:
+            return ('-hide_banner', '-nostats', '-progress', 'pipe:2')
+        return ('-hide_banner', '-nostats')
+
+    @staticmethod
+    def _source_pts(pts: Optional[float], config: FrameExtractionConfig) -> Optional[float]:
+        # com seek na entrada o ffmpeg conta o tempo a partir do início do trecho
+        if pts is None or not config.start_seconds:
+            return pts
+        return round(pts + config.start_seconds, 6)
+
+    @staticmethod
+    def _input(video_path: str, config: FrameExtractionConfig, **options):
+        # seek na entrada: o trecho fora de [start, end) não chega a ser decodificado
+        if config.start_seconds:
+            options['ss'] = config.start_seconds
+        if config.end_seconds:
+            options['t'] = config.end_seconds - config.start_offset
+        if config.mode == ExtractionMode.KEYFRAME:
+            # o decoder descarta tudo que não é keyframe: nem chega a decodificar os P/B-frames
+            options['skip_frame'] = 'nokey'
+        return ffmpeg.input(video_path, **options)
+
+    @classmethod
+    def _filter_frames(cls, stream, config: FrameExtractionConfig):
+        return cls._scale_frames(cls._sample_frames(stream, config), config)
+
+    @staticmethod
+    def _sample_frames(stream, config: FrameExtractionConfig):
+        if config.mode == ExtractionMode.INTERVAL:
+            stream = stream.filter('fps', fps=str(config.frame_rate))
+        elif config.mode == ExtractionMode.SCENE:
+            # o primeiro frame abre a primeira cena; os demais só quando o score de mudança passa do limite
+            stream = stream.filter('select', f'eq(n,0)+gt(scene,{config.scene_threshold})')
+        return stream
+
+    @staticmethod
+    def _scale_frames(stream, config: FrameExtractionConfig):
+        if config.resizes:
+            # só reduz: mantém a proporção dentro da caixa máxima e nunca amplia o frame
+            stream = stream.filter(
+                'scale',
+                w=f'min(iw,{config.max_width})' if config.max_width else 'iw',
+                h=f'min(ih,{config.max_height})' if config.max_height else 'ih',
+                force_original_aspect_ratio='decrease',
+                force_divisible_by=2,
+            )
+        return stream
+
+    @staticmethod
+    def _sampling_options(config: FrameExtractionConfig) -> Dict[str, Any]:
+        """
+        Nos modos keyframe/scene cada frame mantém seu timestamp de origem, sem duplicar para taxa constante.
+        `max_frames` encerra a saída (e a decodificação) ao atingir o limite.
+        """
+        options: Dict[str, Any] = {}
+        if not config.mode.is_uniform:
+            options['fps_mode'] = 'passthrough'
+        if config.max_frames:
+            options['frames:v'] = config.max_frames
+        return options
+
+    @staticmethod
+    def _encoder_options(config: FrameExtractionConfig) -> Dict[str, Any]:
+        """
+        Converte `quality` (1-100) para a escala do encoder do formato:
+        - jpeg: `-q:v` de 31 (pior) a 2 (melhor);
+        - webp: `-quality` de 0 a 100;
+        - png: sem perdas, ignora a qualidade.
+        """
+        if config.quality is None:
+            return {}
+        if config.frame_format == FrameFormat.JPEG:
+            return {'q:v': round(31 - (config.quality - 1) * 29 / 99)}
+        if config.frame_format == FrameFormat.WEBP:
+            return {'quality': config.quality}
+        return {}
+
+
+class _SegmentsProgress:
+    """Soma o progresso dos ffmpeg de cada segmento paralelo em um único `ExtractionProgress`."""
+
+    def __init__(self, on_progress: ProgressCallback):
+        self._on_progress = on_progress
+        self._segments: Dict[int, ExtractionProgress] = {}
+        self._lock = threading.Lock()
+
+    def segment(self, number: int) -> ProgressCallback:
+        def report(progress: ExtractionProgress):
+            with self._lock:
+                self._segments[number] = progress
+                total = ExtractionProgress(
+                    frames=sum(segment.frames for segment in self._segments.values()),
+                    out_time=sum(segment.out_time for segment in self._segments.values()),
+                )
+                self._on_progress(total)
+
+        return report
+
+
 __all__ = ["FFmpegWrapper"]
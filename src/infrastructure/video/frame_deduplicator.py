@@ -0,0 +1,76 @@
+import io
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+from PIL import Image
+
+from src.core.domain.entities.video_frame import VideoFrame
+
+# dHash de 8x8 = 64 bits por frame
+HASH_SIZE = 8
+
+
+def difference_hashes(grays: np.ndarray) -> np.ndarray:
+    """
+    dHash vetorizado de um lote de imagens em tons de cinza com shape `(n, hash_size, hash_size + 1)`.
+    Cada bit indica se o pixel é mais claro que o vizinho da direita; retorna um `uint64` por imagem.
+    """
+    bits = grays[:, :, 1:] > grays[:, :, :-1]
+    packed = np.packbits(bits.reshape(len(grays), -1), axis=1)
+    return packed.view('>u8').ravel().astype(np.uint64)
+
+
+def hamming_distance(first: int, second: int) -> int:
+    return (int(first) ^ int(second)).bit_count()
+
+
+class FrameDeduplicator:
+    """
+    Descarta frames quase idênticos antes do upload comparando o dHash de cada frame com o do
+    último frame mantido: se a distância de Hamming for até `max_distance` bits, o frame é
+    descartado e registrado em `dropped`.
+
+    O frame codificado (png/jpeg/webp) é decodificado direto em escala reduzida de cinza; no
+    jpeg o `draft` do Pillow reduz a escala já na decodificação DCT.
+    """
+
+    def __init__(self, max_distance: int, hash_size: int = HASH_SIZE):
+        self._max_distance = max_distance
+        self._hash_size = hash_size
+        self.dropped: List[Dict[str, Any]] = []
+
+    def filter(self, frames: Iterable[VideoFrame]) -> Iterator[VideoFrame]:
+        last_hash: Optional[int] = None
+        last_index: Optional[int] = None
+        for frame in frames:
+            frame_hash = self.frame_hash(frame.data)
+            if last_hash is not None:
+                distance = hamming_distance(frame_hash, last_hash)
+                if distance <= self._max_distance:
+                    self.dropped.append({
+                        "index": frame.index,
+                        "pts": frame.pts,
+                        "duplicate_of": last_index,
+                        "distance": distance,
+                    })
+                    continue
+            last_hash, last_index = frame_hash, frame.index
+            yield frame
+
+    def frame_hash(self, data: bytes) -> int:
+        return int(difference_hashes(self._grayscale(data)[np.newaxis])[0])
+
+    def frame_hashes(self, frames_data: Sequence[bytes]) -> np.ndarray:
+        """Hashes de vários frames de uma vez (usado no benchmark e em lotes)."""
+        return difference_hashes(np.stack([self._grayscale(data) for data in frames_data]))
+
+    def _grayscale(self, data: bytes) -> np.ndarray:
+        size = (self._hash_size + 1, self._hash_size)
+        with Image.open(io.BytesIO(data)) as image:
+            image.draft('L', (size[0] * 8, size[1] * 8))
+            # reduz antes de converter: a conversão de cor roda só sobre a miniatura
+            thumbnail = image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+            return np.asarray(thumbnail.convert('L'), dtype=np.int16)
+
+
+__all__ = ["FrameDeduplicator", "difference_hashes", "hamming_distance", "HASH_SIZE"]
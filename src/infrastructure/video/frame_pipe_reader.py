@@ -0,0 +1,204 @@
+import queue
+import re
+import struct
+import threading
+import time
+from collections import deque
+from typing import IO, Callable, Dict, Iterator, Optional
+
+from src.core.domain.entities.extraction_progress import ExtractionProgress
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SOI = b"\xff\xd8"
+JPEG_SOS = b"\xff\xda"
+JPEG_EOI = b"\xff\xd9"
+READ_CHUNK_SIZE = 64 * 1024
+
+SHOWINFO_PATTERN = re.compile(r"\[Parsed_showinfo_\d+ @ [^\]]+\] n:\s*\d+ .*?pts_time:(\S+)")
+# blocos `chave=valor` do `-progress`, encerrados por `progress=continue|end`
+PROGRESS_PATTERN = re.compile(r"^(\w+)=\s*(\S+)$")
+
+
+class ImagePipeReader:
+    """
+    Separa os frames codificados que o ffmpeg escreve em sequência no stdout (`image2pipe`).
+
+    Nenhum desses formatos tem delimitador externo, então cada frame é delimitado
+    pela própria estrutura do arquivo:
+    - png: chunk a chunk até o `IEND`;
+    - jpeg: segmentos até o `SOS` e, no dado entrópico, até o marcador `EOI`;
+    - webp: tamanho declarado no cabeçalho `RIFF`.
+    """
+
+    def __init__(self, stream: IO[bytes], image_format: str = "png"):
+        readers = {"png": self._read_png, "jpeg": self._read_jpeg, "webp": self._read_webp}
+        if image_format not in readers:
+            raise ValueError(f"Unsupported image format for ffmpeg pipe: {image_format}")
+        self._stream = stream
+        self._read_available = getattr(stream, "read1", stream.read)
+        self._pending = bytearray()
+        self._read = readers[image_format]
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            frame = self.read_frame()
+            if frame is None:
+                return
+            yield frame
+
+    def read_frame(self) -> Optional[bytes]:
+        return self._read()
+
+    def _read_png(self) -> Optional[bytes]:
+        signature = self._read_exactly(len(PNG_SIGNATURE), allow_eof=True)
+        if signature is None:
+            return None
+        if signature != PNG_SIGNATURE:
+            raise ValueError("Invalid PNG signature in ffmpeg output stream.")
+
+        parts = [signature]
+        while True:
+            header = self._read_exactly(8)
+            length, chunk_type = struct.unpack(">I4s", header)
+            parts.append(header)
+            parts.append(self._read_exactly(length + 4))  # dados + CRC
+            if chunk_type == b"IEND":
+                return b"".join(parts)
+
+    def _read_jpeg(self) -> Optional[bytes]:
+        soi = self._read_exactly(2, allow_eof=True)
+        if soi is None:
+            return None
+        if soi != JPEG_SOI:
+            raise ValueError("Invalid JPEG marker in ffmpeg output stream.")
+
+        parts = [soi]
+        while True:
+            marker = self._read_exactly(2)
+            parts.append(marker)
+            if marker[0] != 0xFF:
+                raise ValueError("Invalid JPEG segment in ffmpeg output stream.")
+            if marker == JPEG_EOI:
+                return b"".join(parts)
+            length_bytes = self._read_exactly(2)
+            (length,) = struct.unpack(">H", length_bytes)
+            parts.append(length_bytes)
+            parts.append(self._read_exactly(length - 2))
+            if marker == JPEG_SOS:
+                # no dado entrópico todo 0xFF é seguido de 0x00 ou RSTn, então o EOI é inequívoco
+                parts.append(self._read_until(JPEG_EOI))
+                return b"".join(parts)
+
+    def _read_webp(self) -> Optional[bytes]:
+        header = self._read_exactly(12, allow_eof=True)
+        if header is None:
+            return None
+        riff, size, webp = struct.unpack("<4sI4s", header)
+        if riff != b"RIFF" or webp != b"WEBP":
+            raise ValueError("Invalid WebP header in ffmpeg output stream.")
+        return header + self._read_exactly(size - 4 + (size & 1))
+
+    def _read_until(self, delimiter: bytes) -> bytes:
+        """Lê até `delimiter` (inclusive); o que vier depois fica pendente para o próximo frame."""
+        buffer = self._take_pending()
+        search_from = 0
+        while True:
+            position = buffer.find(delimiter, search_from)
+            if position != -1:
+                end = position + len(delimiter)
+                self._pending = buffer[end:]
+                return bytes(buffer[:end])
+            search_from = max(0, len(buffer) - len(delimiter) + 1)
+            chunk = self._read_available(READ_CHUNK_SIZE)
+            if not chunk:
+                raise EOFError("Unexpected end of ffmpeg output stream.")
+            buffer.extend(chunk)
+
+    def _read_exactly(self, size: int, allow_eof: bool = False) -> Optional[bytes]:
+        buffer = self._take_pending(size)
+        while len(buffer) < size:
+            chunk = self._stream.read(size - len(buffer))
+            if not chunk:
+                if allow_eof and not buffer:
+                    return None
+                raise EOFError("Unexpected end of ffmpeg output stream.")
+            buffer.extend(chunk)
+        return bytes(buffer)
+
+    def _take_pending(self, size: Optional[int] = None) -> bytearray:
+        if size is None or size >= len(self._pending):
+            taken, self._pending = self._pending, bytearray()
+        else:
+            taken, self._pending = self._pending[:size], self._pending[size:]
+        return taken
+
+
+class FFmpegStderrReader(threading.Thread):
+    """
+    Consome o stderr do ffmpeg em background para que o processo nunca bloqueie no pipe.
+
+    Extrai o `pts_time` de cada linha do filtro `showinfo` e guarda as últimas linhas
+    restantes para compor a mensagem de erro quando o ffmpeg falha.
+
+    Com `on_progress`, também interpreta os blocos do `-progress` (gravados no mesmo pipe) e
+    chama o callback, nesta thread, com um `ExtractionProgress` ao fim de cada bloco.
+    """
+
+    def __init__(
+        self,
+        stream: IO[bytes],
+        tail_size: int = 200,
+        on_progress: Optional[Callable[[ExtractionProgress], None]] = None,
+    ):
+        super().__init__(daemon=True)
+        self._stream = stream
+        self._timestamps: "queue.Queue[float]" = queue.Queue()
+        self._tail = deque(maxlen=tail_size)
+        self._on_progress = on_progress
+        self._progress_fields: Dict[str, str] = {}
+
+    def run(self):
+        for raw_line in iter(self._stream.readline, b""):
+            line = raw_line.decode("utf8", errors="replace").rstrip()
+            match = SHOWINFO_PATTERN.search(line)
+            if match:
+                self._timestamps.put(float(match.group(1)))
+                continue
+            progress = PROGRESS_PATTERN.match(line) if self._on_progress else None
+            if progress:
+                self._read_progress(*progress.groups())
+            else:
+                self._tail.append(line)
+
+    def _read_progress(self, key: str, value: str):
+        if key != "progress":
+            self._progress_fields[key] = value
+            return
+        fields, self._progress_fields = self._progress_fields, {}
+        out_time_us = fields.get("out_time_us", "")
+        self._on_progress(ExtractionProgress(
+            frames=int(fields.get("frame", 0)),
+            # antes do primeiro frame o ffmpeg informa `N/A`
+            out_time=int(out_time_us) / 1_000_000 if out_time_us.lstrip("-").isdigit() else 0.0,
+            done=value == "end",
+        ))
+
+    def next_timestamp(self, timeout: float = 5.0) -> Optional[float]:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self._timestamps.get(timeout=0.05)
+            except queue.Empty:
+                if not self.is_alive() or time.monotonic() >= deadline:
+                    break
+        try:
+            return self._timestamps.get_nowait()
+        except queue.Empty:
+            return None
+
+    @property
+    def output(self) -> bytes:
+        return "\n".join(self._tail).encode("utf8")
+
+
+__all__ = ["ImagePipeReader", "FFmpegStderrReader"]
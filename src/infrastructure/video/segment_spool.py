@@ -0,0 +1,86 @@
+import os
+import tempfile
+import threading
+from collections import deque
+from typing import Deque, Iterable, Iterator, Optional, Tuple
+
+
+class SegmentSpool:
+    """
+    Grava em um arquivo temporário os frames `(tick, dados)` de um segmento à medida que o ffmpeg
+    os produz, em uma thread própria, para que o segmento decodifique até o fim enquanto os
+    anteriores ainda estão sendo consumidos. Em memória fica só o tick e o tamanho de cada frame.
+
+    A leitura acompanha a escrita: devolve os frames já gravados, em ordem, e espera pelos
+    próximos até o segmento terminar. Um erro no produtor é relançado para o consumidor depois
+    dos frames gravados antes dele; sair do contexto cancela o produtor e apaga o arquivo.
+
+    Uso:
+        with SegmentSpool(frames, directory) as spool:
+            for tick, data in spool:
+                ...
+    """
+
+    def __init__(self, source: Iterable[Tuple[int, bytes]], directory: Optional[str] = None):
+        self._source = source
+        self._directory = directory
+        self._entries: Deque[Tuple[int, int]] = deque()
+        self._condition = threading.Condition()
+        self._done = False
+        self._cancelled = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._path: Optional[str] = None
+        self._thread = threading.Thread(target=self._produce, name="segment-spool-producer", daemon=True)
+
+    def __enter__(self) -> "SegmentSpool":
+        fd, self._path = tempfile.mkstemp(suffix=".spool", dir=self._directory)
+        self._writer = os.fdopen(fd, "wb")
+        self._reader = open(self._path, "rb")
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._cancelled.set()
+        self._thread.join()
+        self._reader.close()
+        os.remove(self._path)
+        return False
+
+    def __iter__(self) -> Iterator[Tuple[int, bytes]]:
+        while True:
+            with self._condition:
+                while not self._entries and not self._done:
+                    self._condition.wait()
+                if not self._entries:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                tick, length = self._entries.popleft()
+            # os frames são lidos na ordem em que foram gravados: o offset é implícito
+            yield tick, self._reader.read(length)
+
+    def _produce(self):
+        iterator = iter(self._source)
+        try:
+            for tick, data in iterator:
+                if self._cancelled.is_set():
+                    break
+                self._writer.write(data)
+                # o leitor usa outro descritor: o frame precisa estar no arquivo antes de ser anunciado
+                self._writer.flush()
+                with self._condition:
+                    self._entries.append((tick, len(data)))
+                    self._condition.notify_all()
+        except BaseException as e:
+            self._error = e
+        finally:
+            close = getattr(iterator, "close", None)
+            if close:
+                close()
+            self._writer.close()
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+
+__all__ = ["SegmentSpool"]
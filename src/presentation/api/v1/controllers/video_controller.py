@@ -1,10 +1,21 @@
+from src.core.application.use_cases.cancel_video_job_use_case import CancelVideoJobUseCase
+from src.core.application.use_cases.confirm_video_upload_use_case import ConfirmVideoUploadUseCase
+from src.core.application.use_cases.create_video_upload_use_case import CreateVideoUploadUseCase
+from src.core.application.use_cases.get_frame_cache_stats_use_case import GetFrameCacheStatsUseCase
 from src.core.application.use_cases.register_video_use_case import RegisterVideoUseCase
-from src.core.domain.dtos.video_frame_extractor.register_video_dto import RegisterVideoDTO
+from src.core.domain.dtos.video_frame_extractor.confirm_video_upload_dto import ConfirmVideoUploadDTO
+from src.core.domain.dtos.video_frame_extractor.create_video_upload_dto import CreateVideoUploadDTO
+from src.core.domain.dtos.video_frame_extractor.frame_cache_stats_dto import FrameCacheStatsDTO
+from src.core.domain.dtos.video_frame_extractor.register_video_params_dto import RegisterVideoParamsDTO
 from src.core.domain.dtos.video_frame_extractor.video_job_dto import VideoJobDTO
+from src.core.domain.dtos.video_frame_extractor.video_upload_dto import VideoUploadDTO
 from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
 from src.core.ports.gateways.callbacks.i_notification_gateway import INotificationGateway
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
 from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
 from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+from src.presentation.api.v1.forms.streaming_form_file import StreamingFormFile
 from src.presentation.api.v1.presenters.dto_presenter import DTOPresenter
 from src.core.application.use_cases.get_video_status import GetVideoStatusUseCase
 
@@ -15,20 +26,46 @@ class VideoController:
         storage_gateway: ObjectStorageGateway,
         task_gateway: ITaskQueueGateway,
         notification_gateway: INotificationGateway,
+        video_processor: FFmpegWrapper,
+        frame_cache_repository: IFrameCacheRepository,
     ):
         self._video_job_repository = video_job_repository
         self._storage_gateway = storage_gateway
         self._task_gateway = task_gateway
         self._notification_gateway = notification_gateway
+        self._video_processor = video_processor
+        self._frame_cache_repository = frame_cache_repository
 
-    async def register_video(self, dto: RegisterVideoDTO) -> VideoJobDTO:
+    async def register_video(self, dto: RegisterVideoParamsDTO, video_file: StreamingFormFile) -> VideoJobDTO:
         register_video_use_case: RegisterVideoUseCase = RegisterVideoUseCase.build(
             video_job_repository=self._video_job_repository,
             storage_gateway=self._storage_gateway,
             task_gateway=self._task_gateway,
             notification_gateway=self._notification_gateway,
+            video_processor=self._video_processor,
         )
-        video_job_entity = await register_video_use_case.execute(dto)
+        video_job_entity = await register_video_use_case.execute(dto, video_file.chunks(), video_file.content_type)
+        return DTOPresenter.transform(video_job_entity, VideoJobDTO)
+
+    async def create_video_upload(self, dto: CreateVideoUploadDTO) -> VideoUploadDTO:
+        create_video_upload_use_case: CreateVideoUploadUseCase = CreateVideoUploadUseCase.build(
+            video_job_repository=self._video_job_repository,
+            storage_gateway=self._storage_gateway,
+            task_gateway=self._task_gateway,
+            notification_gateway=self._notification_gateway,
+            video_processor=self._video_processor,
+        )
+        return await create_video_upload_use_case.execute(dto)
+
+    async def confirm_video_upload(self, job_ref: str, dto: ConfirmVideoUploadDTO) -> VideoJobDTO:
+        confirm_video_upload_use_case: ConfirmVideoUploadUseCase = ConfirmVideoUploadUseCase.build(
+            video_job_repository=self._video_job_repository,
+            storage_gateway=self._storage_gateway,
+            task_gateway=self._task_gateway,
+            notification_gateway=self._notification_gateway,
+            video_processor=self._video_processor,
+        )
+        video_job_entity = await confirm_video_upload_use_case.execute(job_ref, dto)
         return DTOPresenter.transform(video_job_entity, VideoJobDTO)
 
     async def get_video_status(self, job_ref: str) -> VideoJobDTO:
@@ -38,4 +75,17 @@ class VideoController:
         video_job_dto = await get_video_status_use_case.execute(job_ref)
         return video_job_dto
 
+    async def cancel_video_job(self, job_ref: str) -> VideoJobDTO:
+        cancel_video_job_use_case: CancelVideoJobUseCase = CancelVideoJobUseCase.build(
+            video_job_repository=self._video_job_repository,
+            task_gateway=self._task_gateway,
+        )
+        return await cancel_video_job_use_case.execute(job_ref)
+
+    async def get_frame_cache_stats(self) -> FrameCacheStatsDTO:
+        get_frame_cache_stats_use_case: GetFrameCacheStatsUseCase = GetFrameCacheStatsUseCase.build(
+            frame_cache_repository=self._frame_cache_repository
+        )
+        return await get_frame_cache_stats_use_case.execute()
+
 __all__ = ["VideoController"]
@@ -0,0 +1,118 @@
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Optional
+
+from fastapi.exceptions import RequestValidationError
+from python_multipart.multipart import MultipartParseError, MultipartParser, parse_options_header
+
+# folga para boundaries e headers das partes ao comparar o Content-Length com o limite do arquivo
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+class StreamingFormFile:
+    """
+    Campo de arquivo de um corpo multipart/form-data lido à medida que chega, sem o spool em
+    memória/disco que o `UploadFile` do FastAPI faz antes de o endpoint rodar.
+
+    `open()` lê o corpo só até os headers da parte `field_name` (preenchendo `filename` e
+    `content_type`); `chunks()` entrega o conteúdo dessa parte na ordem em que chega e para de ler
+    o corpo quando ela termina. As demais partes são descartadas. Como o consumo acompanha o
+    envio, um consumidor lento segura a leitura do socket e o cliente (backpressure).
+
+    Corpo sem o campo, malformado ou maior que `max_size` (pelo Content-Length) gera o mesmo
+    `RequestValidationError` que a validação do FastAPI geraria.
+    """
+
+    def __init__(
+        self,
+        stream: AsyncIterator[bytes],
+        content_type_header: Optional[str],
+        field_name: str,
+        content_length: Optional[int] = None,
+        max_size: Optional[int] = None,
+        max_size_message: str = "File exceeds the maximum size",
+    ):
+        self.field_name = field_name
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self._stream = stream.__aiter__()
+        self._pending: Deque[bytes] = deque()
+        self._found = False
+        self._in_field = False
+        self._finished = False
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+
+        if max_size is not None and content_length and content_length > max_size + FORM_OVERHEAD_BYTES:
+            raise self._error("value_error", f"Value error, {max_size_message}")
+        media_type, options = parse_options_header(content_type_header or "")
+        boundary = options.get(b"boundary")
+        if media_type != b"multipart/form-data" or not boundary:
+            raise self._error("missing", "Field required")
+        self._parser = MultipartParser(boundary, callbacks={
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": lambda data, start, end: self._header_field.extend(data[start:end]),
+            "on_header_value": lambda data, start, end: self._header_value.extend(data[start:end]),
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+    async def open(self) -> "StreamingFormFile":
+        while not self._found:
+            if not await self._feed():
+                raise self._error("missing", "Field required")
+        return self
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        while True:
+            while self._pending:
+                yield self._pending.popleft()
+            if self._finished:
+                return
+            if not await self._feed():
+                raise self._error("value_error", "Value error, request body ended before the end of the file")
+
+    async def _feed(self) -> bool:
+        chunk = await anext(self._stream, None)
+        if chunk is None:
+            return False
+        try:
+            self._parser.write(chunk)
+        except MultipartParseError as e:
+            raise self._error("value_error", f"Value error, invalid multipart body: {e}")
+        return True
+
+    def _error(self, error_type: str, message: str) -> RequestValidationError:
+        return RequestValidationError([{"type": error_type, "loc": ("body", self.field_name), "msg": message, "input": None}])
+
+    def _on_part_begin(self):
+        self._headers = {}
+
+    def _on_header_end(self):
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field.clear()
+        self._header_value.clear()
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if self._found or options.get(b"name") != self.field_name.encode():
+            return
+        self._found = self._in_field = True
+        filename = options.get(b"filename")
+        self.filename = filename.decode("latin-1") if filename else None
+        content_type = self._headers.get(b"content-type")
+        self.content_type = content_type.decode("latin-1") if content_type else None
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if self._in_field and end > start:
+            self._pending.append(bytes(data[start:end]))
+
+    def _on_part_end(self):
+        if self._in_field:
+            self._in_field = False
+            self._finished = True
+
+
+__all__ = ["StreamingFormFile"]
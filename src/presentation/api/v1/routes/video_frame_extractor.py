@@ -1,25 +1,89 @@
-from fastapi import APIRouter, status, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Request, status, Depends
 from dependency_injector.wiring import inject, Provide
 
 from src.core.containers import Container
 from src.presentation.api.v1.controllers.video_controller import VideoController
-from src.core.domain.dtos.video_frame_extractor.register_video_dto import RegisterVideoDTO
+from src.presentation.api.v1.forms.streaming_form_file import StreamingFormFile
+from src.core.domain.dtos.video_frame_extractor.confirm_video_upload_dto import ConfirmVideoUploadDTO
+from src.core.domain.dtos.video_frame_extractor.create_video_upload_dto import CreateVideoUploadDTO
+from src.core.domain.dtos.video_frame_extractor.frame_cache_stats_dto import FrameCacheStatsDTO
+from src.core.domain.dtos.video_frame_extractor.register_video_params_dto import (
+    MAX_VIDEO_FILE_SIZE,
+    MAX_VIDEO_FILE_SIZE_MESSAGE,
+    RegisterVideoParamsDTO,
+)
 from src.core.domain.dtos.video_frame_extractor.video_job_dto import VideoJobDTO
+from src.core.domain.dtos.video_frame_extractor.video_upload_dto import VideoUploadDTO
 
 router = APIRouter()
 
+# o corpo é lido em streaming (sem UploadFile), então o schema do arquivo é declarado à mão na documentação
+REGISTER_VIDEO_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["video_file"],
+                "properties": {
+                    "video_file": {"type": "string", "format": "binary", "description": "Arquivo de vídeo para processamento"},
+                },
+            },
+        },
+    },
+}
+
 @router.post(
     "/video/register",
     response_model=VideoJobDTO,
     status_code=status.HTTP_201_CREATED,
-    summary="Registra um novo vídeo para processamento"
+    summary="Registra um novo vídeo para processamento",
+    openapi_extra={"requestBody": REGISTER_VIDEO_REQUEST_BODY},
 )
 @inject
 async def register_video(
-    dto: RegisterVideoDTO = Depends(),
+    request: Request,
+    dto: RegisterVideoParamsDTO = Depends(),
+    controller: VideoController = Depends(Provide[Container.video_controller]),
+):
+    video_file = await StreamingFormFile(
+        request.stream(),
+        request.headers.get("content-type"),
+        "video_file",
+        content_length=int(request.headers.get("content-length") or 0),
+        max_size=MAX_VIDEO_FILE_SIZE,
+        max_size_message=MAX_VIDEO_FILE_SIZE_MESSAGE,
+    ).open()
+    return await controller.register_video(dto, video_file)
+
+@router.post(
+    "/video/upload",
+    response_model=VideoUploadDTO,
+    status_code=status.HTTP_201_CREATED,
+    summary="Cria um job e devolve URLs assinadas para enviar o vídeo direto ao storage"
+)
+@inject
+async def create_video_upload(
+    dto: CreateVideoUploadDTO,
     controller: VideoController = Depends(Provide[Container.video_controller]),
 ):
-    return await controller.register_video(dto)
+    return await controller.create_video_upload(dto)
+
+@router.post(
+    "/video/{job_ref}/upload/confirm",
+    response_model=VideoJobDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Confirma o upload direto do vídeo e enfileira o processamento"
+)
+@inject
+async def confirm_video_upload(
+    job_ref: str,
+    dto: Optional[ConfirmVideoUploadDTO] = None,
+    controller: VideoController = Depends(Provide[Container.video_controller]),
+):
+    return await controller.confirm_video_upload(job_ref, dto or ConfirmVideoUploadDTO())
 
 @router.get(
     "/video/{job_ref}/status",
@@ -33,3 +97,28 @@ async def get_video_status(
     controller: VideoController = Depends(Provide[Container.video_controller]),
 ):
     return await controller.get_video_status(job_ref)
+
+@router.post(
+    "/video/{job_ref}/cancel",
+    response_model=VideoJobDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Cancela um job de vídeo enfileirado ou em processamento"
+)
+@inject
+async def cancel_video_job(
+    job_ref: str,
+    controller: VideoController = Depends(Provide[Container.video_controller]),
+):
+    return await controller.cancel_video_job(job_ref)
+
+@router.get(
+    "/video/cache/stats",
+    response_model=FrameCacheStatsDTO,
+    status_code=status.HTTP_200_OK,
+    summary="Obtém os contadores de hit/miss do cache de frames"
+)
+@inject
+async def get_frame_cache_stats(
+    controller: VideoController = Depends(Provide[Container.video_controller]),
+):
+    return await controller.get_frame_cache_stats()
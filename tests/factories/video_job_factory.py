@@ -20,6 +20,13 @@ class VideoJobFactory(MongoEngineFactory):
     frames_path = factory.LazyAttribute(lambda o: f"frames/{o.job_ref}/")
     notify_url = factory.LazyFunction(fake.url)
     config = {}
+    media_metadata = {}
+    result = {}
+    content_hash = None
+    progress = {}
+    task_ids = []
+    checkpoint = {}
+    upload = {}
     error_message = None
     created_at = factory.LazyFunction(fake.date_time_this_decade)
     updated_at = factory.LazyFunction(fake.date_time_this_decade)
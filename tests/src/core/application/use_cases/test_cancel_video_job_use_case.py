@@ -0,0 +1,70 @@
+import pytest
+from unittest.mock import Mock
+
+from src.core.application.use_cases.cancel_video_job_use_case import CancelVideoJobUseCase
+from src.core.domain.dtos.video_frame_extractor.video_job_dto import VideoJobDTO
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+from tests.factories.video_job_factory import VideoJobFactory
+
+
+@pytest.fixture
+def mock_video_job_repository():
+    repository = Mock(spec=IVideoJobRepository)
+    repository.save.side_effect = lambda video_job: video_job
+    return repository
+
+
+@pytest.fixture
+def mock_task_gateway():
+    return Mock(spec=ITaskQueueGateway)
+
+
+@pytest.fixture
+def cancel_video_job_use_case(mock_video_job_repository, mock_task_gateway):
+    return CancelVideoJobUseCase.build(video_job_repository=mock_video_job_repository, task_gateway=mock_task_gateway)
+
+
+@pytest.mark.asyncio
+async def test_cancel_marks_job_cancelled_and_revokes_its_tasks(
+    cancel_video_job_use_case, mock_video_job_repository, mock_task_gateway
+):
+    video_job = VideoJobFactory(status="CANCELLED", task_ids=["task-1", "chord-2"]).to_entity()
+    mock_video_job_repository.cancel.return_value = video_job
+
+    result_dto = await cancel_video_job_use_case.execute(video_job.job_ref)
+
+    assert isinstance(result_dto, VideoJobDTO)
+    assert result_dto.status == "CANCELLED"
+    # um único update condicional, sem reescrever o documento lido antes
+    mock_video_job_repository.cancel.assert_called_once_with(video_job.job_ref)
+    mock_video_job_repository.save.assert_not_called()
+    mock_task_gateway.revoke_tasks.assert_called_once_with(["task-1", "chord-2"])
+    mock_task_gateway.notification_status_callback.assert_called_once_with(
+        {"job_ref": video_job.job_ref, "detail": "Processing cancelled by the client"}
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", ["COMPLETED", "ERROR", "CANCELLED"])
+async def test_cancel_rejects_finished_jobs(status, cancel_video_job_use_case, mock_video_job_repository, mock_task_gateway):
+    mock_video_job_repository.cancel.return_value = None
+    mock_video_job_repository.find_status.return_value = status
+
+    with pytest.raises(BadRequestException, match=f"already {status} and cannot be cancelled"):
+        await cancel_video_job_use_case.execute("job-ref")
+
+    mock_video_job_repository.save.assert_not_called()
+    mock_task_gateway.revoke_tasks.assert_not_called()
+    mock_task_gateway.notification_status_callback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cancel_unknown_job(cancel_video_job_use_case, mock_video_job_repository):
+    mock_video_job_repository.cancel.return_value = None
+    mock_video_job_repository.find_status.return_value = None
+
+    with pytest.raises(EntityNotFoundException):
+        await cancel_video_job_use_case.execute("non_existent_job_ref")
@@ -0,0 +1,177 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.application.use_cases.confirm_video_upload_use_case import ConfirmVideoUploadUseCase
+from src.core.domain.dtos.video_frame_extractor.confirm_video_upload_dto import ConfirmVideoUploadDTO
+from src.core.domain.entities.media_metadata import MediaMetadata
+from src.core.domain.entities.storage_object import StorageObject
+from src.core.domain.entities.video_job import VideoJob
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.ports.gateways.callbacks.i_notification_gateway import INotificationGateway
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+
+KEY = "videos/client/job-1"
+
+
+def _video_job(upload_id=None, part_count=None, status="PENDING"):
+    return VideoJob(
+        job_ref="job-1",
+        client_identification="client",
+        status=status,
+        bucket="bucket",
+        video_path="videos",
+        frames_path="frames",
+        upload={"key": KEY, "size": 1024, "content_type": "video/mp4", "upload_id": upload_id, "part_count": part_count},
+    )
+
+
+def _stored(size=1024, etag='"abc123"'):
+    return StorageObject(bucket="bucket", key=KEY, metadata={"ContentLength": size, "ContentType": "video/mp4", "ETag": etag})
+
+
+@pytest.fixture
+def mock_video_job_repository():
+    repository = Mock(spec=IVideoJobRepository)
+    repository.save.side_effect = lambda job: job
+    return repository
+
+
+@pytest.fixture
+def mock_storage_gateway():
+    storage_gateway = Mock(spec=ObjectStorageGateway)
+    storage_gateway.head_object.return_value = _stored()
+    storage_gateway.presign_url.return_value = "https://signed/video"
+    return storage_gateway
+
+
+@pytest.fixture
+def mock_task_gateway():
+    task_gateway = Mock(spec=ITaskQueueGateway)
+    task_gateway.enqueue_video_processing_task.return_value = "task-1"
+    return task_gateway
+
+
+@pytest.fixture
+def mock_video_processor():
+    video_processor = Mock(spec=FFmpegWrapper)
+    video_processor.probe_media.return_value = MediaMetadata(duration=60.0, width=1280, height=720, fps=30.0, codec="h264")
+    return video_processor
+
+
+@pytest.fixture
+def confirm_video_upload_use_case(mock_video_job_repository, mock_storage_gateway, mock_task_gateway, mock_video_processor):
+    return ConfirmVideoUploadUseCase.build(
+        video_job_repository=mock_video_job_repository,
+        storage_gateway=mock_storage_gateway,
+        task_gateway=mock_task_gateway,
+        notification_gateway=Mock(spec=INotificationGateway),
+        video_processor=mock_video_processor,
+    )
+
+
+@pytest.mark.asyncio
+async def test_confirm_probes_the_stored_video_and_enqueues_it(
+    confirm_video_upload_use_case, mock_video_job_repository, mock_storage_gateway, mock_task_gateway, mock_video_processor
+):
+    mock_video_job_repository.find_by_job_ref.return_value = _video_job()
+
+    video_job = await confirm_video_upload_use_case.execute("job-1", ConfirmVideoUploadDTO())
+
+    assert video_job.status == "QUEUED"
+    assert video_job.content_hash == "etag:abc123"
+    assert video_job.media_metadata["duration"] == 60.0
+    mock_video_processor.probe_media.assert_called_once_with("https://signed/video")
+    mock_storage_gateway.complete_multipart_upload.assert_not_called()
+    mock_task_gateway.enqueue_video_processing_task.assert_called_once()
+    mock_video_job_repository.add_task_id.assert_called_once_with("job-1", "task-1")
+
+
+@pytest.mark.asyncio
+async def test_confirm_completes_the_multipart_upload_with_the_client_etags(
+    confirm_video_upload_use_case, mock_video_job_repository, mock_storage_gateway
+):
+    mock_video_job_repository.find_by_job_ref.return_value = _video_job(upload_id="upload-1", part_count=2)
+    mock_storage_gateway.head_object.side_effect = [None, _stored(etag='"abc-2"')]
+    dto = ConfirmVideoUploadDTO(parts=[{"part_number": 2, "etag": '"e2"'}, {"part_number": 1, "etag": '"e1"'}])
+
+    video_job = await confirm_video_upload_use_case.execute("job-1", dto)
+
+    mock_storage_gateway.complete_multipart_upload.assert_called_once_with(
+        "default-bucket", KEY, "upload-1", [(2, '"e2"'), (1, '"e1"')]
+    )
+    assert video_job.status == "QUEUED"
+    assert video_job.content_hash == "etag:abc-2"
+
+
+@pytest.mark.asyncio
+async def test_confirm_before_the_upload_keeps_the_job_pending(
+    confirm_video_upload_use_case, mock_video_job_repository, mock_storage_gateway, mock_task_gateway
+):
+    mock_video_job_repository.find_by_job_ref.return_value = _video_job()
+    mock_storage_gateway.head_object.return_value = None
+
+    with pytest.raises(BadRequestException, match="has not been uploaded yet"):
+        await confirm_video_upload_use_case.execute("job-1", ConfirmVideoUploadDTO())
+
+    mock_video_job_repository.save.assert_not_called()
+    mock_task_gateway.enqueue_video_processing_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_confirm_with_missing_parts_keeps_the_multipart_upload_open(
+    confirm_video_upload_use_case, mock_video_job_repository, mock_storage_gateway
+):
+    mock_video_job_repository.find_by_job_ref.return_value = _video_job(upload_id="upload-1", part_count=2)
+    mock_storage_gateway.head_object.return_value = None
+
+    with pytest.raises(BadRequestException, match="every part from 1 to 2"):
+        await confirm_video_upload_use_case.execute("job-1", ConfirmVideoUploadDTO(parts=[{"part_number": 1, "etag": '"e1"'}]))
+
+    mock_storage_gateway.complete_multipart_upload.assert_not_called()
+    mock_storage_gateway.abort_multipart_upload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_confirm_rejects_an_object_of_another_size_and_deletes_it(
+    confirm_video_upload_use_case, mock_video_job_repository, mock_storage_gateway, mock_task_gateway
+):
+    mock_video_job_repository.find_by_job_ref.return_value = _video_job()
+    mock_storage_gateway.head_object.return_value = _stored(size=4096)
+
+    with pytest.raises(BadRequestException, match="has 4096 bytes but 1024 were declared"):
+        await confirm_video_upload_use_case.execute("job-1", ConfirmVideoUploadDTO())
+
+    assert mock_video_job_repository.save_unless_cancelled.call_args.args[0].status == "ERROR"
+    mock_storage_gateway.delete_object.assert_called_once_with(bucket="default-bucket", key="default-path-video/client/job-1")
+    mock_task_gateway.enqueue_video_processing_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_confirm_does_not_enqueue_a_job_cancelled_meanwhile(
+    confirm_video_upload_use_case, mock_video_job_repository, mock_storage_gateway, mock_task_gateway
+):
+    mock_video_job_repository.find_by_job_ref.return_value = _video_job()
+    mock_video_job_repository.save_unless_cancelled.return_value = False
+
+    with pytest.raises(BadRequestException, match="was cancelled during registration"):
+        await confirm_video_upload_use_case.execute("job-1", ConfirmVideoUploadDTO())
+
+    mock_task_gateway.enqueue_video_processing_task.assert_not_called()
+    mock_task_gateway.notification_status_callback.assert_not_called()
+    mock_storage_gateway.delete_object.assert_called_once_with(bucket="default-bucket", key="default-path-video/client/job-1")
+
+
+@pytest.mark.asyncio
+async def test_confirm_rejects_unknown_and_already_queued_jobs(confirm_video_upload_use_case, mock_video_job_repository):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    with pytest.raises(EntityNotFoundException):
+        await confirm_video_upload_use_case.execute("job-1", ConfirmVideoUploadDTO())
+
+    mock_video_job_repository.find_by_job_ref.return_value = _video_job(status="QUEUED")
+    with pytest.raises(BadRequestException, match="is not waiting for a direct upload"):
+        await confirm_video_upload_use_case.execute("job-1", ConfirmVideoUploadDTO())
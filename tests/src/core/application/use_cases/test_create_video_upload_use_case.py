@@ -0,0 +1,118 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.application.use_cases.create_video_upload_use_case import CreateVideoUploadUseCase
+from src.core.domain.dtos.video_frame_extractor.create_video_upload_dto import CreateVideoUploadDTO
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.ports.gateways.callbacks.i_notification_gateway import INotificationGateway
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def mock_video_job_repository():
+    repository = Mock(spec=IVideoJobRepository)
+    repository.find_by_job_ref.return_value = None
+
+    def save(job):
+        job.job_ref = job.job_ref or "job-1"
+        return job
+
+    repository.save.side_effect = save
+    return repository
+
+
+@pytest.fixture
+def mock_storage_gateway():
+    storage_gateway = Mock(spec=ObjectStorageGateway)
+    storage_gateway.presign_post.return_value = {"url": "https://bucket.s3/", "fields": {"key": "k", "policy": "p"}}
+    storage_gateway.create_multipart_upload.return_value = "upload-1"
+    storage_gateway.presign_upload_part.side_effect = lambda bucket, key, upload_id, number, expiration: f"https://part/{number}"
+    return storage_gateway
+
+
+@pytest.fixture
+def create_video_upload_use_case(mock_video_job_repository, mock_storage_gateway):
+    return CreateVideoUploadUseCase.build(
+        video_job_repository=mock_video_job_repository,
+        storage_gateway=mock_storage_gateway,
+        task_gateway=Mock(spec=ITaskQueueGateway),
+        notification_gateway=Mock(spec=INotificationGateway),
+        video_processor=Mock(spec=FFmpegWrapper),
+    )
+
+
+@pytest.mark.asyncio
+async def test_small_video_gets_a_presigned_post_capped_at_the_declared_size(
+    create_video_upload_use_case, mock_video_job_repository, mock_storage_gateway
+):
+    dto = CreateVideoUploadDTO(client_identification="client", size=10 * MB, content_type="video/mp4")
+
+    upload = await create_video_upload_use_case.execute(dto)
+
+    assert upload.method == "POST"
+    assert upload.status == "PENDING"
+    assert upload.url == "https://bucket.s3/"
+    assert upload.fields == {"key": "k", "policy": "p"}
+    _, kwargs = mock_storage_gateway.presign_post.call_args
+    assert kwargs["max_size"] == 10 * MB
+    assert kwargs["content_type"] == "video/mp4"
+    assert kwargs["key"].endswith(f"/client/{upload.job_ref}")
+    mock_storage_gateway.create_multipart_upload.assert_not_called()
+    saved_job = mock_video_job_repository.save.call_args.args[0]
+    assert saved_job.upload["size"] == 10 * MB
+    assert saved_job.upload["upload_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_large_video_gets_one_presigned_url_per_part(create_video_upload_use_case, mock_video_job_repository, mock_storage_gateway):
+    dto = CreateVideoUploadDTO(client_identification="client", size=150 * MB)
+
+    with patch("src.core.application.use_cases.create_video_upload_use_case.DIRECT_UPLOAD_PART_SIZE_MB", 64):
+        upload = await create_video_upload_use_case.execute(dto)
+
+    assert upload.method == "MULTIPART"
+    assert upload.upload_id == "upload-1"
+    assert upload.part_size == 64 * MB
+    assert [(part.part_number, part.url) for part in upload.parts] == [
+        (1, "https://part/1"), (2, "https://part/2"), (3, "https://part/3"),
+    ]
+    mock_storage_gateway.presign_post.assert_not_called()
+    saved_job = mock_video_job_repository.save.call_args.args[0]
+    assert saved_job.upload["part_count"] == 3
+
+
+def test_part_size_grows_to_stay_within_the_part_limit():
+    with patch("src.core.application.use_cases.create_video_upload_use_case.DIRECT_UPLOAD_PART_SIZE_MB", 5):
+        assert CreateVideoUploadUseCase._part_size(100 * MB) == 5 * MB
+        assert CreateVideoUploadUseCase._part_size(100_000 * MB) == 10 * MB
+
+
+@pytest.mark.asyncio
+async def test_failure_to_presign_aborts_the_multipart_upload_and_fails_the_job(
+    create_video_upload_use_case, mock_video_job_repository, mock_storage_gateway
+):
+    mock_storage_gateway.presign_upload_part.side_effect = RuntimeError("signing failed")
+
+    with pytest.raises(RuntimeError, match="signing failed"):
+        with patch("src.core.application.use_cases.create_video_upload_use_case.DIRECT_UPLOAD_PART_SIZE_MB", 64):
+            await create_video_upload_use_case.execute(CreateVideoUploadDTO(client_identification="client", size=150 * MB))
+
+    mock_storage_gateway.abort_multipart_upload.assert_called_once()
+    assert mock_video_job_repository.save_unless_cancelled.call_args.args[0].status == "ERROR"
+
+
+@pytest.mark.parametrize("payload", [
+    {"client_identification": "client", "size": 0},
+    {"client_identification": "client", "size": 6 * 1024 * MB},
+    {"client_identification": "client", "size": 1, "content_type": "not a mime type"},
+    {"client_identification": "client", "size": 1, "notify_url": "ftp://callback"},
+    {"client_identification": "client", "size": 1, "config": {"frame_format": "gif"}},
+])
+def test_create_video_upload_dto_rejects_invalid_payload(payload):
+    with pytest.raises(ValueError):
+        CreateVideoUploadDTO(**payload)
@@ -0,0 +1,179 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.application.use_cases.dispatch_video_chunks_use_case import DispatchVideoChunksUseCase
+from src.core.domain.dtos.video_frame_extractor.process_video_task_dto import ProcessVideoTaskDTO
+from src.core.domain.entities.frame_segment import FrameSegment
+from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+from tests.factories.video_job_factory import VideoJobFactory
+
+
+@pytest.fixture
+def video_job():
+    return VideoJobFactory(status="QUEUED", video_path="videos", client_identification="client", job_ref="job").to_entity()
+
+
+@pytest.fixture
+def dto(video_job):
+    return ProcessVideoTaskDTO(
+        job_ref=video_job.job_ref,
+        client_identification=video_job.client_identification,
+        bucket=video_job.bucket,
+        video_path=video_job.video_path,
+        frames_path=video_job.frames_path,
+        notify_url=video_job.notify_url,
+        config=video_job.config,
+    )
+
+
+@pytest.fixture
+def gateways(video_job):
+    repository = Mock(spec=IVideoJobRepository)
+    repository.find_by_job_ref.return_value = video_job
+    storage_gateway = Mock(spec=ObjectStorageGateway)
+    storage_gateway.presign_url.return_value = "https://bucket/videos/client/job?X-Amz-Signature=abc"
+    video_processor = Mock(spec=FFmpegWrapper)
+    video_processor.plan_chunks.side_effect = FFmpegWrapper().plan_chunks
+    task_gateway = Mock(spec=ITaskQueueGateway)
+    task_gateway.enqueue_video_chunks.return_value = "chord-id"
+    return repository, storage_gateway, video_processor, task_gateway
+
+
+def _use_case(gateways, chunking_enabled=True, chunk_seconds=600):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    return DispatchVideoChunksUseCase(
+        video_job_repository=repository,
+        storage_gateway=storage_gateway,
+        video_processor=video_processor,
+        task_gateway=task_gateway,
+        chunking_enabled=chunking_enabled,
+        chunk_seconds=chunk_seconds,
+    )
+
+
+def test_dispatch_is_skipped_when_chunking_is_disabled(gateways, dto):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+
+    assert _use_case(gateways, chunking_enabled=False).execute(dto) is None
+
+    storage_gateway.presign_url.assert_not_called()
+    task_gateway.enqueue_video_chunks.assert_not_called()
+
+
+@pytest.mark.parametrize("duration", [None, 600.0])
+def test_dispatch_is_skipped_for_unknown_duration_or_single_chunk(gateways, dto, video_job, duration):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    video_processor.probe_duration.return_value = duration
+
+    assert _use_case(gateways).execute(dto) is None
+
+    task_gateway.enqueue_video_chunks.assert_not_called()
+    repository.save_unless_cancelled.assert_not_called()
+    assert video_job.status == "QUEUED"
+
+
+def test_dispatch_enqueues_one_subtask_per_chunk(gateways, dto, video_job):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    video_processor.probe_duration.return_value = 1500.0
+
+    assert _use_case(gateways).execute(dto) == "chord-id"
+
+    storage_gateway.presign_url.assert_called_once_with(bucket=video_job.bucket, key="videos/client/job")
+    video_processor.probe_duration.assert_called_once_with(storage_gateway.presign_url.return_value)
+    task_data, chunks = task_gateway.enqueue_video_chunks.call_args.args
+    assert task_data["job_ref"] == "job"
+    assert [FrameSegment(**chunk) for chunk in chunks] == [(0, 500), (500, 1000), (1000, None)]
+    assert video_job.status == "PROCESSING"
+    repository.save_unless_cancelled.assert_called_once_with(video_job)
+    repository.add_task_id.assert_called_once_with("job", "chord-id")
+
+
+def test_dispatch_does_not_fan_out_a_job_cancelled_meanwhile(gateways, dto):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    video_processor.probe_duration.return_value = 1500.0
+    repository.save_unless_cancelled.return_value = False
+
+    assert _use_case(gateways).execute(dto) is None
+
+    task_gateway.enqueue_video_chunks.assert_not_called()
+    repository.add_task_id.assert_not_called()
+
+
+def test_dispatch_raises_when_job_does_not_exist(gateways, dto):
+    gateways[0].find_by_job_ref.return_value = None
+
+    with pytest.raises(EntityNotFoundException):
+        _use_case(gateways).execute(dto)
+
+
+def test_dispatch_uses_media_metadata_stored_at_registration(gateways, dto, video_job):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    video_job.media_metadata = {"duration": 1500.0, "width": 1920, "height": 1080, "fps": 30.0, "codec": "h264"}
+
+    assert _use_case(gateways).execute(dto) == "chord-id"
+
+    storage_gateway.presign_url.assert_not_called()
+    video_processor.probe_duration.assert_not_called()
+    assert len(task_gateway.enqueue_video_chunks.call_args.args[1]) == 3
+
+
+@pytest.mark.parametrize("mode", ["keyframe", "scene"])
+def test_dispatch_is_skipped_for_non_uniform_extraction_modes(gateways, dto, video_job, mode):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    video_job.config = {"mode": mode}
+    video_processor.probe_duration.return_value = 3600.0
+
+    assert _use_case(gateways).execute(dto) is None
+
+    video_processor.probe_duration.assert_not_called()
+    task_gateway.enqueue_video_chunks.assert_not_called()
+
+
+@pytest.mark.parametrize("config", [{"frame_count": 20}, {"renditions": [{"width": 320}, {"width": 1920}]}])
+def test_dispatch_is_skipped_for_single_pass_configs(gateways, dto, video_job, config):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    video_job.config = config
+    video_job.media_metadata = {"duration": 3600.0}
+
+    assert _use_case(gateways).execute(dto) is None
+
+    task_gateway.enqueue_video_chunks.assert_not_called()
+
+
+def test_dispatch_splits_only_the_requested_range(gateways, dto, video_job):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    video_job.config = {"start_seconds": 600, "end_seconds": 1500}
+    video_job.media_metadata = {"duration": 3600.0, "width": 1920, "height": 1080, "fps": 30.0, "codec": "h264"}
+
+    assert _use_case(gateways).execute(dto) == "chord-id"
+
+    assert task_gateway.enqueue_video_chunks.call_args.args[1] == [
+        {"start_tick": 0, "end_tick": 450}, {"start_tick": 450, "end_tick": 900},
+    ]
+
+
+def test_dispatch_is_skipped_when_frames_are_already_cached(gateways, dto, video_job):
+    repository, storage_gateway, video_processor, task_gateway = gateways
+    video_job.content_hash = "abc"
+    video_job.media_metadata = {"duration": 3600.0}
+    frame_cache_repository = Mock(spec=IFrameCacheRepository)
+    use_case = DispatchVideoChunksUseCase(
+        video_job_repository=repository,
+        storage_gateway=storage_gateway,
+        video_processor=video_processor,
+        task_gateway=task_gateway,
+        chunking_enabled=True,
+        frame_cache_repository=frame_cache_repository,
+    )
+
+    assert use_case.execute(dto) is None
+
+    frame_cache_repository.find_by_cache_key.assert_called_once()
+    assert frame_cache_repository.find_by_cache_key.call_args.args[0].startswith("abc:")
+    task_gateway.enqueue_video_chunks.assert_not_called()
@@ -48,3 +48,27 @@ async def test_execute_get_video_status_use_case_not_found(get_video_status_use_
 
     mock_video_job_repository.find_by_job_ref.assert_called_once_with(job_ref)
     assert str(exc_info.value) == f"VideoJob com job_ref {job_ref} não encontrado."
+
+
+@pytest.mark.asyncio
+async def test_execute_get_video_status_use_case_exposes_manifest_key(get_video_status_use_case, mock_video_job_repository):
+    video_job_entity = VideoJobFactory(
+        status="COMPLETED", frames_path="frames", client_identification="client", job_ref="job",
+        result={"frames": 2, "dropped_frames": 0, "manifest": "manifest.jsonl"},
+    ).to_entity()
+    mock_video_job_repository.find_by_job_ref.return_value = video_job_entity
+
+    result_dto = await get_video_status_use_case.execute(video_job_entity.job_ref)
+
+    assert result_dto.manifest_key == "frames/client/job/manifest.jsonl"
+
+
+@pytest.mark.asyncio
+async def test_execute_get_video_status_use_case_exposes_progress(get_video_status_use_case, mock_video_job_repository):
+    progress = {"frames_decoded": 30, "out_time": 30.0, "frames_uploaded": 28, "percent": 25.0, "updated_at": "2025-01-01T00:00:00"}
+    video_job_entity = VideoJobFactory(status="PROCESSING", progress=progress).to_entity()
+    mock_video_job_repository.find_by_job_ref.return_value = video_job_entity
+
+    result_dto = await get_video_status_use_case.execute(video_job_entity.job_ref)
+
+    assert result_dto.progress == progress
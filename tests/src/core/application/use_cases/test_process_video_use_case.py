@@ -1,13 +1,34 @@
 
-from unittest.mock import MagicMock, Mock, patch
+import hashlib
+import io
+import json
+import time
+from unittest.mock import ANY, MagicMock, Mock, patch
 
+import numpy as np
 import pytest
+from PIL import Image
 from src.core.domain.dtos.video_frame_extractor.process_video_task_dto import ProcessVideoTaskDTO
+from src.core.domain.entities.extraction_progress import ExtractionProgress
+from src.core.domain.entities.frame_cache_entry import FrameCacheEntry
+from src.core.domain.entities.bulk_upload_result import BulkUploadFailure, BulkUploadResult
+from src.core.domain.entities.frame_extraction_config import FrameExtractionConfig
+from src.core.domain.entities.frame_segment import FrameSegment
+from src.core.domain.entities.frame_rendition import RenditionFrame
+from src.core.domain.entities.sprite_sheet import SpriteSheet, SpriteTile
+from src.core.domain.entities.storage_object import StorageObject
+from src.core.domain.entities.video_frame import VideoFrame
 from src.core.exceptions.entity_not_found_exception import EntityNotFoundException
+from src.core.exceptions.job_cancelled_exception import JobCancelledException
 from src.core.ports.gateways.callbacks.i_notification_gateway import INotificationGateway
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
 from tests.factories.video_job_factory import VideoJobFactory
 from src.core.application.use_cases.process_video_use_case import ProcessVideoUseCase
 
+# layout das chaves de um job sem probe gravado (até 9.999 frames, sem diretórios de hash)
+DEFAULT_KEY_LAYOUT = {"version": 2, "index_width": 4, "shard_prefix_length": 0}
+
+
 @pytest.fixture
 def mock_notification_gateway():
     return Mock(spec=INotificationGateway)
@@ -16,7 +37,6 @@ def mock_notification_gateway():
 @patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper')
 @patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway')
 def test_process_video_use_case_success(mock_storage_gateway, mock_ffmpeg_wrapper, mock_video_job_repository, mock_notification_gateway):
-    mock_storage_gateway.download_object.return_value = b"video content"
     mock_storage_gateway.upload_objects_bulk.return_value = None
     mock_ffmpeg_wrapper.extract_frames.return_value = ["frame1.jpg", "frame2.jpg"]
     mock_notification_gateway.send_notification.return_value = None
@@ -84,7 +104,7 @@ def test_process_video_use_case_video_job_not_found(mock_storage_gateway, mock_f
 @patch('src.infrastructure.repositories.mongoengine.video_job_repository.MongoVideoJobRepository')
 @patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper')
 @patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway')
-def test_raise_error_when_download_object_fails(mock_storage_gateway, mock_ffmpeg_wrapper, mock_video_job_repository, mock_notification_gateway):
+def test_raise_error_when_download_fails(mock_storage_gateway, mock_ffmpeg_wrapper, mock_video_job_repository, mock_notification_gateway):
     video_job = VideoJobFactory()
     mock_video_job_repository.find_by_job_ref.return_value = video_job.to_entity()
     mock_notification_gateway.send_notification.return_value = None
@@ -106,7 +126,7 @@ def test_raise_error_when_download_object_fails(mock_storage_gateway, mock_ffmpe
         notification_gateway=mock_notification_gateway
     )
 
-    mock_storage_gateway.download_object.side_effect = Exception("Download failed")
+    mock_storage_gateway.download_to_file.side_effect = Exception("Download failed")
 
     with pytest.raises(Exception) as exc_info:
         use_case.execute(dto)
@@ -139,7 +159,6 @@ def test_raise_error_when_upload_frames_in_bulk_fails(mock_storage_gateway, mock
         notification_gateway=mock_notification_gateway
     )
     
-    mock_storage_gateway.download_object.return_value = b"video content"
     mock_ffmpeg_wrapper.extract_frames.return_value = ["frame1.jpg", "frame2.jpg"]
     
     use_case._upload_frames_in_bulk = MagicMock(side_effect=Exception("Upload failed"))
@@ -148,3 +167,831 @@ def test_raise_error_when_upload_frames_in_bulk_fails(mock_storage_gateway, mock
         use_case.execute(dto)
         
     assert str(exc_info.value) == "Upload failed"
+
+
+@patch('src.infrastructure.repositories.mongoengine.video_job_repository.MongoVideoJobRepository')
+@patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway')
+def test_process_video_use_case_uploads_streamed_frames(mock_storage_gateway, mock_ffmpeg_wrapper, mock_video_job_repository, mock_notification_gateway):
+    video_job = VideoJobFactory(frames_path="frames", client_identification="client", job_ref="job")
+    mock_video_job_repository.find_by_job_ref.return_value = video_job.to_entity()
+    mock_ffmpeg_wrapper.iter_frames_parallel.return_value = iter([
+        VideoFrame(index=0, pts=0.0, data=b"frame-0"),
+        VideoFrame(index=1, pts=1.0, data=b"frame-1"),
+    ])
+
+    dto = ProcessVideoTaskDTO(
+        job_ref=video_job.job_ref,
+        client_identification=video_job.client_identification,
+        bucket=video_job.bucket,
+        video_path=video_job.video_path,
+        frames_path=video_job.frames_path,
+        notify_url=video_job.notify_url,
+        config=video_job.config,
+    )
+
+    uploaded = []
+    mock_storage_gateway.upload_items_bulk.side_effect = lambda items, **kwargs: uploaded.extend(items) or BulkUploadResult()
+
+    use_case = ProcessVideoUseCase(
+        video_job_repository=mock_video_job_repository,
+        storage_gateway=mock_storage_gateway,
+        video_processor=mock_ffmpeg_wrapper,
+        notification_gateway=mock_notification_gateway
+    )
+    use_case.execute(dto)
+
+    mock_ffmpeg_wrapper.extract_frames.assert_not_called()
+    download_kwargs = mock_storage_gateway.download_to_file.call_args.kwargs
+    assert download_kwargs["key"] == f"{video_job.video_path}/client/job"
+    mock_ffmpeg_wrapper.iter_frames_parallel.assert_called_once_with(
+        download_kwargs["file_path"], FrameExtractionConfig(), on_progress=ANY, start_tick=0
+    )
+    assert [item.key for item in uploaded] == ["frames/client/job/frame_0000.png", "frames/client/job/frame_0001.png"]
+    assert [item.file_object.read() for item in uploaded] == [b"frame-0", b"frame-1"]
+    assert all(item.content_type == "image/png" for item in uploaded)
+    assert [item.metadata for item in uploaded] == [{"pts": "0.000000"}, {"pts": "1.000000"}]
+
+
+@patch('src.infrastructure.repositories.mongoengine.video_job_repository.MongoVideoJobRepository')
+@patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway')
+def test_process_video_use_case_uses_frame_format_from_job_config(mock_storage_gateway, mock_ffmpeg_wrapper, mock_video_job_repository, mock_notification_gateway):
+    video_job = VideoJobFactory(
+        frames_path="frames",
+        client_identification="client",
+        job_ref="job",
+        config={"frame_format": "jpeg", "quality": 80, "max_width": 1280, "delete_after_processing": False},
+    )
+    mock_video_job_repository.find_by_job_ref.return_value = video_job.to_entity()
+    mock_ffmpeg_wrapper.iter_frames_parallel.return_value = iter([VideoFrame(index=0, pts=0.0, data=b"frame-0")])
+
+    dto = ProcessVideoTaskDTO(
+        job_ref=video_job.job_ref,
+        client_identification=video_job.client_identification,
+        bucket=video_job.bucket,
+        video_path=video_job.video_path,
+        frames_path=video_job.frames_path,
+        notify_url=video_job.notify_url,
+        config=video_job.config,
+    )
+
+    uploaded = []
+    mock_storage_gateway.upload_items_bulk.side_effect = lambda items, **kwargs: uploaded.extend(items) or BulkUploadResult()
+
+    use_case = ProcessVideoUseCase(
+        video_job_repository=mock_video_job_repository,
+        storage_gateway=mock_storage_gateway,
+        video_processor=mock_ffmpeg_wrapper,
+        notification_gateway=mock_notification_gateway
+    )
+    use_case.execute(dto)
+
+    frame_config = mock_ffmpeg_wrapper.iter_frames_parallel.call_args.args[1]
+    assert frame_config.frame_format.format == "jpeg"
+    assert (frame_config.quality, frame_config.max_width, frame_config.max_height) == (80, 1280, None)
+    assert [item.key for item in uploaded] == ["frames/client/job/frame_0000.jpg"]
+    assert uploaded[0].content_type == "image/jpeg"
+
+
+@patch('src.core.application.use_cases.process_video_use_case.FRAME_STREAMING_ENABLED', False)
+@patch('src.infrastructure.repositories.mongoengine.video_job_repository.MongoVideoJobRepository')
+@patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway')
+def test_process_video_use_case_falls_back_to_directory_extraction(mock_storage_gateway, mock_ffmpeg_wrapper, mock_video_job_repository, mock_notification_gateway, tmp_path):
+    frame_file = tmp_path / "frame_0000.png"
+    frame_file.write_bytes(b"png-bytes")
+
+    video_job = VideoJobFactory()
+    mock_video_job_repository.find_by_job_ref.return_value = video_job.to_entity()
+    mock_ffmpeg_wrapper.extract_frames.return_value = [str(frame_file)]
+    uploaded = []
+    mock_storage_gateway.upload_items_bulk.side_effect = lambda items, **kwargs: uploaded.extend(items) or BulkUploadResult()
+
+    dto = ProcessVideoTaskDTO(
+        job_ref=video_job.job_ref,
+        client_identification=video_job.client_identification,
+        bucket=video_job.bucket,
+        video_path=video_job.video_path,
+        frames_path=video_job.frames_path,
+        notify_url=video_job.notify_url,
+        config=video_job.config,
+    )
+
+    use_case = ProcessVideoUseCase(
+        video_job_repository=mock_video_job_repository,
+        storage_gateway=mock_storage_gateway,
+        video_processor=mock_ffmpeg_wrapper,
+        notification_gateway=mock_notification_gateway
+    )
+    use_case.execute(dto)
+
+    mock_ffmpeg_wrapper.iter_frames_parallel.assert_not_called()
+    assert [item.file_object.read() for item in uploaded] == [b"png-bytes"]
+    assert uploaded[0].metadata is None
+
+
+@patch('src.infrastructure.repositories.mongoengine.video_job_repository.MongoVideoJobRepository')
+@patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway')
+def test_process_video_use_case_fails_job_when_some_frames_fail_to_upload(mock_storage_gateway, mock_ffmpeg_wrapper, mock_video_job_repository, mock_notification_gateway):
+    video_job = VideoJobFactory()
+    entity = video_job.to_entity()
+    mock_video_job_repository.find_by_job_ref.return_value = entity
+    mock_ffmpeg_wrapper.iter_frames_parallel.return_value = iter([VideoFrame(index=0, pts=0.0, data=b"frame-0")])
+
+    def upload(items, **kwargs):
+        item = next(iter(items))
+        return BulkUploadResult(failed=[BulkUploadFailure(item=item, error=Exception("SlowDown"))])
+
+    mock_storage_gateway.upload_items_bulk.side_effect = upload
+
+    dto = ProcessVideoTaskDTO(
+        job_ref=video_job.job_ref,
+        client_identification=video_job.client_identification,
+        bucket=video_job.bucket,
+        video_path=video_job.video_path,
+        frames_path=video_job.frames_path,
+        notify_url=video_job.notify_url,
+        config=video_job.config,
+    )
+
+    use_case = ProcessVideoUseCase(
+        video_job_repository=mock_video_job_repository,
+        storage_gateway=mock_storage_gateway,
+        video_processor=mock_ffmpeg_wrapper,
+        notification_gateway=mock_notification_gateway
+    )
+
+    with pytest.raises(RuntimeError, match="1 frame"):
+        use_case.execute(dto)
+
+    assert entity.status == "ERROR"
+
+
+def _chunk_use_case(video_job, mock_notification_gateway, frame_cache_repository=None):
+    repository = Mock()
+    repository.find_by_job_ref.return_value = video_job
+    storage_gateway = Mock()
+    storage_gateway.presign_url.return_value = "https://signed/video"
+    uploaded = []
+    storage_gateway.upload_items_bulk.side_effect = (
+        lambda items, **kwargs: BulkUploadResult(uploaded=[item for item in items if not uploaded.append(item)])
+    )
+    video_processor = Mock()
+    use_case = ProcessVideoUseCase(
+        video_job_repository=repository,
+        storage_gateway=storage_gateway,
+        video_processor=video_processor,
+        notification_gateway=mock_notification_gateway,
+        frame_cache_repository=frame_cache_repository,
+    )
+    return use_case, storage_gateway, video_processor, uploaded
+
+
+def _task_dto(video_job):
+    return ProcessVideoTaskDTO(
+        job_ref=video_job.job_ref,
+        client_identification=video_job.client_identification,
+        bucket=video_job.bucket,
+        video_path=video_job.video_path,
+        frames_path=video_job.frames_path,
+        notify_url=video_job.notify_url,
+        config=video_job.config,
+    )
+
+
+def _png_frame(seed):
+    pixels = np.random.default_rng(seed).integers(0, 256, size=(36, 64), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels, mode="L").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_execute_chunk_uploads_segment_frames_from_signed_url(mock_notification_gateway):
+    video_job = VideoJobFactory(status="PROCESSING", frames_path="frames", client_identification="client", job_ref="job").to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    video_processor.iter_segment_frames.return_value = iter([
+        VideoFrame(index=600, pts=600.0, data=b"frame-600"),
+        VideoFrame(index=601, pts=601.0, data=b"frame-601"),
+    ])
+
+    result = use_case.execute_chunk(_task_dto(video_job), FrameSegment(600, 1200))
+
+    # o chord leva só a contagem e a chave da parte do manifesto, não as entradas
+    assert result == {
+        "start_tick": 600, "end_tick": 1200, "frames": 2, "dropped_frames": 0,
+        "manifest_part": "frames/client/job/_chunks/0000000600.jsonl", "upload_metrics": {},
+    }
+    part = storage_gateway.upload_object.call_args.args[0]
+    assert (part.key, part.content_type) == ("frames/client/job/_chunks/0000000600.jsonl", "application/x-ndjson")
+    manifest = [json.loads(line) for line in part.content.splitlines()]
+    assert [(entry["index"], entry["pts"], entry["key"], entry["size"]) for entry in manifest] == [
+        (600, 600.0, "frame_0600.png", 9), (601, 601.0, "frame_0601.png", 9),
+    ]
+    assert manifest[0]["sha256"] == hashlib.sha256(b"frame-600").hexdigest()
+    video_processor.iter_segment_frames.assert_called_once_with(
+        "https://signed/video", FrameSegment(600, 1200), FrameExtractionConfig()
+    )
+    assert [item.key for item in uploaded] == ["frames/client/job/frame_0600.png", "frames/client/job/frame_0601.png"]
+    storage_gateway.download_to_file.assert_not_called()
+    assert video_job.status == "PROCESSING"
+    mock_notification_gateway.send_notification.assert_not_called()
+
+
+def test_complete_chunks_completes_job_and_returns_zipper_payload(mock_notification_gateway):
+    video_job = VideoJobFactory(status="PROCESSING", frames_path="frames", client_identification="client", job_ref="job").to_entity()
+    use_case, storage_gateway, *_ = _chunk_use_case(video_job, mock_notification_gateway)
+
+    second_chunk_entry = {"index": 600, "pts": 600.0, "key": "frame_0600.png", "size": 3, "sha256": "b"}
+    first_chunk_entry = {"index": 0, "pts": 0.0, "key": "frame_0000.png", "size": 3, "sha256": "a"}
+    dropped = {"index": 7, "pts": 7.0, "duplicate_of": 6, "distance": 0}
+    parts = {
+        "frames/client/job/_chunks/0000000600.jsonl": json.dumps(second_chunk_entry).encode() + b"\n",
+        "frames/client/job/_chunks/0000000000.jsonl": b"".join(
+            json.dumps(line).encode() + b"\n" for line in (first_chunk_entry, dropped)
+        ),
+    }
+    storage_gateway.download_object.side_effect = lambda bucket, key: parts[key]
+    result = use_case.complete_chunks(_task_dto(video_job), [
+        {"frames": 12, "dropped_frames": 0, "manifest_part": "frames/client/job/_chunks/0000000600.jsonl"},
+        {"frames": 600, "dropped_frames": 1, "manifest_part": "frames/client/job/_chunks/0000000000.jsonl"},
+        # trecho interrompido pelo cancelamento: não gravou parte
+        {"start_tick": 1200, "end_tick": 1800, "status": "cancelled", "frames": 0},
+    ])
+
+    assert video_job.status == "COMPLETED"
+    assert video_job.result == {
+        "frames": 612, "dropped_frames": 1, "manifest": "manifest.jsonl", "key_layout": DEFAULT_KEY_LAYOUT,
+    }
+    assert result["frames_path"] == "frames/client/job"
+    assert result["key_layout"] == DEFAULT_KEY_LAYOUT
+    assert result["manifest"] == "frames/client/job/manifest.jsonl"
+    manifest_item = storage_gateway.upload_object.call_args.args[0]
+    assert (manifest_item.key, manifest_item.content_type) == ("frames/client/job/manifest.jsonl", "application/x-ndjson")
+    assert [json.loads(line) for line in manifest_item.content.splitlines()] == [
+        first_chunk_entry, dropped, second_chunk_entry,
+    ]
+    storage_gateway.delete_prefix.assert_called_once_with(video_job.bucket, "frames/client/job/_chunks/")
+    mock_notification_gateway.send_notification.assert_called_once()
+
+
+def test_execute_drops_near_duplicate_frames_when_dedup_is_enabled(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        config={"dedup_max_distance": 4},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    static, changed = _png_frame(0), _png_frame(1)
+    video_processor.iter_frames_parallel.return_value = iter([
+        VideoFrame(index=0, pts=0.0, data=static),
+        VideoFrame(index=1, pts=1.0, data=static),
+        VideoFrame(index=2, pts=2.0, data=changed),
+    ])
+
+    use_case.execute(_task_dto(video_job))
+
+    assert [item.key for item in uploaded] == ["frames/client/job/frame_0000.png", "frames/client/job/frame_0002.png"]
+    assert video_job.result == {
+        "frames": 2, "dropped_frames": 1, "manifest": "manifest.jsonl", "key_layout": DEFAULT_KEY_LAYOUT,
+    }
+    # a lista dos descartados vai para o manifesto, não para o documento do job
+    manifest_item = storage_gateway.upload_object.call_args.args[0]
+    assert [json.loads(line).get("duplicate_of") for line in manifest_item.content.splitlines()] == [None, 0, None]
+
+
+def test_execute_spaces_frame_count_over_the_stored_clip_duration(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        config={"frame_count": 10, "start_seconds": 20, "end_seconds": 60},
+        media_metadata={"duration": 120.0, "width": 1280, "height": 720, "fps": 30.0, "codec": "h264"},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    video_processor.iter_frames_parallel.return_value = iter([VideoFrame(index=0, pts=20.0, data=b"frame")])
+
+    use_case.execute(_task_dto(video_job))
+
+    _, frame_config = video_processor.iter_frames_parallel.call_args.args
+    assert (frame_config.fps, frame_config.max_frames, frame_config.frame_count) == (0.25, 10, None)
+    assert (frame_config.start_seconds, frame_config.end_seconds) == (20, 60)
+    video_processor.probe_duration.assert_not_called()
+
+
+def test_execute_widens_frame_keys_for_videos_with_more_than_9999_frames(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        config={"fps": 30},
+        media_metadata={"duration": 400.0, "width": 1280, "height": 720, "fps": 30.0, "codec": "h264"},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    video_processor.iter_frames_parallel.return_value = iter([
+        VideoFrame(index=index, pts=index / 30, data=b"frame") for index in (9999, 10000, 11999)
+    ])
+
+    payload = use_case.execute(_task_dto(video_job))
+
+    keys = [item.key for item in uploaded]
+    assert keys == [
+        "frames/client/job/frame_09999.png", "frames/client/job/frame_10000.png", "frames/client/job/frame_11999.png",
+    ]
+    assert keys == sorted(keys)
+    assert video_job.result["key_layout"] == {"version": 2, "index_width": 5, "shard_prefix_length": 0}
+    assert payload["key_layout"] == video_job.result["key_layout"]
+
+
+def test_execute_spreads_frame_keys_over_hash_prefixes(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    video_processor.iter_frames_parallel.return_value = iter([
+        VideoFrame(index=index, pts=float(index), data=b"frame") for index in range(3)
+    ])
+
+    with patch("src.core.application.use_cases.process_video_use_case.FRAME_KEY_SHARD_PREFIX_LENGTH", 2):
+        payload = use_case.execute(_task_dto(video_job))
+
+    names = [f"frame_{index:04d}.png" for index in range(3)]
+    expected = [f"{hashlib.sha256(name.encode()).hexdigest()[:2]}/{name}" for name in names]
+    assert [item.key for item in uploaded] == [f"frames/client/job/{key}" for key in expected]
+    manifest_item = storage_gateway.upload_object.call_args.args[0]
+    assert manifest_item.key == "frames/client/job/manifest.jsonl"
+    assert [json.loads(line)["key"] for line in manifest_item.content.splitlines()] == expected
+    assert payload["key_layout"] == {"version": 2, "index_width": 4, "shard_prefix_length": 2}
+
+
+def test_execute_reports_extraction_and_upload_progress(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        media_metadata={"duration": 4.0, "width": 1280, "height": 720, "fps": 30.0, "codec": "h264"},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+
+    def iter_frames_parallel(video_path, frame_config, on_progress=None, start_tick=0):
+        for index in range(4):
+            on_progress(ExtractionProgress(frames=index + 1, out_time=float(index + 1)))
+            yield VideoFrame(index=index, pts=float(index), data=b"frame")
+
+    video_processor.iter_frames_parallel.side_effect = iter_frames_parallel
+
+    use_case.execute(_task_dto(video_job))
+
+    repository = use_case._video_job_repository
+    first = repository.update_progress.call_args_list[0].args
+    assert (first[0], first[1]["frames_decoded"], first[1]["percent"]) == ("job", 1, 25.0)
+    final = repository.update_progress.call_args.args[1]
+    assert {key: final[key] for key in ("frames_decoded", "out_time", "frames_uploaded", "percent")} == {
+        "frames_decoded": 4, "out_time": 4.0, "frames_uploaded": 4, "percent": 100.0,
+    }
+    assert video_job.progress == final
+
+
+def test_fail_chunks_marks_job_as_failed(mock_notification_gateway):
+    video_job = VideoJobFactory(status="PROCESSING").to_entity()
+    use_case, *_ = _chunk_use_case(video_job, mock_notification_gateway)
+
+    use_case.fail_chunks(_task_dto(video_job), "chunk timed out")
+
+    assert video_job.status == "ERROR"
+    assert "chunk timed out" in video_job.error_message
+    mock_notification_gateway.send_notification.assert_called_once()
+
+
+def _manifest_entry(index):
+    data = f"frame-{index}".encode()
+    return {
+        "index": index, "pts": float(index), "key": f"frame_{index:04d}.png",
+        "size": len(data), "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+def test_execute_retry_resumes_after_checkpoint_and_skips_existing_frames(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="ERROR", frames_path="frames", client_identification="client", job_ref="job",
+        checkpoint={"frame_index": 1, "pts": 1.0},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    # o frame 2 chegou ao storage (e à parte do manifesto) depois do último checkpoint gravado
+    parts = {
+        "frames/client/job/_checkpoint/0000000000.jsonl": [_manifest_entry(0)],
+        "frames/client/job/_checkpoint/0000000002.jsonl": [_manifest_entry(1), _manifest_entry(2)],
+    }
+    storage_gateway.list_objects.return_value = [
+        StorageObject(bucket=video_job.bucket, key=key)
+        for key in [f"frames/client/job/frame_{index:04d}.png" for index in range(3)] + list(parts)
+    ]
+    storage_gateway.download_object.side_effect = lambda bucket, key: "".join(
+        json.dumps(entry) + "\n" for entry in parts[key]
+    ).encode()
+
+    def iter_frames_parallel(video_path, frame_config, on_progress=None, start_tick=0):
+        assert start_tick == 2
+        for index in range(start_tick, 4):
+            yield VideoFrame(index=index, pts=float(index), data=f"frame-{index}".encode())
+
+    video_processor.iter_frames_parallel.side_effect = iter_frames_parallel
+
+    payload = use_case.execute(_task_dto(video_job))
+
+    storage_gateway.list_objects.assert_called_once_with(video_job.bucket, "frames/client/job/")
+    assert [item.key for item in uploaded] == ["frames/client/job/frame_0003.png"]
+    manifest = storage_gateway.upload_object.call_args.args[0]
+    assert [json.loads(line) for line in manifest.content.decode().splitlines()] == [_manifest_entry(i) for i in range(4)]
+    storage_gateway.delete_prefix.assert_called_once_with(video_job.bucket, "frames/client/job/_checkpoint/")
+    assert video_job.result["frames"] == 4
+    assert video_job.status == "COMPLETED"
+    assert video_job.checkpoint == {}
+    assert payload["manifest"] == "frames/client/job/manifest.jsonl"
+
+
+def test_execute_checkpoints_uploaded_frames_when_upload_fails(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+    ).to_entity()
+    use_case, storage_gateway, video_processor, _ = _chunk_use_case(video_job, mock_notification_gateway)
+    video_processor.iter_frames_parallel.return_value = iter(
+        [VideoFrame(index=index, pts=float(index), data=f"frame-{index}".encode()) for index in range(5)]
+    )
+
+    def upload_items_bulk(items, on_uploaded=None, **kwargs):
+        result = BulkUploadResult()
+        for item in items:
+            if item.key.endswith("frame_0003.png"):
+                result.failed.append(BulkUploadFailure(item=item, error=RuntimeError("SlowDown")))
+                continue
+            result.uploaded.append(StorageObject(bucket=item.bucket, key=item.key))
+            on_uploaded(item)
+        return result
+
+    storage_gateway.upload_items_bulk.side_effect = upload_items_bulk
+
+    with pytest.raises(RuntimeError, match="1 frame"):
+        use_case.execute(_task_dto(video_job))
+
+    repository = use_case._video_job_repository
+    assert repository.save_checkpoint.call_args.args[1] == {"frame_index": 2, "pts": 2.0}
+    parts = [call.args[0] for call in storage_gateway.upload_object.call_args_list]
+    assert all(part.key.startswith("frames/client/job/_checkpoint/") for part in parts)
+    assert [json.loads(line)["index"] for part in parts for line in part.content.splitlines()] == [0, 1, 2]
+    assert video_job.status == "ERROR"
+    assert video_job.checkpoint["frame_index"] == 2
+
+
+@patch('src.core.application.use_cases.process_video_use_case.CANCELLATION_POLL_INTERVAL_SECONDS', 0.01)
+def test_execute_stops_extraction_and_discards_frames_when_job_is_cancelled(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    use_case._video_job_repository.find_status.side_effect = (
+        lambda job_ref: "CANCELLED" if len(uploaded) >= 3 else "PROCESSING"
+    )
+    extraction = {"closed": False}
+
+    def iter_frames_parallel(video_path, frame_config, on_progress=None, start_tick=0):
+        index = 0
+        try:
+            while True:
+                time.sleep(0.005)
+                yield VideoFrame(index=index, pts=float(index), data=b"frame")
+                index += 1
+        finally:
+            extraction["closed"] = True
+
+    video_processor.iter_frames_parallel.side_effect = iter_frames_parallel
+
+    with pytest.raises(JobCancelledException):
+        use_case.execute(_task_dto(video_job))
+
+    assert extraction["closed"]
+    assert video_job.status == "PROCESSING"
+    storage_gateway.delete_prefix.assert_called_once_with(video_job.bucket, "frames/client/job/")
+    storage_gateway.upload_object.assert_not_called()
+    mock_notification_gateway.send_notification.assert_not_called()
+
+
+def test_execute_skips_job_cancelled_before_it_started(mock_notification_gateway):
+    video_job = VideoJobFactory(status="CANCELLED").to_entity()
+    use_case, storage_gateway, video_processor, _ = _chunk_use_case(video_job, mock_notification_gateway)
+
+    with pytest.raises(JobCancelledException):
+        use_case.execute(_task_dto(video_job))
+
+    storage_gateway.download_to_file.assert_not_called()
+    use_case._video_job_repository.save.assert_not_called()
+    assert video_job.status == "CANCELLED"
+
+
+def test_fail_chunks_keeps_cancelled_job_status(mock_notification_gateway):
+    video_job = VideoJobFactory(status="CANCELLED").to_entity()
+    use_case, *_ = _chunk_use_case(video_job, mock_notification_gateway)
+
+    use_case.fail_chunks(_task_dto(video_job), "chunk revoked")
+
+    assert video_job.status == "CANCELLED"
+    mock_notification_gateway.send_notification.assert_not_called()
+
+
+def test_execute_does_not_complete_a_job_cancelled_after_the_last_poll(mock_notification_gateway):
+    video_job = _cached_video_job()
+    frame_cache_repository = Mock(spec=IFrameCacheRepository)
+    frame_cache_repository.find_by_cache_key.return_value = None
+    use_case, storage_gateway, video_processor, _ = _chunk_use_case(video_job, mock_notification_gateway, frame_cache_repository)
+    video_processor.iter_frames_parallel.return_value = iter([VideoFrame(index=0, pts=0.0, data=b"frame-0")])
+    # o cancelamento chega depois da última checagem do watcher, entre o upload e a conclusão
+    use_case._video_job_repository.save_unless_cancelled.side_effect = lambda job: job.status != "COMPLETED"
+
+    with pytest.raises(JobCancelledException):
+        use_case.execute(_task_dto(video_job))
+
+    storage_gateway.delete_prefix.assert_called_with(video_job.bucket, "frames/client/job/")
+    frame_cache_repository.save.assert_not_called()
+    mock_notification_gateway.send_notification.assert_not_called()
+
+
+def test_complete_chunks_discards_frames_of_a_job_cancelled_meanwhile(mock_notification_gateway):
+    video_job = VideoJobFactory(status="PROCESSING", frames_path="frames", client_identification="client", job_ref="job").to_entity()
+    use_case, storage_gateway, *_ = _chunk_use_case(video_job, mock_notification_gateway)
+    use_case._video_job_repository.save_unless_cancelled.return_value = False
+
+    with pytest.raises(JobCancelledException):
+        use_case.complete_chunks(_task_dto(video_job), [{"frames": 1, "dropped_frames": 0}])
+
+    storage_gateway.delete_prefix.assert_called_once_with(video_job.bucket, "frames/client/job/")
+    mock_notification_gateway.send_notification.assert_not_called()
+
+
+def test_failure_of_a_job_cancelled_meanwhile_is_not_notified(mock_notification_gateway):
+    video_job = VideoJobFactory(status="QUEUED").to_entity()
+    use_case, storage_gateway, *_ = _chunk_use_case(video_job, mock_notification_gateway)
+    storage_gateway.download_to_file.side_effect = RuntimeError("Download failed")
+    use_case._video_job_repository.save_unless_cancelled.side_effect = lambda job: job.status != "ERROR"
+
+    with pytest.raises(RuntimeError, match="Download failed"):
+        use_case.execute(_task_dto(video_job))
+
+    use_case._video_job_repository.save.assert_not_called()
+    mock_notification_gateway.send_notification.assert_not_called()
+
+
+def _cached_video_job(**overrides):
+    return VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        content_hash="abc", **overrides,
+    ).to_entity()
+
+
+def _cache_entry(video_job, frames=2):
+    return FrameCacheEntry(
+        cache_key=FrameExtractionConfig.from_dict(video_job.config).cache_key("abc"),
+        content_hash="abc",
+        bucket=video_job.bucket,
+        frames_prefix="frames/other/previous",
+        job_ref="previous",
+        result={"frames": frames, "dropped_frames": 0},
+    )
+
+
+def test_execute_copies_frames_from_cache_without_decoding(mock_notification_gateway):
+    video_job = _cached_video_job()
+    frame_cache_repository = Mock(spec=IFrameCacheRepository)
+    entry = _cache_entry(video_job)
+    frame_cache_repository.find_by_cache_key.return_value = entry
+    use_case, storage_gateway, video_processor, _ = _chunk_use_case(video_job, mock_notification_gateway, frame_cache_repository)
+    storage_gateway.copy_prefix.return_value = 2
+
+    use_case.execute(_task_dto(video_job))
+
+    frame_cache_repository.find_by_cache_key.assert_called_once_with(entry.cache_key)
+    storage_gateway.copy_prefix.assert_called_once_with(video_job.bucket, "frames/other/previous", video_job.bucket, "frames/client/job")
+    storage_gateway.download_to_file.assert_not_called()
+    video_processor.iter_frames_parallel.assert_not_called()
+    assert video_job.status == "COMPLETED"
+    assert video_job.result == {"frames": 2, "dropped_frames": 0, "cached_from": "previous"}
+    assert (entry.job_ref, entry.frames_prefix, entry.hits) == ("job", "frames/client/job", 1)
+    frame_cache_repository.save.assert_called_once_with(entry)
+    frame_cache_repository.record_lookup.assert_called_once_with(hit=True)
+
+
+def test_cache_hit_keeps_entry_when_the_copy_is_deleted_after_processing(mock_notification_gateway):
+    video_job = _cached_video_job(config={"delete_after_processing": True})
+    frame_cache_repository = Mock(spec=IFrameCacheRepository)
+    entry = _cache_entry(video_job)
+    frame_cache_repository.find_by_cache_key.return_value = entry
+    use_case, storage_gateway, *_ = _chunk_use_case(video_job, mock_notification_gateway, frame_cache_repository)
+    storage_gateway.copy_prefix.return_value = 2
+
+    use_case.execute(_task_dto(video_job))
+
+    assert video_job.result["cached_from"] == "previous"
+    # a entrada continua apontando para os frames originais, que não serão apagados
+    assert (entry.job_ref, entry.frames_prefix) == ("previous", "frames/other/previous")
+    frame_cache_repository.save.assert_not_called()
+    frame_cache_repository.record_lookup.assert_called_once_with(hit=True)
+
+
+def test_execute_drops_stale_cache_entry_and_processes_video(mock_notification_gateway):
+    video_job = _cached_video_job()
+    frame_cache_repository = Mock(spec=IFrameCacheRepository)
+    entry = _cache_entry(video_job)
+    frame_cache_repository.find_by_cache_key.return_value = entry
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway, frame_cache_repository)
+    storage_gateway.copy_prefix.return_value = 0
+    video_processor.iter_frames_parallel.return_value = iter([VideoFrame(index=0, pts=0.0, data=b"frame-0")])
+
+    use_case.execute(_task_dto(video_job))
+
+    frame_cache_repository.delete.assert_called_once_with(entry)
+    frame_cache_repository.record_lookup.assert_called_once_with(hit=False)
+    storage_gateway.download_to_file.assert_called_once()
+    assert [item.key for item in uploaded] == ["frames/client/job/frame_0000.png"]
+    stored = frame_cache_repository.save.call_args.args[0]
+    assert (stored.cache_key, stored.job_ref, stored.result) == (
+        entry.cache_key, "job",
+        {"frames": 1, "dropped_frames": 0, "manifest": "manifest.jsonl", "key_layout": DEFAULT_KEY_LAYOUT},
+    )
+
+
+def _upload_metrics(throttle_events, retries, concurrency):
+    return {
+        "concurrency": concurrency, "max_concurrency": 64, "throttle_events": throttle_events,
+        "errors": 0, "successes": 2, "latency_ms": 12.5, "error_rate": 0.0, "retries": retries,
+    }
+
+
+def test_execute_records_upload_metrics_in_the_job_result_but_not_in_the_cache(mock_notification_gateway):
+    video_job = _cached_video_job()
+    frame_cache_repository = Mock(spec=IFrameCacheRepository)
+    frame_cache_repository.find_by_cache_key.return_value = None
+    use_case, storage_gateway, video_processor, _ = _chunk_use_case(video_job, mock_notification_gateway, frame_cache_repository)
+    storage_gateway.upload_items_bulk.side_effect = lambda items, **kwargs: BulkUploadResult(
+        uploaded=list(items), metrics=_upload_metrics(throttle_events=3, retries=4, concurrency=8)
+    )
+    video_processor.iter_frames_parallel.return_value = iter([VideoFrame(index=0, pts=0.0, data=b"frame-0")])
+
+    use_case.execute(_task_dto(video_job))
+
+    assert video_job.result["upload_metrics"] == _upload_metrics(throttle_events=3, retries=4, concurrency=8)
+    assert "upload_metrics" not in frame_cache_repository.save.call_args.args[0].result
+
+
+def test_failed_upload_keeps_upload_metrics_in_the_job_result(mock_notification_gateway):
+    video_job = VideoJobFactory(status="QUEUED").to_entity()
+    use_case, storage_gateway, video_processor, _ = _chunk_use_case(video_job, mock_notification_gateway)
+    storage_gateway.upload_items_bulk.side_effect = lambda items, **kwargs: BulkUploadResult(
+        failed=[BulkUploadFailure(item=item, error=Exception("SlowDown")) for item in items],
+        metrics=_upload_metrics(throttle_events=9, retries=20, concurrency=1),
+    )
+    video_processor.iter_frames_parallel.return_value = iter([VideoFrame(index=0, pts=0.0, data=b"frame-0")])
+
+    with pytest.raises(RuntimeError):
+        use_case.execute(_task_dto(video_job))
+
+    assert video_job.status == "ERROR"
+    assert video_job.result["upload_metrics"]["throttle_events"] == 9
+
+
+def test_complete_chunks_sums_the_upload_metrics_of_the_chunks(mock_notification_gateway):
+    video_job = VideoJobFactory(status="PROCESSING").to_entity()
+    use_case, *_ = _chunk_use_case(video_job, mock_notification_gateway)
+
+    use_case.complete_chunks(_task_dto(video_job), [
+        {"frames": 2, "manifest": [], "upload_metrics": _upload_metrics(throttle_events=1, retries=2, concurrency=16)},
+        {"frames": 2, "manifest": [], "upload_metrics": {}},
+        {"frames": 2, "manifest": [], "upload_metrics": _upload_metrics(throttle_events=3, retries=5, concurrency=4)},
+    ])
+
+    assert video_job.result["upload_metrics"] == {
+        **_upload_metrics(throttle_events=4, retries=7, concurrency=4), "successes": 4,
+    }
+
+
+def test_execute_does_not_cache_frames_deleted_after_processing(mock_notification_gateway):
+    video_job = _cached_video_job(config={"delete_after_processing": True})
+    frame_cache_repository = Mock(spec=IFrameCacheRepository)
+    frame_cache_repository.find_by_cache_key.return_value = None
+    use_case, _, video_processor, _ = _chunk_use_case(video_job, mock_notification_gateway, frame_cache_repository)
+    video_processor.iter_frames_parallel.return_value = iter([VideoFrame(index=0, pts=0.0, data=b"frame-0")])
+
+    use_case.execute(_task_dto(video_job))
+
+    assert video_job.status == "COMPLETED"
+    frame_cache_repository.record_lookup.assert_called_once_with(hit=False)
+    frame_cache_repository.save.assert_not_called()
+
+
+def test_execute_uploads_sprite_sheets_and_index(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        config={"frame_format": "jpeg", "sprite_columns": 2, "sprite_rows": 1},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    video_processor.iter_sprites.return_value = iter([
+        SpriteSheet(index=0, data=b"sprite-0", tile_width=64, tile_height=36, tiles=[
+            SpriteTile(index=0, pts=0.0, x=0, y=0), SpriteTile(index=1, pts=1.0, x=64, y=0),
+        ]),
+        SpriteSheet(index=1, data=b"sprite-1", tile_width=64, tile_height=36, tiles=[
+            SpriteTile(index=2, pts=2.0, x=0, y=0),
+        ]),
+    ])
+
+    use_case.execute(_task_dto(video_job))
+
+    video_processor.iter_frames_parallel.assert_not_called()
+    assert [(item.key, item.file_object.read()) for item in uploaded] == [
+        ("frames/client/job/sprite_0000.jpg", b"sprite-0"), ("frames/client/job/sprite_0001.jpg", b"sprite-1"),
+    ]
+    index_item = storage_gateway.upload_object.call_args.args[0]
+    assert (index_item.key, index_item.content_type) == ("frames/client/job/index.json", "application/json")
+    index = json.loads(index_item.content)
+    assert (index["columns"], index["rows"], index["tile_width"], index["tile_height"]) == (2, 1, 64, 36)
+    assert index["sprites"] == ["sprite_0000.jpg", "sprite_0001.jpg"]
+    assert index["frames"][2] == {"index": 2, "pts": 2.0, "sprite": "sprite_0001.jpg", "x": 0, "y": 0}
+    assert video_job.result == {"frames": 3, "dropped_frames": 0, "sprites": 2, "sprite_index": "index.json"}
+    assert video_job.status == "COMPLETED"
+
+
+def test_execute_uploads_each_rendition_under_its_own_prefix(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        config={"renditions": [{"name": "thumb", "format": "webp", "width": 320}, {"name": "full", "format": "png"}]},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    thumb, full = FrameExtractionConfig.from_dict(video_job.config).renditions
+    video_processor.iter_renditions.return_value = iter([
+        RenditionFrame(thumb, VideoFrame(index=0, pts=0.0, data=b"thumb-0")),
+        RenditionFrame(full, VideoFrame(index=0, pts=0.0, data=b"full-0")),
+        RenditionFrame(thumb, VideoFrame(index=1, pts=1.0, data=b"thumb-1")),
+        RenditionFrame(full, VideoFrame(index=1, pts=1.0, data=b"full-1")),
+    ])
+
+    payload = use_case.execute(_task_dto(video_job))
+
+    video_processor.iter_frames_parallel.assert_not_called()
+    assert [(item.key, item.content_type) for item in uploaded] == [
+        ("frames/client/job/thumb/frame_0000.webp", "image/webp"),
+        ("frames/client/job/full/frame_0000.png", "image/png"),
+        ("frames/client/job/thumb/frame_0001.webp", "image/webp"),
+        ("frames/client/job/full/frame_0001.png", "image/png"),
+    ]
+    manifest_item = storage_gateway.upload_object.call_args.args[0]
+    assert [json.loads(line)["key"] for line in manifest_item.content.splitlines()] == [
+        "thumb/frame_0000.webp", "full/frame_0000.png", "thumb/frame_0001.webp", "full/frame_0001.png",
+    ]
+    assert video_job.result == {
+        "frames": 2, "dropped_frames": 0, "renditions": {"thumb": 2, "full": 2}, "manifest": "manifest.jsonl",
+        "key_layout": DEFAULT_KEY_LAYOUT,
+    }
+    assert payload["renditions"] == {"thumb": "frames/client/job/thumb", "full": "frames/client/job/full"}
+
+
+def test_execute_streams_frames_into_tar_shards_with_byte_range_index(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        config={"shard_size_mb": 1},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, uploaded = _chunk_use_case(video_job, mock_notification_gateway)
+    written = {}
+    storage_gateway.create_multipart_upload.side_effect = lambda bucket, key, content_type: written.setdefault(key, []) or key
+    storage_gateway.upload_part.side_effect = lambda bucket, key, upload_id, number, data: written[key].append(data) or f"etag-{number}"
+    frames = [VideoFrame(index=i, pts=float(i), data=bytes([i]) * 400_000) for i in range(3)]
+    video_processor.iter_frames_parallel.return_value = iter(frames)
+
+    result = use_case.execute(_task_dto(video_job))
+
+    assert uploaded == []
+    assert list(written) == ["frames/client/job/shard_0000.tar", "frames/client/job/shard_0001.tar"]
+    assert storage_gateway.complete_multipart_upload.call_count == 2
+    index = json.loads(storage_gateway.upload_object.call_args.args[0].content)
+    assert index["shards"] == ["shard_0000.tar", "shard_0001.tar"]
+    assert index["dropped_frames"] == []
+    assert [(entry["shard"], entry["name"]) for entry in index["frames"]] == [
+        ("shard_0000.tar", "frame_0000.png"), ("shard_0000.tar", "frame_0001.png"), ("shard_0001.tar", "frame_0002.png"),
+    ]
+    second = index["frames"][1]
+    shard = b"".join(written["frames/client/job/shard_0000.tar"])
+    assert shard[second["offset"]:second["offset"] + second["length"]] == frames[1].data
+    assert video_job.result["shards"] == ["shard_0000.tar", "shard_0001.tar"]
+    assert result["shards"] == ["frames/client/job/shard_0000.tar", "frames/client/job/shard_0001.tar"]
+    assert result["shard_index"] == "frames/client/job/index.json"
+
+
+def test_execute_uploads_columnar_manifest_when_configured(mock_notification_gateway):
+    video_job = VideoJobFactory(
+        status="QUEUED", frames_path="frames", client_identification="client", job_ref="job",
+        config={"manifest_format": "columnar"},
+    ).to_entity()
+    use_case, storage_gateway, video_processor, _ = _chunk_use_case(video_job, mock_notification_gateway)
+    video_processor.iter_frames_parallel.return_value = iter([
+        VideoFrame(index=0, pts=0.0, data=b"frame-0"), VideoFrame(index=1, pts=0.5, data=b"frame-1"),
+    ])
+
+    result = use_case.execute(_task_dto(video_job))
+
+    manifest_item = storage_gateway.upload_object.call_args.args[0]
+    assert (manifest_item.key, manifest_item.content_type) == ("frames/client/job/manifest.json", "application/json")
+    columns = json.loads(manifest_item.content)
+    assert columns["pts"] == [0.0, 0.5]
+    assert columns["key"] == ["frame_0000.png", "frame_0001.png"]
+    assert columns["sha256"][1] == hashlib.sha256(b"frame-1").hexdigest()
+    assert result["manifest"] == "frames/client/job/manifest.json"
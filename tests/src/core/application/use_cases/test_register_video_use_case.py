@@ -1,15 +1,22 @@
-import pytest
-from unittest.mock import ANY, Mock, AsyncMock, call
+import hashlib
+import threading
 
-from fastapi import UploadFile
+import pytest
+from unittest.mock import ANY, Mock
 
 from src.core.application.use_cases.register_video_use_case import RegisterVideoUseCase
-from src.core.domain.dtos.video_frame_extractor.register_video_dto import RegisterVideoDTO
+from src.core.domain.dtos.video_frame_extractor.register_video_params_dto import RegisterVideoParamsDTO
+from src.core.domain.entities.media_metadata import MediaMetadata
+from src.core.domain.entities.task_schedule import TaskSchedule
 from src.core.domain.entities.video_job import VideoJob
+from src.core.exceptions.bad_request_exception import BadRequestException
+from src.core.exceptions.validation_exception import ValidationException
 from src.core.ports.gateways.callbacks.i_notification_gateway import INotificationGateway
 from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
 from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
 from src.core.ports.tasks.i_task_queue_gateway import ITaskQueueGateway
+from src.core.shared.multipart_upload_writer import MIN_PART_SIZE
+from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
 
 
 @pytest.fixture
@@ -19,7 +26,10 @@ def mock_video_job_repository():
 
 @pytest.fixture
 def mock_storage_gateway():
-    return Mock(spec=ObjectStorageGateway)
+    storage_gateway = Mock(spec=ObjectStorageGateway)
+    storage_gateway.create_multipart_upload.return_value = "upload-1"
+    storage_gateway.upload_part.side_effect = lambda bucket, key, upload_id, number, data: f'"etag-{number}"'
+    return storage_gateway
 
 
 @pytest.fixture
@@ -31,9 +41,18 @@ def mock_notification_gateway():
     return Mock(spec=INotificationGateway)
 
 
+@pytest.fixture
+def mock_video_processor():
+    video_processor = Mock(spec=FFmpegWrapper)
+    video_processor.probe_media.return_value = MediaMetadata(
+        duration=60.0, width=1280, height=720, fps=30.0, codec="h264", frame_count=1800
+    )
+    return video_processor
+
+
 @pytest.fixture
 def register_video_use_case(
-    mock_video_job_repository, mock_storage_gateway, mock_task_gateway, mock_notification_gateway
+    mock_video_job_repository, mock_storage_gateway, mock_task_gateway, mock_notification_gateway, mock_video_processor
 ):
     mock_notification_gateway.send_notification.return_value = None
     return RegisterVideoUseCase(
@@ -41,13 +60,15 @@ def register_video_use_case(
         storage_gateway=mock_storage_gateway,
         task_gateway=mock_task_gateway,
         notification_gateway=mock_notification_gateway,
+        video_processor=mock_video_processor,
     )
 
 def test_build_register_video_use_case(
     mock_video_job_repository,
     mock_storage_gateway,
     mock_task_gateway,
-    mock_notification_gateway
+    mock_notification_gateway,
+    mock_video_processor,
 ):
     mock_notification_gateway.send_notification.return_value = None
     use_case = RegisterVideoUseCase.build(
@@ -55,12 +76,14 @@ def test_build_register_video_use_case(
         storage_gateway=mock_storage_gateway,
         task_gateway=mock_task_gateway,
         notification_gateway=mock_notification_gateway,
+        video_processor=mock_video_processor,
     )
 
     assert isinstance(use_case, RegisterVideoUseCase)
     assert use_case._video_job_repository == mock_video_job_repository
     assert use_case._storage_gateway == mock_storage_gateway
     assert use_case._task_gateway == mock_task_gateway
+    assert use_case._video_processor == mock_video_processor
 
 @pytest.mark.asyncio
 async def test_execute_register_video_use_case(
@@ -69,17 +92,7 @@ async def test_execute_register_video_use_case(
     mock_storage_gateway,
     mock_task_gateway,
 ):
-    mock_file = AsyncMock(spec=UploadFile)
-    mock_file.read.return_value = b"fake video content"
-    mock_file.file = Mock()
-    mock_file.content_type = "video/mp4"
-    mock_file.size = 209 * 1024 * 1024  # 209MB
-
-    dto = RegisterVideoDTO(
-        video_file=mock_file,
-        client_identification="test_client",
-        notify_url="http://test.com/notify",
-    )
+    dto = RegisterVideoParamsDTO(client_identification="test_client", notify_url="http://test.com/notify")
 
     saved_job = Mock(spec=VideoJob)
     saved_job.job_ref = "a8eft6ae-7f4e-4d3b-9c1d-1234567890ab"
@@ -93,12 +106,15 @@ async def test_execute_register_video_use_case(
     
     mock_video_job_repository.find_by_job_ref.return_value = None
     mock_video_job_repository.save.return_value = saved_job
+    mock_task_gateway.enqueue_video_processing_task.return_value = "task-id"
 
-    result_job = await register_video_use_case.execute(dto)
+    result_job = await register_video_use_case.execute(dto, _chunks(b"fake video content"), content_type="video/mp4")
 
-    assert mock_video_job_repository.save.call_count == 2
-    mock_storage_gateway.upload_file_obj.assert_called_once()
+    mock_video_job_repository.save.assert_called_once()
+    mock_video_job_repository.save_unless_cancelled.assert_called_once_with(saved_job)
+    mock_storage_gateway.complete_multipart_upload.assert_called_once()
     mock_task_gateway.enqueue_video_processing_task.assert_called_once()
+    mock_video_job_repository.add_task_id.assert_called_once_with(saved_job.job_ref, "task-id")
 
     assert result_job == saved_job
 
@@ -112,25 +128,274 @@ async def test_execute_register_video_use_case_with_error(
 ):
     mock_video_job_repository.find_by_job_ref.return_value = None
     mock_notification_gateway.send_notification.return_value = None
-    mock_file = AsyncMock(spec=UploadFile)
-    mock_file.read.return_value = b"fake video content"
-    mock_file.file = Mock()
-    mock_file.content_type = "video/mp4"
-    mock_file.size = 209 * 1024 * 1024  # 209MB
-
-    dto = RegisterVideoDTO(
-        video_file=mock_file,
-        client_identification="test_client",
-        notify_url="http://test.com/notify",
-    )
+    dto = RegisterVideoParamsDTO(client_identification="test_client", notify_url="http://test.com/notify")
 
     mock_video_job_repository.save.side_effect = Exception("Database error")
 
     with pytest.raises(Exception, match="Database error"):
-        await register_video_use_case.execute(dto)
+        await register_video_use_case.execute(dto, _chunks(b"fake video content"))
+
+    # o job nem chegou a ser gravado: não há o que marcar como ERROR
+    mock_video_job_repository.save.assert_called_once_with(ANY)
+    mock_video_job_repository.save_unless_cancelled.assert_not_called()
+    mock_storage_gateway.create_multipart_upload.assert_not_called()
+    mock_task_gateway.enqueue_video_processing_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_register_video_use_case_stores_frame_config(
+    register_video_use_case,
+    mock_video_job_repository,
+):
+    dto = _upload_dto('{"frame_format": "webp", "quality": 75, "max_width": 1280, "mode": "scene", "scene_threshold": 0.4}')
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+
+    result_job = await _register(register_video_use_case, dto)
+
+    assert result_job.config == {
+        "delete_after_processing": False,
+        "frame_format": "webp",
+        "quality": 75,
+        "max_width": 1280,
+        "max_height": None,
+        "mode": "scene",
+        "scene_threshold": 0.4,
+        "dedup_max_distance": None,
+        "sprite_columns": None,
+        "sprite_rows": None,
+        "shard_size_mb": None,
+        "manifest_format": "jsonl",
+        "start_seconds": None,
+        "end_seconds": None,
+        "fps": None,
+        "max_frames": None,
+        "frame_count": None,
+        "renditions": None,
+    }
+
+
+def _upload_dto(config=None):
+    return RegisterVideoParamsDTO(client_identification="test_client", config=config)
+
+
+async def _chunks(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _register(use_case, dto):
+    return use_case.execute(dto, _chunks(b"fake video content"), content_type="video/mp4")
+
+
+@pytest.mark.asyncio
+async def test_execute_register_video_use_case_stores_media_metadata_and_schedules_task(
+    register_video_use_case,
+    mock_video_job_repository,
+    mock_storage_gateway,
+    mock_task_gateway,
+    mock_video_processor,
+):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+    mock_storage_gateway.presign_url.return_value = "https://signed/video"
+
+    result_job = await _register(register_video_use_case, _upload_dto())
+
+    mock_video_processor.probe_media.assert_called_once_with("https://signed/video")
+    assert result_job.content_hash == hashlib.sha256(b"fake video content").hexdigest()
+    assert result_job.media_metadata == {
+        "duration": 60.0, "width": 1280, "height": 720, "fps": 30.0, "codec": "h264", "frame_count": 1800,
+    }
+    _, schedule = mock_task_gateway.enqueue_video_processing_task.call_args.args
+    assert schedule == TaskSchedule(time_limit=300, soft_time_limit=250, long_running=False)
+
+
+@pytest.mark.asyncio
+async def test_execute_register_video_use_case_routes_long_high_resolution_videos(
+    register_video_use_case,
+    mock_video_job_repository,
+    mock_task_gateway,
+    mock_video_processor,
+):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+    mock_video_processor.probe_media.return_value = MediaMetadata(
+        duration=1800.0, width=3840, height=2160, fps=60.0, codec="hevc"
+    )
+
+    await _register(register_video_use_case, _upload_dto())
+
+    _, schedule = mock_task_gateway.enqueue_video_processing_task.call_args.args
+    assert schedule == TaskSchedule(time_limit=7200, soft_time_limit=6000, long_running=True)
+
+
+@pytest.mark.asyncio
+async def test_execute_register_video_use_case_schedules_by_clip_duration(
+    register_video_use_case,
+    mock_video_job_repository,
+    mock_task_gateway,
+    mock_video_processor,
+):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+    mock_video_processor.probe_media.return_value = MediaMetadata(
+        duration=1800.0, width=3840, height=2160, fps=60.0, codec="hevc"
+    )
+
+    await _register(register_video_use_case, _upload_dto('{"start_seconds": 60, "end_seconds": 120}'))
+
+    _, schedule = mock_task_gateway.enqueue_video_processing_task.call_args.args
+    assert schedule == TaskSchedule(time_limit=540, soft_time_limit=450, long_running=False)
 
-    assert mock_video_job_repository.save.call_count == 2
 
-    mock_video_job_repository.save.assert_called_with(ANY)
-    mock_storage_gateway.upload_file_obj.assert_not_called()
+@pytest.mark.asyncio
+async def test_execute_register_video_use_case_rejects_start_beyond_duration(
+    register_video_use_case,
+    mock_video_job_repository,
+    mock_task_gateway,
+):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+
+    with pytest.raises(BadRequestException, match="beyond the video duration"):
+        await _register(register_video_use_case, _upload_dto('{"start_seconds": 90}'))
+
     mock_task_gateway.enqueue_video_processing_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_register_video_use_case_rejects_undecodable_upload(
+    register_video_use_case,
+    mock_video_job_repository,
+    mock_storage_gateway,
+    mock_task_gateway,
+    mock_video_processor,
+):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+    mock_video_processor.probe_media.side_effect = ValueError("Invalid data found when processing input")
+
+    with pytest.raises(BadRequestException, match="not a decodable video"):
+        await _register(register_video_use_case, _upload_dto())
+
+    failed_job = mock_video_job_repository.save_unless_cancelled.call_args.args[0]
+    assert failed_job.status == "ERROR"
+    mock_storage_gateway.delete_object.assert_called_once()
+    mock_task_gateway.enqueue_video_processing_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_register_video_use_case_probes_outside_the_event_loop(
+    register_video_use_case,
+    mock_video_job_repository,
+    mock_video_processor,
+):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+    probe_threads = []
+    metadata = mock_video_processor.probe_media.return_value
+    mock_video_processor.probe_media.side_effect = lambda url: probe_threads.append(threading.current_thread()) or metadata
+
+    await _register(register_video_use_case, _upload_dto())
+
+    assert probe_threads and probe_threads[0] is not threading.current_thread()
+
+
+def test_register_video_params_dto_names_renditions_by_size_and_format():
+    dto = RegisterVideoParamsDTO(
+        client_identification="test_client",
+        config='{"renditions": [{"width": 320, "format": "webp"}, {"name": "full", "format": "png"}]}',
+    )
+
+    assert dto.job_config().model_dump()["renditions"] == [
+        {"name": "320w_webp", "format": "webp", "width": 320, "height": None, "quality": None},
+        {"name": "full", "format": "png", "width": None, "height": None, "quality": None},
+    ]
+
+
+@pytest.mark.parametrize("config", [
+    '{"frame_format": "gif"}',
+    '{"quality": 101}',
+    '{"max_width": 0}',
+    '{"mode": "every_frame"}',
+    '{"scene_threshold": 1.5}',
+    '{"dedup_max_distance": 65}',
+    '{"sprite_columns": 5}',
+    '{"sprite_columns": 17, "sprite_rows": 2}',
+    '{"sprite_columns": 5, "sprite_rows": 5, "dedup_max_distance": 4}',
+    '{"sprite_columns": 5, "sprite_rows": 5, "shard_size_mb": 64}',
+    '{"shard_size_mb": 0}',
+    '{"manifest_format": "parquet"}',
+    '{"start_seconds": 10, "end_seconds": 5}',
+    '{"fps": 0}',
+    '{"frame_count": 20, "fps": 2}',
+    '{"frame_count": 20, "mode": "scene"}',
+    '{"renditions": []}',
+    '{"renditions": [{"format": "gif"}]}',
+    '{"renditions": [{"width": 320}, {"width": 320, "format": "png"}]}',
+    '{"renditions": [{"width": 320}], "shard_size_mb": 64}',
+    '{"unknown": true}',
+    'not json',
+])
+def test_register_video_params_dto_rejects_invalid_config(config):
+    with pytest.raises(ValueError):
+        RegisterVideoParamsDTO(client_identification="test_client", config=config)
+
+
+@pytest.mark.asyncio
+async def test_execute_forwards_chunks_into_a_multipart_upload(
+    register_video_use_case, mock_video_job_repository, mock_storage_gateway, mock_task_gateway
+):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+    video = b"v" * (MIN_PART_SIZE + 100)
+
+    result_job = await register_video_use_case.execute(
+        _upload_dto(), _chunks(video[:1000], video[1000:]), content_type="video/mp4"
+    )
+
+    _, key, content_type = mock_storage_gateway.create_multipart_upload.call_args.args
+    assert content_type == "video/mp4"
+    assert [part.args[3] for part in mock_storage_gateway.upload_part.call_args_list] == [1, 2]
+    mock_storage_gateway.complete_multipart_upload.assert_called_once_with(
+        ANY, key, "upload-1", [(1, '"etag-1"'), (2, '"etag-2"')]
+    )
+    assert result_job.content_hash == hashlib.sha256(video).hexdigest()
+    assert result_job.status == "QUEUED"
+    mock_task_gateway.enqueue_video_processing_task.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_aborts_as_soon_as_the_size_limit_is_exceeded(
+    register_video_use_case, mock_video_job_repository, mock_storage_gateway, mock_task_gateway, monkeypatch
+):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+    monkeypatch.setattr("src.core.application.use_cases.register_video_use_case.MAX_VIDEO_FILE_SIZE", 1500)
+    consumed = []
+
+    async def chunks():
+        for index in range(10):
+            consumed.append(index)
+            yield b"v" * 1000
+
+    with pytest.raises(ValidationException):
+        await register_video_use_case.execute(_upload_dto(), chunks(), content_type="video/mp4")
+
+    assert consumed == [0, 1]
+    mock_storage_gateway.abort_multipart_upload.assert_called_once()
+    mock_storage_gateway.complete_multipart_upload.assert_not_called()
+    assert mock_video_job_repository.save_unless_cancelled.call_args.args[0].status == "ERROR"
+    mock_task_gateway.enqueue_video_processing_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_rejects_an_empty_video(register_video_use_case, mock_video_job_repository, mock_storage_gateway):
+    mock_video_job_repository.find_by_job_ref.return_value = None
+    mock_video_job_repository.save.side_effect = lambda job: job
+
+    with pytest.raises(BadRequestException, match="empty"):
+        await register_video_use_case.execute(_upload_dto(), _chunks(), content_type="video/mp4")
+
+    mock_storage_gateway.abort_multipart_upload.assert_called_once()
@@ -0,0 +1,97 @@
+from src.core.shared.adaptive_concurrency_controller import AdaptiveConcurrencyController
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _controller(max_limit=8, initial_limit=4):
+    clock = FakeClock()
+    return AdaptiveConcurrencyController(max_limit=max_limit, initial_limit=initial_limit, clock=clock), clock
+
+
+def test_limit_grows_by_one_per_healthy_round():
+    controller, _ = _controller()
+
+    for _ in range(4):
+        controller.on_success(0.1)
+    assert controller.limit == 5
+
+    for _ in range(5):
+        controller.on_success(0.1)
+    assert controller.limit == 6
+
+
+def test_limit_never_exceeds_max():
+    controller, _ = _controller(max_limit=5, initial_limit=5)
+
+    for _ in range(50):
+        controller.on_success(0.1)
+
+    assert controller.limit == 5
+
+
+def test_throttle_halves_the_limit_once_per_latency_window():
+    controller, clock = _controller(initial_limit=8)
+    controller.on_success(1.0)
+
+    assert controller.on_throttle()
+    assert not controller.on_throttle()  # resposta de uma requisição que já estava em voo
+    assert controller.limit == 4
+
+    clock.now = 2.0
+    assert controller.on_throttle()
+    assert controller.limit == 2
+    assert controller.snapshot()["throttle_events"] == 3
+
+
+def test_throttle_never_goes_below_min_limit():
+    controller, clock = _controller(initial_limit=1)
+
+    controller.on_throttle()
+
+    assert controller.limit == 1
+
+
+def test_latency_degradation_stops_growth():
+    controller, _ = _controller()
+    for _ in range(3):
+        controller.on_success(0.1)
+
+    for _ in range(20):
+        controller.on_success(1.0)
+
+    assert controller.limit == 4
+
+
+def test_errors_hold_growth_until_error_rate_recovers():
+    controller, _ = _controller()
+    controller.on_error()
+
+    for _ in range(4):
+        controller.on_success(0.1)
+    assert controller.limit == 4
+
+    for _ in range(20):
+        controller.on_success(0.1)
+    assert controller.limit > 4
+
+
+def test_snapshot_reports_metrics():
+    controller, _ = _controller()
+    controller.on_success(0.25)
+    controller.on_error()
+
+    assert controller.snapshot() == {
+        "concurrency": 4,
+        "max_concurrency": 8,
+        "throttle_events": 0,
+        "errors": 1,
+        "successes": 1,
+        "latency_ms": 250.0,
+        "error_rate": 0.2,
+    }
@@ -0,0 +1,74 @@
+import time
+
+import pytest
+
+from src.core.shared.bounded_pipeline import BoundedPipeline
+
+
+def _slow_source(count, delay, produced=None):
+    for i in range(count):
+        time.sleep(delay)
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+
+def test_pipeline_yields_all_items_in_order():
+    with BoundedPipeline(range(100), max_buffered=4) as pipeline:
+        assert list(pipeline) == list(range(100))
+
+
+def test_pipeline_overlaps_producer_and_consumer():
+    started = time.monotonic()
+    with BoundedPipeline(_slow_source(10, 0.05), max_buffered=4) as pipeline:
+        for _ in pipeline:
+            time.sleep(0.05)
+    elapsed = time.monotonic() - started
+
+    # sequencial levaria ~1.0s; sobreposto fica próximo de max(produção, consumo)
+    assert elapsed < 0.85
+
+
+def test_pipeline_bounds_items_ahead_of_consumer():
+    produced = []
+    with BoundedPipeline(_slow_source(50, 0, produced), max_buffered=3) as pipeline:
+        iterator = iter(pipeline)
+        next(iterator)
+        time.sleep(0.2)
+        # 1 consumido + 3 na fila + 1 aguardando espaço no produtor
+        assert len(produced) <= 5
+
+
+def test_pipeline_propagates_producer_error():
+    def failing_source():
+        yield 1
+        raise RuntimeError("ffmpeg died")
+
+    with pytest.raises(RuntimeError, match="ffmpeg died"):
+        with BoundedPipeline(failing_source(), max_buffered=2) as pipeline:
+            list(pipeline)
+
+
+def test_pipeline_consumer_error_cancels_and_closes_source():
+    closed = []
+
+    def source():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            closed.append(True)
+
+    with pytest.raises(ValueError):
+        with BoundedPipeline(source(), max_buffered=2) as pipeline:
+            for item in pipeline:
+                if item == 3:
+                    raise ValueError("upload failed")
+
+    assert pipeline.cancelled
+    assert closed == [True]
+
+
+def test_pipeline_rejects_invalid_buffer_size():
+    with pytest.raises(ValueError):
+        BoundedPipeline([], max_buffered=0)
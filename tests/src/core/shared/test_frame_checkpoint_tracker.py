@@ -0,0 +1,111 @@
+import json
+from unittest.mock import Mock
+
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.shared.frame_checkpoint_tracker import FrameCheckpointTracker
+from tests.factories.video_job_factory import VideoJobFactory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _entry(index):
+    return {"index": index, "pts": float(index), "key": f"frame_{index:04d}.png", "size": 1, "sha256": "x"}
+
+
+def _tracker(checkpoint=None, min_interval=5.0):
+    repository = Mock(spec=IVideoJobRepository)
+    storage_gateway = Mock(spec=ObjectStorageGateway)
+    video_job = VideoJobFactory(job_ref="job", checkpoint=checkpoint or {}).to_entity()
+    clock = FakeClock()
+    tracker = FrameCheckpointTracker(
+        repository, storage_gateway, video_job, "frames/job", min_interval=min_interval, clock=clock
+    )
+    return tracker, repository, storage_gateway, video_job
+
+
+def _submit(tracker, *indexes):
+    for index in indexes:
+        tracker.submitted(f"frames/job/frame_{index:04d}.png", _entry(index))
+
+
+def _parts(storage_gateway):
+    return {
+        call.args[0].key: [json.loads(line) for line in call.args[0].content.splitlines()]
+        for call in storage_gateway.upload_object.call_args_list
+    }
+
+
+def _jsonl(*indexes):
+    return "".join(json.dumps(_entry(index)) + "\n" for index in indexes).encode()
+
+
+def test_checkpoint_advances_only_over_contiguous_uploads():
+    tracker, repository, storage_gateway, video_job = _tracker(min_interval=0)
+    _submit(tracker, 0, 1, 2)
+
+    tracker.uploaded("frames/job/frame_0001.png")
+    repository.save_checkpoint.assert_not_called()
+
+    tracker.uploaded("frames/job/frame_0000.png")
+    repository.save_checkpoint.assert_called_once_with("job", {"frame_index": 1, "pts": 1.0})
+    assert _parts(storage_gateway) == {"frames/job/_checkpoint/0000000001.jsonl": [_entry(0), _entry(1)]}
+    assert video_job.checkpoint == {"frame_index": 1, "pts": 1.0}
+    assert tracker.resume_tick == 2
+
+
+def test_checkpoint_writes_are_throttled_and_flushed_on_demand():
+    tracker, repository, storage_gateway, video_job = _tracker()
+    _submit(tracker, 0, 1, 2)
+
+    tracker.uploaded("frames/job/frame_0000.png")
+    tracker.uploaded("frames/job/frame_0001.png")
+    assert repository.save_checkpoint.call_count == 1
+
+    tracker.flush()
+
+    assert list(_parts(storage_gateway).values()) == [[_entry(0)], [_entry(1)]]
+    assert video_job.checkpoint["frame_index"] == 1
+
+
+def test_failed_checkpoint_write_is_retried_with_the_next_one():
+    tracker, repository, storage_gateway, video_job = _tracker(min_interval=0)
+    repository.save_checkpoint.side_effect = [ConnectionError("mongo down"), None]
+    _submit(tracker, 0, 1)
+
+    tracker.uploaded("frames/job/frame_0000.png")
+    tracker.uploaded("frames/job/frame_0001.png")
+
+    assert _parts(storage_gateway)["frames/job/_checkpoint/0000000001.jsonl"] == [_entry(0), _entry(1)]
+    assert video_job.checkpoint == {"frame_index": 1, "pts": 1.0}
+
+
+def test_resumes_after_the_stored_checkpoint_with_entries_from_the_parts():
+    tracker, repository, storage_gateway, video_job = _tracker(checkpoint={"frame_index": 9, "pts": 9.0})
+    # a parte 0000000004 foi refeita na 0000000009; a 0000000012 foi gravada sem o checkpoint avançar
+    parts = {
+        "frames/job/_checkpoint/0000000004.jsonl": _jsonl(0, 1, 2, 3, 4),
+        "frames/job/_checkpoint/0000000009.jsonl": _jsonl(0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        "frames/job/_checkpoint/0000000012.jsonl": _jsonl(10, 11, 12),
+    }
+    storage_gateway.download_object.side_effect = lambda bucket, key: parts[key]
+
+    entries = tracker.resumed_entries(["frames/job/frame_0000.png", *parts])
+
+    assert tracker.resume_tick == 10
+    assert entries == [_entry(index) for index in range(10)]
+    assert FrameCheckpointTracker(repository, storage_gateway, VideoJobFactory().to_entity(), "frames/x").resume_tick == 0
+
+
+def test_discard_removes_the_manifest_parts():
+    tracker, repository, storage_gateway, video_job = _tracker()
+
+    tracker.discard()
+
+    storage_gateway.delete_prefix.assert_called_once_with(video_job.bucket, "frames/job/_checkpoint/")
@@ -0,0 +1,62 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.exceptions.job_cancelled_exception import JobCancelledException
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.shared.job_cancellation_watcher import JobCancellationWatcher
+
+
+def _wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_watcher_flags_cancellation_from_the_job_status():
+    repository = Mock(spec=IVideoJobRepository)
+    repository.find_status.side_effect = ["PROCESSING", "PROCESSING", "CANCELLED"]
+
+    with JobCancellationWatcher(repository, "job", poll_interval=0.01) as cancellation:
+        assert _wait_until(lambda: cancellation.cancelled)
+        with pytest.raises(JobCancelledException, match="job"):
+            cancellation.raise_if_cancelled()
+
+    # depois de detectar o cancelamento a thread para de consultar o status
+    assert repository.find_status.call_count == 3
+
+
+def test_guard_closes_the_source_once_cancelled():
+    repository = Mock(spec=IVideoJobRepository)
+    repository.find_status.return_value = "PROCESSING"
+    source = {"yielded": 0, "closed": False}
+
+    def frames():
+        try:
+            while True:
+                source["yielded"] += 1
+                yield source["yielded"]
+        finally:
+            source["closed"] = True
+
+    with JobCancellationWatcher(repository, "job", poll_interval=0.01) as cancellation:
+        guarded = cancellation.guard(frames())
+        assert [next(guarded), next(guarded)] == [1, 2]
+        repository.find_status.return_value = "CANCELLED"
+        assert _wait_until(lambda: cancellation.cancelled)
+
+        with pytest.raises(JobCancelledException):
+            next(guarded)
+
+    assert source["closed"]
+    assert source["yielded"] == 3
+
+
+def test_status_read_errors_do_not_stop_the_watcher():
+    repository = Mock(spec=IVideoJobRepository)
+    repository.find_status.side_effect = [ConnectionError("mongo down"), "CANCELLED"]
+
+    with JobCancellationWatcher(repository, "job", poll_interval=0.01) as cancellation:
+        assert _wait_until(lambda: cancellation.cancelled)
@@ -0,0 +1,66 @@
+from unittest.mock import Mock
+
+from src.core.domain.entities.extraction_progress import ExtractionProgress
+from src.core.ports.repositories.i_video_job_repository import IVideoJobRepository
+from src.core.shared.job_progress_tracker import JobProgressTracker
+from tests.factories.video_job_factory import VideoJobFactory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _tracker(total_seconds=120.0, min_interval=2.0):
+    repository = Mock(spec=IVideoJobRepository)
+    video_job = VideoJobFactory(job_ref="job").to_entity()
+    clock = FakeClock()
+    tracker = JobProgressTracker(repository, video_job, total_seconds, min_interval=min_interval, clock=clock)
+    return tracker, repository, video_job, clock
+
+
+def _written(repository):
+    return [call.args[1] for call in repository.update_progress.call_args_list]
+
+
+def test_progress_writes_are_throttled_to_the_minimum_interval():
+    tracker, repository, video_job, clock = _tracker()
+
+    tracker.on_extraction(ExtractionProgress(frames=10, out_time=30.0))
+    for _ in range(50):
+        tracker.on_uploaded()
+    clock.now = 1.9
+    tracker.on_extraction(ExtractionProgress(frames=20, out_time=45.0))
+    clock.now = 2.0
+    tracker.on_extraction(ExtractionProgress(frames=30, out_time=60.0))
+
+    written = _written(repository)
+    assert len(written) == 2
+    assert repository.update_progress.call_args.args[0] == "job"
+    assert {key: written[-1][key] for key in ("frames_decoded", "out_time", "frames_uploaded", "percent")} == {
+        "frames_decoded": 30, "out_time": 60.0, "frames_uploaded": 50, "percent": 50.0,
+    }
+    assert video_job.progress == written[-1]
+
+
+def test_finish_writes_immediately_and_completes_the_percentage():
+    tracker, repository, video_job, clock = _tracker()
+    tracker.on_extraction(ExtractionProgress(frames=10, out_time=118.0))
+
+    tracker.finish()
+
+    assert len(_written(repository)) == 2
+    assert video_job.progress["percent"] == 100.0
+
+
+def test_percent_is_unknown_without_duration_and_write_errors_do_not_break_the_job():
+    tracker, repository, video_job, clock = _tracker(total_seconds=None)
+    repository.update_progress.side_effect = RuntimeError("mongo down")
+
+    tracker.on_extraction(ExtractionProgress(frames=3, out_time=3.0))
+
+    assert video_job.progress["percent"] is None
+    assert video_job.progress["frames_decoded"] == 3
@@ -0,0 +1,51 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.ports.cloud.object_storage_gateway import ObjectStorageGateway
+from src.core.shared.multipart_upload_writer import MIN_PART_SIZE, MultipartUploadWriter
+
+
+def _storage_gateway():
+    storage_gateway = Mock(spec=ObjectStorageGateway)
+    storage_gateway.create_multipart_upload.return_value = "upload-id"
+    storage_gateway.upload_part.side_effect = lambda bucket, key, upload_id, number, data: f"etag-{number}-{len(data)}"
+    return storage_gateway
+
+
+def test_writer_uploads_fixed_size_parts_and_completes_in_order():
+    storage_gateway = _storage_gateway()
+
+    with MultipartUploadWriter(
+        storage_gateway, "bucket", "shard.tar", "application/x-tar", part_size=MIN_PART_SIZE, max_in_flight=2
+    ) as writer:
+        for _ in range(5):
+            writer.write(b"x" * (MIN_PART_SIZE // 2 + 1))
+        assert writer.tell() == 5 * (MIN_PART_SIZE // 2 + 1)
+
+    storage_gateway.create_multipart_upload.assert_called_once_with("bucket", "shard.tar", "application/x-tar")
+    parts = storage_gateway.complete_multipart_upload.call_args.args[3]
+    assert sorted(parts) == [(1, f"etag-1-{MIN_PART_SIZE}"), (2, f"etag-2-{MIN_PART_SIZE}"), (3, f"etag-3-{MIN_PART_SIZE // 2 + 5}")]
+    storage_gateway.abort_multipart_upload.assert_not_called()
+
+
+def test_writer_uploads_a_single_part_for_small_content():
+    storage_gateway = _storage_gateway()
+
+    writer = MultipartUploadWriter(storage_gateway, "bucket", "shard.tar")
+    writer.write(b"tiny")
+    writer.close()
+
+    assert storage_gateway.complete_multipart_upload.call_args.args[3] == [(1, "etag-1-4")]
+
+
+def test_writer_aborts_when_a_part_fails():
+    storage_gateway = _storage_gateway()
+    storage_gateway.upload_part.side_effect = RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError, match="connection reset"):
+        with MultipartUploadWriter(storage_gateway, "bucket", "shard.tar") as writer:
+            writer.write(b"x" * 10)
+
+    storage_gateway.complete_multipart_upload.assert_not_called()
+    storage_gateway.abort_multipart_upload.assert_called_once_with("bucket", "shard.tar", "upload-id")
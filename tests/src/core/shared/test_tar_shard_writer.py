@@ -0,0 +1,21 @@
+import io
+import tarfile
+
+from src.core.shared.tar_shard_writer import TarShardWriter
+
+
+def test_tar_shard_writer_writes_readable_tar_with_member_offsets():
+    stream = io.BytesIO()
+    tar = TarShardWriter(stream)
+
+    first = tar.add("frame_0000.png", b"first frame")
+    second = tar.add("frame_0001.png", b"y" * 1500)
+    tar.close()
+
+    content = stream.getvalue()
+    assert tar.size == len(content) == TarShardWriter.entry_size(11) + TarShardWriter.entry_size(1500) + 1024
+    assert content[first[0]:first[0] + first[1]] == b"first frame"
+    assert content[second[0]:second[0] + second[1]] == b"y" * 1500
+    with tarfile.open(fileobj=io.BytesIO(content)) as archive:
+        assert archive.getnames() == ["frame_0000.png", "frame_0001.png"]
+        assert archive.extractfile("frame_0001.png").read() == b"y" * 1500
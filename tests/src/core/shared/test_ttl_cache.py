@@ -0,0 +1,41 @@
+from src.core.shared.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_returns_value_until_ttl_expires():
+    clock = FakeClock()
+    cache = TTLCache(clock=clock)
+    cache.set("k", "v", ttl=10)
+
+    clock.now = 9.9
+    assert cache.get("k") == "v"
+
+    clock.now = 10
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_evicts_expired_then_oldest_when_full():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, clock=clock)
+    cache.set("short", 1, ttl=1)
+    cache.set("a", 2, ttl=100)
+    clock.now = 5
+    cache.set("b", 3, ttl=100)
+
+    assert cache.get("short") is None
+    assert cache.get("a") == 2
+    assert cache.get("b") == 3
+
+    cache.set("c", 4, ttl=100)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == 4
+    assert len(cache) == 2
@@ -3,6 +3,8 @@ from unittest.mock import Mock, patch
 
 from celery import Celery
 
+from src.config import celery_config
+from src.core.domain.entities.task_schedule import TaskSchedule
 from src.infrastructure.gateways.celery_task_queue_gateway import CeleryTaskQueueGateway
 
 
@@ -33,3 +35,48 @@ def test_enqueue_video_processing_task(gateway, mock_celery_app):
         args=[task_data]
     )
     assert task_id == "some-task-id"
+
+
+def test_enqueue_video_processing_task_with_schedule(gateway, mock_celery_app):
+    task_data = {"job_ref": "test_job_123"}
+    mock_celery_app.send_task.return_value.id = "some-task-id"
+
+    gateway.enqueue_video_processing_task(task_data, TaskSchedule(time_limit=3600, soft_time_limit=3000, long_running=True))
+
+    mock_celery_app.send_task.assert_called_once_with(
+        'src.infrastructure.tasks.video_tasks.extract_frames_task',
+        args=[task_data],
+        time_limit=3600,
+        soft_time_limit=3000,
+        queue=celery_config.extract_frames_long_q,
+    )
+
+
+@patch('src.infrastructure.gateways.celery_task_queue_gateway.chord')
+def test_enqueue_video_chunks_builds_chord_with_failure_callback(mock_chord):
+    celery_app = Celery('test', set_as_current=False)
+    gateway = CeleryTaskQueueGateway(celery_app=celery_app)
+    mock_chord.return_value.return_value.id = "chord-id"
+    task_data = {"job_ref": "test_job_123"}
+    chunks = [{"start_tick": 0, "end_tick": 600}, {"start_tick": 600, "end_tick": None}]
+
+    chord_id = gateway.enqueue_video_chunks(task_data, chunks)
+
+    header = list(mock_chord.call_args.args[0].tasks)
+    assert [task.task for task in header] == ['src.infrastructure.tasks.video_tasks.extract_frames_chunk_task'] * 2
+    assert [task.args for task in header] == [(task_data, chunk) for chunk in chunks]
+
+    callback = mock_chord.return_value.call_args.args[0]
+    assert callback.task == 'src.infrastructure.tasks.video_tasks.finalize_chunked_video_task'
+    assert callback.args == (task_data,)
+    errback = callback.options['link_error'][0]
+    assert errback['task'] == 'src.infrastructure.tasks.video_tasks.fail_chunked_video_task'
+    assert errback['kwargs'] == {'task_data': task_data}
+    assert chord_id == "chord-id"
+
+
+def test_revoke_tasks_revokes_without_terminating(gateway, mock_celery_app):
+    gateway.revoke_tasks(["task-1", "chord-2"])
+    gateway.revoke_tasks([])
+
+    mock_celery_app.control.revoke.assert_called_once_with(["task-1", "chord-2"])
@@ -0,0 +1,63 @@
+import io
+import os
+
+import pytest
+
+from src.core.domain.entities.storage_config import StorageConfig
+from src.core.domain.entities.storage_item import StorageItem
+from src.infrastructure.gateways.filesystem_storage_gateway import FileSystemStorageGateway
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def gateway(tmp_path):
+    return FileSystemStorageGateway(StorageConfig(endpoint_url=f"file://{tmp_path / 'storage'}"))
+
+
+def test_objects_are_plain_files_under_the_root(gateway, tmp_path):
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/job/frame_0000.png", content=b"x", metadata={"pts": "0.000000"}))
+
+    path = tmp_path / "storage" / BUCKET / "frames" / "job" / "frame_0000.png"
+    assert path.read_bytes() == b"x"
+    assert gateway.presign_url(BUCKET, "frames/job/frame_0000.png") == path.as_uri()
+    assert not os.listdir(tmp_path / "storage" / ".tmp")
+
+
+def test_uploads_from_files_on_disk_are_hardlinked(gateway, tmp_path):
+    source = tmp_path / "input_video"
+    source.write_bytes(b"video")
+
+    with open(source, "rb") as file_object:
+        gateway.upload_file_obj(StorageItem(bucket=BUCKET, key="videos/job", file_object=file_object))
+
+    stored = tmp_path / "storage" / BUCKET / "videos" / "job"
+    assert os.stat(stored).st_ino == os.stat(source).st_ino
+    source.unlink()
+    assert stored.read_bytes() == b"video"
+
+
+def test_copy_prefix_and_download_to_file_do_not_copy_content(gateway, tmp_path):
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/a/frame_0000.png", file_object=io.BytesIO(b"x")))
+    target = tmp_path / "downloaded"
+
+    gateway.copy_prefix(BUCKET, "frames/a", BUCKET, "frames/b")
+    gateway.download_to_file(BUCKET, "frames/b/frame_0000.png", str(target))
+
+    stored = tmp_path / "storage" / BUCKET / "frames" / "a" / "frame_0000.png"
+    assert os.stat(target).st_ino == os.stat(stored).st_ino
+
+
+def test_replacing_an_object_does_not_change_earlier_copies(gateway):
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/a/frame_0000.png", content=b"old"))
+    gateway.copy_prefix(BUCKET, "frames/a", BUCKET, "frames/b")
+
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/a/frame_0000.png", content=b"new"))
+
+    assert gateway.download_object(BUCKET, "frames/b/frame_0000.png") == b"old"
+    assert gateway.download_object(BUCKET, "frames/a/frame_0000.png") == b"new"
+
+
+def test_keys_cannot_escape_the_root(gateway):
+    with pytest.raises(ValueError):
+        gateway.upload_object(StorageItem(bucket=BUCKET, key="../outside", content=b"x"))
@@ -0,0 +1,42 @@
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import urlopen
+
+from src.core.domain.entities.storage_item import StorageItem
+from src.infrastructure.gateways.in_memory_storage_gateway import InMemoryStorageGateway
+
+BUCKET = "test-bucket"
+KEY = "videos/client/job"
+
+
+def _read(url):
+    with urlopen(url) as response:
+        return response.read()
+
+
+def test_presigned_url_is_a_local_file_uri():
+    gateway = InMemoryStorageGateway()
+    gateway.upload_object(StorageItem(bucket=BUCKET, key=KEY, content=b"video-v1"))
+
+    url = gateway.presign_url(BUCKET, KEY)
+
+    assert url.startswith("file://")
+    assert _read(url) == b"video-v1"
+    # the object is written to disk only once while it does not change
+    assert gateway.presign_url(BUCKET, KEY) == url
+
+
+def test_spilled_copy_follows_replacement_and_deletion_of_the_object():
+    gateway = InMemoryStorageGateway()
+    gateway.upload_object(StorageItem(bucket=BUCKET, key=KEY, content=b"video-v1"))
+    first_path = Path(urlparse(gateway.presign_url(BUCKET, KEY)).path)
+
+    gateway.upload_object(StorageItem(bucket=BUCKET, key=KEY, content=b"video-v2"))
+    second_url = gateway.presign_url(BUCKET, KEY)
+
+    assert _read(second_url) == b"video-v2"
+    assert not first_path.exists()
+
+    gateway.delete_object(BUCKET, KEY)
+
+    assert not Path(urlparse(second_url).path).exists()
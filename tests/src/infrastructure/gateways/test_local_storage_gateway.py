@@ -0,0 +1,137 @@
+import io
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.core.domain.entities.storage_config import StorageConfig
+from src.core.domain.entities.storage_item import StorageItem
+from src.core.shared.multipart_upload_writer import MIN_PART_SIZE, MultipartUploadWriter
+from src.infrastructure.gateways.filesystem_storage_gateway import FileSystemStorageGateway
+from src.infrastructure.gateways.in_memory_storage_gateway import InMemoryStorageGateway
+
+BUCKET = "test-bucket"
+
+
+def _config(tmp_path, **fault_injection):
+    return StorageConfig(
+        endpoint_url=str(tmp_path / "storage"),
+        max_concurrency=8,
+        retry_multiplier=0.01,
+        retry_min=0,
+        retry_max=1,
+        upload_retry_deadline=5.0,
+        extra={"fault_injection": fault_injection},
+    )
+
+
+@pytest.fixture(params=["filesystem", "memory"])
+def make_gateway(request, tmp_path):
+    backend = FileSystemStorageGateway if request.param == "filesystem" else InMemoryStorageGateway
+    return lambda **fault_injection: backend(_config(tmp_path, **fault_injection))
+
+
+def _items(count, prefix="frames/job"):
+    return [
+        StorageItem(bucket=BUCKET, key=f"{prefix}/frame_{i:04d}.png", file_object=io.BytesIO(b"frame-%d" % i), content_type="image/png")
+        for i in range(count)
+    ]
+
+
+def test_objects_round_trip_with_metadata(make_gateway, tmp_path):
+    gateway = make_gateway()
+
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/job/frame_0000.png", content=b"x", content_type="image/png", metadata={"pts": "4.200000"}))
+
+    assert gateway.download_object(BUCKET, "frames/job/frame_0000.png") == b"x"
+    assert gateway.object_metadata(BUCKET, "frames/job/frame_0000.png") == ("image/png", {"pts": "4.200000"})
+    target = tmp_path / "downloaded"
+    assert gateway.download_to_file(BUCKET, "frames/job/frame_0000.png", str(target)) == 1
+    assert target.read_bytes() == b"x"
+
+
+def test_missing_object_raises_no_such_key(make_gateway):
+    gateway = make_gateway()
+
+    with pytest.raises(ClientError) as error:
+        gateway.download_object(BUCKET, "missing")
+
+    assert error.value.response["Error"]["Code"] == "NoSuchKey"
+
+
+def test_head_object_reports_size_and_content_type(make_gateway):
+    gateway = make_gateway()
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="videos/client/job", content=b"video", content_type="video/mp4"))
+
+    stored = gateway.head_object(BUCKET, "videos/client/job")
+
+    assert stored.metadata == {"ContentLength": 5, "ContentType": "video/mp4", "ETag": None}
+    assert gateway.head_object(BUCKET, "videos/client/missing") is None
+
+
+def test_listing_follows_s3_prefix_semantics(make_gateway):
+    gateway = make_gateway()
+    gateway.upload_items_bulk(_items(3, "frames/a") + _items(1, "frames/ab") + _items(1, "frames/a/ff"))
+
+    assert [obj.key for obj in gateway.list_objects(BUCKET, "frames/a/")] == [
+        "frames/a/ff/frame_0000.png", "frames/a/frame_0000.png", "frames/a/frame_0001.png", "frames/a/frame_0002.png",
+    ]
+    assert len(gateway.list_objects(BUCKET, "frames/a")) == 5
+    assert gateway.list_objects(BUCKET, "frames/missing/") == []
+
+
+def test_copy_and_delete_prefix(make_gateway):
+    gateway = make_gateway()
+    gateway.upload_items_bulk(_items(3, "frames/a"))
+
+    assert gateway.copy_prefix(BUCKET, "frames/a", BUCKET, "frames/b") == 3
+    assert gateway.download_object(BUCKET, "frames/b/frame_0001.png") == b"frame-1"
+    assert gateway.object_metadata(BUCKET, "frames/b/frame_0001.png")[0] == "image/png"
+
+    assert gateway.delete_prefix(BUCKET, "frames/a/") == 3
+    assert gateway.list_objects(BUCKET, "frames/a/") == []
+    assert len(gateway.list_objects(BUCKET, "frames/b/")) == 3
+
+
+def test_multipart_upload_assembles_parts_in_order(make_gateway):
+    gateway = make_gateway()
+    parts = [b"a" * MIN_PART_SIZE, b"b" * MIN_PART_SIZE, b"tail"]
+
+    with MultipartUploadWriter(gateway, BUCKET, "frames/job/shard_0000.tar", "application/x-tar", part_size=MIN_PART_SIZE) as writer:
+        for part in parts:
+            writer.write(part)
+
+    assert gateway.download_object(BUCKET, "frames/job/shard_0000.tar") == b"".join(parts)
+    assert gateway.object_metadata(BUCKET, "frames/job/shard_0000.tar")[0] == "application/x-tar"
+
+
+def test_complete_multipart_upload_rejects_unknown_parts(make_gateway):
+    gateway = make_gateway()
+    upload_id = gateway.create_multipart_upload(BUCKET, "big")
+    etag = gateway.upload_part(BUCKET, "big", upload_id, 1, b"data")
+
+    with pytest.raises(ClientError) as error:
+        gateway.complete_multipart_upload(BUCKET, "big", upload_id, [(1, etag), (2, '"other"')])
+
+    assert error.value.response["Error"]["Code"] == "InvalidPart"
+    gateway.abort_multipart_upload(BUCKET, "big", upload_id)
+    assert gateway.list_objects(BUCKET, "big") == []
+
+
+def test_injected_throttling_drives_the_adaptive_bulk_upload(make_gateway):
+    gateway = make_gateway(throttle_rate=0.3, seed=7)
+
+    result = gateway.upload_items_bulk(_items(40))
+
+    assert result.ok
+    assert len(gateway.list_objects(BUCKET, "frames/job/")) == 40
+    assert result.metrics["throttle_events"] > 0
+    assert result.metrics["retries"] == result.metrics["throttle_events"]
+
+
+def test_injected_errors_are_retried_on_single_uploads(make_gateway):
+    gateway = make_gateway(error_rate=0.5, seed=3)
+
+    for item in _items(5):
+        gateway.upload_object(item)
+
+    assert len(gateway.list_objects(BUCKET, "frames/job/")) == 5
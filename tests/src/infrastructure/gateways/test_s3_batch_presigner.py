@@ -0,0 +1,69 @@
+import datetime
+from unittest.mock import patch
+
+import boto3
+import pytest
+from botocore.config import Config
+
+from src.infrastructure.gateways.s3_batch_presigner import S3BatchPresigner
+
+KEYS = [
+    "frames/client/job/frame_0000.png",
+    "frames/client/job/with space.png",
+    "frames/ação/ü+x=y&z.png",
+    "frames/k~1!*()'.png",
+]
+
+
+def _client(addressing_style, token=None):
+    session = boto3.session.Session(
+        aws_access_key_id="AKIDEXAMPLE",
+        aws_secret_access_key="secret",
+        aws_session_token=token,
+        region_name="sa-east-1",
+    )
+    client = session.client("s3", config=Config(signature_version="s3v4", s3={"addressing_style": addressing_style}))
+    return client, lambda: session.get_credentials().get_frozen_credentials()
+
+
+@pytest.mark.parametrize("addressing_style,token", [("virtual", None), ("path", "session/token+=")])
+def test_batch_urls_match_botocore_signatures(addressing_style, token):
+    client, credentials = _client(addressing_style, token)
+    fixed_now = datetime.datetime(2026, 10, 18, 12, 0, 0)
+
+    with patch("botocore.auth.get_current_datetime", return_value=fixed_now):
+        urls = S3BatchPresigner(client, credentials).presign_get_urls("my-bucket", KEYS, 900)
+        expected = {
+            key: client.generate_presigned_url("get_object", Params={"Bucket": "my-bucket", "Key": key}, ExpiresIn=900)
+            for key in KEYS
+        }
+
+    assert urls == expected
+
+
+def test_batch_signs_template_once_with_botocore():
+    client, credentials = _client("virtual")
+    presigner = S3BatchPresigner(client, credentials)
+
+    with patch.object(client, "generate_presigned_url", wraps=client.generate_presigned_url) as botocore_presign:
+        urls = presigner.presign_get_urls("my-bucket", KEYS, 3600)
+
+    assert botocore_presign.call_count == 1
+    assert set(urls) == set(KEYS)
+
+
+def test_batch_falls_back_to_botocore_when_template_is_not_reusable():
+    client, _ = _client("virtual")
+    presigner = S3BatchPresigner(client, lambda: None)
+
+    with patch.object(client, "generate_presigned_url", wraps=client.generate_presigned_url) as botocore_presign:
+        urls = presigner.presign_get_urls("my-bucket", KEYS, 3600)
+
+    assert botocore_presign.call_count == len(KEYS)
+    assert set(urls) == set(KEYS)
+
+
+def test_empty_batch_returns_empty_dict():
+    client, credentials = _client("virtual")
+
+    assert S3BatchPresigner(client, credentials).presign_get_urls("my-bucket", [], 3600) == {}
@@ -0,0 +1,434 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import time
+from unittest.mock import patch
+
+import boto3
+import pytest
+import requests
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from src.core.domain.entities.storage_config import StorageConfig
+from src.core.domain.entities.storage_item import StorageItem
+from src.core.domain.entities.storage_object import StorageObject
+from src.core.shared.multipart_upload_writer import MIN_PART_SIZE, MultipartUploadWriter
+from src.core.shared.tar_shard_writer import TarShardWriter
+from src.infrastructure.gateways.s3_storage_gateway import S3StorageGateway
+
+BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def aws_credentials(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+
+
+@pytest.fixture
+def s3(aws_credentials):
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        yield
+
+
+def _gateway(max_concurrency=8, put_latency=0.0):
+    gateway = S3StorageGateway(StorageConfig(max_concurrency=max_concurrency))
+    if put_latency:
+        gateway._client.meta.events.register(
+            "before-sign.s3.PutObject", lambda **kwargs: time.sleep(put_latency)
+        )
+    return gateway
+
+
+def _items(count):
+    return (
+        StorageItem(bucket=BUCKET, key=f"frames/frame_{i:04d}.png", file_object=io.BytesIO(b"x" * 10), content_type="image/png")
+        for i in range(count)
+    )
+
+
+def test_connection_pool_is_sized_to_concurrency(s3):
+    gateway = _gateway(max_concurrency=24)
+
+    assert gateway._client.meta.config.max_pool_connections == 24
+
+
+def test_upload_items_bulk_uploads_every_item(s3):
+    gateway = _gateway()
+
+    result = gateway.upload_items_bulk(_items(20))
+
+    assert result.ok
+    assert sorted(obj.key for obj in result.uploaded) == [f"frames/frame_{i:04d}.png" for i in range(20)]
+    listed = boto3.client("s3", region_name="us-east-1").list_objects_v2(Bucket=BUCKET, Prefix="frames/")
+    assert listed["KeyCount"] == 20
+
+
+def test_upload_object_stores_custom_metadata(s3):
+    gateway = _gateway()
+
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/frame_0000.png", content=b"x", metadata={"pts": "4.200000"}))
+
+    head = boto3.client("s3", region_name="us-east-1").head_object(Bucket=BUCKET, Key="frames/frame_0000.png")
+    assert head["Metadata"] == {"pts": "4.200000"}
+
+
+def test_upload_items_bulk_is_faster_than_serial_with_latency(s3):
+    latency, count = 0.05, 16
+
+    serial_gateway = _gateway(put_latency=latency)
+    concurrent_gateway = _gateway(max_concurrency=8, put_latency=latency)
+
+    started = time.monotonic()
+    serial = serial_gateway.upload_items_bulk(_items(count), max_concurrency=1)
+    serial_elapsed = time.monotonic() - started
+
+    started = time.monotonic()
+    concurrent = concurrent_gateway.upload_items_bulk(_items(count))
+    concurrent_elapsed = time.monotonic() - started
+
+    assert serial.ok and concurrent.ok
+    assert serial_elapsed >= latency * count
+    assert concurrent_elapsed < serial_elapsed / 2
+
+
+def test_upload_items_bulk_collects_failures_without_aborting(s3, monkeypatch):
+    gateway = _gateway(max_concurrency=4)
+    original = gateway._put_object
+
+    def put_object(item):
+        if item.key.endswith("0003.png"):
+            raise RuntimeError("corrupted frame")
+        return original(item)
+
+    monkeypatch.setattr(gateway, "_put_object", put_object)
+
+    result = gateway.upload_items_bulk(_items(6))
+
+    assert not result.ok
+    assert [failure.item.key for failure in result.failed] == ["frames/frame_0003.png"]
+    assert str(result.failed[0].error) == "corrupted frame"
+    assert len(result.uploaded) == 5
+
+
+def test_upload_items_bulk_reports_each_successful_upload(s3, monkeypatch):
+    gateway = _gateway(max_concurrency=4)
+    original = gateway._put_object
+
+    def put_object(item):
+        if item.key.endswith("0002.png"):
+            raise RuntimeError("corrupted frame")
+        return original(item)
+
+    monkeypatch.setattr(gateway, "_put_object", put_object)
+    reported = []
+
+    gateway.upload_items_bulk(_items(5), on_uploaded=lambda item: reported.append(item.key))
+
+    assert sorted(reported) == [f"frames/frame_{i:04d}.png" for i in (0, 1, 3, 4)]
+
+
+def _slow_down(item):
+    return ClientError(
+        {"Error": {"Code": "SlowDown", "Message": "Please reduce your request rate."},
+         "ResponseMetadata": {"HTTPStatusCode": 503}},
+        "PutObject",
+    )
+
+
+def _retrying_gateway(max_concurrency=8, upload_retry_deadline=5.0):
+    return S3StorageGateway(StorageConfig(
+        max_concurrency=max_concurrency,
+        retry_multiplier=0.01,
+        retry_min=0,
+        retry_max=1,
+        upload_retry_deadline=upload_retry_deadline,
+    ))
+
+
+def test_upload_items_bulk_retries_throttled_items_and_backs_off(s3, monkeypatch):
+    gateway = _retrying_gateway()
+    original = gateway._put_object
+    throttled = set()
+
+    def put_object(item):
+        if item.key not in throttled and item.key.endswith(("0001.png", "0002.png", "0003.png")):
+            throttled.add(item.key)
+            raise _slow_down(item)
+        return original(item)
+
+    monkeypatch.setattr(gateway, "_put_object", put_object)
+
+    result = gateway.upload_items_bulk(_items(12))
+
+    assert result.ok
+    assert len(result.uploaded) == 12
+    assert result.metrics["throttle_events"] == 3
+    assert result.metrics["retries"] == 3
+    assert result.metrics["concurrency"] < result.metrics["max_concurrency"]
+
+
+def test_upload_items_bulk_gives_up_after_the_retry_deadline(s3, monkeypatch):
+    gateway = _retrying_gateway(upload_retry_deadline=0.2)
+    original = gateway._put_object
+
+    def put_object(item):
+        if item.key.endswith("0001.png"):
+            raise _slow_down(item)
+        return original(item)
+
+    monkeypatch.setattr(gateway, "_put_object", put_object)
+
+    started = time.monotonic()
+    result = gateway.upload_items_bulk(_items(4))
+
+    assert time.monotonic() - started < 3
+    assert [failure.item.key for failure in result.failed] == ["frames/frame_0001.png"]
+    assert result.failed[0].error.response["Error"]["Code"] == "SlowDown"
+    assert result.metrics["retries"] >= 1
+    assert len(result.uploaded) == 3
+
+
+def test_upload_items_bulk_retry_deadline_covers_intermittent_throttling(s3, monkeypatch):
+    gateway = _retrying_gateway(upload_retry_deadline=0.3)
+    original = gateway._put_object
+    throttled = set()
+
+    def put_object(item):
+        # cada item é limitado só na primeira tentativa: entre um e outro não há nada em backoff
+        if item.key not in throttled:
+            throttled.add(item.key)
+            raise _slow_down(item)
+        return original(item)
+
+    def slow_items():
+        for item in _items(8):
+            time.sleep(0.1)
+            yield item
+
+    monkeypatch.setattr(gateway, "_put_object", put_object)
+
+    result = gateway.upload_items_bulk(slow_items(), max_concurrency=1)
+
+    uploaded = sorted(obj.key for obj in result.uploaded)
+    failed = [failure.item.key for failure in result.failed]
+    assert "frames/frame_0000.png" in uploaded
+    # o prazo conta desde a primeira falha do lote: os últimos itens já não são refeitos
+    assert failed[-3:] == [f"frames/frame_{i:04d}.png" for i in (5, 6, 7)]
+
+
+def test_upload_items_bulk_does_not_retry_client_errors(s3, monkeypatch):
+    gateway = _retrying_gateway()
+
+    def put_object(item):
+        raise ClientError({"Error": {"Code": "AccessDenied"}, "ResponseMetadata": {"HTTPStatusCode": 403}}, "PutObject")
+
+    monkeypatch.setattr(gateway, "_put_object", put_object)
+
+    result = gateway.upload_items_bulk(_items(2))
+
+    assert len(result.failed) == 2
+    assert gateway.upload_metrics()["retries"] == 0
+    assert gateway.upload_metrics()["throttle_events"] == 0
+
+
+def test_upload_items_bulk_raises_concurrency_while_healthy(s3, monkeypatch):
+    gateway = _gateway(max_concurrency=8)
+    initial = gateway.upload_metrics()["concurrency"]
+
+    def put_object(item):
+        time.sleep(0.01)
+        return StorageObject(bucket=item.bucket, key=item.key)
+
+    monkeypatch.setattr(gateway, "_put_object", put_object)
+
+    result = gateway.upload_items_bulk(_items(60))
+
+    assert result.ok
+    assert initial == 4
+    assert result.metrics["concurrency"] > initial
+
+
+def test_upload_objects_bulk_keeps_list_api(s3):
+    gateway = _gateway()
+
+    uploaded = gateway.upload_objects_bulk([(b"a", "a.bin"), (b"b", "b.bin")], bucket=BUCKET, prefix="bulk/")
+
+    assert sorted(obj.key for obj in uploaded) == ["bulk/a.bin", "bulk/b.bin"]
+    assert gateway.download_object(BUCKET, "bulk/a.bin") == b"a"
+
+
+def test_uploads_and_listings_do_not_presign_until_url_is_read(s3):
+    gateway = _gateway()
+
+    with patch.object(gateway._client, "generate_presigned_url", wraps=gateway._client.generate_presigned_url) as presign:
+        result = gateway.upload_items_bulk(_items(3))
+        listed = gateway.list_objects(BUCKET, "frames/")
+        assert presign.call_count == 0
+
+        url = listed[0].url
+
+    assert presign.call_count == 1
+    assert listed[0].key in url
+    assert len(result.uploaded) == len(listed) == 3
+
+
+def test_presign_url_is_cached_per_expiry_window(s3):
+    gateway = _gateway()
+
+    with patch.object(gateway._client, "generate_presigned_url", wraps=gateway._client.generate_presigned_url) as presign:
+        first = gateway.presign_url(BUCKET, "frames/frame_0000.png")
+        second = gateway.presign_url(BUCKET, "frames/frame_0000.png")
+        gateway.presign_url(BUCKET, "frames/frame_0000.png", expiration=60)
+
+    assert first == second
+    assert presign.call_count == 2
+
+
+def test_presign_urls_signs_only_uncached_keys(s3):
+    gateway = _gateway()
+    keys = [f"frames/frame_{i:04d}.png" for i in range(5)]
+    cached = gateway.presign_url(BUCKET, keys[0])
+
+    with patch.object(gateway._batch_presigner, "presign_get_urls", wraps=gateway._batch_presigner.presign_get_urls) as batch:
+        urls = gateway.presign_urls(BUCKET, keys)
+        again = gateway.presign_urls(BUCKET, keys)
+
+    batch.assert_called_once()
+    assert list(batch.call_args.args[1]) == keys[1:]
+    assert urls[keys[0]] == cached
+    assert urls == again
+    assert all("X-Amz-Signature=" in url for url in urls.values())
+
+
+def _record_get_ranges(gateway):
+    ranges = []
+    gateway._client.meta.events.register(
+        "provide-client-params.s3.GetObject", lambda params, **kwargs: ranges.append(params.get("Range"))
+    )
+    return ranges
+
+
+def test_download_to_file_streams_large_objects_with_ranged_gets(s3, tmp_path):
+    content = os.urandom(3 * 1024 * 1024 + 123)
+    boto3.client("s3", region_name="us-east-1").put_object(Bucket=BUCKET, Key="videos/big", Body=content)
+    gateway = S3StorageGateway(StorageConfig(multipart_threshold=1024 * 1024, multipart_chunksize=1024 * 1024))
+    ranges = _record_get_ranges(gateway)
+    target = tmp_path / "input_video"
+
+    size = gateway.download_to_file(BUCKET, "videos/big", str(target))
+
+    assert size == len(content)
+    assert target.read_bytes() == content
+    assert len(ranges) == 4
+    assert all(r and r.startswith("bytes=") for r in ranges)
+
+
+def test_download_to_file_uses_single_get_for_small_objects(s3, tmp_path):
+    boto3.client("s3", region_name="us-east-1").put_object(Bucket=BUCKET, Key="videos/small", Body=b"tiny video")
+    gateway = _gateway()
+    ranges = _record_get_ranges(gateway)
+    target = tmp_path / "input_video"
+
+    assert gateway.download_to_file(BUCKET, "videos/small", str(target)) == 10
+    assert target.read_bytes() == b"tiny video"
+    assert len(ranges) == 1
+
+
+def test_upload_file_obj_streams_large_objects_in_multipart(s3):
+    content = os.urandom(3 * 1024 * 1024 + 17)
+    gateway = S3StorageGateway(StorageConfig(multipart_threshold=1024 * 1024, multipart_chunksize=1024 * 1024))
+
+    gateway.upload_file_obj(StorageItem(bucket=BUCKET, key="videos/big", file_object=io.BytesIO(content)))
+
+    assert gateway.download_object(BUCKET, "videos/big") == content
+
+
+def test_copy_prefix_copies_objects_server_side_with_metadata(s3):
+    gateway = _gateway()
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/a/frame_0000.png", content=b"0", metadata={"pts": "0.000000"}))
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/a/frame_0001.png", content=b"1", content_type="image/png"))
+    gateway.upload_object(StorageItem(bucket=BUCKET, key="frames/ab/frame_0000.png", content=b"other job"))
+
+    copied = gateway.copy_prefix(BUCKET, "frames/a", BUCKET, "frames/b/")
+
+    client = boto3.client("s3", region_name="us-east-1")
+    assert copied == 2
+    assert sorted(obj.key for obj in gateway.list_objects(BUCKET, "frames/b/")) == [
+        "frames/b/frame_0000.png", "frames/b/frame_0001.png",
+    ]
+    assert client.head_object(Bucket=BUCKET, Key="frames/b/frame_0000.png")["Metadata"] == {"pts": "0.000000"}
+    assert client.head_object(Bucket=BUCKET, Key="frames/b/frame_0001.png")["ContentType"] == "image/png"
+    assert gateway.copy_prefix(BUCKET, "frames/missing", BUCKET, "frames/c") == 0
+
+
+def test_multipart_tar_shard_supports_ranged_get_of_a_single_frame(s3):
+    gateway = _gateway()
+    frames = [os.urandom(MIN_PART_SIZE // 2) for _ in range(3)]
+
+    with MultipartUploadWriter(gateway, BUCKET, "frames/job/shard_0000.tar", "application/x-tar", part_size=MIN_PART_SIZE) as writer:
+        tar = TarShardWriter(writer)
+        offsets = [tar.add(f"frame_{i:04d}.png", frame) for i, frame in enumerate(frames)]
+        tar.close()
+
+    offset, length = offsets[2]
+    client = boto3.client("s3", region_name="us-east-1")
+    ranged = client.get_object(Bucket=BUCKET, Key="frames/job/shard_0000.tar", Range=f"bytes={offset}-{offset + length - 1}")
+    assert ranged["Body"].read() == frames[2]
+    assert client.head_object(Bucket=BUCKET, Key="frames/job/shard_0000.tar")["ContentType"] == "application/x-tar"
+
+
+def test_abort_multipart_upload_leaves_no_object(s3):
+    gateway = _gateway()
+    upload_id = gateway.create_multipart_upload(BUCKET, "frames/job/shard_0000.tar")
+    gateway.upload_part(BUCKET, "frames/job/shard_0000.tar", upload_id, 1, b"partial")
+
+    gateway.abort_multipart_upload(BUCKET, "frames/job/shard_0000.tar", upload_id)
+
+    assert gateway.list_objects(BUCKET, "frames/job/") == []
+
+
+def test_presigned_post_uploads_straight_to_the_bucket(s3):
+    gateway = _gateway()
+    presigned = gateway.presign_post(BUCKET, "videos/client/job", "video/mp4", max_size=1024)
+
+    response = requests.post(presigned["url"], data=presigned["fields"], files={"file": ("video.mp4", b"x" * 100)})
+
+    assert response.status_code == 204
+    stored = gateway.head_object(BUCKET, "videos/client/job")
+    assert stored.metadata["ContentLength"] == 100
+    assert stored.metadata["ContentType"] == "video/mp4"
+    assert stored.metadata["ETag"] == f'"{hashlib.md5(b"x" * 100).hexdigest()}"'
+
+
+def test_presigned_post_policy_caps_size_and_pins_content_type(s3):
+    gateway = _gateway()
+    presigned = gateway.presign_post(BUCKET, "videos/client/job", "video/mp4", max_size=1024)
+
+    policy = json.loads(base64.b64decode(presigned["fields"]["policy"]))
+
+    assert ["content-length-range", 1, 1024] in policy["conditions"]
+    assert {"Content-Type": "video/mp4"} in policy["conditions"]
+
+
+def test_presigned_part_urls_complete_a_multipart_upload(s3):
+    gateway = _gateway()
+    upload_id = gateway.create_multipart_upload(BUCKET, "videos/client/job", "video/mp4")
+    chunks = [b"a" * MIN_PART_SIZE, b"b" * 10]
+
+    parts = []
+    for number, chunk in enumerate(chunks, start=1):
+        response = requests.put(gateway.presign_upload_part(BUCKET, "videos/client/job", upload_id, number), data=chunk)
+        parts.append((number, response.headers["ETag"]))
+    gateway.complete_multipart_upload(BUCKET, "videos/client/job", upload_id, parts)
+
+    assert gateway.head_object(BUCKET, "videos/client/job").metadata["ContentLength"] == MIN_PART_SIZE + 10
+
+
+def test_head_object_returns_none_for_missing_objects(s3):
+    assert _gateway().head_object(BUCKET, "videos/missing") is None
@@ -0,0 +1,41 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from src.core.domain.entities.storage_config import StorageConfig
+from src.infrastructure.gateways.storage_fault_injector import StorageFaultInjector
+
+
+def test_latency_and_bandwidth_are_slept_per_request():
+    slept = []
+    injector = StorageFaultInjector(latency=0.02, bandwidth=1000, sleep=slept.append)
+
+    injector.before_request("PutObject", size=500)
+    injector.before_request("ListObjectsV2")
+
+    assert slept == [pytest.approx(0.52), pytest.approx(0.02)]
+
+
+def test_throttles_and_errors_are_raised_as_s3_client_errors():
+    injector = StorageFaultInjector(throttle_rate=0.5, error_rate=0.5, seed=1)
+    codes = set()
+
+    for _ in range(50):
+        with pytest.raises(ClientError) as error:
+            injector.before_request("PutObject")
+        codes.add((error.value.response["Error"]["Code"], error.value.response["ResponseMetadata"]["HTTPStatusCode"]))
+
+    assert codes == {("SlowDown", 503), ("InternalError", 500)}
+
+
+def test_from_config_reads_fault_injection_options():
+    slept = []
+    injector = StorageFaultInjector.from_config(StorageConfig(extra={"fault_injection": {
+        "latency_ms": 10, "bandwidth_mbps": 8, "error_rate": 0, "throttle_rate": 0,
+    }}))
+    injector._sleep = slept.append
+
+    injector.before_request("PutObject", size=1_000_000)
+
+    assert injector.enabled
+    assert slept == [pytest.approx(1.01)]
+    assert not StorageFaultInjector.from_config(StorageConfig()).enabled
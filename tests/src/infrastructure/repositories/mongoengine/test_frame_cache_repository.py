@@ -0,0 +1,63 @@
+import pytest
+
+from src.core.domain.entities.frame_cache_entry import FrameCacheEntry
+from src.core.ports.repositories.i_frame_cache_repository import IFrameCacheRepository
+from src.infrastructure.repositories.mongoengine.frame_cache_repository import MongoFrameCacheRepository
+from src.infrastructure.repositories.mongoengine.models.frame_cache_model import FrameCacheCounterModel, FrameCacheEntryModel
+
+
+class TestMongoFrameCacheRepository:
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.frame_cache_repository: IFrameCacheRepository = MongoFrameCacheRepository()
+        self.clean_database()
+
+    def clean_database(self):
+        for model in (FrameCacheEntryModel, FrameCacheCounterModel):
+            try:
+                model.drop_collection()
+            except Exception:
+                pass
+
+    def _entry(self, job_ref="job-1"):
+        return FrameCacheEntry(
+            cache_key="abc:123",
+            content_hash="abc",
+            bucket="bucket",
+            frames_prefix=f"frames/client/{job_ref}",
+            job_ref=job_ref,
+            result={"frames": 12, "dropped_frames": 0},
+        )
+
+    def test_save_and_find_by_cache_key(self):
+        self.frame_cache_repository.save(self._entry())
+
+        found = self.frame_cache_repository.find_by_cache_key("abc:123")
+
+        assert found.job_ref == "job-1"
+        assert found.result == {"frames": 12, "dropped_frames": 0}
+        assert self.frame_cache_repository.find_by_cache_key("missing") is None
+
+    def test_save_updates_the_entry_of_the_same_cache_key(self):
+        self.frame_cache_repository.save(self._entry())
+        entry = self.frame_cache_repository.find_by_cache_key("abc:123")
+        entry.point_to("bucket", "frames/client/job-2", "job-2")
+
+        self.frame_cache_repository.save(entry)
+
+        found = self.frame_cache_repository.find_by_cache_key("abc:123")
+        assert (found.job_ref, found.frames_prefix, found.hits) == ("job-2", "frames/client/job-2", 1)
+        assert FrameCacheEntryModel.objects.count() == 1
+
+    def test_delete_and_stats(self):
+        self.frame_cache_repository.save(self._entry())
+        self.frame_cache_repository.record_lookup(hit=True)
+        self.frame_cache_repository.record_lookup(hit=False)
+        self.frame_cache_repository.record_lookup(hit=False)
+
+        assert self.frame_cache_repository.stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+        self.frame_cache_repository.delete(self._entry())
+
+        assert self.frame_cache_repository.stats()["entries"] == 0
@@ -118,3 +118,87 @@ class TestMongoVideoJobRepository:
         assert found.id == video_job.id
         assert found.job_ref == video_job.job_ref
         assert found.status == video_job.status
+
+    def test_update_progress_sets_only_the_progress_field(self):
+        video_job = VideoJobFactory(status="PROCESSING", result={"frames": 0})
+        progress = {"frames_decoded": 30, "out_time": 30.0, "frames_uploaded": 28, "percent": 25.0}
+
+        self.video_job_repository.update_progress(video_job.job_ref, progress)
+
+        model = VideoJobModel.objects(job_ref=video_job.job_ref).first()
+        assert model.progress == progress
+        assert model.status == "PROCESSING"
+        assert model.result == {"frames": 0}
+
+    def test_add_task_id_appends_and_survives_save(self):
+        video_job = VideoJobFactory(status="QUEUED")
+
+        self.video_job_repository.add_task_id(video_job.job_ref, "task-1")
+        self.video_job_repository.add_task_id(video_job.job_ref, "chord-2")
+        entity = VideoJobModel.objects(job_ref=video_job.job_ref).first().to_entity()
+        entity.status = "PROCESSING"
+        self.video_job_repository.save(entity)
+
+        assert VideoJobModel.objects(job_ref=video_job.job_ref).first().task_ids == ["task-1", "chord-2"]
+
+    def test_find_status_reads_only_the_status(self):
+        video_job = VideoJobFactory(status="CANCELLED")
+
+        assert self.video_job_repository.find_status(video_job.job_ref) == "CANCELLED"
+        assert self.video_job_repository.find_status("nonexistent_job_ref") is None
+
+    def test_save_checkpoint_sets_only_the_checkpoint(self):
+        video_job = VideoJobFactory(status="PROCESSING", result={"frames": 3})
+
+        self.video_job_repository.save_checkpoint(video_job.job_ref, {"frame_index": 1, "pts": 1.0})
+        self.video_job_repository.save_checkpoint(video_job.job_ref, {"frame_index": 2, "pts": 2.0})
+
+        model = VideoJobModel.objects(job_ref=video_job.job_ref).first()
+        assert model.checkpoint == {"frame_index": 2, "pts": 2.0}
+        assert model.result == {"frames": 3}
+
+    @pytest.mark.parametrize("status", ["PENDING", "QUEUED", "PROCESSING"])
+    def test_cancel_marks_unfinished_job_cancelled(self, status):
+        video_job = VideoJobFactory(status=status, result={"frames": 3})
+
+        cancelled = self.video_job_repository.cancel(video_job.job_ref)
+
+        assert cancelled.status == "CANCELLED"
+        model = VideoJobModel.objects(job_ref=video_job.job_ref).first()
+        assert model.status == "CANCELLED"
+        assert model.inactivated_at is not None
+        assert model.result == {"frames": 3}
+
+    @pytest.mark.parametrize("status", ["COMPLETED", "ERROR", "CANCELLED"])
+    def test_cancel_does_not_touch_finished_job(self, status):
+        video_job = VideoJobFactory(status=status)
+
+        assert self.video_job_repository.cancel(video_job.job_ref) is None
+        assert self.video_job_repository.cancel("nonexistent_job_ref") is None
+        assert VideoJobModel.objects(job_ref=video_job.job_ref).first().status == status
+
+    def test_save_unless_cancelled_does_not_overwrite_a_cancel(self):
+        video_job = VideoJobFactory(status="PROCESSING")
+        # o worker leu o job antes do cancelamento
+        entity = VideoJobModel.objects(job_ref=video_job.job_ref).first().to_entity()
+        self.video_job_repository.cancel(video_job.job_ref)
+
+        entity.result = {"frames": 10}
+        entity.complete()
+
+        assert self.video_job_repository.save_unless_cancelled(entity) is False
+        model = VideoJobModel.objects(job_ref=video_job.job_ref).first()
+        assert model.status == "CANCELLED"
+        assert model.result == {}
+
+    def test_save_unless_cancelled_saves_a_running_job(self):
+        video_job = VideoJobFactory(status="PROCESSING")
+        self.video_job_repository.add_task_id(video_job.job_ref, "task-1")
+        entity = VideoJobModel.objects(job_ref=video_job.job_ref).first().to_entity()
+
+        entity.result = {"frames": 10}
+        entity.complete()
+
+        assert self.video_job_repository.save_unless_cancelled(entity) is True
+        model = VideoJobModel.objects(job_ref=video_job.job_ref).first()
+        assert (model.status, model.result, model.task_ids) == ("COMPLETED", {"frames": 10}, ["task-1"])
@@ -1,7 +1,18 @@
+import io
 import os
+import struct
+import threading
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
+from PIL import Image
+from src.core.constants.extraction_mode import ExtractionMode
+from src.core.constants.frame_format import FrameFormat
+from src.core.domain.entities.frame_extraction_config import FrameExtractionConfig
+from src.core.domain.entities.frame_segment import FrameSegment
+from src.core.domain.entities.media_metadata import MediaMetadata
+from src.core.domain.entities.video_frame import VideoFrame
 from src.infrastructure.video.ffmpeg_wrapper import FFmpegWrapper
+from src.infrastructure.video.frame_pipe_reader import PNG_SIGNATURE
 
 
 @patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
@@ -33,6 +44,25 @@ def test_extract_frames_success(ffmpeg_mock, tmp_path):
     pipeline.run.assert_called_once_with(capture_stdout=True, capture_stderr=True, quiet=True)
 
 
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_extract_frames_orders_frames_numerically_past_9999(ffmpeg_mock, tmp_path):
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    for name in ["frame_9999.png", "frame_10000.png", "frame_1000.png", "frame_1001.png"]:
+        (output_dir / name).write_text("x")
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    ffmpeg_mock.input.return_value = pipeline
+
+    extracted = FFmpegWrapper().extract_frames("/path/to/video.mp4", str(output_dir))
+
+    assert [os.path.basename(path) for path in extracted] == [
+        "frame_1000.png", "frame_1001.png", "frame_9999.png", "frame_10000.png",
+    ]
+
+
 @patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
 def test_extract_frames_empty_output_dir_returns_empty(ffmpeg_mock, tmp_path):
     video_path = "/path/to/video.mp4"
@@ -78,3 +108,476 @@ def test_extract_frames_ffmpeg_error_reraises(ffmpeg_mock, tmp_path):
     wrapper = FFmpegWrapper()
     with pytest.raises(FakeFFmpegError):
         wrapper.extract_frames(video_path, str(output_dir))
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_extract_frames_uses_configured_format_and_size(ffmpeg_mock, tmp_path):
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    for name in ["frame_0000.webp", "frame_0001.webp", "frame_0000.png"]:
+        (output_dir / name).write_text("x")
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    ffmpeg_mock.input.return_value = pipeline
+
+    config = FrameExtractionConfig(frame_format=FrameFormat.WEBP, quality=70, max_height=720)
+    extracted = FFmpegWrapper().extract_frames("/path/to/video.mp4", str(output_dir), config)
+
+    assert extracted == [str(output_dir / "frame_0000.webp"), str(output_dir / "frame_0001.webp")]
+    pipeline.filter.assert_any_call(
+        "scale", w="iw", h="min(ih,720)", force_original_aspect_ratio="decrease", force_divisible_by=2
+    )
+    pipeline.output.assert_called_once_with(
+        os.path.join(str(output_dir), "frame_%04d.webp"), start_number=0, quality=70
+    )
+
+
+def _fake_png(payload: bytes) -> bytes:
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + chunk_type + data + b"\x00\x00\x00\x00"
+
+    return PNG_SIGNATURE + chunk(b"IHDR", payload) + chunk(b"IEND", b"")
+
+
+def _showinfo_line(n: int, pts_time: float) -> bytes:
+    return f"[Parsed_showinfo_1 @ 0x55] n: {n:3d} pts: {n:6d} pts_time:{pts_time} duration: 1\n".encode()
+
+
+def _fake_process(stdout: bytes, stderr: bytes, returncode: int = 0):
+    process = Mock()
+    process.stdout = io.BytesIO(stdout)
+    process.stderr = io.BytesIO(stderr)
+    process.returncode = returncode
+    process.poll.return_value = returncode
+    return process
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_yields_frames_from_pipe(ffmpeg_mock):
+    frames = [_fake_png(b"first"), _fake_png(b"second")]
+    process = _fake_process(b"".join(frames), _showinfo_line(0, 0) + b"some log\n" + _showinfo_line(1, 1.0))
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    pipeline.global_args.return_value = pipeline
+    pipeline.run_async.return_value = process
+    ffmpeg_mock.input.return_value = pipeline
+
+    wrapper = FFmpegWrapper()
+    extracted = list(wrapper.iter_frames("/path/to/video.mp4"))
+
+    assert [tuple(frame) for frame in extracted] == [(0, 0.0, frames[0]), (1, 1.0, frames[1])]
+    ffmpeg_mock.input.assert_called_once_with("/path/to/video.mp4")
+    pipeline.output.assert_called_once_with("pipe:", format="image2pipe", vcodec="png")
+    pipeline.run_async.assert_called_once_with(pipe_stdout=True, pipe_stderr=True)
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_kills_process_when_consumer_stops(ffmpeg_mock):
+    process = _fake_process(_fake_png(b"a") + _fake_png(b"b"), b"")
+    process.poll.return_value = None
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    pipeline.global_args.return_value = pipeline
+    pipeline.run_async.return_value = process
+    ffmpeg_mock.input.return_value = pipeline
+
+    generator = FFmpegWrapper().iter_frames("/path/to/video.mp4")
+    next(generator)
+    generator.close()
+
+    process.kill.assert_called_once()
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_raises_when_ffmpeg_fails(ffmpeg_mock):
+    class FakeFFmpegError(Exception):
+        def __init__(self, cmd, stdout, stderr):
+            super().__init__(cmd)
+            self.stderr = stderr
+
+    ffmpeg_mock.Error = FakeFFmpegError
+    process = _fake_process(b"", b"Invalid data found when processing input\n", returncode=1)
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    pipeline.global_args.return_value = pipeline
+    pipeline.run_async.return_value = process
+    ffmpeg_mock.input.return_value = pipeline
+
+    with pytest.raises(FakeFFmpegError) as exc_info:
+        list(FFmpegWrapper().iter_frames("/path/to/video.mp4"))
+
+    assert b"Invalid data found" in exc_info.value.stderr
+
+
+@pytest.mark.parametrize(
+    "quality, expected_qscale",
+    [(100, 2), (1, 31), (80, 8)],
+)
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_encodes_jpeg_with_mapped_quality(ffmpeg_mock, quality, expected_qscale):
+    process = _fake_process(b"", b"")
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    pipeline.global_args.return_value = pipeline
+    pipeline.run_async.return_value = process
+    ffmpeg_mock.input.return_value = pipeline
+
+    config = FrameExtractionConfig(frame_format=FrameFormat.JPEG, quality=quality)
+    assert list(FFmpegWrapper().iter_frames("/path/to/video.mp4", config)) == []
+
+    pipeline.output.assert_called_once_with(
+        "pipe:", format="image2pipe", vcodec="mjpeg", **{"q:v": expected_qscale}
+    )
+    assert "scale" not in [call.args[0] for call in pipeline.filter.call_args_list]
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_keyframe_mode_skips_non_key_frames_and_keeps_source_timestamps(ffmpeg_mock):
+    frames = [_fake_png(b"first"), _fake_png(b"second")]
+    process = _fake_process(b"".join(frames), _showinfo_line(0, 0) + _showinfo_line(1, 4.2))
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    pipeline.global_args.return_value = pipeline
+    pipeline.run_async.return_value = process
+    ffmpeg_mock.input.return_value = pipeline
+
+    config = FrameExtractionConfig(mode=ExtractionMode.KEYFRAME)
+    extracted = list(FFmpegWrapper().iter_frames("/path/to/video.mp4", config))
+
+    assert [(frame.index, frame.pts) for frame in extracted] == [(0, 0.0), (1, 4.2)]
+    ffmpeg_mock.input.assert_called_once_with("/path/to/video.mp4", skip_frame="nokey")
+    assert [call.args[0] for call in pipeline.filter.call_args_list] == ["showinfo"]
+    pipeline.output.assert_called_once_with("pipe:", format="image2pipe", vcodec="png", fps_mode="passthrough")
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_seeks_to_range_and_reports_source_timestamps(ffmpeg_mock):
+    frames = [_fake_png(b"first"), _fake_png(b"second")]
+    process = _fake_process(b"".join(frames), _showinfo_line(0, 0) + _showinfo_line(1, 0.5))
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    pipeline.global_args.return_value = pipeline
+    pipeline.run_async.return_value = process
+    ffmpeg_mock.input.return_value = pipeline
+
+    config = FrameExtractionConfig(start_seconds=30, end_seconds=90, fps=2, max_frames=50)
+    extracted = list(FFmpegWrapper().iter_frames("/path/to/video.mp4", config))
+
+    assert [(frame.index, frame.pts) for frame in extracted] == [(0, 30.0), (1, 30.5)]
+    ffmpeg_mock.input.assert_called_once_with("/path/to/video.mp4", ss=30, t=60)
+    pipeline.filter.assert_any_call("fps", fps="2")
+    pipeline.output.assert_called_once_with("pipe:", format="image2pipe", vcodec="png", **{"frames:v": 50})
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.subprocess.Popen")
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_renditions_decodes_once_and_splits_into_one_pipe_per_rendition(ffmpeg_mock, popen_mock):
+    small = [_fake_png(b"small-0"), _fake_png(b"small-1")]
+    large = [_fake_png(b"large-0"), _fake_png(b"large-1")]
+
+    pipeline = MagicMock()
+    pipeline.filter.return_value = pipeline
+    pipeline.split.return_value = pipeline
+    pipeline.__getitem__.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    ffmpeg_mock.input.return_value = pipeline
+    ffmpeg_mock.merge_outputs.return_value.global_args.return_value.compile.return_value = ["ffmpeg"]
+
+    def popen(args, pass_fds, **kwargs):
+        # o ffmpeg escreve cada rendition no fd herdado
+        for write_fd, frames in zip(pass_fds, [small, large]):
+            os.write(write_fd, b"".join(frames))
+        return _fake_process(b"", _showinfo_line(0, 0) + _showinfo_line(1, 1.0))
+
+    popen_mock.side_effect = popen
+
+    config = FrameExtractionConfig.from_dict({"renditions": [
+        {"width": 320, "format": "png"}, {"width": 1920, "format": "png", "name": "full"},
+    ]})
+    extracted = list(FFmpegWrapper().iter_renditions("/path/to/video.mp4", config))
+
+    assert [(item.rendition.name, tuple(item.frame)) for item in extracted] == [
+        ("320w_png", (0, 0.0, small[0])), ("full", (0, 0.0, large[0])),
+        ("320w_png", (1, 1.0, small[1])), ("full", (1, 1.0, large[1])),
+    ]
+    ffmpeg_mock.input.assert_called_once_with("/path/to/video.mp4")
+    pipeline.split.assert_called_once_with()
+    pipeline.filter.assert_any_call(
+        "scale", w="min(iw,320)", h="ih", force_original_aspect_ratio="decrease", force_divisible_by=2
+    )
+    pass_fds = popen_mock.call_args.kwargs["pass_fds"]
+    assert [call.args[0] for call in pipeline.output.call_args_list] == [f"pipe:{fd}" for fd in pass_fds]
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_reports_ffmpeg_progress(ffmpeg_mock):
+    stderr = _showinfo_line(0, 0) + b"frame=1\nout_time_us=1000000\nprogress=end\n"
+    process = _fake_process(_fake_png(b"first"), stderr)
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    pipeline.global_args.return_value = pipeline
+    pipeline.run_async.return_value = process
+    ffmpeg_mock.input.return_value = pipeline
+
+    progress = []
+    list(FFmpegWrapper().iter_frames("/path/to/video.mp4", on_progress=progress.append))
+
+    pipeline.global_args.assert_called_once_with("-hide_banner", "-nostats", "-progress", "pipe:2")
+    assert [(item.frames, item.out_time, item.done) for item in progress] == [(1, 1.0, True)]
+
+
+def _sprite_png(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_sprites_tiles_frames_and_maps_each_to_its_offset(ffmpeg_mock):
+    sprites = [_sprite_png(60, 40), _sprite_png(60, 40)]
+    showinfo = b"".join(_showinfo_line(n, float(n)) for n in range(9))
+    process = _fake_process(b"".join(sprites), showinfo)
+
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    pipeline.global_args.return_value = pipeline
+    pipeline.run_async.return_value = process
+    ffmpeg_mock.input.return_value = pipeline
+
+    config = FrameExtractionConfig(sprite_columns=3, sprite_rows=2)
+    extracted = list(FFmpegWrapper().iter_sprites("/path/to/video.mp4", config))
+
+    assert [(sprite.index, sprite.data) for sprite in extracted] == [(0, sprites[0]), (1, sprites[1])]
+    assert (extracted[0].tile_width, extracted[0].tile_height) == (20, 20)
+    assert [tuple(tile) for tile in extracted[0].tiles] == [
+        (0, 0.0, 0, 0), (1, 1.0, 20, 0), (2, 2.0, 40, 0), (3, 3.0, 0, 20), (4, 4.0, 20, 20), (5, 5.0, 40, 20),
+    ]
+    # a última grade fica incompleta: só os frames que sobraram
+    assert [tuple(tile) for tile in extracted[1].tiles] == [(6, 6.0, 0, 0), (7, 7.0, 20, 0), (8, 8.0, 40, 0)]
+    assert [call.args[0] for call in pipeline.filter.call_args_list] == ["fps", "showinfo", "tile"]
+    pipeline.filter.assert_any_call("tile", layout="3x2")
+    pipeline.output.assert_called_once_with("pipe:", format="image2pipe", vcodec="png", fps_mode="passthrough")
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_extract_frames_scene_mode_selects_scene_changes(ffmpeg_mock, tmp_path):
+    pipeline = Mock()
+    pipeline.filter.return_value = pipeline
+    pipeline.output.return_value = pipeline
+    ffmpeg_mock.input.return_value = pipeline
+
+    config = FrameExtractionConfig(mode=ExtractionMode.SCENE, scene_threshold=0.45)
+    FFmpegWrapper().extract_frames("/path/to/video.mp4", str(tmp_path), config)
+
+    ffmpeg_mock.input.assert_called_once_with("/path/to/video.mp4")
+    pipeline.filter.assert_called_once_with("select", "eq(n,0)+gt(scene,0.45)")
+    pipeline.output.assert_called_once_with(
+        os.path.join(str(tmp_path), "frame_%04d.png"), start_number=0, fps_mode="passthrough"
+    )
+
+
+def _probe_result(duration, **stream):
+    video_stream = {
+        "codec_type": "video", "codec_name": "h264", "width": 1280, "height": 720, "avg_frame_rate": "30000/1001",
+    }
+    video_stream.update(stream)
+    return {
+        "format": {"duration": duration},
+        "streams": [{"codec_type": "audio", "codec_name": "aac"}, video_stream],
+    }
+
+
+def test_plan_segments_splits_timeline_on_frame_ticks():
+    wrapper = FFmpegWrapper(parallelism=4, min_segment_seconds=10)
+
+    assert wrapper._plan_segments(120.0) == [(0, 30), (30, 60), (60, 90), (90, None)]
+    assert wrapper._plan_segments(25.0) == [(0, 13), (13, None)]
+    assert wrapper._plan_segments(9.0) == [(0, None)]
+    assert FFmpegWrapper(parallelism=1)._plan_segments(3600.0) == [(0, None)]
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_parallel_falls_back_to_single_pipe_for_short_videos(ffmpeg_mock):
+    ffmpeg_mock.probe.return_value = _probe_result("12.0")
+    wrapper = FFmpegWrapper(parallelism=4, min_segment_seconds=30)
+    expected = [VideoFrame(index=0, pts=0.0, data=b"frame")]
+
+    with patch.object(wrapper, "iter_frames", return_value=iter(expected)) as iter_frames:
+        assert list(wrapper.iter_frames_parallel("/path/to/video.mp4")) == expected
+
+    iter_frames.assert_called_once()
+    ffmpeg_mock.input.assert_not_called()
+
+
+@pytest.mark.parametrize("mode", [ExtractionMode.KEYFRAME, ExtractionMode.SCENE])
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_parallel_uses_single_pipe_for_non_uniform_modes(ffmpeg_mock, mode):
+    wrapper = FFmpegWrapper(parallelism=4, min_segment_seconds=10)
+    config = FrameExtractionConfig(mode=mode)
+
+    with patch.object(wrapper, "iter_frames", return_value=iter([])) as iter_frames:
+        assert list(wrapper.iter_frames_parallel("/path/to/video.mp4", config)) == []
+
+    iter_frames.assert_called_once_with("/path/to/video.mp4", config, None)
+    ffmpeg_mock.probe.assert_not_called()
+
+
+def _fake_segment_input(inputs, duration=40.0, returncode=0):
+    def fake_input(video_path, **options):
+        # cada ffmpeg de segmento também gera os ticks da margem antes e depois do seu intervalo;
+        # com -copyts o showinfo reporta o pts_time na linha do tempo do vídeo inteiro
+        seek = options["ss"]
+        last = seek + options.get("t", duration - seek)
+        ticks = range(round(seek), min(round(last), round(duration)))
+        inputs.append(options)
+
+        pipeline = Mock()
+        pipeline.filter.return_value = pipeline
+        pipeline.output.return_value = pipeline
+        pipeline.global_args.return_value = pipeline
+        pipeline.run_async.side_effect = lambda **kwargs: _fake_process(
+            b"".join(_fake_png(f"frame-{tick}".encode()) for tick in ticks),
+            b"".join(_showinfo_line(n, float(tick)) for n, tick in enumerate(ticks)),
+            returncode,
+        )
+        return pipeline
+
+    return fake_input
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_parallel_merges_segments_without_boundary_duplicates(ffmpeg_mock):
+    ffmpeg_mock.probe.return_value = _probe_result("40.0")
+    inputs = []
+    ffmpeg_mock.input.side_effect = _fake_segment_input(inputs)
+
+    frames = list(FFmpegWrapper(parallelism=4, min_segment_seconds=10).iter_frames_parallel("/path/to/video.mp4"))
+
+    assert [frame.index for frame in frames] == list(range(40))
+    assert [frame.data for frame in frames] == [_fake_png(f"frame-{tick}".encode()) for tick in range(40)]
+    assert [frame.pts for frame in frames] == [float(tick) for tick in range(40)]
+    assert sorted(options["ss"] for options in inputs) == [0.0, 9.0, 19.0, 29.0]
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_parallel_resumes_from_tick_keeping_global_indexes(ffmpeg_mock):
+    ffmpeg_mock.probe.return_value = _probe_result("40.0")
+    inputs = []
+    ffmpeg_mock.input.side_effect = _fake_segment_input(inputs)
+
+    frames = list(FFmpegWrapper(parallelism=4, min_segment_seconds=10).iter_frames_parallel("/path/to/video.mp4", start_tick=25))
+
+    assert [frame.index for frame in frames] == list(range(25, 40))
+    assert [frame.pts for frame in frames] == [float(tick) for tick in range(25, 40)]
+    # os segmentos já concluídos não são decodificados de novo
+    assert sorted(options["ss"] for options in inputs) == [24.0, 29.0]
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_parallel_decodes_later_segments_while_the_first_is_consumed(ffmpeg_mock):
+    ffmpeg_mock.probe.return_value = _probe_result("40.0")
+    last_segment_done = threading.Event()
+
+    def stream_segment(video_path, segment, config, processes, lock, on_progress=None):
+        for tick in range(segment.start_tick, segment.end_tick or 40):
+            yield tick, f"frame-{tick}".encode()
+        if segment.end_tick is None:
+            last_segment_done.set()
+
+    wrapper = FFmpegWrapper(parallelism=4, min_segment_seconds=10)
+    wrapper._stream_segment = stream_segment
+    frames = wrapper.iter_frames_parallel("/path/to/video.mp4")
+
+    first = next(frames)
+    # o último segmento termina de decodificar sem que ninguém tenha lido além do primeiro frame
+    assert last_segment_done.wait(timeout=5)
+    rest = list(frames)
+
+    assert first.index == 0
+    assert [frame.index for frame in rest] == list(range(1, 40))
+    assert rest[-1].data == b"frame-39"
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_iter_frames_parallel_raises_when_a_segment_fails(ffmpeg_mock):
+    class FakeFFmpegError(Exception):
+        def __init__(self, cmd, stdout, stderr):
+            super().__init__(cmd)
+            self.stderr = stderr
+
+    ffmpeg_mock.Error = FakeFFmpegError
+    ffmpeg_mock.probe.return_value = _probe_result("40.0")
+    ffmpeg_mock.input.side_effect = _fake_segment_input([], returncode=1)
+
+    with pytest.raises(FakeFFmpegError):
+        list(FFmpegWrapper(parallelism=4, min_segment_seconds=10).iter_frames_parallel("/path/to/video.mp4"))
+
+
+def test_resume_segments_drops_finished_segments():
+    segments = FFmpegWrapper(parallelism=4, min_segment_seconds=10)._plan_segments(120.0)
+
+    assert FFmpegWrapper._resume_segments(segments, 45) == [(45, 60), (60, 90), (90, None)]
+    assert FFmpegWrapper._resume_segments([FrameSegment(0, 30)], 30) == []
+
+
+def test_plan_chunks_caps_each_chunk_duration():
+    wrapper = FFmpegWrapper(parallelism=1)
+
+    assert wrapper.plan_chunks(7200.0, 600) == [(start, start + 600) for start in range(0, 6600, 600)] + [(6600, None)]
+    assert wrapper.plan_chunks(300.0, 600) == [(0, None)]
+
+
+def test_plan_chunks_splits_only_the_requested_range():
+    wrapper = FFmpegWrapper(parallelism=4, min_segment_seconds=10)
+    config = FrameExtractionConfig(start_seconds=600, end_seconds=1800, fps=0.5)
+
+    assert wrapper.plan_chunks(7200.0, 600, config) == [(0, 300), (300, 600)]
+    assert wrapper._plan_segments(7200.0, FrameExtractionConfig(max_frames=25)) == [(0, 7), (7, 14), (14, 21), (21, 25)]
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_probe_media_reads_video_stream_metadata(ffmpeg_mock):
+    ffmpeg_mock.probe.return_value = _probe_result("125.5", nb_frames="3762")
+
+    metadata = FFmpegWrapper.probe_media("https://signed/video")
+
+    assert metadata == MediaMetadata(duration=125.5, width=1280, height=720, fps=29.97, codec="h264", frame_count=3762)
+    assert metadata.estimated_frames(1) == 126
+
+
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_probe_media_estimates_frame_count_when_container_has_none(ffmpeg_mock):
+    ffmpeg_mock.probe.return_value = _probe_result("10.0", avg_frame_rate="25/1")
+
+    assert FFmpegWrapper.probe_media("/path/to/video.webm").frame_count == 250
+
+
+@pytest.mark.parametrize("probe_result", [
+    {"format": {"duration": "10.0"}, "streams": [{"codec_type": "audio"}]},
+    _probe_result("0"),
+    _probe_result("10.0", avg_frame_rate="0/0", r_frame_rate="0/0"),
+])
+@patch("src.infrastructure.video.ffmpeg_wrapper.ffmpeg")
+def test_probe_media_rejects_files_without_decodable_video(ffmpeg_mock, probe_result):
+    ffmpeg_mock.probe.return_value = probe_result
+
+    with pytest.raises(ValueError):
+        FFmpegWrapper.probe_media("/path/to/audio.mp3")
+
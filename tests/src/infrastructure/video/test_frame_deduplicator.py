@@ -0,0 +1,66 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.core.domain.entities.video_frame import VideoFrame
+from src.infrastructure.video.frame_deduplicator import FrameDeduplicator, difference_hashes, hamming_distance
+
+
+def _encode(pixels: np.ndarray, image_format: str = "PNG") -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels.astype(np.uint8)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def _gradient(width=320, height=180, reverse=False):
+    row = np.linspace(255, 0, width) if reverse else np.linspace(0, 255, width)
+    return np.tile(row, (height, 1))
+
+
+def test_difference_hashes_sets_one_bit_per_brighter_right_neighbour():
+    increasing = np.tile(np.arange(9), (8, 1))
+    decreasing = increasing[:, ::-1]
+
+    hashes = difference_hashes(np.stack([increasing, decreasing]))
+
+    assert hashes.dtype == np.uint64
+    assert int(hashes[0]) == 2 ** 64 - 1
+    assert int(hashes[1]) == 0
+    assert hamming_distance(hashes[0], hashes[1]) == 64
+
+
+@pytest.mark.parametrize("image_format", ["PNG", "JPEG", "WEBP"])
+def test_frame_hash_is_stable_across_encodings(image_format):
+    deduplicator = FrameDeduplicator(max_distance=4)
+    pixels = _gradient()
+
+    assert hamming_distance(deduplicator.frame_hash(_encode(pixels)), deduplicator.frame_hash(_encode(pixels, image_format))) <= 4
+
+
+def test_filter_drops_frames_close_to_the_last_kept_frame():
+    noise = np.random.default_rng(1).integers(-2, 3, size=(180, 320))
+    static = _encode(_gradient())
+    static_with_noise = _encode(np.clip(_gradient() + noise, 0, 255))
+    changed = _encode(_gradient(reverse=True))
+    frames = [
+        VideoFrame(index=0, pts=0.0, data=static),
+        VideoFrame(index=1, pts=1.0, data=static_with_noise),
+        VideoFrame(index=2, pts=2.0, data=changed),
+        VideoFrame(index=3, pts=3.0, data=changed),
+    ]
+    deduplicator = FrameDeduplicator(max_distance=6)
+
+    kept = list(deduplicator.filter(frames))
+
+    assert [frame.index for frame in kept] == [0, 2]
+    assert [(d["index"], d["pts"], d["duplicate_of"]) for d in deduplicator.dropped] == [(1, 1.0, 0), (3, 3.0, 2)]
+    assert all(d["distance"] <= 6 for d in deduplicator.dropped)
+
+
+def test_frame_hashes_matches_single_frame_hash():
+    deduplicator = FrameDeduplicator(max_distance=0)
+    frames = [_encode(_gradient()), _encode(_gradient(reverse=True))]
+
+    assert [int(value) for value in deduplicator.frame_hashes(frames)] == [deduplicator.frame_hash(data) for data in frames]
@@ -0,0 +1,121 @@
+import io
+import struct
+
+import pytest
+
+from src.core.domain.entities.extraction_progress import ExtractionProgress
+from src.infrastructure.video.frame_pipe_reader import JPEG_EOI, JPEG_SOI, JPEG_SOS, PNG_SIGNATURE, FFmpegStderrReader, ImagePipeReader
+
+
+def _png(payload: bytes) -> bytes:
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + chunk_type + data + b"\x00\x00\x00\x00"
+
+    return PNG_SIGNATURE + chunk(b"IHDR", payload) + chunk(b"IDAT", payload * 3) + chunk(b"IEND", b"")
+
+
+def _jpeg(payload: bytes) -> bytes:
+    def segment(marker: bytes, data: bytes) -> bytes:
+        return marker + struct.pack(">H", len(data) + 2) + data
+
+    # dado entrópico com byte 0xFF "escapado" (0xFF00) e marcador de restart, como no mjpeg
+    scan = payload + b"\xff\x00" + payload + b"\xff\xd0" + payload
+    return JPEG_SOI + segment(b"\xff\xe0", b"JFIF\x00") + segment(JPEG_SOS, b"\x01\x01\x00") + scan + JPEG_EOI
+
+
+def _webp(payload: bytes) -> bytes:
+    body = b"WEBP" + b"VP8 " + struct.pack("<I", len(payload)) + payload + (b"\x00" if len(payload) % 2 else b"")
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+class OneByteStream(io.BytesIO):
+    """Simula um pipe que entrega poucos bytes por leitura."""
+
+    def read(self, size=-1):
+        return super().read(min(size, 1) if size and size > 0 else size)
+
+    def read1(self, size=-1):
+        return self.read(size)
+
+
+def test_image_pipe_reader_splits_concatenated_pngs():
+    frames = [_png(b"a"), _png(b"bb"), _png(b"ccc")]
+
+    assert list(ImagePipeReader(io.BytesIO(b"".join(frames)))) == frames
+
+
+def test_image_pipe_reader_handles_short_reads():
+    frames = [_png(b"abc"), _png(b"def")]
+
+    assert list(ImagePipeReader(OneByteStream(b"".join(frames)))) == frames
+
+
+def test_image_pipe_reader_rejects_invalid_signature():
+    with pytest.raises(ValueError):
+        ImagePipeReader(io.BytesIO(b"not a png at all")).read_frame()
+
+
+def test_image_pipe_reader_raises_on_truncated_frame():
+    with pytest.raises(EOFError):
+        ImagePipeReader(io.BytesIO(_png(b"abc")[:-6])).read_frame()
+
+
+@pytest.mark.parametrize("stream_class", [io.BytesIO, OneByteStream])
+def test_image_pipe_reader_splits_concatenated_jpegs(stream_class):
+    frames = [_jpeg(b"a"), _jpeg(b"bb" * 40000), _jpeg(b"ccc")]
+
+    assert list(ImagePipeReader(stream_class(b"".join(frames)), "jpeg")) == frames
+
+
+@pytest.mark.parametrize("stream_class", [io.BytesIO, OneByteStream])
+def test_image_pipe_reader_splits_concatenated_webps(stream_class):
+    frames = [_webp(b"a"), _webp(b"bb"), _webp(b"ccc")]
+
+    assert list(ImagePipeReader(stream_class(b"".join(frames)), "webp")) == frames
+
+
+def test_image_pipe_reader_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        ImagePipeReader(io.BytesIO(b""), "gif")
+
+
+def test_image_pipe_reader_raises_on_truncated_jpeg():
+    with pytest.raises(EOFError):
+        ImagePipeReader(io.BytesIO(_jpeg(b"abc")[:-2]), "jpeg").read_frame()
+
+
+def test_stderr_reader_parses_showinfo_timestamps_and_keeps_other_lines():
+    stderr = io.BytesIO(
+        b"Input #0, mov,mp4 from 'in.mp4':\n"
+        b"[Parsed_showinfo_1 @ 0x7f] n:   0 pts:      0 pts_time:0       duration: 1\n"
+        b"[Parsed_showinfo_1 @ 0x7f] n:   1 pts:      1 pts_time:1.5     duration: 1\n"
+        b"[Parsed_showinfo_1 @ 0x7f] config in time_base: 1/1, frame_rate: 1/1\n"
+    )
+    reader = FFmpegStderrReader(stderr)
+    reader.start()
+    reader.join()
+
+    assert reader.next_timestamp(timeout=0) == 0.0
+    assert reader.next_timestamp(timeout=0) == 1.5
+    assert reader.next_timestamp(timeout=0) is None
+    assert b"Input #0" in reader.output
+    assert b"config in time_base" in reader.output
+
+
+def test_stderr_reader_reports_progress_blocks():
+    stderr = io.BytesIO(
+        b"frame=0\nout_time_us=N/A\nprogress=continue\n"
+        b"[Parsed_showinfo_1 @ 0x7f] n:   0 pts:      0 pts_time:0       duration: 1\n"
+        b"frame=12\nfps=0.00\nout_time_us=12000000\nout_time=00:00:12.000000\nprogress=end\n"
+    )
+    progress = []
+    reader = FFmpegStderrReader(stderr, on_progress=progress.append)
+    reader.start()
+    reader.join()
+
+    assert progress == [
+        ExtractionProgress(frames=0, out_time=0.0, done=False),
+        ExtractionProgress(frames=12, out_time=12.0, done=True),
+    ]
+    assert reader.next_timestamp(timeout=0) == 0.0
+    assert b"out_time" not in reader.output
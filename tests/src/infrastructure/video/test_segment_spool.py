@@ -0,0 +1,58 @@
+import os
+import threading
+
+import pytest
+
+from src.infrastructure.video.segment_spool import SegmentSpool
+
+
+def test_spool_returns_frames_in_order_and_removes_the_file(tmp_path):
+    frames = [(tick, f"frame-{tick}".encode() * (tick + 1)) for tick in range(5)]
+
+    with SegmentSpool(iter(frames), str(tmp_path)) as spool:
+        assert list(spool) == frames
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_producer_runs_ahead_of_the_consumer(tmp_path):
+    produced = threading.Event()
+
+    def frames():
+        for tick in range(100):
+            yield tick, b"x" * 1024
+        produced.set()
+
+    with SegmentSpool(frames(), str(tmp_path)) as spool:
+        # nada foi consumido e o produtor já gravou o segmento inteiro
+        assert produced.wait(timeout=5)
+        assert len(list(spool)) == 100
+
+
+def test_spool_reraises_producer_error_after_the_frames_written_before_it(tmp_path):
+    def frames():
+        yield 0, b"frame-0"
+        raise RuntimeError("ffmpeg failed")
+
+    with SegmentSpool(frames(), str(tmp_path)) as spool:
+        iterator = iter(spool)
+        assert next(iterator) == (0, b"frame-0")
+        with pytest.raises(RuntimeError, match="ffmpeg failed"):
+            next(iterator)
+
+
+def test_spool_stops_the_producer_when_the_consumer_leaves(tmp_path):
+    closed = threading.Event()
+
+    def frames():
+        try:
+            for tick in range(10 ** 9):
+                yield tick, b"x"
+        finally:
+            closed.set()
+
+    with SegmentSpool(frames(), str(tmp_path)) as spool:
+        assert next(iter(spool)) == (0, b"x")
+
+    assert closed.is_set()
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,92 @@
+import pytest
+from fastapi.exceptions import RequestValidationError
+
+from src.presentation.api.v1.forms.streaming_form_file import StreamingFormFile
+
+BOUNDARY = "test-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def _body(*parts):
+    body = b""
+    for name, filename, content_type, content in parts:
+        body += f"--{BOUNDARY}\r\nContent-Disposition: form-data; name=\"{name}\"; filename=\"{filename}\"\r\n".encode()
+        body += f"Content-Type: {content_type}\r\n\r\n".encode() + content + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+class _Stream:
+    """Corpo entregue em pedaços de `chunk_size` bytes, contando quantos já foram lidos."""
+
+    def __init__(self, body, chunk_size):
+        self._chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.read = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.read == len(self._chunks):
+            raise StopAsyncIteration
+        self.read += 1
+        return self._chunks[self.read - 1]
+
+
+async def _read(form_file):
+    return b"".join([chunk async for chunk in form_file.chunks()])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+async def test_streams_the_file_part_across_any_chunking(chunk_size):
+    video = bytes(range(256)) * 40
+    body = _body(("notes", "notes.txt", "text/plain", b"skip me"), ("video_file", "clip.mp4", "video/mp4", video))
+
+    form_file = await StreamingFormFile(_Stream(body, chunk_size), CONTENT_TYPE, "video_file").open()
+
+    assert form_file.filename == "clip.mp4"
+    assert form_file.content_type == "video/mp4"
+    assert await _read(form_file) == video
+
+
+@pytest.mark.asyncio
+async def test_reads_the_body_only_as_far_as_it_is_consumed():
+    stream = _Stream(_body(("video_file", "clip.mp4", "video/mp4", b"v" * 1000), ("after", "a.txt", "text/plain", b"a" * 1000)), 100)
+
+    form_file = await StreamingFormFile(stream, CONTENT_TYPE, "video_file").open()
+    assert stream.read == 2
+
+    assert await _read(form_file) == b"v" * 1000
+    assert stream.read < 21
+
+
+@pytest.mark.asyncio
+async def test_missing_field_raises_the_fastapi_validation_error():
+    body = _body(("notes", "notes.txt", "text/plain", b"not a video"))
+
+    with pytest.raises(RequestValidationError) as error:
+        await StreamingFormFile(_Stream(body, 16), CONTENT_TYPE, "video_file").open()
+
+    assert error.value.errors() == [{"type": "missing", "loc": ("body", "video_file"), "msg": "Field required", "input": None}]
+
+
+@pytest.mark.asyncio
+async def test_body_that_is_not_multipart_is_missing_the_field():
+    with pytest.raises(RequestValidationError):
+        await StreamingFormFile(_Stream(b"{}", 16), "application/json", "video_file").open()
+
+
+def test_content_length_above_the_limit_is_rejected_before_reading():
+    with pytest.raises(RequestValidationError) as error:
+        StreamingFormFile(_Stream(b"", 16), CONTENT_TYPE, "video_file", content_length=10 * 1024 * 1024, max_size=1024, max_size_message="too big")
+
+    assert error.value.errors()[0]["msg"] == "Value error, too big"
+
+
+@pytest.mark.asyncio
+async def test_truncated_body_fails_the_stream():
+    body = _body(("video_file", "clip.mp4", "video/mp4", b"v" * 1000))[:-200]
+    form_file = await StreamingFormFile(_Stream(body, 64), CONTENT_TYPE, "video_file").open()
+
+    with pytest.raises(RequestValidationError, match="ended before the end of the file"):
+        await _read(form_file)
@@ -1,6 +1,10 @@
+import hashlib
 from http import HTTPStatus
 from unittest.mock import patch
 
+from src.core.domain.entities.media_metadata import MediaMetadata
+from src.core.domain.entities.storage_object import StorageObject
+from tests.factories.video_job_factory import VideoJobFactory
 from tests.conftest import get_headers
 
 
@@ -14,7 +18,21 @@ def test_send_empty_payload_for_route_register_video(client):
                 "loc": ["query", "client_identification"],
                 "msg": "Field required",
                 "type": "missing"
-            },
+            }
+        ]
+    }
+
+
+def test_send_payload_without_video_file_for_route_register_video(client):
+    response = client.post(
+        "/api/v1/video/register",
+        params={"client_identification": "test_client"},
+        files={"other_file": ("notes.txt", b"not a video", "text/plain")},
+        headers=get_headers()
+    )
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.json() == {
+        "detail": [
             {
                 "input": None,
                 "loc": ["body", "video_file"],
@@ -24,12 +42,29 @@ def test_send_empty_payload_for_route_register_video(client):
         ]
     }
 
-# Mock upload_object and enqueue_video_processing_task
-@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway.upload_file_obj')
+
+def _multipart_storage_patches(func):
+    for name, value in (
+        ("create_multipart_upload", "upload-1"),
+        ("upload_part", '"etag-1"'),
+        ("complete_multipart_upload", None),
+        ("abort_multipart_upload", None),
+    ):
+        func = patch(f"src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway.{name}", return_value=value)(func)
+    return func
+
+
+# Mock the streamed multipart upload, probe_media and enqueue_video_processing_task
+@patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper.probe_media')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway.presign_url')
 @patch('src.infrastructure.gateways.celery_task_queue_gateway.CeleryTaskQueueGateway.enqueue_video_processing_task')
-def test_send_correct_payload_for_route_register_video(mock_enqueue_task, mock_upload_object, client):
+@_multipart_storage_patches
+def test_send_correct_payload_for_route_register_video(
+    mock_create, mock_upload_part, mock_complete, mock_abort, mock_enqueue_task, mock_presign_url, mock_probe_media, client
+):
     mock_enqueue_task.return_value = "mocked_task_id"
-    mock_upload_object.return_value = {"message": "Object uploaded successfully"}
+    mock_presign_url.return_value = "https://signed/video"
+    mock_probe_media.return_value = MediaMetadata(duration=12.0, width=640, height=360, fps=30.0, codec="h264")
     
     response = client.post(
         "/api/v1/video/register",
@@ -46,3 +81,101 @@ def test_send_correct_payload_for_route_register_video(mock_enqueue_task, mock_u
     assert 'created_at' in response_json
     assert 'updated_at' in response_json
     assert response_json['status'] == 'QUEUED'
+    assert response_json['media_metadata']['duration'] == 12.0
+    assert response_json['content_hash'] == hashlib.sha256(b"fake video content").hexdigest()
+    assert mock_create.call_args.args[-1] == "video/mp4"
+    assert mock_upload_part.call_args.args[-1] == b"fake video content"
+    mock_complete.assert_called_once()
+    mock_abort.assert_not_called()
+
+
+@patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper.probe_media')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway.delete_object')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway.presign_url')
+@patch('src.infrastructure.gateways.celery_task_queue_gateway.CeleryTaskQueueGateway.enqueue_video_processing_task')
+@_multipart_storage_patches
+def test_route_register_video_rejects_undecodable_file(
+    mock_create, mock_upload_part, mock_complete, mock_abort, mock_enqueue_task, mock_presign_url, mock_delete_object, mock_probe_media, client
+):
+    mock_presign_url.return_value = "https://signed/video"
+    mock_probe_media.side_effect = ValueError("Invalid data found when processing input")
+
+    response = client.post(
+        "/api/v1/video/register",
+        params={"client_identification": "test_client", "notify_url": "http://callback.url"},
+        files={"video_file": ("test_video.mp4", b"fake video content", "video/mp4")},
+        headers=get_headers()
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    mock_delete_object.assert_called_once()
+    mock_enqueue_task.assert_not_called()
+
+
+@patch('src.infrastructure.repositories.mongoengine.frame_cache_repository.MongoFrameCacheRepository.stats')
+def test_route_frame_cache_stats_returns_hit_ratio(mock_stats, client):
+    mock_stats.return_value = {"hits": 3, "misses": 1, "entries": 2}
+
+    response = client.get("/api/v1/video/cache/stats", headers=get_headers())
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"hits": 3, "misses": 1, "entries": 2, "hit_ratio": 0.75}
+
+
+@patch('src.infrastructure.gateways.celery_task_queue_gateway.CeleryTaskQueueGateway.notification_status_callback')
+@patch('src.infrastructure.gateways.celery_task_queue_gateway.CeleryTaskQueueGateway.revoke_tasks')
+def test_route_cancel_video_job_revokes_queued_task(mock_revoke_tasks, mock_notification, client):
+    video_job = VideoJobFactory(status="QUEUED", task_ids=["task-1"])
+
+    response = client.post(f"/api/v1/video/{video_job.job_ref}/cancel", headers=get_headers())
+    again = client.post(f"/api/v1/video/{video_job.job_ref}/cancel", headers=get_headers())
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["status"] == "CANCELLED"
+    mock_revoke_tasks.assert_called_once_with(["task-1"])
+    assert again.status_code == HTTPStatus.BAD_REQUEST
+
+
+@patch('src.infrastructure.gateways.celery_task_queue_gateway.CeleryTaskQueueGateway.notification_status_callback')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway.presign_post')
+def test_route_create_video_upload_returns_presigned_post(mock_presign_post, mock_notification, client):
+    mock_presign_post.return_value = {"url": "https://bucket.s3.amazonaws.com/", "fields": {"key": "k", "policy": "p"}}
+
+    response = client.post(
+        "/api/v1/video/upload",
+        json={"client_identification": "test_client", "size": 1024, "content_type": "video/mp4", "config": {"fps": 2}},
+        headers=get_headers()
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    response_json = response.json()
+    assert response_json["method"] == "POST"
+    assert response_json["status"] == "PENDING"
+    assert response_json["fields"] == {"key": "k", "policy": "p"}
+    assert mock_presign_post.call_args.kwargs["key"].endswith(f"/test_client/{response_json['job_ref']}")
+
+
+@patch('src.infrastructure.gateways.celery_task_queue_gateway.CeleryTaskQueueGateway.notification_status_callback')
+@patch('src.infrastructure.gateways.celery_task_queue_gateway.CeleryTaskQueueGateway.enqueue_video_processing_task')
+@patch('src.infrastructure.video.ffmpeg_wrapper.FFmpegWrapper.probe_media')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway.presign_url')
+@patch('src.infrastructure.gateways.s3_storage_gateway.S3StorageGateway.head_object')
+def test_route_confirm_video_upload_enqueues_the_job(
+    mock_head_object, mock_presign_url, mock_probe_media, mock_enqueue_task, mock_notification, client
+):
+    video_job = VideoJobFactory(upload={"key": "videos/client/job", "size": 1024, "upload_id": None})
+    mock_head_object.return_value = StorageObject(
+        bucket="bucket", key="videos/client/job", metadata={"ContentLength": 1024, "ETag": '"abc"'}
+    )
+    mock_presign_url.return_value = "https://signed/video"
+    mock_probe_media.return_value = MediaMetadata(duration=12.0, width=640, height=360, fps=30.0, codec="h264")
+    mock_enqueue_task.return_value = "task-1"
+
+    response = client.post(f"/api/v1/video/{video_job.job_ref}/upload/confirm", headers=get_headers())
+    again = client.post(f"/api/v1/video/{video_job.job_ref}/upload/confirm", headers=get_headers())
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["status"] == "QUEUED"
+    assert response.json()["content_hash"] == "etag:abc"
+    mock_enqueue_task.assert_called_once()
+    assert again.status_code == HTTPStatus.BAD_REQUEST